@@ -28,20 +28,94 @@ __copyright__ = """
 
    s. FLOSS-EXCEPTION.txt
 """
-from rich import pretty
-from rich.console import Console
-from rich.traceback import install as tb_install
+import os
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-from asamint.asam import AsamMC
-from asamint.calibration.api import Calibration, ExecutionPolicy, OfflineCalibration, OnlineCalibration, ParameterCache, Status
+from asamint.version import __version__
 
-pretty.install()
+if TYPE_CHECKING:
+    from rich.console import Console
 
+    from asamint.asam import AsamMC
+    from asamint.calibration.api import Calibration, ExecutionPolicy, OfflineCalibration, OnlineCalibration, ParameterCache, Status
 
-console = Console()
-tb_install(show_locals=True, max_frames=3)  # Install custom exception handler.
+    console: Console
 
-from asamint.version import __version__
+# Public names and their defining modules.  Nothing is imported before first
+# access (PEP 562), so ``import asamint`` -- e.g. in a CLI before argument
+# parsing or in a worker process -- does not pull in pya2l, SQLAlchemy & Co.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "AsamMC": "asamint.asam",
+    "Calibration": "asamint.calibration.api",
+    "OnlineCalibration": "asamint.calibration.api",
+    "OfflineCalibration": "asamint.calibration.api",
+    "ParameterCache": "asamint.calibration.api",
+    "ExecutionPolicy": "asamint.calibration.api",
+    "Status": "asamint.calibration.api",
+}
+
+_SUBMODULES = frozenset(
+    (
+        "adapters",
+        "api",
+        "asam",
+        "calibration",
+        "cdf",
+        "cmdline",
+        "config",
+        "core",
+        "cvx",
+        "damos",
+        "hdf5",
+        "mdf",
+        "measurement",
+        "model",
+        "msrsw",
+        "utils",
+        "xcp",
+    )
+)
+
+
+def install_rich(*, pretty: bool = True, traceback: bool = True, show_locals: bool = True, max_frames: int = 3) -> None:
+    """Install rich's pretty printer and traceback handler for the running interpreter.
+
+    ``import asamint`` no longer does this; call it from interactive sessions or
+    CLI entry points, or set the environment variable ``ASAMINT_RICH=1`` to
+    install both on import.
+    """
+    if pretty:
+        from rich import pretty as rich_pretty
+
+        rich_pretty.install()
+    if traceback:
+        from rich.traceback import install as tb_install
+
+        tb_install(show_locals=show_locals, max_frames=max_frames)
+
+
+def __getattr__(name: str) -> object:
+    if name == "console":
+        from rich.console import Console
+
+        value: object = Console()
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _SUBMODULES:
+        value = import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _SUBMODULES | {"console"})
+
+
+if os.environ.get("ASAMINT_RICH", "").lower() in ("1", "true", "yes", "on"):
+    install_rich()
 
 __all__ = [
     "AsamMC",
@@ -51,5 +125,6 @@ __all__ = [
     "ParameterCache",
     "ExecutionPolicy",
     "Status",
+    "install_rich",
     "__version__",
 ]
@@ -1,13 +1,23 @@
-"""Adapter layer for external libraries."""
-
-from asamint.adapters.a2l import open_a2l_database
-from asamint.adapters.mdf import mdf_channels, open_mdf, save_mdf
-from asamint.adapters.objutils import open_image
-from asamint.adapters.xcp import McObject, compute_checksum
-from asamint.adapters.xcp import create_master as create_xcp_master
-from asamint.adapters.xcp import make_continuous_blocks
+"""Adapter layer for external libraries.
+
+The convenience re-exports below are resolved on first access (PEP 562), so
+importing one adapter (e.g. :mod:`asamint.adapters.objutils`) does not load
+the libraries behind the others (pya2l, asammdf, pyxcp).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from asamint.core.deprecation import DeprecatedAlias, deprecated_dir, deprecated_getattr
 
+if TYPE_CHECKING:
+    from asamint.adapters.a2l import open_a2l_database
+    from asamint.adapters.mdf import mdf_channels, open_mdf, save_mdf
+    from asamint.adapters.objutils import open_image
+    from asamint.adapters.xcp import McObject, compute_checksum
+    from asamint.adapters.xcp import create_master as create_xcp_master
+    from asamint.adapters.xcp import make_continuous_blocks
+
 __all__ = [
     "create_xcp_master",
     "compute_checksum",
@@ -20,12 +30,30 @@ __all__ = [
     "mdf_channels",
 ]
 
+# Re-exported name -> (adapter module, attribute).
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "create_xcp_master": ("asamint.adapters.xcp", "create_master"),
+    "compute_checksum": ("asamint.adapters.xcp", "compute_checksum"),
+    "make_continuous_blocks": ("asamint.adapters.xcp", "make_continuous_blocks"),
+    "McObject": ("asamint.adapters.xcp", "McObject"),
+    "open_a2l_database": ("asamint.adapters.a2l", "open_a2l_database"),
+    "open_image": ("asamint.adapters.objutils", "open_image"),
+    "open_mdf": ("asamint.adapters.mdf", "open_mdf"),
+    "save_mdf": ("asamint.adapters.mdf", "save_mdf"),
+    "mdf_channels": ("asamint.adapters.mdf", "mdf_channels"),
+}
+
 _DEPRECATED_ALIASES: dict[str, DeprecatedAlias] = {}
 
 
 def __getattr__(name: str) -> object:
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attr_name = _LAZY_ATTRIBUTES[name]
+        value = getattr(import_module(module_name), attr_name)
+        globals()[name] = value
+        return value
     return deprecated_getattr(name, _DEPRECATED_ALIASES, globals(), __name__)
 
 
 def __dir__() -> list[str]:
-    return deprecated_dir(_DEPRECATED_ALIASES, globals())
+    return sorted(set(deprecated_dir(_DEPRECATED_ALIASES, globals())) | set(_LAZY_ATTRIBUTES))
@@ -29,6 +29,10 @@ from pya2l.functions import Formula, fix_axis_par, fix_axis_par_dist
 
 A2LDBSession: TypeAlias = Any  # pya2l DB session (SQLAlchemy ORM Session)
 
+#: Version of the pya2l database schema (part of derived-cache keys).
+A2L_SCHEMA_VERSION: int = model.CURRENT_SCHEMA_VERSION
+PYA2L_VERSION: str = pya2l.__version__
+
 _log = logging.getLogger(__name__)
 
 inspect = a2l_inspect
@@ -39,8 +43,17 @@ class ManagedA2LSession:
     disposes the underlying SQLAlchemy engine to prevent ``ResourceWarning`` about
     unclosed SQLite connections."""
 
-    def __init__(self, database: model.A2LDatabase) -> None:
+    def __init__(self, database: model.A2LDatabase, a2l_path: Path | None = None) -> None:
         self._database: model.A2LDatabase | None = database
+        #: Source ``.a2l`` file (``None`` if the database was opened directly).
+        self.a2l_path: Path | None = a2l_path
+
+    @property
+    def db_path(self) -> Path | None:
+        """Path of the underlying ``.a2ldb`` file."""
+        if self._database is None:
+            return None
+        return Path(self._database.dbname).resolve()
 
     # ------------------------------------------------------------------ #
     # Lifecycle
@@ -230,16 +243,21 @@ def open_a2l_database(a2l_file: str, encoding: str = "latin-1", *, local: bool =
     """
     a2l_path, db_path = _a2l_database_paths(a2l_file, local=local)
     if db_path.exists() and _local_a2ldb_is_current(db_path):
-        return _open_managed(db_path)
-    return _import_a2l_fresh(
-        a2l_path,
-        db_path,
-        local=local,
-        encoding=encoding,
-    )
+        session = _open_managed(db_path)
+    else:
+        session = _import_a2l_fresh(
+            a2l_path,
+            db_path,
+            local=local,
+            encoding=encoding,
+        )
+    if a2l_path.exists():
+        session.a2l_path = a2l_path.resolve()
+    return session
 
 
 __all__ = [
+    "A2L_SCHEMA_VERSION",
     "A2LDBSession",
     "ManagedA2LSession",
     "a2l_inspect",
@@ -258,5 +276,6 @@ __all__ = [
     "model",
     "open_a2l_database",
     "inspect",
+    "PYA2L_VERSION",
     "path_components",
 ]
@@ -326,6 +326,7 @@ def import_from_cdf(
     db_path: str | Path,
     *,
     logger: logging.Logger | None = None,
+    streaming: bool = False,
 ) -> CdfIOResult:
     """Import calibration parameters from a CDF20 XML into an MSRSW database.
 
@@ -336,11 +337,12 @@ def import_from_cdf(
         xml_path: Path to the ``.cdfx`` file.
         db_path: Destination ``.msrswdb`` path.
         logger: Optional logger.
+        streaming: Use the incremental, constant-memory importer.
 
     Returns:
         :class:`CdfIOResult` with the written paths.
     """
-    return import_cdf(xml_path=xml_path, db_path=db_path, logger=logger)
+    return import_cdf(xml_path=xml_path, db_path=db_path, logger=logger, streaming=streaming)
 
 
 # ---------------------------------------------------------------------------
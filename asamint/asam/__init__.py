@@ -26,7 +26,7 @@ __copyright__ = """
 """
 __author__ = "Christoph Schueler"
 
-import bisect
+import math
 import os
 import time
 from collections import defaultdict
@@ -58,6 +58,8 @@ from asamint.adapters.xcp import (
     ecu_states_from_raw,
 )
 from asamint.asam.epk import Epk
+from asamint.asam.memory_map import MemoryRangeIndex
+from asamint.compu import compiled_conversion
 from asamint.config import (
     get_application,
     snapshot_general_config,
@@ -66,6 +68,7 @@ from asamint.config import (
 from asamint.core import ByteOrder, get_data_type
 from asamint.core import byte_order as core_byte_order
 from asamint.utils import current_timestamp
+from asamint.utils.buffers import ColumnarBuffer
 import ufilename
 
 
@@ -282,30 +285,19 @@ class AsamMC:
             )
             memory_ranges.append(mr)
 
-        memory_ranges = sorted(memory_ranges, key=lambda k: k.address)
-        keys = [r.address for r in memory_ranges]
+        self.calibration_memory_index = index = MemoryRangeIndex(memory_ranges)
 
-        for chs in self.session.query(model.Characteristic).all():
-            idx = bisect.bisect_right(keys, chs.address)
-            if idx > 0:
-                mr = memory_ranges[idx - 1]
-                if chs.address in mr:
-                    mr.characteristics.append(chs.name)
+        for klass, attr in ((model.Characteristic, "characteristics"), (model.AxisPts, "axis_pts")):
+            rows = self.session.query(klass.name, klass.address).all()
+            for (name, _), idx in zip(rows, index.locate([address for _, address in rows]).tolist(), strict=True):
+                if idx >= 0:
+                    getattr(index[idx], attr).append(name)
 
-        for ax in self.session.query(model.AxisPts).all():
-            idx = bisect.bisect_right(keys, ax.address)
-            if idx > 0:
-                mr = memory_ranges[idx - 1]
-                if ax.address in mr:
-                    mr.axis_pts.append(ax.name)
-
-        epk_addr, epk_len = self.epk.epk_address_and_length()
-
-        for mr in memory_ranges:
+        for mr in index:
             mr.characteristics.sort()
             mr.axis_pts.sort()
 
-        return memory_ranges
+        return index.ranges
 
     def __del__(self) -> None:
         self.close()
@@ -502,19 +494,62 @@ class AsamMC:
             case _:
                 return np.dtype(endian + "u4")
 
+    def _polling_blocks(self, meas_info: list[dict[str, Any]]) -> list[tuple[int, int, np.dtype]]:
+        """Merge measurement addresses into contiguous upload blocks.
+
+        Overlapping measurements (e.g. bit-fields sharing an address) end up in
+        the same block, each with its own field, so all of them decode from the
+        same upload.
+
+        Returns
+        -------
+        list of (address, length, dtype):
+            ``dtype`` is a structured dtype with one field per measurement at
+            its offset inside the block, so a block decodes in one ``frombuffer``.
+        """
+        groups: list[tuple[int, int, int, list[dict[str, Any]]]] = []  # (ext, start, end, members)
+        for mi in sorted(meas_info, key=lambda mi: (mi["ext"], mi["address"])):
+            start, end = mi["address"], mi["address"] + mi["nbytes"]
+            if groups and groups[-1][0] == mi["ext"] and start <= groups[-1][2]:
+                ext, first, last, members = groups[-1]
+                members.append(mi)
+                groups[-1] = (ext, first, max(last, end), members)
+            else:
+                groups.append((mi["ext"], start, end, [mi]))
+        blocks: list[tuple[int, int, np.dtype]] = []
+        for _, start, end, members in groups:
+            dtype = np.dtype(
+                {
+                    "names": [mi["name"] for mi in members],
+                    "formats": [mi["dtype"] for mi in members],
+                    "offsets": [mi["address"] - start for mi in members],
+                    "itemsize": end - start,
+                }
+            )
+            blocks.append((start, end - start, dtype))
+        return blocks
+
     def acquire_via_pyxcp(  # noqa: C901
         self,
         master: Any,
         duration_s: float | None = None,
         samples: int | None = None,
         period_s: float = 0.01,
-    ) -> dict[str, Any]:
+    ) -> ColumnarBuffer:
         """Acquire measurement samples via a pyxcp Master by periodic polling.
 
         This is a simple polling-based acquisition for compatibility. For
         higher performance consider using DAQ/ODT configuration in pyxcp.
 
-        Returns a dict compatible with save_measurements():
+        Adjacent measurements are merged into contiguous memory blocks which
+        are read with one ``master.upload`` each and decoded with a single
+        structured-dtype ``frombuffer``. Samples go straight into preallocated
+        typed columns (:class:`ColumnarBuffer`); duration-based runs grow them
+        geometrically. Timing statistics of the polling loop are kept in
+        ``self.acquisition_timing``.
+
+        Returns a mapping compatible with save_measurements() whose values are
+        views into the sample columns:
         {"TIMESTAMPS": np.ndarray, <meas_name>: np.ndarray, ...}
         """
         if not hasattr(self, "measurement_variables") or not self.measurement_variables:
@@ -525,7 +560,11 @@ class AsamMC:
 
         # Build per-measurement access info
         meas_info: list[dict[str, Any]] = []
+        seen: set[str] = set()
         for m in self.measurement_variables:
+            if m.name in seen:
+                continue
+            seen.add(m.name)
             try:
                 bo = core_byte_order(m, getattr(self, "mod_common", None)) or ByteOrder.MSB_LAST
                 dtype = self._numpy_dtype_for_asam(m.dataType, bo)
@@ -536,6 +575,7 @@ class AsamMC:
                     "dtype": dtype,
                     "nbytes": nbytes,
                     "address": addr,
+                    "ext": int(getattr(m, "ecuAddressExtension", 0) or 0),
                     "bitMask": m.bitMask,
                     "bitOperation": m.bitOperation,
                     "compuMethod": m.compuMethod,
@@ -544,49 +584,101 @@ class AsamMC:
             except (AttributeError, TypeError, ValueError, KeyError) as e:
                 self.logger.error(f"Cannot prepare measurement '{getattr(m, 'name', '?')}': {e}")
 
-        # Determine number of samples
-        if samples is None:
-            samples = max(1, int(round(duration_s / period_s)))
-
-        # Buffers
-        buffers: dict[str, list[Any]] = {mi["name"]: [] for mi in meas_info}
-        ts: list[float] = []
+        # Preallocate typed columns: exactly *samples* rows, or an estimate that grows for duration-based runs.
+        if samples is not None:
+            capacity = samples
+        elif period_s > 0:
+            capacity = math.ceil(duration_s / period_s) + 1
+        else:
+            capacity = 1024
+        # One structured column per block ('#' cannot occur in A2L identifiers); fields are split off after the run.
+        blocks = self._polling_blocks(meas_info)
+        block_dtypes = {f"#{idx}": dtype for idx, (_, _, dtype) in enumerate(blocks)}
+        block_keys = list(block_dtypes)
+        buffer = ColumnarBuffer({"TIMESTAMPS": np.float64} | block_dtypes, capacity=capacity)
+        failed_rows: dict[int, list[int]] = defaultdict(list)
+        overruns = 0
 
         t0 = time.perf_counter()
-        for k in range(samples):
+        while samples is None or buffer.size < samples:
             t_now = time.perf_counter() - t0
-            ts.append(t_now)
-            for mi in meas_info:
+            if duration_s is not None and (t_now >= duration_s or buffer.size * period_s >= duration_s):
+                break
+            k = buffer.new_row()
+            columns = buffer.storage
+            columns["TIMESTAMPS"][k] = t_now
+            for idx, (address, length, dtype) in enumerate(blocks):
                 try:
-                    data = master.upload(mi["address"], mi["nbytes"])  # returns bytes
-                    val = np.frombuffer(data, dtype=mi["dtype"], count=1)[0]
-                    # Apply bit operations
-                    if mi["bitMask"] is not None:
-                        val = val & mi["bitMask"]
-                    bo = mi["bitOperation"]
-                    if bo and bo.get("amount"):
-                        amount = bo["amount"]
-                        if bo.get("direction") == "L":
-                            val = val << amount
-                        else:
-                            val = val >> amount
-                    buffers[mi["name"]].append(val)
+                    # One upload and one decode per contiguous block.
+                    columns[block_keys[idx]][k] = np.frombuffer(master.upload(address, length), dtype=dtype, count=1)[0]
                 except (OSError, IndexError, KeyError, TypeError, ValueError) as e:
-                    self.logger.error(f"pyxcp upload failed for {mi['name']}: {e}")
-                    buffers[mi["name"]].append(np.nan)
+                    self.logger.error(f"pyxcp upload failed for block 0x{address:08X} ({length} bytes): {e}")
+                    failed_rows[idx].append(k)
             # Sleep remaining time in period
             t_elapsed = time.perf_counter() - t0
             t_target = (k + 1) * period_s
             delay = t_target - t_elapsed
             if delay > 0:
                 time.sleep(delay)
+            else:
+                overruns += 1
+
+        # Every block field becomes its own contiguous column, so each column is written by the upload of its block.
+        for key, dtype in block_dtypes.items():
+            records = buffer.pop(key)
+            for name in dtype.names:
+                buffer[name] = records[name]
+        # Bit operations work in-place on the columns; failed uploads turn the affected block's columns into NaN-marked floats.
+        for mi in meas_info:
+            self._apply_bit_operations(buffer[mi["name"]], mi)
+        for idx, rows in failed_rows.items():
+            for name in blocks[idx][2].names:
+                values = buffer[name].astype(np.float64)
+                values[rows] = np.nan
+                buffer[name] = values
+        for m in self.measurement_variables:
+            if m.name not in buffer:
+                self.logger.warning(f"Measurement '{m.name}' was not acquired, storing NaN samples.")
+                buffer[m.name] = np.full(buffer.size, np.nan)
+
+        self.acquisition_timing = self._polling_timing(buffer["TIMESTAMPS"], period_s, overruns, len(blocks))
 
         # Return RAW internal values; conversion to physical happens in save_measurements()
-        result: dict[str, Any] = {"TIMESTAMPS": np.asarray(ts)}
-        for m in self.measurement_variables:
-            raw_vals = np.asarray(buffers[m.name])
-            result[m.name] = raw_vals
-        return result
+        return buffer
+
+    @staticmethod
+    def _apply_bit_operations(raw_vals: np.ndarray, info: dict[str, Any]) -> np.ndarray:
+        """Apply BIT_MASK and BIT_OPERATION of a measurement in-place (integer types only)."""
+        if raw_vals.dtype.kind not in "iu":
+            return raw_vals
+        if info["bitMask"] is not None:
+            bits = raw_vals.dtype.itemsize * 8
+            raw_vals &= np.array(info["bitMask"] & ((1 << bits) - 1), dtype=np.uint64).astype(raw_vals.dtype)
+        bo = info["bitOperation"]
+        if bo and bo.get("amount"):
+            amount = bo["amount"]
+            if bo.get("direction") == "L":
+                raw_vals <<= amount
+            else:
+                raw_vals >>= amount
+        return raw_vals
+
+    @staticmethod
+    def _polling_timing(ts: np.ndarray, period_s: float, overruns: int, uploads: int) -> dict[str, Any]:
+        """Jitter statistics of a polling run (all times in seconds)."""
+        dt = np.diff(ts)
+        lateness = ts - np.arange(ts.shape[0]) * period_s
+        return {
+            "samples": int(ts.shape[0]),
+            "period_s": float(period_s),
+            "uploads_per_sample": uploads,
+            "mean_period_s": float(dt.mean()) if dt.size else None,
+            "std_period_s": float(dt.std()) if dt.size else None,
+            "min_period_s": float(dt.min()) if dt.size else None,
+            "max_period_s": float(dt.max()) if dt.size else None,
+            "max_lateness_s": float(lateness.max()) if lateness.size else None,
+            "overruns": overruns,
+        }
 
     def calculate_physical_values(self, internal_values, cm_object) -> Any:
         """Calculate pyhsical value representation from raw, ECU-internal values.
@@ -626,7 +718,6 @@ class AsamMC:
             if name == "NO_COMPU_METHOD":
                 return internal_values
 
-            calculator = CompuMethod(self.session, name)
-            return calculator.int_to_physical(internal_values)
+            return compiled_conversion(self.session, name).int_to_physical(internal_values)
         except (AttributeError, ValueError, KeyError):
             return internal_values
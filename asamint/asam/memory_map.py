@@ -0,0 +1,116 @@
+"""Address look-ups in the calibration memory map.
+
+:class:`MemoryRangeIndex` keeps the ``MEMORY_SEGMENT`` ranges of a module as
+sorted ``starts`` / ``ends`` arrays, so an address is mapped to its segment by
+binary search instead of a linear scan -- one at a time with :meth:`find` or
+for whole arrays of addresses with :meth:`locate`.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+from asamint.adapters.a2l import inspect
+from asamint.adapters.xcp import make_continuous_blocks
+
+if TYPE_CHECKING:
+    from asamint.asam import MemoryRange
+
+
+def is_in_hex_file(memory_range: MemoryRange) -> bool:
+    """Whether the contents of *memory_range* are part of a hex file.
+
+    Calibration variables in RAM and ``EXCLUDE_FROM_FLASH`` segments only exist on the ECU.
+    """
+    if memory_range.prg_type == inspect.PrgTypeSegment.EXCLUDE_FROM_FLASH:
+        return False
+    return not (
+        memory_range.prg_type == inspect.PrgTypeSegment.CALIBRATION_VARIABLES and memory_range.memory_type == inspect.MemoryType.RAM
+    )
+
+
+class MemoryRangeIndex:
+    """Interval index over non-overlapping :class:`~asamint.asam.MemoryRange` objects.
+
+    Args:
+        ranges: Memory ranges, in any order.
+    """
+
+    def __init__(self, ranges: Iterable[MemoryRange]) -> None:
+        self.ranges: list[MemoryRange] = sorted(ranges, key=lambda r: r.address)
+        self.starts = np.array([r.address for r in self.ranges], dtype=np.int64)
+        self.ends = self.starts + np.array([r.length for r in self.ranges], dtype=np.int64)
+        self.in_hex = np.array([is_in_hex_file(r) for r in self.ranges], dtype=bool)
+        # Scalar look-ups are cheaper with bisect than with a NumPy round trip.
+        self._start_list = self.starts.tolist()
+        self._end_list = self.ends.tolist()
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def __iter__(self) -> Iterator[MemoryRange]:
+        return iter(self.ranges)
+
+    def __getitem__(self, idx: int) -> MemoryRange:
+        return self.ranges[idx]
+
+    def find(self, address: int) -> Optional[MemoryRange]:
+        """The memory range containing *address*, or ``None``."""
+        idx = bisect.bisect_right(self._start_list, address) - 1
+        if idx >= 0 and address < self._end_list[idx]:
+            return self.ranges[idx]
+        return None
+
+    def locate(self, addresses: Sequence[int] | np.ndarray) -> np.ndarray:
+        """Indices into :attr:`ranges` of the ranges containing *addresses*.
+
+        Args:
+            addresses: Any number of addresses.
+
+        Returns:
+            ``int64`` array of the same length; ``-1`` where no range contains the address.
+        """
+        addresses = np.asarray(addresses, dtype=np.int64)
+        if not self.ranges:
+            return np.full(addresses.shape, -1, dtype=np.int64)
+        idx = np.searchsorted(self.starts, addresses, side="right") - 1
+        found = (idx >= 0) & (addresses < self.ends[np.maximum(idx, 0)])
+        return np.where(found, idx, -1)
+
+    def in_hex_file(self, addresses: Sequence[int] | np.ndarray) -> np.ndarray:
+        """Boolean mask of the *addresses* whose contents are part of a hex file.
+
+        Addresses outside of every range count as present, like an empty memory map.
+        """
+        idx = self.locate(addresses)
+        if not self.ranges:
+            return np.ones(idx.shape, dtype=bool)
+        return np.where(idx >= 0, self.in_hex[np.maximum(idx, 0)], True)
+
+    def gaps(self) -> np.ndarray:
+        """Distance between the end of every range and the start of its successor (``len - 1`` entries)."""
+        return self.starts[1:] - self.ends[:-1]
+
+    def continuous_blocks(self, objects: Sequence[Any]) -> list[Any]:
+        """Merge memory objects into transfer blocks that do not cross range boundaries.
+
+        Args:
+            objects: :class:`~asamint.adapters.xcp.McObject` instances.
+
+        Returns:
+            Blocks of :func:`~asamint.adapters.xcp.make_continuous_blocks`, sorted by address.
+        """
+        if not objects:
+            return []
+        groups: dict[int, list[Any]] = defaultdict(list)
+        for obj, idx in zip(objects, self.locate([obj.address for obj in objects]).tolist(), strict=True):
+            groups[idx].append(obj)
+        blocks = []
+        for group in groups.values():
+            blocks.extend(make_continuous_blocks(group))
+        return sorted(blocks, key=lambda b: (b.ext, b.address))
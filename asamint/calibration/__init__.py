@@ -34,6 +34,7 @@ __copyright__ = """
 
 from collections import defaultdict
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import IntEnum
 from functools import reduce
@@ -57,17 +58,23 @@ from asamint.adapters.xcp import (
     make_continuous_blocks,
 )
 from asamint.asam import AsamMC
+from asamint.asam.memory_map import MemoryRangeIndex
 from asamint.calibration import api
 from asamint.calibration.api import (
     Calibration,
     ExecutionPolicy,
+    FlushStats,
     OfflineCalibration,
     OnlineCalibration,
     ParameterCache,
     RangeError,
     ReadOnlyError,
     Status,
+    WriteBehindPolicy,
 )
+from asamint.calibration.definitions import DefinitionSnapshot
+from asamint.calibration.delta_refresh import DEFAULT_BLOCK_SIZE, DEFAULT_MIN_RANGE, RefreshStats, refresh_image
+from asamint.calibration.layout_cache import LayoutCache
 from asamint.calibration.mapfile import MapFile
 from asamint.core.exceptions import CalibrationError
 from asamint.model.calibration import klasses
@@ -285,6 +292,8 @@ class CalibrationData:
         self._parameters: dict[str, dict[str, Any]] = {k: {} for k in _PARAMETER_CATEGORIES}
         self.memory_map: defaultdict[int, list[MemoryObject]] = defaultdict(list)
         self.memory_errors: defaultdict[int, list[MemoryObject]] = defaultdict(list)
+        self._definitions: DefinitionSnapshot | None = None
+        self._layouts: LayoutCache | None = None
 
     # -- Context-manager protocol ------------------------------------------
 
@@ -313,6 +322,21 @@ class CalibrationData:
         """Query callable from the ASAM MC object."""
         return self.asam_mc.query
 
+    @property
+    def definitions(self) -> DefinitionSnapshot:
+        """Bulk-loaded A2L definitions, built on first access."""
+        if self._definitions is None:
+            self._definitions = DefinitionSnapshot.load(self.session, self.logger)
+        return self._definitions
+
+    @property
+    def layouts(self) -> LayoutCache:
+        """Resolved parameter memory layouts, served from the on-disk layout cache."""
+        if self._layouts is None:
+            # Deferred: the definitions are only loaded (once, via the property) on a cache miss.
+            self._layouts = LayoutCache.for_session(self.session, lambda: self.definitions, self.logger)
+        return self._layouts
+
     # -- Memory layout -----------------------------------------------------
 
     def get_memory_ranges(self) -> list[McObject]:
@@ -329,19 +353,17 @@ class CalibrationData:
             epk_addr, epk_len = self.epk.epk_address_and_length()
             result.append(McObject("EPK", epk_addr, 0, epk_len, ""))
 
-        # Axis points
-        for a in self.query(model.AxisPts).order_by(model.AxisPts.address).all():
-            ax = AxisPts.get(self.session, a.name)
-            result.append(McObject(ax.name, ax.address, 0, ax.total_allocated_memory, ""))
+        # Axis points and characteristics
+        result.extend(self.layouts.memory_objects())
 
-        # Add all characteristics
-        characteristics = self.query(model.Characteristic).order_by(model.Characteristic.type, model.Characteristic.address).all()
-        for c in characteristics:
-            characteristic = Characteristic.get(self.session, c.name)
-            mem_size = characteristic.total_allocated_memory
-            result.append(McObject(characteristic.name, characteristic.address, 0, mem_size, ""))
+        return self._continuous_blocks(result)
 
-        return make_continuous_blocks(result)
+    def _continuous_blocks(self, objects: list[McObject]) -> list[McObject]:
+        """Merge *objects* into transfer blocks, split at memory segment boundaries if the segments are known."""
+        index = getattr(self.asam_mc, "calibration_memory_index", None)
+        if not isinstance(index, MemoryRangeIndex):
+            return make_continuous_blocks(objects)
+        return index.continuous_blocks(objects)
 
     # -- Validation --------------------------------------------------------
 
@@ -398,6 +420,23 @@ class CalibrationData:
     # Backward-compatible typo alias.
     validata_image = validate_image
 
+    def refresh_image(self, image: Image, block_size: int = DEFAULT_BLOCK_SIZE, min_range: int = DEFAULT_MIN_RANGE) -> RefreshStats:
+        """Update *image* in place from the XCP slave, pulling only ranges whose checksums differ.
+
+        Where :meth:`validate_image` only reports per-block checksum
+        equality, mismatching blocks are bisected here and the differing
+        ranges are pulled and patched into the image.
+
+        Args:
+            image: Memory image to refresh.
+            block_size: Largest number of bytes checksummed by one ``BUILD_CHECKSUM``.
+            min_range: Bisection stops at ranges of this many bytes, which are pulled.
+
+        Returns:
+            Counters of the refresh, including ``bytes_saved``.
+        """
+        return refresh_image(image, self.asam_mc.xcp_master, block_size=block_size, min_range=min_range, logger=self.logger)
+
     # -- XCP upload / download ---------------------------------------------
 
     def get_image_from_xcp(self) -> Image:
@@ -482,41 +521,80 @@ class CalibrationData:
             raise CalibrationError("Empty calibration image.")
         return image
 
-    def load_hex(self) -> None:
+    def load_hex(self, *, workers: int = 1, overlap_writers: bool = False) -> None:
         """Load all calibration parameters from the current image.
 
         Processes axis points, values, ASCII strings, value blocks,
         curves, maps, and cubes; then writes a calibration JSON log and
         imports into the MSRSW + HDF5 databases.
+
+        Args:
+            workers: Number of processes decoding the parameters; ``1`` decodes
+                in this process (see :mod:`asamint.calibration.parallel`).
+            overlap_writers: Write the JSON log, the memory map, the MSRSW and
+                the HDF5 database concurrently, each in its own thread.
         """
-        self._load_axis_pts()
-        self._load_values()
-        self._load_asciis()
-        self._load_value_blocks()
-        self._load_curves()
-        self._load_maps()
-        self._load_cubes()
-
-        # Calibration log
+        self._load_parameters(workers)
+        self._write_outputs(overlap_writers)
+
+    def _load_parameters(self, workers: int = 1) -> None:
+        """Decode all parameters of the image into :attr:`parameters`."""
+        if workers > 1:
+            from asamint.calibration.parallel import ParallelLoader
+
+            ParallelLoader(self, workers).run()
+        else:
+            self._load_axis_pts()
+            self._load_values()
+            self._load_asciis()
+            self._load_value_blocks()
+            self._load_curves()
+            self._load_maps()
+            self._load_cubes()
+
+    def _write_outputs(self, overlap_writers: bool = False) -> None:
+        """Write the calibration log, the MSRSW + HDF5 databases and the memory map."""
+        if overlap_writers:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [pool.submit(self._write_calibration_log), pool.submit(self._write_map_file)]
+                importer = self._create_db_importer()
+                try:
+                    importer.run(pool)
+                finally:
+                    importer.close()
+                for future in futures:
+                    future.result()
+        else:
+            self._write_calibration_log()
+            importer = self._create_db_importer()
+            importer.run()
+            importer.close()
+            self._write_map_file()
+
+    def _write_calibration_log(self) -> None:
+        """Write :attr:`parameters` as JSON to the ``logs`` sub-directory."""
         calibration_log = klasses.dump_characteristics(self._parameters)
         log_path = self.asam_mc.sub_dir("logs") / self.asam_mc.generate_filename(".json")
         self.logger.info("Writing calibration log to %s", log_path)
         log_path.write_bytes(calibration_log)
 
-        # Database import
+    def _create_db_importer(self) -> Any:
+        """Create the MSRSW + HDF5 databases for :attr:`parameters`."""
         from asamint.cdf.importer import DBImporter
 
         db_name = self.asam_mc.generate_filename(None)
-        imp = DBImporter(db_name, self._parameters, self.logger)
-        imp.run()
-        imp.close()
+        return DBImporter(db_name, self._parameters, self.logger)
 
-        # Memory map file
+    def _write_map_file(self) -> None:
+        """Write the memory map of the calibration segments."""
         map_name = self.asam_mc.generate_filename(".map")
+        memory_map = getattr(self.asam_mc, "calibration_memory_index", None)
+        if not isinstance(memory_map, MemoryRangeIndex):
+            memory_map = self.asam_mc.calibration_memory_map
         mm = MapFile(
             self.asam_mc.session,
             map_name,
-            self.asam_mc.calibration_memory_map,
+            memory_map,
             self.memory_errors,
         )
         mm.run()
@@ -545,6 +623,8 @@ class CalibrationData:
             self.image,
             self._parameters,
             self.logger,
+            definitions=self.definitions,
+            layouts=self.layouts,
         )
 
     def load_characteristics(
@@ -576,6 +656,8 @@ class CalibrationData:
             self.image,
             self._parameters,
             self.logger,
+            definitions=self.definitions,
+            layouts=self.layouts,
         )
 
         # Validate the image
@@ -583,7 +665,9 @@ class CalibrationData:
             raise ValueError("Empty calibration image.")
 
         # Create the calibration API object
-        self.api = api.Calibration(self.asam_mc, self.image, self._parameters, self.logger)
+        self.api = api.Calibration(
+            self.asam_mc, self.image, self._parameters, self.logger, definitions=self.definitions, layouts=self.layouts
+        )
 
         # Process all characteristics
         self.load_hex()
@@ -966,24 +1050,7 @@ class CalibrationData:
         if hexfile_type not in ("ihex", "srec"):
             raise ValueError("'hexfile_type' must be either 'ihex' or 'srec'")
 
-        result: list[McObject] = []
-
-        for a in self.query(model.AxisPts).order_by(model.AxisPts.address).all():
-            ax = AxisPts.get(self.session, a.name)
-            result.append(McObject(ax.name, ax.address, 0, ax.total_allocated_memory, ""))
-
-        # Add all characteristics
-        characteristics = self.query(model.Characteristic).order_by(model.Characteristic.type, model.Characteristic.address).all()
-        for c in characteristics:
-            characteristic = Characteristic.get(self.session, c.name)
-            if characteristic is None:
-                self.logger.warning("Characteristic %s not found", c.name)
-                continue
-            result.append(McObject(characteristic.name, characteristic.address, 0, characteristic.total_allocated_memory, ""))
-            mem_size = characteristic.total_allocated_memory
-            result.append(McObject(characteristic.name, characteristic.address, 0, mem_size, ""))
-
-        blocks = make_continuous_blocks(result)
+        blocks = self._continuous_blocks(self.layouts.memory_objects())
 
         # Calculate total size for logging
         total_size = reduce(lambda a, s: s.length + a, blocks, 0)
@@ -1029,11 +1096,8 @@ class CalibrationData:
     def _load_values(self) -> None:
         """Load all scalar-value characteristics from the current image."""
         self.logger.info("Loading scalar value characteristics")
-        for characteristic in self.characteristics("VALUE"):
-            if characteristic is None:
-                continue
-            self.logger.debug(f"Processing VALUE '{characteristic.name}' @0x{characteristic.address:08x}")
-            self._parameters["VALUE"][characteristic.name] = self.api.load_value(characteristic.name)
+        names = [characteristic.name for characteristic in self.characteristics("VALUE") if characteristic is not None]
+        self._parameters["VALUE"].update(self.api.load_many(names))
 
     def _load_axis_pts(self) -> None:
         """Load all axis-points from the current image."""
@@ -1180,12 +1244,8 @@ class CalibrationData:
         return generate_c_structs_from_log(self.asam_mc, Path(log_path) if log_path else None, out_path, tpath)
 
     def axis_points(self) -> Generator[AxisPts, None, None]:
-        """Yield all axis-points defined in the A2L file."""
-        for a in self.query(model.AxisPts).order_by(model.AxisPts.address).all():
-            try:
-                yield AxisPts.get(self.session, a.name)
-            except (AttributeError, ValueError, KeyError) as exc:
-                self.logger.error("Error loading axis points '%s': %s", a.name, exc)
+        """Yield all axis-points defined in the A2L file (ordered by address)."""
+        yield from self.definitions.axis_pts.values()
 
     def characteristics(self, category: str) -> Generator[Characteristic, None, None]:
         """Yield all characteristics of a given *category*.
@@ -1193,13 +1253,4 @@ class CalibrationData:
         Args:
             category: ``"VALUE"``, ``"CURVE"``, ``"MAP"``, etc.
         """
-        # Query all characteristics of the specified category
-        query = self.query(model.Characteristic.name).filter(model.Characteristic.type == category)
-
-        # Yield each characteristic
-        for characteristic in query.all():
-            try:
-                yield Characteristic.get(self.session, characteristic.name)
-            except (AttributeError, ValueError, KeyError) as e:
-                self.logger.error(f"Error loading {category} '{characteristic.name}': {e}")
-                continue
+        yield from self.definitions.characteristics_of(category)
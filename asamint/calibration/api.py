@@ -28,23 +28,31 @@ __copyright__ = """
    s. FLOSS-EXCEPTION.txt
 """
 
+import bisect
 import logging
 import operator
+import threading
+import time
+import weakref
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import IntEnum
-from functools import partialmethod, reduce
+from functools import partial, reduce
 from logging import Logger
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Any, Callable, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union, cast
 
 if TYPE_CHECKING:
+    from asamint.calibration.curve_axis import NormalizedGrid
+    from asamint.calibration.definitions import DefinitionSnapshot
     from asamint.calibration.dependent import (
         DependencyEngine,
         DependencyGraph,
         EvaluationResult,
     )
+    from asamint.calibration.layout_cache import LayoutCache
 
 import numpy as np
 
@@ -63,6 +71,9 @@ from asamint.adapters.a2l import (
 )
 from asamint.adapters.objutils import Image, InvalidAddressError, Section
 from asamint.asam import AsamMC
+from asamint.asam.memory_map import MemoryRangeIndex, is_in_hex_file
+from asamint.calibration.delta_refresh import DEFAULT_BLOCK_SIZE, DEFAULT_MIN_RANGE, RefreshStats, refresh_image
+from asamint.compu import compiled_conversion
 from asamint.core import CalibrationLimits, CalibrationValue
 from asamint.core.exceptions import CalibrationError, VirtualWriteError
 from asamint.core.logging import configure_logging
@@ -76,6 +87,19 @@ ValueType = Union[float, int, bool, str, CalibrationValue]
 BOOLEAN_MAP = {"true": 1, "false": 0}
 AXES = ("x", "y", "z", "4", "5")
 _EMPTY_AXIS_POLICIES = {"warn", "ignore", "error"}
+# Byte orders ``load_many`` can express as a plain numpy dtype (no word swapping).
+_NUMPY_BYTE_ORDER = {"MSB_LAST": "<", "MSB_FIRST": ">"}
+# Conversion types whose ``int_to_physical`` is element-wise on numpy arrays.
+_VECTORISABLE_CONVERSIONS = frozenset({"IDENTICAL", "LINEAR", "RAT_FUNC"})
+
+
+class _ValuePlan(NamedTuple):
+    """Where and how :meth:`Calibration.load_many` gathers one VALUE from the image."""
+
+    name: str
+    address: int
+    dtype: np.dtype
+    bit_mask: int
 
 
 @dataclass(slots=True)
@@ -210,11 +234,11 @@ class ParameterCache:
         self.parent = parent
 
         # Initialize caches for different parameter types
-        self.curves = DictLike(partialmethod(parent.load_curve_or_map, category="CURVE", num_axes=1))
-        self.maps = DictLike(partialmethod(parent.load_curve_or_map, category="MAP", num_axes=2))
-        self.cuboids = DictLike(partialmethod(parent.load_curve_or_map, category="CUBOID", num_axes=3))
-        self.cube4s = DictLike(partialmethod(parent.load_curve_or_map, category="CUBE_4", num_axes=4))
-        self.cube5s = DictLike(partialmethod(parent.load_curve_or_map, category="CUBE_5", num_axes=5))
+        self.curves = DictLike(partial(parent.load_curve_or_map, category="CURVE", num_axes=1))
+        self.maps = DictLike(partial(parent.load_curve_or_map, category="MAP", num_axes=2))
+        self.cuboids = DictLike(partial(parent.load_curve_or_map, category="CUBOID", num_axes=3))
+        self.cube4s = DictLike(partial(parent.load_curve_or_map, category="CUBE_4", num_axes=4))
+        self.cube5s = DictLike(partial(parent.load_curve_or_map, category="CUBE_5", num_axes=5))
         self.axis_pts = DictLike(parent.load_axis_pts)
         self.values = DictLike(parent.load_value)
         self.value_dtos = DictLike(parent.load_value_dto)
@@ -276,6 +300,8 @@ class Calibration:
         empty_axis_policy: Optional[str] = None,
         preload_characteristics: Optional[Iterable[str]] = None,
         preload_axis_pts: Optional[Iterable[str]] = None,
+        definitions: Optional["DefinitionSnapshot"] = None,
+        layouts: Optional["LayoutCache"] = None,
     ) -> None:
         """Initialize the Calibration object.
 
@@ -284,6 +310,8 @@ class Calibration:
             image: Memory image containing calibration data
             parameter_cache: Cache for calibration parameters
             logger: Logger for recording operations and errors
+            definitions: Optional bulk-loaded A2L definitions used to seed the definition cache
+            layouts: Optional resolved parameter layouts (see :class:`LayoutCache`) used by :meth:`load_many`
         """
         self.image = image
         self.asam_mc = asam_mc
@@ -304,9 +332,16 @@ class Calibration:
             )
         )
         self._definition_cache: dict[tuple[str, str], Any] = {}
+        self.definitions = definitions
+        self.layouts = layouts
         self._virtual_store: dict[str, Any] = {}
         self._dep_graph: Optional["DependencyGraph"] = None
         self._dep_engine: Optional["DependencyEngine"] = None
+        self._batch_depth = 0
+        self._batch_modified: dict[str, None] = {}
+        self._grids: dict[str, "NormalizedGrid"] = {}
+        self._layout_base_addresses: dict[tuple[str, str], list[int]] = {}
+        self._suspend_recalculation = False
         self._preload_definitions()
         if preload_characteristics or preload_axis_pts:
             self.preload_selected(characteristics=preload_characteristics, axis_pts=preload_axis_pts)
@@ -690,6 +725,11 @@ class Calibration:
     def _preload_definitions(self) -> None:
         """Preload characteristic types and axis existence to reduce repeated DB hits."""
 
+        definitions = getattr(self, "definitions", None)
+        if definitions is not None:
+            definitions.seed(self._definition_cache)
+            return
+
         try:
             characteristic_rows = list(self.session.query(model.Characteristic.name, model.Characteristic.type).all())
             axis_rows = list(self.session.query(model.AxisPts.name).all())
@@ -780,9 +820,51 @@ class Calibration:
         DEPENDENT results are written back to the image; VIRTUAL results are
         cached only.  Returns a list of ``EvaluationResult`` objects.
         """
+        return self._recalculate((modified_name,))
+
+    def _recalculate(self, modified_names: Iterable[str]) -> "list[EvaluationResult]":
+        """Run one merged recalculation pass.
+
+        Write-backs of dependents do not trigger further recalculations; the
+        merged calculation order already covers the whole transitive closure.
+        """
         if not self.dependency_graph.entries:
             return []
-        return self.dependency_engine.recalculate_dependents(modified_name)
+        saved = getattr(self, "_suspend_recalculation", False)
+        self._suspend_recalculation = True
+        try:
+            return self.dependency_engine.recalculate_many(modified_names)
+        finally:
+            self._suspend_recalculation = saved
+
+    @contextmanager
+    def batch(self) -> Iterator["Calibration"]:
+        """Defer dependency recalculation until the end of the block.
+
+        Inside the block ``save_*`` calls only record the modified
+        characteristics.  On exit one merged calculation order is computed
+        and every affected dependent is evaluated and written back once,
+        no matter how many of its inputs were changed.  Batches may be
+        nested; recalculation happens when the outermost one exits.
+
+        Example::
+
+            with cal.batch():
+                for name, value in new_values.items():
+                    cal.save_value(name, value)
+        """
+        depth = getattr(self, "_batch_depth", 0)
+        if depth == 0:
+            self._batch_modified = {}
+        self._batch_depth = depth + 1
+        try:
+            yield self
+        finally:
+            self._batch_depth = depth
+            if depth == 0:
+                modified, self._batch_modified = list(self._batch_modified), {}
+                if modified:
+                    self._recalculate_modified(modified)
 
     # ------------------------------------------------------------------
     # Virtual characteristics — bulk API
@@ -819,26 +901,40 @@ class Calibration:
         return results
 
     def _trigger_recalculation(self, characteristic_name: str) -> None:
-        """Trigger recalculation of dependents after a save, if any exist."""
+        """Trigger recalculation of dependents after a save, if any exist.
+
+        Inside :meth:`batch` the name is only recorded.
+        """
+        self._invalidate_grids(characteristic_name)
+        if getattr(self, "_suspend_recalculation", False):
+            return
+        if getattr(self, "_batch_depth", 0):
+            self._batch_modified[characteristic_name] = None
+            return
+        self._recalculate_modified([characteristic_name])
+
+    def _recalculate_modified(self, modified_names: list[str]) -> None:
+        """Recalculate the dependents of *modified_names* in one pass."""
         if not getattr(self, "session", None):
             return
         try:
-            dependents = self.dependency_graph.dependents_of(characteristic_name)
+            graph = self.dependency_graph
+            dependents = {dep_name for name in modified_names for dep_name in graph.dependents_of(name)}
             if dependents:
                 # Invalidate stale virtual store entries before recalculation
                 for dep_name in dependents:
                     self._virtual_store.pop(dep_name, None)
-                results = self.recalculate_dependents(characteristic_name)
+                results = self._recalculate(modified_names)
                 if results:
                     self.logger.debug(
-                        "Recalculated %d dependent(s) after saving %r",
+                        "Recalculated %d dependent(s) after saving %s",
                         len(results),
-                        characteristic_name,
+                        repr(modified_names[0]) if len(modified_names) == 1 else f"{len(modified_names)} characteristics",
                     )
         except (CalibrationError, ValueError, TypeError, AttributeError) as exc:
             self.logger.warning(
-                "Dependency recalculation failed after saving %r: %s",
-                characteristic_name,
+                "Dependency recalculation failed after saving %s: %s",
+                ", ".join(repr(name) for name in modified_names[:5]) + (", ..." if len(modified_names) > 5 else ""),
                 exc,
             )
 
@@ -869,6 +965,35 @@ class Calibration:
 
         return lookup_normalized_map(self, characteristic_name, *raw_inputs)
 
+    def interpolate_many(self, characteristic_name: str, inputs: np.ndarray) -> np.ndarray:
+        """Interpolate a CURVE/MAP/CUBOID/CUBE_4/CUBE_5 at many operating points.
+
+        Same results as :meth:`interpolate`, but the characteristic is loaded and
+        its axes (including CURVE_AXIS normalisation curves) are prepared only
+        once; the grid is kept until the characteristic or one of its axes is saved.
+
+        Args:
+            characteristic_name: Name of the characteristic.
+            inputs: Raw physical inputs of shape ``(N, ndim)``, one column per
+                axis (x, y, z, …); shape ``(N,)`` is accepted for a CURVE.
+
+        Returns:
+            The ``N`` interpolated values.
+        """
+        from asamint.calibration.curve_axis import NormalizedGrid
+
+        grid = self._grids.get(characteristic_name)
+        if grid is None:
+            grid = self._grids[characteristic_name] = NormalizedGrid.load(self, characteristic_name)
+        return grid(inputs)
+
+    def _invalidate_grids(self, name: str) -> None:
+        """Forget the :meth:`interpolate_many` grids built from *name*."""
+        grids = getattr(self, "_grids", None)
+        if grids:
+            for stale in [key for key, grid in grids.items() if name in grid.sources]:
+                del grids[stale]
+
     def load(self, name: str) -> Any:  # noqa: C901
         """Load a calibration parameter by name.
 
@@ -915,6 +1040,150 @@ class Calibration:
 
         return result
 
+    def load_many(self, names: Iterable[str]) -> dict[str, Any]:
+        """Load many calibration parameters in one go.
+
+        Non-virtual VALUE characteristics with a plain byte order are gathered from the image section buffers in one vectorised
+        pass per section and numpy dtype, then converted per COMPU_METHOD.  Their layouts come from :attr:`layouts` if set, so
+        the characteristics are only resolved for the conversion.  All other parameters are dispatched to :meth:`load`.
+
+        Args:
+            names: Names of the parameters to load
+
+        Returns:
+            Mapping of name to the object :meth:`load` would return, in the order of *names*
+
+        Raises:
+            ValueError: If a parameter is not found
+        """
+        names = list(dict.fromkeys(names))
+        batch: list[_ValuePlan] = []
+        for name in names:
+            plan = self._batch_value_plan(name)
+            if plan is not None:
+                batch.append(plan)
+
+        loaded: dict[str, Any] = {}
+        raw_values = self._gather_values(batch)
+        resolved = {pos: self.get_characteristic(batch[pos].name, "VALUE", False) for pos in raw_values}
+        by_compu_method: dict[int, list[int]] = defaultdict(list)
+        for pos, characteristic in resolved.items():
+            by_compu_method[id(self.get_compu_method(characteristic))].append(pos)
+        for positions in by_compu_method.values():
+            characteristics = [resolved[pos] for pos in positions]
+            raws = [raw_values[pos] for pos in positions]
+            for characteristic, raw, phys in zip(characteristics, raws, self._convert_many(characteristics, raws), strict=True):
+                loaded[characteristic.name] = self._make_value(characteristic, raw, phys)
+
+        for name in names:
+            if name not in loaded:
+                loaded[name] = self.load(name)
+        return {name: loaded[name] for name in names}
+
+    def _batch_value_plan(self, name: str) -> Optional[_ValuePlan]:
+        """Read plan if *name* qualifies for the vectorised VALUE path, taken from :attr:`layouts` if it knows *name*."""
+        layout = self.layouts.get(name) if self.layouts is not None else None
+        if layout is not None:
+            if layout.category != "VALUE" or layout.virtual:
+                return None
+            address, np_dtype, bit_mask = layout.address, layout.dtype or None, layout.bit_mask
+            byte_order = self.asam_byte_order(SimpleNamespace(byteOrder=layout.byte_order or None))
+        else:
+            try:
+                if self.characteristic_category(name) != "VALUE":
+                    return None
+            except ValueError:
+                return None
+            characteristic = self.get_characteristic(name, "VALUE", False)
+            if getattr(characteristic, "virtual_characteristic", None):
+                return None
+            address, np_dtype, bit_mask = (
+                characteristic.address,
+                getattr(characteristic, "fnc_np_dtype", None),
+                characteristic.bitMask,
+            )
+            byte_order = self.asam_byte_order(characteristic)
+        prefix = _NUMPY_BYTE_ORDER.get(byte_order)
+        if prefix is None or np_dtype is None or not self._is_address_in_hex_file(address):
+            return None
+        dtype = np.dtype(np_dtype).newbyteorder(prefix)
+        if bit_mask and dtype.kind not in "iu":
+            return None
+        return _ValuePlan(name, address, dtype, bit_mask or 0)
+
+    def _gather_values(self, batch: list[_ValuePlan]) -> dict[int, Any]:
+        """Read the raw scalars of *batch* from the image, grouped by section and dtype.
+
+        Returns:
+            Raw value (Python scalar) by position in *batch*; entries not fully
+            contained in a single image section are omitted.
+        """
+        sections = sorted(self.image.sections, key=lambda sec: sec.start_address)
+        if not batch or not sections:
+            return {}
+        starts = np.array([sec.start_address for sec in sections], dtype=np.int64)
+        ends = starts + np.array([len(sec) for sec in sections], dtype=np.int64)
+        addresses = np.array([plan.address for plan in batch], dtype=np.int64)
+        section_index = np.searchsorted(starts, addresses, side="right") - 1
+
+        groups: dict[tuple[int, np.dtype], list[int]] = defaultdict(list)
+        for pos, (plan, idx) in enumerate(zip(batch, section_index.tolist(), strict=True)):
+            if idx >= 0 and addresses[pos] + plan.dtype.itemsize <= ends[idx]:
+                groups[(idx, plan.dtype)].append(pos)
+
+        result: dict[int, Any] = {}
+        for (idx, dtype), positions in groups.items():
+            buffer = np.frombuffer(sections[idx].data, dtype=np.uint8)
+            offsets = addresses[positions] - starts[idx]
+            gathered = buffer[offsets[:, np.newaxis] + np.arange(dtype.itemsize)]
+            values = np.ascontiguousarray(gathered).view(dtype).reshape(-1)
+            bit_masks = [batch[pos].bit_mask for pos in positions]
+            if any(bit_masks):
+                native = values.dtype.newbyteorder("=")
+                masks = np.array([(mask or ~0) & 0xFFFFFFFFFFFFFFFF for mask in bit_masks], dtype=np.uint64).astype(native)
+                # Right-shift to get rid of trailing zeros (s. ASAM 2-MC spec)
+                shifts = np.array([ffs(mask) if mask else 0 for mask in bit_masks], dtype=native)
+                values = (values.astype(native) & masks) >> shifts
+            result.update(zip(positions, values.tolist(), strict=True))
+        return result
+
+    def _convert_many(self, characteristics: list[Characteristic], raws: list[Any]) -> list[Any]:
+        """Convert raw values of characteristics sharing one COMPU_METHOD."""
+        compu_method = compiled_conversion(self.session, self.get_compu_method(characteristics[0]))
+        if getattr(compu_method, "conversion_type", getattr(compu_method, "conversionType", None)) in _VECTORISABLE_CONVERSIONS:
+            try:
+                return list(compu_method.int_to_physical(np.asarray(raws)))
+            except (ValueError, TypeError, ZeroDivisionError, FloatingPointError):
+                pass
+        return [self.int_to_physical(characteristic, raw) for characteristic, raw in zip(characteristics, raws, strict=True)]
+
+    def _make_value(self, characteristic: Characteristic, raw: Any, phys: Any) -> klasses.Value:
+        """Build the :class:`klasses.Value` for a non-virtual VALUE (mirrors :meth:`load_value`)."""
+        is_bool = (characteristic.bitMask in SINGLE_BITS) if characteristic.bitMask else False
+        if is_bool and characteristic.compuMethod != "NO_COMPU_METHOD":
+            if getattr(characteristic.compuMethod, "conversionType", None) != "TAB_VERB":
+                phys = "true" if bool(raw) else "false"
+        if characteristic.physUnit is None and characteristic._conversionRef != "NO_COMPU_METHOD":
+            unit = characteristic.compuMethod.unit
+        else:
+            unit = characteristic.physUnit
+        is_numeric = self.is_numeric(characteristic.compuMethod)
+        if characteristic.dependent_characteristic:
+            category = "DEPENDENT_VALUE"
+        else:
+            category = ("BOOLEAN" if is_bool else "VALUE") if is_numeric else "TEXT"
+        return klasses.Value(
+            name=characteristic.name,
+            comment=characteristic.longIdentifier,
+            category=category,
+            _raw=raw,
+            _phys=phys,
+            displayIdentifier=characteristic.displayIdentifier,
+            unit=unit,
+            is_numeric=is_numeric,
+            api=self,
+        )
+
     def save(self, name: str, value: Any) -> None:  # noqa: C901
         """Save a value to a calibration parameter.
 
@@ -1318,30 +1587,34 @@ class Calibration:
         self._trigger_recalculation(characteristic_name)
         return Status.OK
 
-    def _is_in_hex_file(self, obj: Union[Characteristic, AxisPts]) -> bool:
-        """Check if the object's address falls into a range that is in the hex file."""
+    def _memory_index(self) -> Optional[MemoryRangeIndex]:
+        """Interval index of the calibration memory map, ``None`` without one."""
         asam_mc = getattr(self, "asam_mc", None)
-        if asam_mc is None:
-            return True
+        index = getattr(asam_mc, "calibration_memory_index", None)
+        if isinstance(index, MemoryRangeIndex):
+            return index
         cal_map = getattr(asam_mc, "calibration_memory_map", None)
         if not cal_map:
-            return True
+            return None
+        cached = getattr(self, "_memory_index_cache", None)
+        if cached is None or cached[0] is not cal_map:
+            cached = (cal_map, MemoryRangeIndex(cal_map))
+            self._memory_index_cache = cached
+        return cached[1]
 
-        address = getattr(obj, "address", None)
+    def _is_in_hex_file(self, obj: Union[Characteristic, AxisPts]) -> bool:
+        """Check if the object's address falls into a range that is in the hex file."""
+        return self._is_address_in_hex_file(getattr(obj, "address", None))
+
+    def _is_address_in_hex_file(self, address: Optional[int]) -> bool:
+        """Check if *address* falls into a range that is in the hex file."""
         if address is None:
             return True
-
-        # Find the memory range for this address
-        for mr in cal_map:
-            if address in mr:
-                # PrgType CALIBRATION_VARIABLES and MemoryType RAM are NOT in the hex file
-                if mr.prg_type == inspect.PrgTypeSegment.CALIBRATION_VARIABLES and mr.memory_type == inspect.MemoryType.RAM:
-                    return False
-                # EXCLUDE_FROM_FLASH is NOT in the hex file
-                if mr.prg_type == inspect.PrgTypeSegment.EXCLUDE_FROM_FLASH:
-                    return False
-                break
-        return True
+        index = self._memory_index()
+        if index is None:
+            return True
+        mr = index.find(address)
+        return mr is None or is_in_hex_file(mr)
 
     def load_value(self, characteristic_name: str) -> klasses.Value:  # noqa: C901
         """Load a scalar value characteristic.
@@ -1844,6 +2117,7 @@ class Calibration:
             self.write_nd_array(ap, "x", component_name, int_values)
         except InvalidAddressError as exc:
             return self._address_error_status(ap.name, exc, " x-axis")
+        self._invalidate_grids(ap.name)
         return Status.OK
 
     def load_curve_or_map(  # noqa: C901
@@ -1871,11 +2145,7 @@ class Calibration:
         raw = np.array([])
 
         # Get the computation method
-        if characteristic.compuMethod != "NO_COMPU_METHOD":
-            characteristic_cm = characteristic.compuMethod.name
-        else:
-            characteristic_cm = "NO_COMPU_METHOD"
-        chr_cm = CompuMethod.get(self.session, characteristic_cm)
+        chr_cm = self.get_compu_method(characteristic)
 
         # Get function unit and data type
         fnc_unit = chr_cm.unit
@@ -1897,7 +2167,7 @@ class Calibration:
         if not in_hex:
             self.logger.debug(f"{characteristic.name!r}: Address 0x{address:08x} not in hex file (RAM or excluded). Skipping read.")
             raw = np.zeros(axes_container.shape)
-            phys = chr_cm.int_to_physical(raw)
+            phys = compiled_conversion(self.session, chr_cm).int_to_physical(raw)
         else:
             try:
                 raw = self.image.read_asam_ndarray(
@@ -1919,7 +2189,7 @@ class Calibration:
 
                 # Convert to physical values
                 try:
-                    phys = chr_cm.int_to_physical(raw)
+                    phys = compiled_conversion(self.session, chr_cm).int_to_physical(raw)
                 except (
                     ValueError,
                     TypeError,
@@ -2083,6 +2353,8 @@ class Calibration:
             )
         except InvalidAddressError as exc:
             return self._address_error_status(characteristic.name, exc)
+        if isinstance(self.parameter_cache, ParameterCache):
+            self.parameter_cache.invalidate(characteristic_name)
         self._trigger_recalculation(characteristic_name)
         return Status.OK
 
@@ -2121,8 +2393,7 @@ class Calibration:
             max_axis_points = axis_descr.maxAxisPoints
 
             # Get computation method
-            axis_cm_name = "NO_COMPU_METHOD" if axis_descr.compuMethod == "NO_COMPU_METHOD" else axis_descr.compuMethod.name
-            axis_cm = CompuMethod.get(self.session, axis_cm_name)
+            axis_cm = self.get_compu_method(axis_descr)
             axis_unit = axis_cm.unit
 
             # Get axis category
@@ -2154,7 +2425,7 @@ class Calibration:
                         raw_axis_values = raw_axis_values[:no_axis_points]
                         if reversed_storage:
                             raw_axis_values = raw_axis_values[::-1]
-                        converted_axis_values = axis_cm.int_to_physical(raw_axis_values)
+                        converted_axis_values = compiled_conversion(self.session, axis_cm).int_to_physical(raw_axis_values)
                     else:
                         raw_axis_values = np.array([])
                         converted_axis_values = np.array([])
@@ -2220,7 +2491,7 @@ class Calibration:
                         raw_axis_values = np.array([])
 
                     no_axis_points = len(raw_axis_values)
-                    converted_axis_values = axis_cm.int_to_physical(raw_axis_values)
+                    converted_axis_values = compiled_conversion(self.session, axis_cm).int_to_physical(raw_axis_values)
                     axis_pts_ref = None
 
                 case _:
@@ -2265,7 +2536,7 @@ class Calibration:
         Returns:
             Physical values
         """
-        cm = self.get_compu_method(characteristic)
+        cm = compiled_conversion(getattr(self, "session", None), self.get_compu_method(characteristic))
         try:
             return cm.int_to_physical(int_values)
         except Exception as exc:
@@ -2346,12 +2617,13 @@ class Calibration:
             The computation method
         """
         cm_name = "NO_COMPU_METHOD" if characteristic.compuMethod == "NO_COMPU_METHOD" else characteristic.compuMethod.name
+        cache = self._definition_cache_or_init()
         cache_key = ("CM", cm_name)
-        cached = self._definition_cache.get(cache_key)
+        cached = cache.get(cache_key)
         if cached is not None:
             return cached
         compu_method = CompuMethod.get(self.session, cm_name)
-        self._definition_cache[cache_key] = compu_method
+        cache[cache_key] = compu_method
         return compu_method
 
     def get_characteristic(self, characteristic_name: str, type_name: str, save: bool = False) -> Characteristic:
@@ -2504,11 +2776,17 @@ class Calibration:
         components = obj.record_layout_components
         offset = 0
 
+        # Definitions are cached, so patch relative to the A2L addresses, not to the last patch.
+        key = (type(obj).__name__, obj.name)
+        if key not in self._layout_base_addresses:
+            self._layout_base_addresses[key] = [attr.address for _, attr in components["position"]]
+
         # Process each position element
-        for name, attr in components["position"]:
+        for (name, attr), base_address in zip(components["position"], self._layout_base_addresses[key], strict=True):
+            attr.address = base_address
             # Apply offset from previous patches
             if offset:
-                aligned_address = obj.record_layout.alignment.align(attr.data_type, attr.address + offset)
+                aligned_address = obj.record_layout.alignment.align(attr.data_type, base_address + offset)
                 attr.address = aligned_address
                 self.logger.debug(
                     f"Updating RecordLayout for {obj.name!r} / {obj.record_layout.name!r}:  -> [0x{aligned_address:08x}]"
@@ -2742,15 +3020,112 @@ class Calibration:
         return compu_method == "NO_COMPU_METHOD" or compu_method.conversionType != "TAB_VERB"
 
 
+@dataclass(frozen=True, slots=True)
+class WriteBehindPolicy:
+    """Coalescing parameters of the background flusher of :class:`OnlineCalibration`.
+
+    Dirty regions are collected for at most *window* seconds after the first
+    unflushed save, or until *max_bytes* bytes are pending, and then pushed
+    to the ECU in one coalesced flush.
+    """
+
+    window: float = 0.05
+    max_bytes: int = 4096
+
+    def __post_init__(self) -> None:
+        if self.window < 0:
+            raise ValueError(f"window must not be negative, got {self.window!r}")
+        if self.max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {self.max_bytes!r}")
+
+
+@dataclass(frozen=True, slots=True)
+class FlushStats:
+    """Snapshot of the ECU write-back counters of an :class:`OnlineCalibration`.
+
+    ``regions_marked`` counts the memory regions recorded by ``save_*`` calls
+    (including recalculated dependents), ``round_trips`` the ``setMta`` +
+    ``push`` pairs actually sent by flushes and ``pending`` the regions not
+    yet pushed.  ``bytes_unchanged`` counts the dirty bytes a flush skipped
+    because they match the shadow image (only with *diff_gap*).
+    """
+
+    regions_marked: int
+    flushes: int
+    round_trips: int
+    bytes_pushed: int
+    bytes_unchanged: int
+    pending: int
+
+    @property
+    def round_trips_saved(self) -> int:
+        """Round-trips avoided compared with pushing every recorded region on its own."""
+        return max(self.regions_marked - self.round_trips - self.pending, 0)
+
+
 class OnlineCalibration(Calibration):
     """Online calibration with live XCP write-back to ECU.
 
     Extends the base ``Calibration`` with transparent ECU synchronisation:
     every ``save_*`` call writes to the local memory image **and** pushes
     the modified bytes to the ECU via XCP.
+
+    With ``write_behind=WriteBehindPolicy(...)`` the push is deferred: a
+    background thread coalesces the dirty regions of consecutive saves and
+    sends them in one flush once the policy's time window has elapsed or its
+    byte threshold is reached.  :meth:`barrier` waits until every preceding
+    save has reached the ECU, :meth:`close` (or leaving a ``with`` block)
+    stops the thread and pushes what is still pending.  Calling
+    :meth:`close` is mandatory: the thread does not keep the instance
+    alive, but regions still dirty when an unclosed instance is garbage
+    collected (or the interpreter exits) are not pushed -- a warning is
+    logged instead.  An error raised by the XCP master in the background
+    is re-raised as :class:`CalibrationError` by the next ``save_*``,
+    :meth:`flush`, :meth:`barrier` or :meth:`close` call; the regions that
+    were not sent stay dirty and are retried afterwards.
+
+    Explicit and background flushes share one lock with the image writes,
+    so the XCP master is never used from two threads at once.
+
+    By default a save marks the whole memory footprint of the
+    characteristic dirty, so changing one cell of a large map pushes the
+    entire map.  With *diff_gap* set, a shadow copy of the memory contents
+    last synchronised with the ECU is kept, and a flush pushes only the
+    bytes differing from it; changed runs separated by at most *diff_gap*
+    unchanged bytes are sent as one extent, as a round-trip costs more than
+    a few surplus bytes.  The shadow doubles the memory held for the image.
+    It is only taken from contents known to be on the ECU: the image the
+    constructor uploaded, or the image after :meth:`upload_image`,
+    :meth:`download_image` or :meth:`refresh_image`.  A caller-supplied
+    *image* is not assumed to match the ECU, so until the first of these
+    calls flushes push the whole footprint.
+
+    Example::
+
+        with OnlineCalibration(session, master, write_behind=WriteBehindPolicy(window=0.1)) as cal:
+            for name, value in new_values.items():
+                cal.save_value(name, value)
+            cal.barrier()
+            print(cal.stats.round_trips_saved)
     """
 
-    __slots__ = ("xcp_master", "_dirty_regions", "_auto_flush")
+    __slots__ = (
+        "xcp_master",
+        "_dirty_regions",
+        "_auto_flush",
+        "_write_behind",
+        "_condition",
+        "_flusher",
+        "_closing",
+        "_urgent",
+        "_flush_error",
+        "_pending_bytes",
+        "_dirty_since",
+        "_counters",
+        "_diff_gap",
+        "_shadow",
+        "_finalizer",
+    )
 
     def __init__(
         self,
@@ -2759,16 +3134,33 @@ class OnlineCalibration(Calibration):
         image: Optional[Image] = None,
         *,
         auto_flush: bool = True,
+        write_behind: Optional[WriteBehindPolicy] = None,
+        diff_gap: Optional[int] = None,
         loglevel: str = "INFO",
     ) -> None:
+        if diff_gap is not None and diff_gap < 0:
+            raise ValueError(f"diff_gap must not be negative, got {diff_gap!r}")
         self.xcp_master = xcp_master
         self._dirty_regions: list[tuple[int, int]] = []
         self._auto_flush = auto_flush
+        self._write_behind = write_behind
+        self._condition = threading.Condition(threading.RLock())
+        self._flusher: Optional[threading.Thread] = None
+        self._closing = False
+        self._urgent = False
+        self._flush_error: Optional[Exception] = None
+        self._pending_bytes = 0
+        self._dirty_since = 0.0
+        self._counters = dict.fromkeys(("regions_marked", "flushes", "round_trips", "bytes_pushed", "bytes_unchanged"), 0)
+        self._diff_gap = diff_gap
+        self._shadow: Optional[_ShadowImage] = None
+        self._finalizer: Optional[weakref.finalize] = None
 
         ctx = _build_calibration_context(asam_mc, loglevel)
 
+        uploaded = image is None
         if image is None:
-            image = _upload_parameters_xcp(ctx.session, xcp_master, ctx.logger)
+            image = _upload_parameters_xcp(ctx.session, xcp_master, ctx.logger, ctx.calibration_memory_index)
 
         if hasattr(image, "join_sections"):
             try:
@@ -2777,6 +3169,22 @@ class OnlineCalibration(Calibration):
                 ctx.logger.debug("Skipping join_sections(): %s", exc)
 
         super().__init__(ctx, image, ParameterCache(), ctx.logger)
+        if uploaded:
+            self._reset_shadow()
+
+        if write_behind is not None:
+            # The thread only holds a weak reference, so an unclosed instance can still be collected.
+            self._flusher = threading.Thread(
+                target=_run_write_behind, args=(weakref.ref(self), self._condition), name="asamint-write-behind", daemon=True
+            )
+            self._finalizer = weakref.finalize(self, _abandon_write_behind, self._condition, self._dirty_regions, self.logger)
+            self._flusher.start()
+
+    def __enter__(self) -> "OnlineCalibration":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
 
     def save_value(
         self,
@@ -2787,17 +3195,18 @@ class OnlineCalibration(Calibration):
         limitsPolicy: ExecutionPolicy = ExecutionPolicy.EXCEPT,
     ) -> Status:
         """Save a scalar value and push to ECU if *auto_flush* is enabled."""
-        status = super().save_value(
-            characteristic_name,
-            value,
-            extendedLimits=extendedLimits,
-            readOnlyPolicy=readOnlyPolicy,
-            limitsPolicy=limitsPolicy,
-        )
-        if status == Status.OK:
-            self._mark_dirty_characteristic(characteristic_name)
-            if self._auto_flush:
-                self.flush()
+        with self._condition:
+            self._raise_flush_error()
+            status = super().save_value(
+                characteristic_name,
+                value,
+                extendedLimits=extendedLimits,
+                readOnlyPolicy=readOnlyPolicy,
+                limitsPolicy=limitsPolicy,
+            )
+            if status == Status.OK:
+                self._mark_dirty_characteristic(characteristic_name)
+                self._schedule_flush()
         return status
 
     def save_value_block(
@@ -2807,15 +3216,16 @@ class OnlineCalibration(Calibration):
         readOnlyPolicy: ExecutionPolicy = ExecutionPolicy.EXCEPT,
     ) -> Status:
         """Save a value block and push to ECU if *auto_flush* is enabled."""
-        status = super().save_value_block(
-            characteristic_name,
-            values,
-            readOnlyPolicy=readOnlyPolicy,
-        )
-        if status == Status.OK:
-            self._mark_dirty_characteristic(characteristic_name)
-            if self._auto_flush:
-                self.flush()
+        with self._condition:
+            self._raise_flush_error()
+            status = super().save_value_block(
+                characteristic_name,
+                values,
+                readOnlyPolicy=readOnlyPolicy,
+            )
+            if status == Status.OK:
+                self._mark_dirty_characteristic(characteristic_name)
+                self._schedule_flush()
         return status
 
     def save_curve_or_map(
@@ -2826,26 +3236,41 @@ class OnlineCalibration(Calibration):
         raw_changed: bool = False,
     ) -> Status:
         """Save a curve/map and push to ECU if *auto_flush* is enabled."""
-        status = super().save_curve_or_map(
-            characteristic_name,
-            values,
-            readOnlyPolicy=readOnlyPolicy,
-            raw_changed=raw_changed,
-        )
-        if status == Status.OK:
-            self._mark_dirty_characteristic(characteristic_name)
-            if self._auto_flush:
-                self.flush()
+        with self._condition:
+            self._raise_flush_error()
+            status = super().save_curve_or_map(
+                characteristic_name,
+                values,
+                readOnlyPolicy=readOnlyPolicy,
+                raw_changed=raw_changed,
+            )
+            if status == Status.OK:
+                self._mark_dirty_characteristic(characteristic_name)
+                self._schedule_flush()
         return status
 
-    def _trigger_recalculation(self, characteristic_name: str) -> None:
+    def _recalculate_modified(self, modified_names: list[str]) -> None:
         """Suppress auto-flush during dependency chain; caller flushes."""
+        with self._condition:
+            saved = self._auto_flush
+            self._auto_flush = False
+            try:
+                super()._recalculate_modified(modified_names)
+            finally:
+                self._auto_flush = saved
+
+    @contextmanager
+    def batch(self) -> Iterator["OnlineCalibration"]:
+        """Like :meth:`Calibration.batch`, but push all changes to the ECU in a single flush on exit."""
         saved = self._auto_flush
         self._auto_flush = False
         try:
-            super()._trigger_recalculation(characteristic_name)
+            with super().batch():
+                yield self
         finally:
             self._auto_flush = saved
+        if saved:
+            self.flush()
 
     def _mark_dirty_characteristic(self, name: str) -> None:
         """Record a characteristic's full memory footprint as dirty."""
@@ -2853,66 +3278,252 @@ class OnlineCalibration(Calibration):
             char = self.get_characteristic(name, None, False)
             if char is None or char.virtual_characteristic:
                 return
-            self._dirty_regions.append((char.address, char.total_allocated_memory))
+            region = (char.address, char.total_allocated_memory)
         except (ValueError, AttributeError):
-            pass
+            return
+        if not self._dirty_regions:
+            self._dirty_since = time.monotonic()
+        self._dirty_regions.append(region)
+        self._pending_bytes += region[1]
+        self._counters["regions_marked"] += 1
+
+    def _schedule_flush(self) -> None:
+        """Push the dirty regions now, or hand them to the background flusher."""
+        if not self._auto_flush:
+            return
+        if self._flusher is None:
+            self.flush()
+        else:
+            self._condition.notify_all()
 
-    def flush(self) -> int:
-        """Push all dirty memory regions to the ECU."""
+    def _raise_flush_error(self) -> None:
+        """Re-raise (once) the error of a failed background flush."""
+        error, self._flush_error = self._flush_error, None
+        if error is not None:
+            self._condition.notify_all()
+            raise CalibrationError(f"Background flush to ECU failed: {error}") from error
+
+    def _push_dirty(self) -> int:
+        """Merge and push the dirty regions; the caller holds the lock.
+
+        Extents not sent because the XCP master raised stay dirty.
+        """
         if not self._dirty_regions:
             return 0
 
         regions = _merge_regions(self._dirty_regions)
-        total = 0
-        for addr, length in regions:
-            data = self.image.read(addr, length)
-            self.xcp_master.setMta(addr)
-            self.xcp_master.push(data)
-            total += length
+        self._dirty_regions.clear()
+        self._pending_bytes = 0
+        extents = self._changed_extents(regions)
+        total = sent = 0
+        try:
+            for addr, data in extents:
+                self.xcp_master.setMta(addr)
+                self.xcp_master.push(data)
+                if self._shadow is not None:
+                    self._shadow.update(addr, data)
+                total += len(data)
+                sent += 1
+        except Exception:
+            unsent = [(addr, len(data)) for addr, data in extents[sent:]]
+            self._dirty_regions[:0] = unsent
+            self._pending_bytes += sum(length for _, length in unsent)
+            raise
+        finally:
+            self._counters["round_trips"] += sent
+            self._counters["bytes_pushed"] += total
+        self._counters["flushes"] += 1
+        self._condition.notify_all()
 
         self.logger.debug(
-            "Flushed %d bytes in %d region(s) to ECU",
+            "Flushed %d bytes in %d extent(s) of %d region(s) to ECU",
             total,
+            len(extents),
             len(regions),
         )
-        self._dirty_regions.clear()
         return total
 
+    def _changed_extents(self, regions: list[tuple[int, int]]) -> list[tuple[int, bytes]]:
+        """``(address, data)`` to push for the merged dirty *regions*, diffed against the shadow if enabled."""
+        extents: list[tuple[int, bytes]] = []
+        for addr, length in regions:
+            data = bytes(self.image.read(addr, length))
+            if self._shadow is None:
+                extents.append((addr, data))
+                continue
+            changed = self._shadow.diff(addr, data, cast(int, self._diff_gap))
+            extents.extend((start, data[start - addr : start - addr + size]) for start, size in changed)
+            self._counters["bytes_unchanged"] += length - sum(size for _, size in changed)
+        return extents
+
+    def _reset_shadow(self) -> None:
+        """Take the current image as the ECU's memory contents."""
+        if self._diff_gap is not None:
+            self._shadow = _ShadowImage(self.image)
+
+    def _flusher_step(self) -> Optional[float]:
+        """One round of the write-behind thread; the caller holds the lock.
+
+        Returns:
+            Seconds to wait before the next round, ``None`` to wait for a notification
+        """
+        policy = cast(WriteBehindPolicy, self._write_behind)
+        if self._flush_error is not None or not self._dirty_regions or not self._auto_flush:
+            return None
+        remaining = self._dirty_since + policy.window - time.monotonic()
+        if not self._urgent and self._pending_bytes < policy.max_bytes and remaining > 0:
+            return remaining
+        self._urgent = False
+        try:
+            self._push_dirty()
+        except Exception as exc:
+            self.logger.error("Background flush to ECU failed: %s", exc)
+            self._flush_error = exc
+            self._condition.notify_all()
+        return 0.0
+
+    def flush(self) -> int:
+        """Push all dirty memory regions to the ECU.
+
+        Overlapping and adjacent regions are merged first, so a flush costs
+        one ``setMta`` + ``push`` round-trip per coalesced region.
+
+        Returns:
+            Number of bytes pushed
+
+        Raises:
+            CalibrationError: If a preceding background flush failed
+        """
+        with self._condition:
+            self._raise_flush_error()
+            return self._push_dirty()
+
+    def barrier(self, timeout: Optional[float] = None) -> None:
+        """Block until every preceding save has been pushed to the ECU.
+
+        With a running write-behind thread the pending regions are pushed by
+        that thread without waiting for the end of the coalescing window;
+        otherwise this is a plain :meth:`flush`.
+
+        Args:
+            timeout: Maximum number of seconds to wait; ``None`` waits indefinitely
+
+        Raises:
+            CalibrationError: If a background flush failed
+            TimeoutError: If regions are still pending after *timeout* seconds
+        """
+        with self._condition:
+            if self._flusher is None or not self._auto_flush:
+                self.flush()
+                return
+            self._urgent = True
+            self._condition.notify_all()
+            done = self._condition.wait_for(lambda: not self._dirty_regions or self._flush_error is not None, timeout)
+            self._raise_flush_error()
+            if not done:
+                raise TimeoutError(f"{len(self._dirty_regions)} dirty region(s) not pushed within {timeout} s")
+
+    def close(self) -> None:
+        """Stop the write-behind thread and push what is still pending if *auto_flush* is enabled.
+
+        Later saves push synchronously again.
+
+        Raises:
+            CalibrationError: If a background flush failed
+        """
+        flusher = self._flusher
+        if flusher is not None:
+            with self._condition:
+                self._closing = True
+                self._condition.notify_all()
+            flusher.join()
+            self._flusher = None
+            self._closing = False
+            cast(weakref.finalize, self._finalizer).detach()
+            self._finalizer = None
+        if self._auto_flush:
+            self.flush()
+        else:
+            with self._condition:
+                self._raise_flush_error()
+
+    @property
+    def stats(self) -> FlushStats:
+        """Current write-back counters."""
+        with self._condition:
+            return FlushStats(pending=len(self._dirty_regions), **self._counters)
+
     def update(self) -> None:
         """Push all pending changes to the ECU (alias for :meth:`flush`)."""
         self.flush()
 
+    def _clear_dirty(self) -> None:
+        self._dirty_regions.clear()
+        self._pending_bytes = 0
+        self._condition.notify_all()
+
     def upload_image(self) -> Image:
         """Re-upload all calibration parameters from the ECU."""
-        self.image = _upload_parameters_xcp(self.session, self.xcp_master, self.logger)
-        if hasattr(self.image, "join_sections"):
-            try:
-                self.image.join_sections()
-            except (OSError, AttributeError, ValueError):
-                pass
-        if isinstance(self.parameter_cache, ParameterCache):
-            self.parameter_cache.clear()
-        self._dirty_regions.clear()
-        self._dep_graph = None
-        self._dep_engine = None
-        return self.image
+        with self._condition:
+            self.image = _upload_parameters_xcp(self.session, self.xcp_master, self.logger, self._memory_index())
+            if hasattr(self.image, "join_sections"):
+                try:
+                    self.image.join_sections()
+                except (OSError, AttributeError, ValueError):
+                    pass
+            if isinstance(self.parameter_cache, ParameterCache):
+                self.parameter_cache.clear()
+            self._grids.clear()
+            self._clear_dirty()
+            self._reset_shadow()
+            self._dep_graph = None
+            self._dep_engine = None
+            return self.image
+
+    def refresh_image(self, *, block_size: int = DEFAULT_BLOCK_SIZE, min_range: int = DEFAULT_MIN_RANGE) -> RefreshStats:
+        """Bring the local image up to date with the ECU, pulling only ranges whose checksums differ.
+
+        Cheaper than :meth:`upload_image` after a reconnect, when the ECU
+        has changed only a few bytes: the image is compared block-wise via
+        ``BUILD_CHECKSUM``, mismatching blocks are bisected and only the
+        differing ranges are pulled and patched into the image.  As with
+        :meth:`upload_image`, pending (unflushed) changes are discarded.
+
+        Args:
+            block_size: Largest number of bytes checksummed by one ``BUILD_CHECKSUM``
+            min_range: Bisection stops at ranges of this many bytes, which are pulled
+
+        Returns:
+            Counters of the refresh, including ``bytes_saved``
+        """
+        with self._condition:
+            self._clear_dirty()
+            stats = refresh_image(self.image, self.xcp_master, block_size=block_size, min_range=min_range, logger=self.logger)
+            if stats.bytes_pulled:
+                if isinstance(self.parameter_cache, ParameterCache):
+                    self.parameter_cache.clear()
+                self._grids.clear()
+            self._reset_shadow()
+            return stats
 
     def download_image(self) -> int:
         """Push the entire local memory image to the ECU."""
-        total = 0
-        for section in self.image.sections:
-            data = bytes(section.data)
-            self.xcp_master.setMta(section.start_address)
-            self.xcp_master.push(data)
-            total += len(data)
-
-        self.logger.info(
-            "Downloaded %.2f KBytes to ECU (%d sections)",
-            total / 1024,
-            len(self.image.sections),
-        )
-        self._dirty_regions.clear()
-        return total
+        with self._condition:
+            total = 0
+            for section in self.image.sections:
+                data = bytes(section.data)
+                self.xcp_master.setMta(section.start_address)
+                self.xcp_master.push(data)
+                total += len(data)
+
+            self.logger.info(
+                "Downloaded %.2f KBytes to ECU (%d sections)",
+                total / 1024,
+                len(self.image.sections),
+            )
+            self._clear_dirty()
+            self._reset_shadow()
+            return total
 
 
 # ---------------------------------------------------------------------------
@@ -2924,6 +3535,7 @@ def _upload_parameters_xcp(
     session: Any,
     xcp_master: Any,
     logger: Logger,
+    memory_index: Optional[MemoryRangeIndex] = None,
 ) -> Image:
     """Upload all calibration parameters from ECU via XCP.
 
@@ -2935,6 +3547,7 @@ def _upload_parameters_xcp(
         session: pya2l database session
         xcp_master: XCP master instance for ECU communication
         logger: Logger for progress information
+        memory_index: Memory segments; if given, no block crosses a segment boundary
 
     Returns:
         Image containing all calibration parameter data
@@ -2968,7 +3581,7 @@ def _upload_parameters_xcp(
         raise ValueError("No calibration parameters found in A2L.")
 
     # Merge adjacent memory blocks for efficient transfer
-    blocks = make_continuous_blocks(result)
+    blocks = memory_index.continuous_blocks(result) if memory_index is not None else make_continuous_blocks(result)
 
     total_size = sum(b.length for b in blocks)
     logger.info(
@@ -3011,6 +3624,85 @@ def _merge_regions(regions: list[tuple[int, int]]) -> list[tuple[int, int]]:
     return merged
 
 
+def _run_write_behind(ref: "weakref.ReferenceType[OnlineCalibration]", condition: threading.Condition) -> None:
+    """Body of the write-behind thread of an :class:`OnlineCalibration`.
+
+    The instance is referenced only while a round runs, never while waiting,
+    so the thread ends once the instance is closed or collected.
+    """
+    with condition:
+        while True:
+            cal = ref()
+            if cal is None or cal._closing:
+                return
+            timeout = cal._flusher_step()
+            del cal
+            condition.wait(timeout)
+
+
+def _abandon_write_behind(condition: threading.Condition, dirty_regions: list[tuple[int, int]], logger: Logger) -> None:
+    """Finalizer of an :class:`OnlineCalibration` collected (or alive at exit) without :meth:`~OnlineCalibration.close`."""
+    with condition:
+        if dirty_regions:
+            logger.warning(
+                "OnlineCalibration was not closed: %d dirty region(s) (%d bytes) were not pushed to the ECU",
+                len(dirty_regions),
+                sum(length for _, length in dirty_regions),
+            )
+        condition.notify_all()
+
+
+def _changed_extents(old: np.ndarray, new: np.ndarray, gap: int) -> list[tuple[int, int]]:
+    """``(offset, length)`` runs in which the byte arrays *old* and *new* differ.
+
+    Runs separated by at most *gap* equal bytes are merged into one.
+    """
+    changed = np.flatnonzero(old != new)
+    if not changed.size:
+        return []
+    breaks = np.flatnonzero(np.diff(changed) > gap + 1)
+    starts = changed[np.r_[0, breaks + 1]]
+    ends = changed[np.r_[breaks, changed.size - 1]] + 1
+    return list(zip(starts.tolist(), (ends - starts).tolist(), strict=True))
+
+
+class _ShadowImage:
+    """Copy of the memory contents last synchronised with the ECU, one byte array per image section."""
+
+    __slots__ = ("_starts", "_blocks")
+
+    def __init__(self, image: Image) -> None:
+        sections = sorted(image.sections, key=lambda section: section.start_address)
+        self._starts = [section.start_address for section in sections]
+        self._blocks = [np.frombuffer(bytes(section.data), dtype=np.uint8).copy() for section in sections]
+
+    def _locate(self, address: int, length: int) -> Optional[np.ndarray]:
+        idx = bisect.bisect_right(self._starts, address) - 1
+        if idx < 0:
+            return None
+        offset = address - self._starts[idx]
+        block = self._blocks[idx]
+        if offset + length > block.size:
+            return None
+        return block[offset : offset + length]
+
+    def diff(self, address: int, data: bytes, gap: int) -> list[tuple[int, int]]:
+        """``(address, length)`` extents in which *data* differs from the shadow at *address*.
+
+        Memory not covered by the shadow counts as changed.
+        """
+        old = self._locate(address, len(data))
+        if old is None:
+            return [(address, len(data))]
+        return [(address + offset, length) for offset, length in _changed_extents(old, np.frombuffer(data, dtype=np.uint8), gap)]
+
+    def update(self, address: int, data: bytes) -> None:
+        """Record *data* as written to the ECU at *address*."""
+        view = self._locate(address, len(data))
+        if view is not None:
+            view[:] = np.frombuffer(data, dtype=np.uint8)
+
+
 @dataclass(frozen=True, slots=True)
 class _CalibrationContext:
     session: Any
@@ -3019,6 +3711,7 @@ class _CalibrationContext:
     logger: logging.Logger
     empty_axis_policy: str
     calibration_memory_map: list[Any] = field(default_factory=list)
+    calibration_memory_index: Optional[MemoryRangeIndex] = None
 
 
 def _resolve_empty_axis_policy(a2l_db: Any) -> str:
@@ -3067,6 +3760,9 @@ def _build_calibration_context(a2l_db: Any, loglevel: str) -> _CalibrationContex
     logger = _candidate_logger
     empty_axis_policy = _resolve_empty_axis_policy(a2l_db)
     calibration_memory_map = list(getattr(a2l_db, "calibration_memory_map", []) or [])
+    calibration_memory_index = getattr(a2l_db, "calibration_memory_index", None)
+    if not isinstance(calibration_memory_index, MemoryRangeIndex):
+        calibration_memory_index = MemoryRangeIndex(calibration_memory_map) if calibration_memory_map else None
     return _CalibrationContext(
         session=session,
         mod_common=mod_common,
@@ -3074,6 +3770,7 @@ def _build_calibration_context(a2l_db: Any, loglevel: str) -> _CalibrationContex
         logger=logger,
         empty_axis_policy=empty_axis_policy,
         calibration_memory_map=calibration_memory_map,
+        calibration_memory_index=calibration_memory_index,
     )
 
 
@@ -3095,6 +3792,8 @@ class OfflineCalibration(Calibration):
         *,
         preload_characteristics: Optional[Iterable[str]] = None,
         preload_axis_pts: Optional[Iterable[str]] = None,
+        definitions: Optional["DefinitionSnapshot"] = None,
+        layouts: Optional["LayoutCache"] = None,
     ) -> None:
         """Initialize the OfflineCalibration object.
 
@@ -3104,8 +3803,15 @@ class OfflineCalibration(Calibration):
             hexfile_name: Optional name of the hex file
             hexfile_type: Optional type of the hex file
             loglevel: Logging level
+            definitions: Optional bulk-loaded A2L definitions (see :class:`DefinitionSnapshot`)
+            layouts: Optional resolved parameter layouts; defaults to the up-to-date
+                layout cache file next to the ``.a2ldb``, if there is one
         """
+        from asamint.calibration.layout_cache import LayoutCache
+
         ctx = _build_calibration_context(a2l_db, loglevel)
+        if layouts is None:
+            layouts = LayoutCache.find(ctx.session, ctx.logger)
         if hasattr(image, "join_sections"):
             try:
                 image.join_sections()
@@ -3119,6 +3825,8 @@ class OfflineCalibration(Calibration):
             ctx.logger,
             preload_characteristics=preload_characteristics,
             preload_axis_pts=preload_axis_pts,
+            definitions=definitions,
+            layouts=layouts,
         )
         self.hexfile_name = hexfile_name
         self.hexfile_type = hexfile_type
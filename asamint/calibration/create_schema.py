@@ -24,7 +24,6 @@ HEADER = '''
 import binascii
 from collections import defaultdict
 import datetime
-import mmap
 from pathlib import Path
 import re
 import sqlite3
@@ -35,50 +34,25 @@ from decimal import Decimal
 from lxml import etree  # nosec
 import sqlalchemy as sqa
 from sqlalchemy import Column, ForeignKey, create_engine, event, orm, types
-from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import Mapped, as_declarative, relationship, backref, mapped_column
 from sqlalchemy.ext.associationproxy import association_proxy
 
+from asamint.calibration.msrsw_sqlite import (
+    CACHE_SIZE,
+    CURRENT_SCHEMA_VERSION,
+    DB_EXTENSION,
+    DEFAULT_PROFILE,
+    PAGE_SIZE,
+    PROFILES,
+    SQLiteProfile,
+    calculateCacheSize,
+    get_profile,
+    regexer,
+    set_sqlite3_pragmas,
+)
 from asamint.utils.xml import create_validator
 
-DB_EXTENSION    = ".msrswdb"
-
-CURRENT_SCHEMA_VERSION = 10
-
-CACHE_SIZE      = 4 # MB
-PAGE_SIZE       = mmap.PAGESIZE
-
-
-def calculateCacheSize(value):
-    return -(value // PAGE_SIZE)
-
-
-REGEXER_CACHE = {}
-
-
-def regexer(value, expr):
-    if not REGEXER_CACHE.get(expr):
-        REGEXER_CACHE[expr] = re.compile(expr, re.UNICODE)
-    re_expr = REGEXER_CACHE[expr]
-    return re_expr.match(value) is not None
-
-
-@event.listens_for(Engine, "connect")
-def set_sqlite3_pragmas(dbapi_connection, connection_record):
-    dbapi_connection.create_function("REGEXP", 2, regexer)
-    cursor = dbapi_connection.cursor()
-    #cursor.execute("PRAGMA jornal_mode=WAL")
-    cursor.execute("PRAGMA FOREIGN_KEYS=ON")
-    cursor.execute("PRAGMA PAGE_SIZE={}".format(PAGE_SIZE))
-    cursor.execute(
-        "PRAGMA CACHE_SIZE={}".format(calculateCacheSize(CACHE_SIZE * 1024 * 1024))
-    )
-    cursor.execute("PRAGMA SYNCHRONOUS=OFF") # FULL
-    cursor.execute("PRAGMA LOCKING_MODE=EXCLUSIVE") # NORMAL
-    cursor.execute("PRAGMA TEMP_STORE=MEMORY")  # FILE
-    cursor.close()
-
 
 @as_declarative()
 class Base:
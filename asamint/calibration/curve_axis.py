@@ -8,15 +8,20 @@ Provides:
   floating-point indices with clamping  (section B.1.4).
 - ``lookup_normalized_map``:  high-level convenience that chains
   normalisation + interpolation for a map characteristic.
+- ``interpolate_normalized_many`` / ``NormalizedGrid``:  the same for many
+  operating points at once, against a grid that is normalised only once.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Union
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import numpy as np
 
+from asamint.calibration.lookup import LookupTable
+
 if TYPE_CHECKING:
     from asamint.calibration.api import Calibration
 
@@ -79,8 +84,7 @@ def interpolate_normalized(
     3. Compute the fractional part ``frac = idx - lo``.
     4. Linearly interpolate between the two adjacent slices.
 
-    Dimensions are processed from the **last** to the **first** so that
-    the first index corresponds to columns (X) and the second to rows (Y),
+    The first index corresponds to columns (X) and the second to rows (Y),
     matching the Appendix B convention.
 
     Parameters
@@ -101,35 +105,41 @@ def interpolate_normalized(
     if len(indices) != values.ndim:
         raise ValueError(f"Expected {values.ndim} indices for a {values.ndim}-D map, got {len(indices)}.")
 
-    # Reverse indices: ASAM axis order [x, y, z, …] → numpy dim order
-    # [outermost … rows, cols].  Processing from last dim to first ensures
-    # that remaining dimension indices stay valid after each reduction.
-    dim_indices = list(reversed(indices))
+    return float(interpolate_normalized_many(values, [indices])[0])
 
-    for dim in reversed(range(len(dim_indices))):
-        idx = dim_indices[dim]
-        size = values.shape[dim]
 
-        # Clamp (B.1.4)
-        idx = max(0.0, min(idx, size - 1.0))
+def interpolate_normalized_many(
+    map_values: np.ndarray,
+    indices: np.ndarray,
+) -> np.ndarray:
+    """Vectorised :func:`interpolate_normalized` for many operating points.
 
-        lo = int(idx)
-        hi = lo + 1
-        if hi >= size:
-            hi = size - 1
-            lo = hi
+    Clamping and per-dimension linear interpolation follow B.1.4; the
+    result is the multilinear blend of the ``2**ndim`` surrounding grid
+    points (see :class:`~asamint.calibration.lookup.LookupTable`), computed
+    for all operating points at once.
 
-        frac = idx - lo
+    Parameters
+    ----------
+    map_values : np.ndarray
+        The map's function values, as for ``interpolate_normalized``.
+    indices : np.ndarray
+        Floating-point indices of shape ``(N, ndim)``, each row ordered
+        ``[x, y, z, …]``.
 
-        # Build slice objects for lo and hi along this dimension
-        slices_lo: list[Union[int, slice]] = [slice(None)] * values.ndim
-        slices_hi: list[Union[int, slice]] = [slice(None)] * values.ndim
-        slices_lo[dim] = lo
-        slices_hi[dim] = hi
+    Returns
+    -------
+    np.ndarray
+        The ``N`` interpolated values.
+    """
+    values = np.asarray(map_values, dtype=np.float64)
+    indices = np.asarray(indices, dtype=np.float64)
 
-        values = values[tuple(slices_lo)] * (1.0 - frac) + values[tuple(slices_hi)] * frac
+    if indices.ndim != 2 or indices.shape[1] != values.ndim:
+        raise ValueError(f"Expected indices of shape (N, {values.ndim}) for a {values.ndim}-D map, got {indices.shape}.")
 
-    return float(values)
+    # ASAM axis order [x, y, z, …] runs opposite to numpy's [… rows, cols].
+    return LookupTable(values).interpolate_indices(indices[:, ::-1])
 
 
 # ---------------------------------------------------------------------------
@@ -150,7 +160,8 @@ def lookup_normalized_map(
        through the referenced curve.
     3. For non-CURVE_AXIS axes (STD_AXIS, COM_AXIS, FIX_AXIS), use
        ``numpy.interp`` to convert the raw input to a floating-point index.
-    4. Interpolate the map function values using the float indices.
+    4. Interpolate the map function values using the float indices; as in
+       the loaded parameter, dimension ``i`` of the values belongs to axis ``i``.
 
     Parameters
     ----------
@@ -181,29 +192,77 @@ def lookup_normalized_map(
     if len(raw_inputs) != num_axes:
         raise ValueError(f"{characteristic_name!r} has {num_axes} axis/axes, but {len(raw_inputs)} input(s) were given.")
 
-    # Load the characteristic (populates axes and function values)
-    obj = calibration.load_curve_or_map(characteristic_name, chr_type, num_axes)
-
-    # Build floating-point indices for each axis
-    float_indices: list[float] = []
-    for axis_idx, axis in enumerate(obj.axes):
-        inp = raw_inputs[axis_idx]
-
-        if axis.category == "CURVE_AXIS" and axis.axis_pts_ref:
-            # Normalise through the referenced curve
-            ref_curve = calibration.parameter_cache["CURVE"][axis.axis_pts_ref]
-            curve_x = np.asarray(ref_curve.axes[0].phys, dtype=np.float64)
-            curve_y = np.asarray(ref_curve.phys, dtype=np.float64)
-            float_indices.append(normalize_axis_input(curve_x, curve_y, inp))
-        else:
-            # For STD_AXIS / COM_AXIS / FIX_AXIS: convert raw input to a
-            # floating-point index via interpolation against the axis values.
-            axis_vals = np.asarray(axis.phys, dtype=np.float64)
-            size = len(axis_vals)
-            if size < 2:
-                float_indices.append(0.0)
-            else:
-                index_array = np.arange(size, dtype=np.float64)
-                float_indices.append(float(np.interp(inp, axis_vals, index_array)))
+    return float(NormalizedGrid.load(calibration, characteristic_name)([raw_inputs])[0])
+
+
+@dataclass(frozen=True)
+class NormalizedGrid:
+    """A loaded CURVE / MAP / CUBOID / CUBE_4 / CUBE_5, ready for repeated lookups.
+
+    Every axis is stored as an ``(xp, fp)`` pair for ``numpy.interp`` that
+    maps raw inputs straight to floating-point indices: the referenced
+    normalisation curve for CURVE_AXIS axes, ``(axis values, 0 … size-1)``
+    otherwise.
 
-    return interpolate_normalized(np.asarray(obj.phys), float_indices)
+    Attributes
+    ----------
+    name : str
+        Name of the characteristic.
+    table : LookupTable
+        The function values, indexed by floating-point indices.
+    axes : tuple
+        One ``(xp, fp)`` pair per axis, in axis order (x, y, z, …).
+    sources : frozenset[str]
+        The characteristic and every AXIS_PTS / CURVE the grid was built from.
+    """
+
+    name: str
+    table: LookupTable
+    axes: tuple[tuple[np.ndarray, np.ndarray], ...]
+    sources: frozenset[str]
+
+    @classmethod
+    def load(cls, calibration: "Calibration", characteristic_name: str) -> "NormalizedGrid":
+        """Load *characteristic_name* and normalise its axes.
+
+        Raises
+        ------
+        ValueError
+            If the characteristic is not a CURVE / MAP / CUBOID / CUBE_4 / CUBE_5.
+        """
+        chr_type = calibration.characteristic_category(characteristic_name)
+        num_axes = {"CURVE": 1, "MAP": 2, "CUBOID": 3, "CUBE_4": 4, "CUBE_5": 5}.get(chr_type)
+        if num_axes is None:
+            raise ValueError(
+                f"interpolate_many() requires a CURVE/MAP/CUBOID/CUBE_4/CUBE_5, got {chr_type!r} for {characteristic_name!r}."
+            )
+        obj = calibration.load_curve_or_map(characteristic_name, chr_type, num_axes)
+
+        axes = []
+        sources = {characteristic_name}
+        for axis in obj.axes:
+            if axis.axis_pts_ref:
+                sources.add(axis.axis_pts_ref)
+            if axis.category == "CURVE_AXIS" and axis.axis_pts_ref:
+                ref_curve = calibration.parameter_cache["CURVE"][axis.axis_pts_ref]
+                axes.append((np.asarray(ref_curve.axes[0].phys, dtype=np.float64), np.asarray(ref_curve.phys, dtype=np.float64)))
+            else:
+                axis_vals = np.asarray(axis.phys, dtype=np.float64)
+                if len(axis_vals) < 2:
+                    axes.append((np.zeros(1), np.zeros(1)))
+                else:
+                    axes.append((axis_vals, np.arange(len(axis_vals), dtype=np.float64)))
+        return cls(characteristic_name, LookupTable(obj.phys), tuple(axes), frozenset(sources))
+
+    def indices(self, inputs: np.ndarray) -> np.ndarray:
+        """Floating-point indices of shape ``(N, ndim)`` for raw *inputs* of shape ``(N, ndim)``."""
+        inputs = np.asarray(inputs, dtype=np.float64)
+        if inputs.ndim == 1 and len(self.axes) == 1:
+            inputs = inputs[:, np.newaxis]
+        if inputs.ndim != 2 or inputs.shape[1] != len(self.axes):
+            raise ValueError(f"{self.name!r} has {len(self.axes)} axis/axes, but inputs of shape {inputs.shape} were given.")
+        return np.column_stack([np.interp(inputs[:, idx], xp, fp) for idx, (xp, fp) in enumerate(self.axes)])
+
+    def __call__(self, inputs: np.ndarray) -> np.ndarray:
+        """Interpolate at all operating points in *inputs* (shape ``(N, ndim)``; ``(N,)`` for a CURVE)."""
+        return self.table.interpolate_indices(self.indices(inputs))
@@ -0,0 +1,147 @@
+"""
+Bulk A2L definition snapshot for calibration loading.
+
+Resolving parameters one at a time via ``Characteristic.get`` costs a couple
+of dozen lazy SQLAlchemy round-trips per name, which dominates
+``CalibrationData.load_hex()`` on large A2L files.  This module loads every
+CHARACTERISTIC, AXIS_PTS, RECORD_LAYOUT and COMPU_METHOD row with a fixed
+number of ``selectin`` queries per table and indexes the resulting pya2l
+inspect objects by name.
+
+Provides:
+- ``DefinitionSnapshot``: name-indexed characteristics / axis points /
+  compu methods / record layouts, plus per-category name lists.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import selectinload
+
+from asamint.adapters.a2l import AxisPts, Characteristic, CompuMethod, inspect, model
+
+logger = logging.getLogger(__name__)
+
+# Relationships that must never be eager-loaded: ``module`` is a back-reference
+# whose own ``selectin`` relationships would pull in the complete A2L module.
+_SKIPPED_RELATIONSHIPS = frozenset({"module", "characteristic", "typedef_characteristic"})
+
+
+def _eager_options(entity: Any) -> list[Any]:
+    """``selectinload`` options for all direct relationships of *entity*."""
+    return [
+        selectinload(getattr(entity, rel.key))
+        for rel in sa_inspect(entity).relationships
+        if rel.key not in _SKIPPED_RELATIONSHIPS and rel.mapper.class_ is not model.Module
+    ]
+
+
+def _characteristic_options() -> list[Any]:
+    """Eager-load CHARACTERISTIC rows including their AXIS_DESCRs."""
+    axis_descr = selectinload(model.Characteristic.axis_descr)
+    nested = [
+        axis_descr.selectinload(getattr(model.AxisDescr, rel.key))
+        for rel in sa_inspect(model.AxisDescr).relationships
+        if rel.key not in _SKIPPED_RELATIONSHIPS and rel.mapper.class_ is not model.Module
+    ]
+    return [*_eager_options(model.Characteristic), *nested]
+
+
+@dataclass(slots=True)
+class DefinitionSnapshot:
+    """Name-indexed, in-memory view of the calibration-relevant A2L definitions.
+
+    Attributes:
+        characteristics: CHARACTERISTIC inspect objects by name.
+        axis_pts: AXIS_PTS inspect objects by name (ordered by address).
+        compu_methods: COMPU_METHOD inspect objects by name.
+        record_layouts: RECORD_LAYOUT inspect objects by name.
+        types: CHARACTERISTIC type (``"VALUE"``, ``"MAP"``, ...) by name.
+    """
+
+    characteristics: dict[str, Characteristic] = field(default_factory=dict)
+    axis_pts: dict[str, AxisPts] = field(default_factory=dict)
+    compu_methods: dict[str, CompuMethod] = field(default_factory=dict)
+    record_layouts: dict[str, Any] = field(default_factory=dict)
+    types: dict[str, str] = field(default_factory=dict)
+    _by_category: dict[str, list[str]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def load(cls, session: Any, log: Optional[logging.Logger] = None) -> DefinitionSnapshot:
+        """Load all calibration definitions from *session* in bulk.
+
+        COMPU_METHODs and RECORD_LAYOUTs are resolved first so that the
+        pya2l session cache already holds them when the characteristics and
+        axis points are constructed.
+
+        Args:
+            session: pya2l database session.
+            log: Logger for skipped definitions; defaults to the module logger.
+
+        Returns:
+            A populated :class:`DefinitionSnapshot`.
+        """
+        log = log or logger
+        snapshot = cls()
+
+        for row in session.query(model.CompuMethod).options(*_eager_options(model.CompuMethod)).all():
+            cm = CompuMethod.get(session, row.name)
+            if cm is not None:
+                snapshot.compu_methods[row.name] = cm
+
+        for row in session.query(model.RecordLayout).options(*_eager_options(model.RecordLayout)).all():
+            layout = inspect.RecordLayout.get(session, row.name, db_instance=row)
+            if layout is not None:
+                snapshot.record_layouts[row.name] = layout
+
+        axis_rows = session.query(model.AxisPts).options(*_eager_options(model.AxisPts)).order_by(model.AxisPts.address).all()
+        for row in axis_rows:
+            ap = AxisPts.get(session, row.name, db_instance=row)
+            if ap is None:
+                log.error("Error loading axis points '%s'", row.name)
+                continue
+            snapshot.axis_pts[row.name] = ap
+
+        for row in session.query(model.Characteristic).options(*_characteristic_options()).all():
+            characteristic = Characteristic.get(session, row.name, db_instance=row)
+            if characteristic is None:
+                log.error("Error loading %s '%s'", row.type, row.name)
+                continue
+            snapshot.characteristics[row.name] = characteristic
+            snapshot.types[row.name] = row.type
+            snapshot._by_category.setdefault(row.type, []).append(row.name)
+
+        log.debug(
+            "Loaded A2L definition snapshot: %d characteristics, %d axis points, %d compu methods, %d record layouts",
+            len(snapshot.characteristics),
+            len(snapshot.axis_pts),
+            len(snapshot.compu_methods),
+            len(snapshot.record_layouts),
+        )
+        return snapshot
+
+    def names(self, category: str) -> list[str]:
+        """Names of all characteristics of *category*, in A2L order."""
+        return list(self._by_category.get(category, ()))
+
+    def characteristics_of(self, category: str) -> list[Characteristic]:
+        """All characteristics of *category*, in A2L order."""
+        return [self.characteristics[name] for name in self._by_category.get(category, ())]
+
+    def seed(self, cache: dict[tuple[str, str], Any]) -> None:
+        """Populate a ``Calibration._definition_cache`` from this snapshot."""
+        for name, characteristic in self.characteristics.items():
+            cache[("CHAR", name)] = characteristic
+            cache[("TYPE", name)] = characteristic.type
+        for name, ap in self.axis_pts.items():
+            cache[("AXIS", name)] = ap
+            cache[("AXIS_EXISTS", name)] = True
+        for name, cm in self.compu_methods.items():
+            cache[("CM", name)] = cm
+
+    def __len__(self) -> int:
+        return len(self.characteristics) + len(self.axis_pts)
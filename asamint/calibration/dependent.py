@@ -11,9 +11,11 @@ Provides:
 
 from __future__ import annotations
 
+import ast
 import logging
 import re
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any, Optional, Union
@@ -21,6 +23,7 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 import numpy as np
 
 from asamint.adapters.a2l import Characteristic, CompuMethod, Formula, model
+from asamint.calibration.lookup import LookupTable
 from asamint.core.exceptions import CalibrationError
 
 if TYPE_CHECKING:
@@ -81,12 +84,14 @@ class DependencyGraph:
     """Directed acyclic graph of dependent/virtual characteristics.
 
     Build once per A2L session; query to get the recalculation order
-    when an input characteristic is modified.
+    when one or more input characteristics are modified.
     """
 
     entries: dict[str, DependencyEntry] = field(default_factory=dict)
     # input_name → list of dependent_names that reference it
     reverse_map: dict[str, list[str]] = field(default_factory=lambda: defaultdict(list))
+    # dependent_name → level (longest input chain), computed on first use
+    _levels: Optional[dict[str, int]] = field(default=None, init=False, repr=False, compare=False)
 
     # ------------------------------------------------------------------
     # Construction
@@ -147,6 +152,18 @@ class DependencyGraph:
         """Return the direct dependents of *input_name*."""
         return list(self.reverse_map.get(input_name, []))
 
+    @property
+    def levels(self) -> dict[str, int]:
+        """Level index of all entries.
+
+        Entries whose inputs are all plain characteristics have level 0; every
+        other entry sits one level above its highest dependent input.  Sorting
+        by level is therefore a valid topological order.
+        """
+        if self._levels is None:
+            self._levels = self._compute_levels()
+        return self._levels
+
     def calculation_order(self, modified_name: str) -> list[DependencyEntry]:
         """Return a topologically sorted list of entries that must be
         recalculated when *modified_name* changes.
@@ -154,17 +171,26 @@ class DependencyGraph:
         The order guarantees that every entry appears after all its inputs
         have been recalculated.
         """
-        affected = self._collect_affected(modified_name)
+        return self.calculation_order_many((modified_name,))
+
+    def calculation_order_many(self, modified_names: Iterable[str]) -> list[DependencyEntry]:
+        """Merged calculation order for several modified characteristics.
+
+        Every affected entry appears exactly once, after all of its inputs.
+        """
+        affected = self._collect_affected(*modified_names)
         if not affected:
             return []
         return self._topological_sort(affected)
 
-    def _collect_affected(self, modified_name: str) -> set[str]:
+    def _collect_affected(self, *modified_names: str) -> set[str]:
         """BFS to collect all transitively affected dependent names."""
         affected: set[str] = set()
-        queue = list(self.reverse_map.get(modified_name, []))
+        queue: deque[str] = deque()
+        for modified_name in modified_names:
+            queue.extend(self.reverse_map.get(modified_name, []))
         while queue:
-            name = queue.pop(0)
+            name = queue.popleft()
             if name in affected:
                 continue
             affected.add(name)
@@ -172,30 +198,39 @@ class DependencyGraph:
         return affected
 
     def _topological_sort(self, affected: set[str]) -> list[DependencyEntry]:
-        """Kahn's algorithm restricted to *affected* nodes."""
-        in_degree: dict[str, int] = dict.fromkeys(affected, 0)
-        for name in affected:
-            for inp in self.entries[name].input_names:
-                if inp in affected:
-                    in_degree[name] += 1
-
-        ready = sorted(n for n, d in in_degree.items() if d == 0)
-        result: list[DependencyEntry] = []
-        while ready:
-            name = ready.pop(0)
-            result.append(self.entries[name])
-            for dep_name in self.reverse_map.get(name, []):
-                if dep_name in in_degree:
-                    in_degree[dep_name] -= 1
-                    if in_degree[dep_name] == 0:
-                        ready.append(dep_name)
-                        ready.sort()
-        return result
+        """Order *affected* nodes by (level, name) using the precomputed level index."""
+        levels = self.levels
+        return [self.entries[name] for name in sorted(affected, key=lambda name: (levels[name], name))]
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _compute_levels(self) -> dict[str, int]:
+        """Longest-path level of every entry (iterative DFS, inputs first)."""
+        levels: dict[str, int] = {}
+        for root in self.entries:
+            if root in levels:
+                continue
+            stack = [root]
+            visiting = {root}
+            while stack:
+                name = stack[-1]
+                pending = next((inp for inp in self.entries[name].input_names if inp in self.entries and inp not in levels), None)
+                if pending is not None:
+                    if pending in visiting:
+                        raise CalibrationError(f"Circular dependency detected involving {pending!r}")
+                    visiting.add(pending)
+                    stack.append(pending)
+                    continue
+                stack.pop()
+                visiting.discard(name)
+                levels[name] = 1 + max(
+                    (levels[inp] for inp in self.entries[name].input_names if inp in self.entries),
+                    default=-1,
+                )
+        return levels
+
     def _detect_cycles(self) -> None:
         """Raise ``CalibrationError`` if the graph contains a cycle."""
         WHITE, GRAY, BLACK = 0, 1, 2
@@ -413,45 +448,6 @@ def _eval_max(values: np.ndarray) -> float:
     return float(np.max(values))
 
 
-def _eval_interp_1d(
-    axis_values: np.ndarray,
-    fnc_values: np.ndarray,
-    position: float,
-) -> float:
-    """G.1.8.3 — 1-D interpolation (CURVE)."""
-    return float(np.interp(position, axis_values, fnc_values))
-
-
-def _eval_interp_nd(
-    axes: list[np.ndarray],
-    fnc_values: np.ndarray,
-    positions: list[float],
-) -> float:
-    """G.1.8.3 — N-D interpolation (MAP, CUBOID, …).
-
-    Uses successive 1-D interpolations along each axis (multilinear).
-    """
-    result = fnc_values.astype(float)
-    # Interpolate from the last axis to the first
-    for dim in reversed(range(len(axes))):
-        axis = axes[dim]
-        pos = positions[dim]
-        # Clamp
-        pos = np.clip(pos, axis[0], axis[-1])
-        # Find bracketing indices
-        idx = np.searchsorted(axis, pos, side="right") - 1
-        idx = np.clip(idx, 0, len(axis) - 2)
-        lo, hi = axis[idx], axis[idx + 1]
-        frac = (pos - lo) / (hi - lo) if hi != lo else 0.0
-        # Interpolate along this dimension
-        slices_lo = [slice(None)] * result.ndim
-        slices_hi = [slice(None)] * result.ndim
-        slices_lo[dim] = idx
-        slices_hi[dim] = idx + 1
-        result = result[tuple(slices_lo)] * (1.0 - frac) + result[tuple(slices_hi)] * frac
-    return float(result)
-
-
 # ---------------------------------------------------------------------------
 # Formula evaluation helpers
 # ---------------------------------------------------------------------------
@@ -482,6 +478,201 @@ def _detect_special_function(formula: str) -> Optional[tuple[str, str, list[floa
     return None
 
 
+# Functions available in formulas (numexpr names → numpy ufuncs)
+_FORMULA_FUNCTIONS: dict[str, Any] = {
+    name: getattr(np, name)
+    for name in (
+        "sin",
+        "cos",
+        "tan",
+        "arcsin",
+        "arccos",
+        "arctan",
+        "arctan2",
+        "sinh",
+        "cosh",
+        "tanh",
+        "arcsinh",
+        "arccosh",
+        "arctanh",
+        "exp",
+        "expm1",
+        "log",
+        "log10",
+        "log1p",
+        "sqrt",
+        "floor",
+        "ceil",
+        "where",
+    )
+}
+
+
+def _float_result(func: Any) -> Any:
+    """Wrap *func* to compute in float64, as numexpr does for integer operands."""
+
+    def evaluate(values: Any) -> Any:
+        return func(np.asarray(values, dtype=np.float64))
+
+    return evaluate
+
+
+for _name in ("floor", "ceil"):
+    _FORMULA_FUNCTIONS[_name] = _float_result(_FORMULA_FUNCTIONS[_name])
+_FORMULA_FUNCTIONS["abs"] = _float_result(np.abs)
+
+# Operand types numexpr computes in (it has no 8/16 bit or unsigned integer types)
+_NUMEXPR_CASTS: dict[np.dtype, np.dtype] = {
+    np.dtype(src): np.dtype(dst)
+    for src, dst in (
+        (np.int8, np.int32),
+        (np.int16, np.int32),
+        (np.uint8, np.int32),
+        (np.uint16, np.int32),
+        (np.uint32, np.int64),
+        (np.uint64, np.int64),
+        (np.float16, np.float32),
+    )
+}
+
+
+def _numexpr_operand(value: Any) -> np.ndarray:
+    """*value* as a numpy array of the type numexpr would compute it in."""
+    array = np.asarray(value)
+    cast = _NUMEXPR_CASTS.get(array.dtype)
+    return array if cast is None else array.astype(cast)
+
+
+_FORMULA_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Mod,
+    ast.Pow,
+    ast.LShift,
+    ast.RShift,
+    ast.BitAnd,
+    ast.BitOr,
+    ast.BitXor,
+    ast.Invert,
+    ast.UAdd,
+    ast.USub,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+)
+
+
+class CompiledFormula:
+    """A dependency formula compiled once into a vectorised Python function.
+
+    pya2l normalises the formula text (operator spellings, ``pow()``, hex
+    literals and ``sysc()`` substitution).  The resulting expression is parsed,
+    checked against the arithmetic subset numexpr understands and compiled to
+    a function of ``X1 … Xn`` with the system constants bound as globals, so
+    calling it costs no parsing at all.  Scalars and numpy arrays are
+    accepted alike.
+
+    Expressions outside that subset, and evaluations that raise, are handed
+    to pya2l's numexpr interpreter, so results and error behaviour match
+    ``Formula.int_to_physical``.  To keep numexpr semantics, inputs are cast
+    to numexpr's operand types (8/16 bit and unsigned integers are widened)
+    and evaluated as numpy values, so integers raised to negative integer
+    powers raise and fall back; ``abs``, ``floor`` and ``ceil`` return
+    floats; chained comparisons such as ``1 < X1 < 3``, which numexpr
+    rejects, are not compiled.
+
+    One difference remains: numexpr evaluates float literals in double
+    precision, so ``float32`` inputs combined with a literal give ``float64``
+    there but stay ``float32`` here.
+    """
+
+    __slots__ = ("expression", "_func", "_interpreter")
+
+    def __init__(self, formula: str, num_inputs: int, system_constants: Optional[dict[str, Any]] = None) -> None:
+        self._interpreter = Formula(formula=formula, system_constants=system_constants or {})
+        self.expression: str = self._interpreter.formula
+        self._func = _compile_expression(self.expression, num_inputs, system_constants or {})
+
+    @property
+    def compiled(self) -> bool:
+        """``True`` unless the formula is evaluated by the numexpr fallback."""
+        return self._func is not None
+
+    def __call__(self, *args: Any) -> Any:
+        if self._func is not None:
+            try:
+                with np.errstate(all="ignore"):
+                    result = self._func(*map(_numexpr_operand, args))
+            except Exception:  # noqa: BLE001 - numexpr reports the failure
+                return self._interpreter.int_to_physical(*args)
+            if isinstance(result, (np.ndarray, np.generic)) and result.ndim == 0:
+                return result.item()
+            return result
+        return self._interpreter.int_to_physical(*args)
+
+
+def _compile_expression(expression: str, num_inputs: int, system_constants: dict[str, Any]) -> Optional[Any]:  # noqa: C901
+    """Compile a normalised formula to ``lambda X1, …, Xn: <expression>``; ``None`` if unsupported."""
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError:
+        return None
+    params = [f"X{idx}" for idx in range(1, num_inputs + 1)]
+    constants = {name: value for name, value in system_constants.items() if name.isidentifier()}
+    known = set(params) | set(constants) | set(_FORMULA_FUNCTIONS)
+    for node in ast.walk(tree):
+        if not isinstance(node, _FORMULA_NODES):
+            return None
+        if isinstance(node, ast.Name):
+            if node.id == "X" and num_inputs == 1:
+                node.id = "X1"
+            elif node.id not in known:
+                return None
+        elif isinstance(node, ast.Compare) and len(node.ops) > 1:
+            return None
+        elif isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in _FORMULA_FUNCTIONS or node.keywords:
+                return None
+        elif isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            return None
+    lambda_ = ast.Expression(
+        body=ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg=name) for name in params],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=tree.body,
+        )
+    )
+    ast.fix_missing_locations(lambda_)
+    namespace: dict[str, Any] = {"__builtins__": {}, **_FORMULA_FUNCTIONS, **constants}
+    return eval(compile(lambda_, "<formula>", "eval"), namespace)  # noqa: S307 - whitelisted AST
+
+
+@dataclass(frozen=True)
+class _Program:
+    """Cached evaluation plan of one dependency entry."""
+
+    special: Optional[tuple[str, str, list[float]]]
+    formula: Optional[CompiledFormula]
+
+
 # ---------------------------------------------------------------------------
 # DependencyEngine
 # ---------------------------------------------------------------------------
@@ -506,6 +697,10 @@ class DependencyEngine:
     def __init__(self, calibration: Calibration, graph: DependencyGraph) -> None:
         self._cal = calibration
         self._graph = graph
+        # entry name → special function / compiled formula, built on first evaluation
+        self._programs: dict[str, _Program] = {}
+        # input name → (loaded parameter, lookup table) for interp(); rebuilt when the parameter is reloaded
+        self._tables: dict[str, tuple[Any, LookupTable]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -513,11 +708,29 @@ class DependencyEngine:
 
     def evaluate(self, entry: DependencyEntry) -> EvaluationResult:
         """Evaluate a single dependency entry and return the physical result."""
-        special = _detect_special_function(entry.formula)
-        if special is not None:
-            return self._evaluate_special(entry, *special)
+        program = self._program(entry)
+        if program.special is not None:
+            return self._evaluate_special(entry, *program.special)
         return self._evaluate_formula(entry)
 
+    def clear_compiled(self) -> None:
+        """Forget all compiled formulas, e.g. after system constants changed."""
+        self._programs.clear()
+
+    def _program(self, entry: DependencyEntry) -> _Program:
+        """Return the cached evaluation plan of *entry*, building it on first use."""
+        program = self._programs.get(entry.name)
+        if program is None:
+            special = _detect_special_function(entry.formula)
+            formula = None
+            if special is None:
+                system_constants = {}
+                if self._cal.mod_par is not None:
+                    system_constants = self._cal.mod_par.systemConstants
+                formula = CompiledFormula(entry.formula, len(entry.input_names), system_constants)
+            program = self._programs[entry.name] = _Program(special, formula)
+        return program
+
     def recalculate_dependents(self, modified_name: str) -> list[EvaluationResult]:
         """Recalculate all characteristics affected by a change to *modified_name*.
 
@@ -526,7 +739,18 @@ class DependencyEngine:
 
         Returns the list of evaluation results in calculation order.
         """
-        order = self._graph.calculation_order(modified_name)
+        return self.recalculate_many((modified_name,))
+
+    def recalculate_many(self, modified_names: Iterable[str]) -> list[EvaluationResult]:
+        """Recalculate everything affected by a change to any of *modified_names*.
+
+        The affected entries are merged into one calculation order, so a
+        dependent shared by several modified inputs is evaluated (and written
+        back) only once.
+
+        Returns the list of evaluation results in calculation order.
+        """
+        order = self._graph.calculation_order_many(modified_names)
         if not order:
             return []
 
@@ -554,13 +778,7 @@ class DependencyEngine:
     def _evaluate_formula(self, entry: DependencyEntry) -> EvaluationResult:
         """Evaluate a standard arithmetic formula."""
         input_values = self._load_input_values(entry)
-
-        system_constants = {}
-        if self._cal.mod_par is not None:
-            system_constants = self._cal.mod_par.systemConstants
-
-        fx = Formula(formula=entry.formula, system_constants=system_constants)
-        result = fx.int_to_physical(*input_values)
+        result = self._program(entry).formula(*input_values)
 
         # Coerce result type for VALUE dependents (always scalar)
         if entry.dependent_type == "VALUE" and isinstance(result, np.ndarray):
@@ -580,20 +798,13 @@ class DependencyEngine:
         extra_args: list[float],
     ) -> EvaluationResult:
         """Evaluate a special function (min, max, interp)."""
-        values, axes = self._load_input_array(param_name)
-
-        if func_name == "min":
-            result = _eval_min(values)
+        if func_name == "interp":
+            table = self._lookup_table(param_name)
+            result = table.evaluate(extra_args[: table.ndim])
+        elif func_name == "min":
+            result = _eval_min(self._load_input_array(param_name)[0])
         elif func_name == "max":
-            result = _eval_max(values)
-        elif func_name == "interp":
-            if axes is not None and len(axes) >= 1:
-                if len(axes) == 1:
-                    result = _eval_interp_1d(axes[0], values.ravel(), extra_args[0])
-                else:
-                    result = _eval_interp_nd(axes, values, extra_args[: len(axes)])
-            else:
-                raise CalibrationError(f"interp() requires a CURVE-like input, got {param_name}")
+            result = _eval_max(self._load_input_array(param_name)[0])
         else:
             raise CalibrationError(f"Unknown special function: {func_name}")
 
@@ -642,6 +853,17 @@ class DependencyEngine:
 
         raise CalibrationError(f"min/max/interp requires CURVE or VAL_BLK, got {inp_type} for '{param_name}'")
 
+    def _lookup_table(self, param_name: str) -> LookupTable:
+        """The lookup table of the CURVE-like input *param_name*, reused while the loaded parameter is unchanged."""
+        inp_type = self._cal.characteristic_category(param_name)
+        if inp_type not in CURVE_LIKE_TYPES:
+            raise CalibrationError(f"interp() requires a CURVE-like input, got {param_name}")
+        obj = self._load_or_cached(inp_type, param_name)
+        cached = self._tables.get(param_name)
+        if cached is None or cached[0] is not obj:
+            cached = self._tables[param_name] = (obj, LookupTable.from_parameter(obj))
+        return cached[1]
+
     def _load_or_cached(self, category: str, name: str) -> Any:
         """Load a parameter from cache or via the Calibration API."""
         from asamint.calibration.api import ParameterCache
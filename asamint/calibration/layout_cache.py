@@ -0,0 +1,331 @@
+"""
+Persistent, memory-mappable cache of resolved parameter memory layouts.
+
+Deriving address, numpy dtype, shape, byte order, bit mask and allocated size
+for every CHARACTERISTIC / AXIS_PTS requires walking the pya2l ORM, which
+dominates the start-up of batch exporters on large A2L files.
+:class:`LayoutCache` stores these values in a flat structured numpy array
+written next to the ``.a2ldb`` file (``<name>.a2llayout``).  Subsequent
+processes map the file read-only instead of re-deriving the layouts; the
+memory-range computation of ``CalibrationData`` and the vectorised VALUE
+path of ``Calibration.load_many`` read their layouts from it.
+
+File format (little endian)::
+
+    MAGIC (8 bytes) | header length (uint32) | JSON header | padding | records
+
+The JSON header holds the format version, the SHA-256 of the A2L file, the
+pya2l schema and package versions, the record dtype and the record count.
+A mismatch in any of these invalidates the file.
+
+Provides:
+- ``ParameterLayout``: resolved layout of a single parameter.
+- ``LayoutCache``: build / save / open / look-up of the layout table.
+- ``a2l_digest``: content hash of an A2L file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import struct
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+import numpy as np
+
+from asamint.adapters.a2l import A2L_SCHEMA_VERSION, PYA2L_VERSION
+from asamint.adapters.xcp import McObject
+from asamint.calibration.definitions import DefinitionSnapshot
+
+logger = logging.getLogger(__name__)
+
+LAYOUT_CACHE_VERSION = 3
+LAYOUT_CACHE_SUFFIX = ".a2llayout"
+
+_MAGIC = b"A2LLAYT\x00"
+_PREAMBLE = struct.Struct("<8sI")
+_ALIGNMENT = 64
+_MAX_DIMS = 5
+_AXIS_PTS = "AXIS_PTS"
+
+
+class ParameterLayout(NamedTuple):
+    """Resolved memory layout of a CHARACTERISTIC or AXIS_PTS.
+
+    ``dtype`` is the numpy type string of one function value (``""`` if there
+    is none), ``byte_order`` the A2L ``BYTE_ORDER`` of the parameter itself
+    (``""`` if it inherits the MOD_COMMON default).
+    """
+
+    name: str
+    category: str
+    address: int
+    size: int
+    dtype: str
+    byte_order: str
+    shape: tuple[int, ...]
+    order: str
+    bit_mask: int
+    virtual: bool
+
+
+def a2l_digest(a2l_path: str | Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 hex digest of *a2l_path*."""
+    digest = hashlib.sha256()
+    with open(a2l_path, "rb") as fp:
+        while chunk := fp.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_path_for(db_path: str | Path) -> Path:
+    """Layout cache file belonging to the ``.a2ldb`` file *db_path*."""
+    return Path(db_path).with_suffix(LAYOUT_CACHE_SUFFIX)
+
+
+def _record_dtype(name_width: int) -> np.dtype:
+    return np.dtype(
+        [
+            ("name", f"<U{max(name_width, 1)}"),
+            ("category", "<U8"),
+            ("address", "<u8"),
+            ("size", "<u8"),
+            ("dtype", "<U8"),
+            ("byte_order", "<U16"),
+            ("ndim", "u1"),
+            ("shape", "<u4", (_MAX_DIMS,)),
+            ("order", "<U1"),
+            ("bit_mask", "<u8"),
+            ("virtual", "?"),
+        ]
+    )
+
+
+def _layout_of(name: str, category: str, obj: Any) -> ParameterLayout:
+    if category == _AXIS_PTS:
+        shape: tuple[int, ...] = (int(obj.maxAxisPoints),)
+        order = "C"
+    else:
+        shape = tuple(int(d) for d in (obj.fnc_np_shape or ()))
+        order = obj.fnc_np_order or "C"
+    np_dtype = getattr(obj, "fnc_np_dtype", None)
+    return ParameterLayout(
+        name=name,
+        category=category,
+        address=int(obj.address),
+        size=int(obj.total_allocated_memory or 0),
+        dtype=np.dtype(np_dtype).str if np_dtype else "",
+        byte_order=obj.byteOrder or "",
+        shape=shape[:_MAX_DIMS],
+        order=order,
+        bit_mask=int(getattr(obj, "bitMask", None) or 0),
+        virtual=bool(getattr(obj, "virtual_characteristic", None)),
+    )
+
+
+class LayoutCache:
+    """Name-indexed table of :class:`ParameterLayout` records.
+
+    Records are kept in a numpy structured array which is either built from a
+    :class:`DefinitionSnapshot` or memory-mapped from a cache file.  Axis
+    points come first (ordered by address), followed by characteristics.
+    """
+
+    def __init__(self, records: np.ndarray, header: dict[str, Any]) -> None:
+        self.records = records
+        self.header = header
+        self._index: Optional[dict[str, int]] = None
+
+    # -- Construction --------------------------------------------------------
+
+    @classmethod
+    def build(cls, definitions: DefinitionSnapshot, a2l_hash: str = "") -> LayoutCache:
+        """Build a layout table from bulk-loaded A2L *definitions*."""
+        layouts = [_layout_of(name, _AXIS_PTS, ap) for name, ap in definitions.axis_pts.items()]
+        layouts.extend(_layout_of(name, definitions.types[name], chx) for name, chx in definitions.characteristics.items())
+        dtype = _record_dtype(max((len(lay.name) for lay in layouts), default=1))
+        records = np.zeros(len(layouts), dtype=dtype)
+        for idx, lay in enumerate(layouts):
+            shape = lay.shape + (0,) * (_MAX_DIMS - len(lay.shape))
+            records[idx] = (
+                lay.name,
+                lay.category,
+                lay.address,
+                lay.size,
+                lay.dtype,
+                lay.byte_order,
+                len(lay.shape),
+                shape,
+                lay.order,
+                lay.bit_mask,
+                lay.virtual,
+            )
+        return cls(records, cls._make_header(a2l_hash, dtype, len(layouts)))
+
+    @staticmethod
+    def _make_header(a2l_hash: str, dtype: np.dtype, count: int) -> dict[str, Any]:
+        return {
+            "version": LAYOUT_CACHE_VERSION,
+            "a2l_sha256": a2l_hash,
+            "schema_version": A2L_SCHEMA_VERSION,
+            "pya2l_version": PYA2L_VERSION,
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "count": count,
+        }
+
+    def save(self, path: str | Path) -> None:
+        """Write the cache atomically to *path*."""
+        path = Path(path)
+        header = json.dumps(self.header).encode("utf-8")
+        data_offset = _PREAMBLE.size + len(header)
+        padding = (-data_offset) % _ALIGNMENT
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as fp:
+            fp.write(_PREAMBLE.pack(_MAGIC, len(header) + padding))
+            fp.write(header)
+            fp.write(b" " * padding)
+            fp.write(np.ascontiguousarray(self.records).tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def open(cls, path: str | Path, a2l_hash: str) -> Optional[LayoutCache]:
+        """Memory-map the cache file at *path*.
+
+        Returns:
+            The cache, or ``None`` if the file is missing, corrupt, or was
+            written for a different A2L file, pya2l version or format version.
+        """
+        path = Path(path)
+        try:
+            with open(path, "rb") as fp:
+                magic, header_len = _PREAMBLE.unpack(fp.read(_PREAMBLE.size))
+                if magic != _MAGIC:
+                    return None
+                header = json.loads(fp.read(header_len))
+        except (OSError, struct.error, ValueError):
+            return None
+        if (
+            header.get("version") != LAYOUT_CACHE_VERSION
+            or header.get("a2l_sha256") != a2l_hash
+            or header.get("schema_version") != A2L_SCHEMA_VERSION
+            or header.get("pya2l_version") != PYA2L_VERSION
+        ):
+            return None
+        dtype = np.lib.format.descr_to_dtype(header["descr"])
+        count = int(header["count"])
+        if count == 0:
+            return cls(np.zeros(0, dtype=dtype), header)
+        try:
+            records = np.memmap(path, dtype=dtype, mode="r", offset=_PREAMBLE.size + header_len, shape=(count,))
+        except (OSError, ValueError):
+            return None
+        return cls(records, header)
+
+    @classmethod
+    def find(cls, session: Any, log: Optional[logging.Logger] = None) -> Optional[LayoutCache]:
+        """Open the cache file belonging to *session* without building it.
+
+        Returns:
+            The cache, or ``None`` if the session does not know its source
+            A2L file or there is no up-to-date cache file.
+        """
+        log = log or logger
+        a2l_path = getattr(session, "a2l_path", None)
+        db_path = getattr(session, "db_path", None)
+        if a2l_path is None or db_path is None:
+            return None
+        path = cache_path_for(db_path)
+        cache = cls.open(path, a2l_digest(a2l_path))
+        if cache is not None:
+            log.debug("Using layout cache '%s' (%d parameters)", path, len(cache))
+        return cache
+
+    @classmethod
+    def for_session(
+        cls,
+        session: Any,
+        definitions: Union[DefinitionSnapshot, Callable[[], DefinitionSnapshot], None] = None,
+        log: Optional[logging.Logger] = None,
+    ) -> LayoutCache:
+        """Open the cache file belonging to *session*, (re-)building it if stale.
+
+        If the session does not know its source A2L file (e.g. a bare pya2l
+        session), the table is built in memory only.
+
+        Args:
+            session: Session returned by ``open_a2l_database``.
+            definitions: Definitions used on a cache miss, or a callable
+                returning them; loaded from *session* if omitted.
+            log: Logger; defaults to the module logger.
+        """
+        log = log or logger
+        cache = cls.find(session, log)
+        if cache is not None:
+            return cache
+        if definitions is None:
+            snapshot = DefinitionSnapshot.load(session, log)
+        elif callable(definitions):
+            snapshot = definitions()
+        else:
+            snapshot = definitions
+        a2l_path = getattr(session, "a2l_path", None)
+        db_path = getattr(session, "db_path", None)
+        if a2l_path is None or db_path is None:
+            return cls.build(snapshot)
+
+        path = cache_path_for(db_path)
+        cache = cls.build(snapshot, a2l_digest(a2l_path))
+        try:
+            cache.save(path)
+        except OSError as exc:
+            log.warning("Could not write layout cache '%s': %s", path, exc)
+        else:
+            log.debug("Wrote layout cache '%s' (%d parameters)", path, len(cache))
+        return cache
+
+    # -- Access --------------------------------------------------------------
+
+    def _name_index(self) -> dict[str, int]:
+        if self._index is None:
+            self._index = {str(name): idx for idx, name in enumerate(self.records["name"])}
+        return self._index
+
+    def _to_layout(self, rec: Any) -> ParameterLayout:
+        ndim = int(rec["ndim"])
+        return ParameterLayout(
+            name=str(rec["name"]),
+            category=str(rec["category"]),
+            address=int(rec["address"]),
+            size=int(rec["size"]),
+            dtype=str(rec["dtype"]),
+            byte_order=str(rec["byte_order"]),
+            shape=tuple(int(d) for d in rec["shape"][:ndim]),
+            order=str(rec["order"]),
+            bit_mask=int(rec["bit_mask"]),
+            virtual=bool(rec["virtual"]),
+        )
+
+    def get(self, name: str) -> Optional[ParameterLayout]:
+        """Layout of parameter *name*, or ``None`` if unknown."""
+        idx = self._name_index().get(name)
+        return None if idx is None else self._to_layout(self.records[idx])
+
+    def memory_objects(self) -> list[McObject]:
+        """One :class:`McObject` per parameter, suitable for ``make_continuous_blocks``."""
+        return [
+            McObject(str(name), int(address), 0, int(size), "")
+            for name, address, size in zip(self.records["name"], self.records["address"], self.records["size"], strict=True)
+        ]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._name_index()
+
+    def __iter__(self) -> Iterator[ParameterLayout]:
+        return (self._to_layout(rec) for rec in self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
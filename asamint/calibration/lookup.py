@@ -0,0 +1,194 @@
+"""
+Multilinear lookup tables for CURVE, MAP, CUBOID, CUBE_4 and CUBE_5 characteristics.
+
+:class:`LookupTable` is the one interpolator behind ``Calibration.interpolate``,
+``Calibration.interpolate_many`` (via :mod:`asamint.calibration.curve_axis`) and
+the ``interp()`` special function of the dependency engine.  It is built once
+from the function values -- and optionally the axis breakpoints -- of a loaded
+parameter and then evaluates any number of operating points:
+
+* Positions outside an axis are clamped to its first / last breakpoint.
+* Within a cell, the ``2**ndim`` surrounding function values are blended
+  with multilinear weights; all cell corners are addressed by precomputed
+  offsets into the flattened values.
+
+Dimension ``i`` of the function values belongs to axis ``i``, as in
+:class:`~asamint.model.calibration.klasses.Map` and friends.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import product
+from typing import Any, Optional
+
+import numpy as np
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """A read-only view of *array*; the array itself stays writeable."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class LookupTable:
+    """Multilinear interpolation over an N-dimensional grid.
+
+    Args:
+        values: Function values; dimension ``i`` belongs to axis ``i``.
+        axes: Monotonically increasing breakpoints per axis.  Without
+            axes, positions are floating-point indices into *values*.
+        dtype: ``numpy.float64`` (default) or ``numpy.float32``, which halves
+            the memory of large tables at the cost of precision.
+
+    Attributes:
+        values: Read-only view of the contiguous function values.
+        axes: Read-only views of the contiguous breakpoints, or ``None``.
+        strides: Element (not byte) strides of :attr:`values`.
+    """
+
+    __slots__ = (
+        "values",
+        "axes",
+        "dtype",
+        "strides",
+        "_flat",
+        "_max_index",
+        "_max_lower",
+        "_corners",
+        "_offsets",
+        "_axis_lists",
+        "_scalar_dims",
+        "_scalar_corners",
+    )
+
+    def __init__(
+        self,
+        values: Any,
+        axes: Optional[Sequence[Any]] = None,
+        *,
+        dtype: Any = np.float64,
+    ) -> None:
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"LookupTable supports float32 and float64, not {self.dtype}.")
+        values = np.ascontiguousarray(values, dtype=self.dtype)
+        if values.ndim == 0:
+            raise ValueError("LookupTable requires at least one dimension.")
+        if axes is not None:
+            axes = [np.ascontiguousarray(axis, dtype=self.dtype).ravel() for axis in axes]
+            if [len(axis) for axis in axes] != list(values.shape):
+                raise ValueError(
+                    f"Axis lengths {[len(axis) for axis in axes]} do not match function values of shape {values.shape}."
+                )
+        self.values = _read_only(values)
+        self.axes = None if axes is None else tuple(_read_only(axis) for axis in axes)
+        self._flat = _read_only(values.reshape(-1))
+
+        shape = np.array(values.shape, dtype=np.intp)
+        self.strides = np.array(values.strides, dtype=np.intp) // values.itemsize
+        self._max_index = (shape - 1).astype(self.dtype)
+        self._max_lower = np.maximum(shape - 2, 0)
+        # One row per cell corner: which dimensions use the upper neighbour, and the resulting flat offset.
+        self._corners = np.array(list(product((False, True), repeat=values.ndim)), dtype=bool)
+        steps = np.where(shape > 1, self.strides, 0)
+        self._offsets = self._corners.astype(np.intp) @ steps
+        # Plain Python copies for evaluate(): one operating point is cheaper without NumPy dispatch.
+        self._axis_lists = None if self.axes is None else [axis.tolist() for axis in self.axes]
+        self._scalar_dims = list(zip(shape.tolist(), self.strides.tolist(), self._max_lower.tolist(), strict=True))
+        self._scalar_corners = list(zip(self._corners.tolist(), self._offsets.tolist(), strict=True))
+
+    @classmethod
+    def from_parameter(cls, parameter: Any, *, dtype: Any = np.float64) -> LookupTable:
+        """Build a table from a loaded ``klasses.Curve`` / ``Map`` / ``Cuboid`` / ``Cube4`` / ``Cube5``."""
+        return cls(parameter.phys, [axis.phys for axis in parameter.axes], dtype=dtype)
+
+    @property
+    def ndim(self) -> int:
+        return self.values.ndim
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.values.shape
+
+    def indices(self, positions: Any) -> np.ndarray:
+        """Floating-point indices of shape ``(N, ndim)`` for *positions* of shape ``(N, ndim)``."""
+        positions = np.asarray(positions, dtype=self.dtype)
+        if self.axes is None:
+            return positions
+        result = np.empty(positions.shape, dtype=self.dtype)
+        for dim, axis in enumerate(self.axes):
+            if len(axis) < 2:
+                result[:, dim] = 0.0
+            else:
+                result[:, dim] = np.interp(positions[:, dim], axis, np.arange(len(axis), dtype=self.dtype))
+        return result
+
+    def interpolate_indices(self, indices: Any) -> np.ndarray:
+        """Interpolate at floating-point *indices* of shape ``(N, ndim)``; indices are clamped to the grid.
+
+        Returns:
+            The ``N`` interpolated values.
+        """
+        indices = np.asarray(indices, dtype=self.dtype)
+        if indices.ndim != 2 or indices.shape[1] != self.ndim:
+            raise ValueError(f"Expected indices of shape (N, {self.ndim}) for a {self.ndim}-D table, got {indices.shape}.")
+        indices = np.clip(indices, 0.0, self._max_index)
+        lower = np.minimum(indices.astype(np.intp), self._max_lower)
+        frac = indices - lower
+        base = lower @ self.strides
+        result = np.zeros(len(indices), dtype=self.dtype)
+        for corner, offset in zip(self._corners, self._offsets, strict=True):
+            weights = np.prod(np.where(corner, frac, 1.0 - frac), axis=1)
+            result += weights * self._flat[base + offset]
+        return result
+
+    def evaluate_many(self, positions: Any) -> np.ndarray:
+        """Interpolate at *positions* of shape ``(N, ndim)``; shape ``(N,)`` is accepted for one axis.
+
+        Returns:
+            The ``N`` interpolated values.
+        """
+        positions = np.asarray(positions, dtype=self.dtype)
+        if positions.ndim == 1 and self.ndim == 1:
+            positions = positions[:, np.newaxis]
+        if positions.ndim != 2 or positions.shape[1] != self.ndim:
+            raise ValueError(f"Expected positions of shape (N, {self.ndim}) for a {self.ndim}-D table, got {positions.shape}.")
+        return self.interpolate_indices(self.indices(positions))
+
+    def evaluate(self, position: Sequence[float]) -> float:
+        """Interpolate at a single operating point (one position per axis).
+
+        Gives the same result as :meth:`evaluate_many` but computes in Python floats,
+        which avoids the per-call overhead of NumPy for one point.
+        """
+        if len(position) != self.ndim:
+            raise ValueError(f"Expected {self.ndim} position(s) for a {self.ndim}-D table, got {len(position)}.")
+        base = 0
+        fracs = []
+        for dim, (size, stride, max_lower) in enumerate(self._scalar_dims):
+            pos = float(position[dim])
+            if self._axis_lists is None:
+                idx = min(max(pos, 0.0), size - 1.0)
+            else:
+                axis = self._axis_lists[dim]
+                if size < 2 or pos <= axis[0]:
+                    idx = 0.0
+                elif pos >= axis[-1]:
+                    idx = size - 1.0
+                else:
+                    lower = bisect_right(axis, pos) - 1
+                    idx = lower + (pos - axis[lower]) / (axis[lower + 1] - axis[lower])
+            lower = min(int(idx), max_lower)
+            base += lower * stride
+            fracs.append(idx - lower)
+        result = 0.0
+        for corner, offset in self._scalar_corners:
+            weight = 1.0
+            for frac, upper in zip(fracs, corner, strict=True):
+                weight *= frac if upper else 1.0 - frac
+            if weight:
+                result += weight * self._flat.item(base + offset)
+        return result
@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Union
 
+from asamint.asam.memory_map import MemoryRangeIndex
 from asamint.model.calibration.klasses import MemoryType
 from pya2l.api import inspect
 
@@ -24,16 +25,16 @@ class MapFile:
 
     Args:
         filename: Output file path.
-        memory_map: List of :class:`~asamint.asam.MemoryRange` describing the
-            ECU memory segments together with the characteristic names they
-            contain.
+        memory_map: :class:`~asamint.asam.memory_map.MemoryRangeIndex` or list
+            of :class:`~asamint.asam.MemoryRange` describing the ECU memory
+            segments together with the characteristic names they contain.
         memory_errors: Mapping of ``address → list[MemoryObject]`` collected
             during the calibration scan.
     """
 
-    def __init__(self, session, filename: Union[str, Path], memory_map: list, memory_errors: dict) -> None:
+    def __init__(self, session, filename: Union[str, Path], memory_map: Union[MemoryRangeIndex, list], memory_errors: dict) -> None:
         self.session = session
-        self.memory_map = memory_map
+        self.memory_map = memory_map if isinstance(memory_map, MemoryRangeIndex) else MemoryRangeIndex(memory_map)
         self.memory_errors = memory_errors
         self.out_file = open(filename, "w", encoding="utf-8")  # noqa: WPS515
 
@@ -73,7 +74,7 @@ class MapFile:
         self._error_objects()
 
     # ------------------------------------------------------------------
-    # Segments / allocated objects (list[MemoryRange])
+    # Segments / allocated objects (MemoryRangeIndex)
     # ------------------------------------------------------------------
 
     def _segment_header(self) -> None:
@@ -81,12 +82,12 @@ class MapFile:
         self._separator()
 
     def _allocated_objects(self) -> None:
-        prev_end: int | None = None
+        # gaps() has one entry less than there are ranges; the first range has no predecessor.
+        gaps = [0, *self.memory_map.gaps().tolist()] if len(self.memory_map) else []
 
-        for mr in sorted(self.memory_map, key=lambda r: r.address):
+        for mr, gap in zip(self.memory_map, gaps, strict=True):
             # Print gap between segments
-            if prev_end is not None and mr.address > prev_end:
-                gap = mr.address - prev_end
+            if gap > 0:
                 self._writeln(f"    {'<gap>':<28s}  {'':>9s}  {gap:>14d}  {'':28s}  {'':<12s}")
 
             # Segment line
@@ -115,8 +116,6 @@ class MapFile:
             for name, address, size, category in entries:
                 self._writeln(f"    {name:<63s}  0x{address:010X}  {size:>8d}  {category}")
 
-            prev_end = mr.address + mr.length
-
         self._separator()
 
     # ------------------------------------------------------------------
@@ -1,7 +1,7 @@
 import binascii
 import datetime
+import functools
 import logging
-import mmap
 import re
 import sqlite3
 import typing
@@ -13,48 +13,25 @@ from pathlib import Path
 import sqlalchemy as sqa
 from lxml import etree  # nosec
 from sqlalchemy import Column, ForeignKey, create_engine, event, orm, types
-from sqlalchemy.engine import Engine
-from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import Mapped, as_declarative, backref, mapped_column, relationship
 
+from asamint.calibration.msrsw_sqlite import (
+    CACHE_SIZE,
+    CURRENT_SCHEMA_VERSION,
+    DB_EXTENSION,
+    DEFAULT_PROFILE,
+    PAGE_SIZE,
+    PROFILES,
+    SQLiteProfile,
+    calculateCacheSize,
+    get_profile,
+    regexer,
+    set_sqlite3_pragmas,
+)
 from asamint.utils.xml import create_validator
 
-DB_EXTENSION = ".msrswdb"
-
-CURRENT_SCHEMA_VERSION = 10
-
-CACHE_SIZE = 4  # MB
-PAGE_SIZE = mmap.PAGESIZE
-
-
-def calculateCacheSize(value):
-    return -(value // PAGE_SIZE)
-
-
-REGEXER_CACHE = {}
-
-
-def regexer(value, expr):
-    if not REGEXER_CACHE.get(expr):
-        REGEXER_CACHE[expr] = re.compile(expr, re.UNICODE)
-    re_expr = REGEXER_CACHE[expr]
-    return re_expr.match(value) is not None
-
-
-@event.listens_for(Engine, "connect")
-def set_sqlite3_pragmas(dbapi_connection, connection_record):
-    dbapi_connection.create_function("REGEXP", 2, regexer)
-    cursor = dbapi_connection.cursor()
-    # cursor.execute("PRAGMA jornal_mode=WAL")
-    cursor.execute("PRAGMA FOREIGN_KEYS=ON")
-    cursor.execute(f"PRAGMA PAGE_SIZE={PAGE_SIZE}")
-    cursor.execute(f"PRAGMA CACHE_SIZE={calculateCacheSize(CACHE_SIZE * 1024 * 1024)}")
-    cursor.execute("PRAGMA SYNCHRONOUS=OFF")  # FULL
-    cursor.execute("PRAGMA LOCKING_MODE=EXCLUSIVE")  # NORMAL
-    cursor.execute("PRAGMA TEMP_STORE=MEMORY")  # FILE
-    cursor.close()
-
 
 @as_declarative()
 class Base:
@@ -25662,7 +25639,15 @@ ROOT_ELEMENT = "MSRSW"
 
 
 class MSRSWDatabase:
-    def __init__(self, filename: Path | str, debug: bool = False, logLevel: str = "INFO") -> None:
+    def __init__(
+        self,
+        filename: Path | str,
+        debug: bool = False,
+        logLevel: str = "INFO",
+        *,
+        profile: typing.Union[str, SQLiteProfile, None] = None,
+    ) -> None:
+        self.profile = get_profile(DEFAULT_PROFILE if profile is None else profile)
         if filename == ":memory:":
             self.dbname = ""
         else:
@@ -25675,14 +25660,17 @@ class MSRSWDatabase:
             connect_args={"detect_types": sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES},
             native_datetime=True,
         )
+        event.listen(self._engine, "connect", functools.partial(set_sqlite3_pragmas, self.profile))
 
         self._session = orm.Session(self._engine, autoflush=False, autocommit=False)
         self._metadata = Base.metadata
         # loadInitialData(Node)
         Base.metadata.create_all(self.engine)
-        meta = MetaData(schema_version=CURRENT_SCHEMA_VERSION)
-        self.session.add(meta)
-        self.session.flush()
+        # Only new databases are written to, so that readers can open a file a writer is working on.
+        if self.session.query(MetaData.rid).first() is None:
+            meta = MetaData(schema_version=CURRENT_SCHEMA_VERSION)
+            self.session.add(meta)
+            self.session.flush()
         self.session.commit()
         self._closed = False
 
@@ -25698,8 +25686,9 @@ class MSRSWDatabase:
         self._closed = True
 
     def create_indices(self):
-        index_name = sqa.Index("shortname_content_idx", ShortName.content)
-        index_name.create(bind=self.engine)
+        # Plain DDL: an ``sqa.Index`` would register with ``Base.metadata`` and be created by every later ``create_all``.
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS shortname_content_idx ON short_name (content)")
 
     @property
     def engine(self):
@@ -25820,3 +25809,267 @@ class Parser:
             attr = self.get_attr(attr)
             if attr == "noNamespaceSchemaLocation":
                 meta.xml_schema = value
+
+
+@dataclass(frozen=True)
+class _ChildLink:
+    """How a child element row is attached to the row of its parent element."""
+
+    kind: str  # "parent": parent_column ← child rid, "child": child_column ← parent rid, "assoc": via association row
+    single: bool
+    parent_column: typing.Optional[str] = None
+    child_column: typing.Optional[str] = None
+    assoc_table: typing.Optional[sqa.Table] = None
+    discriminator: tuple[str, str] = ("", "")
+
+
+@dataclass
+class PendingRow:
+    """A row of :class:`BulkWriter` that has a primary key but may not be written yet."""
+
+    klass: typing.Optional[type]
+    rid: int = 0
+    row: dict = field(default_factory=dict)
+    linked: set = field(default_factory=set)
+    assocs: dict = field(default_factory=dict)
+
+
+class BulkWriter:
+    """Write MSRSW rows with SQLAlchemy Core instead of the ORM unit of work.
+
+    Primary keys are assigned up front (``max(rid) + 1`` per table),
+    relationships are resolved from the ORM mappings (foreign keys on parent
+    or child rows, polymorphic association rows) and rows are written per
+    table with ``executemany``, ``batch_size`` rows at a time.  Rows reference
+    each other before both are written, so foreign-key enforcement is switched
+    off while writing and all touched tables are verified with
+    ``PRAGMA foreign_key_check`` in :meth:`commit`.
+
+    Args:
+        db: Target database; its session connection is used.
+        batch_size: Number of pending rows that triggers a flush.
+    """
+
+    def __init__(self, db: MSRSWDatabase, *, batch_size: int = 10_000):
+        self.db = db
+        self.batch_size = batch_size
+        self.rows = 0
+        self._conn = db.session.connection()
+        # Checking deferred constraints row by row is quadratic without indices on the
+        # foreign-key columns; switch enforcement off (only possible outside a
+        # transaction) and check the result once at the end instead.
+        self._check_foreign_keys = not self._conn.connection.dbapi_connection.in_transaction
+        if self._check_foreign_keys:
+            self._conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            self._conn.exec_driver_sql("BEGIN")
+        else:
+            self._conn.exec_driver_sql("PRAGMA defer_foreign_keys=ON")
+        self._next_rid: dict[sqa.Table, int] = {}
+        self._pending: dict[sqa.Table, list[dict]] = defaultdict(list)
+        self._num_pending = 0
+
+    def row(self, klass: type, content: typing.Any = None) -> PendingRow:
+        """Allocate a row of *klass* filled with column defaults (and *content* for terminal elements)."""
+        row = dict(_row_template(klass))
+        rid = row["rid"] = self._allocate(klass.__table__)
+        if content is not None:
+            row["content"] = content
+        return PendingRow(klass, rid, row)
+
+    def link(self, parent: PendingRow, child: PendingRow) -> None:
+        """Attach *child* to *parent*; both rows must not be written yet."""
+        key = child.klass.__name__
+        link = _child_link(parent.klass, key)
+        if link is None:
+            return
+        if link.single:
+            if key in parent.linked:
+                return
+            parent.linked.add(key)
+        if link.kind == "parent":
+            parent.row[link.parent_column] = child.rid
+        elif link.kind == "child":
+            child.row[link.child_column] = parent.rid
+        else:
+            assoc_rid = parent.assocs.get(key)
+            if assoc_rid is None:
+                assoc_rid = parent.assocs[key] = self._allocate(link.assoc_table)
+                discriminator, identity = link.discriminator
+                self._emit(link.assoc_table, {"rid": assoc_rid, "content": None, discriminator: identity})
+                parent.row[link.parent_column] = assoc_rid
+            child.row[link.child_column] = assoc_rid
+
+    def add(self, *rows: PendingRow) -> None:
+        """Queue *rows* for writing; they must not be modified afterwards."""
+        for pending in rows:
+            self._emit(pending.klass.__table__, pending.row)
+
+    def flush(self) -> None:
+        """Write all queued rows."""
+        for table, rows in self._pending.items():
+            if rows:
+                self._conn.execute(table.insert(), rows)
+                self.rows += len(rows)
+        self._pending.clear()
+        self._num_pending = 0
+
+    def check_foreign_keys(self) -> None:
+        """Raise ``sqlalchemy.exc.IntegrityError`` if any written row has a dangling reference."""
+        for table in self._next_rid:
+            violations = self._conn.exec_driver_sql(f'PRAGMA foreign_key_check("{table.name}")').fetchall()
+            if violations:
+                raise sqa.exc.IntegrityError(
+                    f"PRAGMA foreign_key_check({table.name})",
+                    violations[:10],
+                    sqlite3.IntegrityError("FOREIGN KEY constraint failed"),
+                )
+
+    def commit(self) -> None:
+        """Flush, verify foreign keys and commit the transaction."""
+        self.flush()
+        if self._check_foreign_keys:
+            self.check_foreign_keys()
+        self.db.commit_transaction()
+        if self._check_foreign_keys:
+            self.db.session.connection().exec_driver_sql("PRAGMA foreign_keys=ON")
+            self.db.commit_transaction()  # return the connection to the pool
+
+    def _allocate(self, table: sqa.Table) -> int:
+        rid = self._next_rid.get(table)
+        if rid is None:
+            rid = self._conn.execute(sqa.select(sqa.func.coalesce(sqa.func.max(table.c.rid), 0))).scalar() + 1
+        self._next_rid[table] = rid + 1
+        return rid
+
+    def _emit(self, table: sqa.Table, row: dict) -> None:
+        self._pending[table].append(row)
+        self._num_pending += 1
+        if self._num_pending >= self.batch_size:
+            self.flush()
+
+
+class StreamingParser(Parser):
+    """Import a CDF / MSRSW file with constant memory.
+
+    The document is read with ``etree.iterparse``; every element is turned
+    into a plain row as soon as it is complete and then dropped from the tree.
+    Rows are written with a :class:`BulkWriter`, ``batch_size`` rows at a
+    time.  The resulting database is equivalent to the one written by
+    :class:`Parser`.
+
+    Unlike :class:`Parser` no DTD validation is performed.
+    """
+
+    def __init__(self, file_name: str, db: MSRSWDatabase, root_elem: str = ROOT_ELEMENT, *, batch_size: int = 10_000):
+        self.logger = logging.getLogger(f"{__name__}.StreamingParser")
+        self.schema_version = 0
+        self.variant = "MSRSW"
+        self.file_name = file_name
+        self.db = db
+        self.root = None
+        self.writer = BulkWriter(db, batch_size=batch_size)
+
+        self.parse_stream(file_name)
+        self.writer.commit()
+        self.update_metadata()
+        self.db.commit_transaction()
+        self.db.close()
+
+    @property
+    def rows(self) -> int:
+        """Number of rows written so far."""
+        return self.writer.rows
+
+    def parse_stream(self, file_name: str) -> None:
+        stack: list[PendingRow] = []
+        for phase, elem in etree.iterparse(file_name, events=("start", "end")):  # nosec
+            if phase == "start":
+                stack.append(self._open_element(elem, stack[-1] if stack else None))
+                continue
+            current = stack.pop()
+            if current.klass is not None:
+                if current.klass.TERMINAL:
+                    current.row["content"] = elem.text
+                if stack and stack[-1].klass is not None:
+                    self.writer.link(stack[-1], current)
+                self.writer.add(current)
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+        self.writer.flush()
+
+    def check_foreign_keys(self) -> None:
+        """Raise ``sqlalchemy.exc.IntegrityError`` if any imported row has a dangling reference."""
+        self.writer.check_foreign_keys()
+
+    def _open_element(self, elem, parent: typing.Optional[PendingRow]) -> PendingRow:
+        if parent is not None and parent.klass is None:
+            return PendingRow(None)  # inside an invalid element: skipped, like Parser does
+        element = ELEMENTS.get(elem.tag)
+        if self.root is None:
+            self.root = etree.Element(elem.tag, elem.attrib)
+        if not element:
+            self.logger.warning("invalid tag: %s", elem.tag)
+            return PendingRow(None)
+        pending = self.writer.row(element)
+        columns = _attribute_columns(element)
+        for name, value in elem.attrib.items():
+            column = columns.get(self.get_attr(name))
+            if column is not None:
+                pending.row[column] = value
+        return pending
+
+
+@functools.lru_cache(maxsize=None)
+def _row_template(klass: type) -> dict:
+    """Column defaults of *klass*, keyed like ``Table.insert()`` parameters."""
+    row = {}
+    for column in klass.__table__.columns:
+        default = column.default
+        row[column.key] = default.arg if default is not None and default.is_scalar else None
+    return row
+
+
+@functools.lru_cache(maxsize=None)
+def _attribute_columns(klass: type) -> dict:
+    """XML attribute name → column key of *klass*."""
+    mapper = sqa.inspect(klass)
+    return {name: mapper.get_property(attr).columns[0].key for name, attr in klass.ATTRIBUTES.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _child_link(klass: type, key: str) -> typing.Optional[_ChildLink]:
+    """Resolve how a child of class name *key* is stored for a parent of *klass* (see ``Parser``)."""
+    logger = logging.getLogger(f"{__name__}.BulkWriter")
+    if key not in klass.ELEMENTS:
+        logger.warning("unknown key: %s", key)
+        return None
+    attrib, elem_tp = klass.ELEMENTS[key]
+    if klass.SELF_REF and (attrib[:-1] == klass.__tablename__):
+        attrib = "children"
+    single = elem_tp != "A"
+    mapper = sqa.inspect(klass)
+    if attrib in mapper.relationships:
+        relationship_ = mapper.relationships[attrib]
+        ((local, remote),) = relationship_.local_remote_pairs
+        if relationship_.direction is orm.MANYTOONE:
+            return _ChildLink("parent", single, parent_column=local.key)
+        return _ChildLink("child", single, child_column=remote.key)
+    proxy = mapper.all_orm_descriptors.get(attrib)
+    if isinstance(proxy, AssociationProxy):
+        assoc_relationship = mapper.relationships[proxy.target_collection]
+        ((parent_column, _),) = assoc_relationship.local_remote_pairs
+        assoc_mapper = assoc_relationship.mapper
+        ((_, child_column),) = assoc_mapper.relationships[proxy.value_attr].local_remote_pairs
+        return _ChildLink(
+            "assoc",
+            single,
+            parent_column=parent_column.key,
+            child_column=child_column.key,
+            assoc_table=assoc_mapper.local_table,
+            discriminator=(assoc_mapper.polymorphic_on.key, assoc_mapper.polymorphic_identity),
+        )
+    logger.warning("unknown attribute: %s", attrib)
+    return None
@@ -0,0 +1,292 @@
+"""
+Read SW-INSTANCEs from an MSRSW database with SQLAlchemy Core.
+
+:mod:`asamint.calibration.msrsw_db` declares the complete MSRSW schema -- some
+700 tables -- as ORM classes.  Importing it and configuring its mappers, which
+happens on the first query, takes several seconds even if only a handful of
+tables are read.  :class:`MSRSWReader` covers the common read path -- looking
+up SW-INSTANCEs with their value and axis containers -- without the ORM:
+a table is reflected from the database file when it is first touched, so only
+the tables a query needs are ever materialised.
+
+Results are the dataclasses of :mod:`asamint.msrsw.elements`, built the same way
+:class:`asamint.cdf.walker.CdfWalker` builds them from ORM objects.
+"""
+
+from __future__ import annotations
+
+import binascii
+import functools
+import typing
+from collections.abc import Iterator
+from decimal import Decimal
+from pathlib import Path
+from types import TracebackType
+
+import sqlalchemy as sqa
+from sqlalchemy import create_engine, event
+
+from asamint.calibration.msrsw_sqlite import DB_EXTENSION, SQLiteProfile, get_profile, set_sqlite3_pragmas
+from asamint.msrsw import elements
+
+# SW-INSTANCE children resolved to their content; table ``x`` is referenced by column ``x_id``.
+_INSTANCE_REFS = ("short_name", "long_name", "display_name", "category", "sw_feature_ref", "sw_model_link")
+
+# Value elements of SW-VALUES-PHYS / SW-VALUES-CODED, in the order of ``CdfWalker.do_values``.
+_VALUE_KINDS = ("v", "vg", "vt", "vf", "vh")
+
+# Value elements of a VG; like ``CdfWalker.do_vgs`` only the first non-empty kind is used.
+_VG_KINDS = ("v", "vf", "vt", "vh")
+
+_VALUE_CLASSES = {"v": elements.V, "vf": elements.VF, "vt": elements.VT, "vh": elements.VH}
+
+
+def _content(row: typing.Mapping[str, typing.Any], key: str, default: typing.Any = None) -> typing.Any:
+    """Content of the element joined as *key*, or *default* if there is no such element (cf. ``walker.get_content``)."""
+    return default if row[f"{key}_rid"] is None else row[key]
+
+
+def _value(kind: str, content: typing.Any) -> typing.Any:
+    if kind == "v" and content is not None:
+        content = Decimal(content)  # the only DecimalType column of the schema
+    elif kind == "vh":
+        content = content.strip()
+        try:
+            content = binascii.unhexlify(content)
+        except binascii.Error:
+            pass
+    return _VALUE_CLASSES[kind](phys=content)
+
+
+class MSRSWReader:
+    """Read-only access to the SW-INSTANCEs of an existing MSRSW database.
+
+    Values and axes are taken from the SW-VALUE-CONT / SW-AXIS-CONTS of the
+    instance itself or -- if it has none, as usual in CDF20 files -- from its
+    first SW-INSTANCE-PROPS-VARIANT.
+
+    Args:
+        filename: Database file; the suffix is replaced by ``.msrswdb``.
+        profile: Name of a profile in ``msrsw_sqlite.PROFILES`` or a :class:`SQLiteProfile`.
+
+    Raises:
+        FileNotFoundError: If the database does not exist.
+    """
+
+    def __init__(self, filename: Path | str, *, profile: typing.Union[str, SQLiteProfile] = "concurrent-read") -> None:
+        self.profile = get_profile(profile)
+        self.dbname = Path(filename).with_suffix(DB_EXTENSION)
+        if not self.dbname.exists():
+            raise FileNotFoundError(f"MSRSW database {str(self.dbname)!r} does not exist.")
+        self._engine = create_engine(f"sqlite:///{self.dbname}")
+        event.listen(self._engine, "connect", functools.partial(set_sqlite3_pragmas, self.profile))
+        self._metadata = sqa.MetaData()
+        self._tables: dict[str, sqa.Table] = {}
+        with self._engine.connect() as conn:
+            meta = self.table("metadata")
+            self.schema_version = conn.execute(sqa.select(meta.c.schema_version)).scalar()
+
+    def __enter__(self) -> MSRSWReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._engine.dispose()
+
+    @property
+    def loaded_tables(self) -> frozenset[str]:
+        """Names of the tables reflected so far."""
+        return frozenset(self._tables)
+
+    def table(self, name: str) -> sqa.Table:
+        """The Core table *name*, reflected from the database on first access."""
+        table = self._tables.get(name)
+        if table is None:
+            table = self._tables[name] = sqa.Table(name, self._metadata, autoload_with=self._engine)
+        return table
+
+    def instance_names(self, category: typing.Optional[str] = None) -> list[str]:
+        """Short names of all SW-INSTANCEs (optionally of one *category*), in document order."""
+        instance = self.table("sw_instance")
+        short_name = self.table("short_name")
+        query = sqa.select(short_name.c.content).join_from(instance, short_name, instance.c.short_name_id == short_name.c.rid)
+        if category is not None:
+            cat = self.table("category")
+            query = query.join(cat, instance.c.category_id == cat.c.rid).where(cat.c.content == category)
+        with self._engine.connect() as conn:
+            return list(conn.execute(query.order_by(instance.c.rid)).scalars())
+
+    def instance(self, name: str) -> typing.Optional[elements.CalibrationParameter]:
+        """The first SW-INSTANCE with short name *name*, or ``None``."""
+        short_name = self.table("short_name")
+        query = self._instance_query().where(short_name.c.content == name).limit(1)
+        with self._engine.connect() as conn:
+            row = conn.execute(query).mappings().first()
+            return None if row is None else self._parameter(conn, row)
+
+    def instances(self, category: typing.Optional[str] = None) -> Iterator[elements.CalibrationParameter]:
+        """All SW-INSTANCEs (optionally of one *category*), in document order."""
+        query = self._instance_query()
+        if category is not None:
+            query = query.where(self.table("category").c.content == category)
+        with self._engine.connect() as conn:
+            for row in conn.execute(query).mappings().all():
+                yield self._parameter(conn, row)
+
+    def _instance_query(self) -> sqa.Select:
+        instance = self.table("sw_instance")
+        columns = [
+            instance.c.rid,
+            instance.c.sw_value_cont_id,
+            instance.c.sw_axis_conts_id,
+            instance.c.sw_instance_props_variants_id,
+        ]
+        joined: sqa.FromClause = instance
+        for key in _INSTANCE_REFS:
+            table = self.table(key)
+            joined = joined.outerjoin(table, instance.c[f"{key}_id"] == table.c.rid)
+            columns.extend((table.c.rid.label(f"{key}_rid"), table.c.content.label(key)))
+        return sqa.select(*columns).select_from(joined).order_by(instance.c.rid)
+
+    def _parameter(self, conn: sqa.Connection, row: typing.Mapping[str, typing.Any]) -> elements.CalibrationParameter:
+        value_cont_id = row["sw_value_cont_id"]
+        axis_conts_id = row["sw_axis_conts_id"]
+        if value_cont_id is None and axis_conts_id is None and row["sw_instance_props_variants_id"] is not None:
+            variant = self.table("sw_instance_props_variant")
+            first = conn.execute(
+                sqa.select(variant.c.sw_value_cont_id, variant.c.sw_axis_conts_id)
+                .where(variant.c.sw_instance_props_variants_id == row["sw_instance_props_variants_id"])
+                .order_by(variant.c.rid)
+                .limit(1)
+            ).first()
+            if first is not None:
+                value_cont_id, axis_conts_id = first
+        return elements.CalibrationParameter(
+            _content(row, "short_name", ""),
+            _content(row, "display_name", ""),
+            _content(row, "category", ""),
+            _content(row, "long_name", ""),
+            _content(row, "sw_feature_ref"),
+            _content(row, "sw_model_link"),
+            self._axis_conts(conn, axis_conts_id),
+            self._value_cont(conn, value_cont_id),
+        )
+
+    def _value_cont(self, conn: sqa.Connection, rid: typing.Optional[int]) -> elements.ValueContainer:
+        if rid is None:
+            return elements.ValueContainer(unit_display_name=None, array_size=(), values_phys=[], values_int=[])
+        cont = self.table("sw_value_cont")
+        unit = self.table("unit_display_name")
+        row = (
+            conn.execute(
+                sqa.select(cont, unit.c.rid.label("unit_rid"), unit.c.content.label("unit"))
+                .select_from(cont.outerjoin(unit, cont.c.unit_display_name_id == unit.c.rid))
+                .where(cont.c.rid == rid)
+            )
+            .mappings()
+            .one()
+        )
+        return elements.ValueContainer(
+            unit_display_name=elements.UnitDisplayName(_content(row, "unit", "")),
+            array_size=self._array_size(conn, row["sw_arraysize_id"]),
+            values_phys=self._values(conn, "sw_values_phys", row["sw_values_phys_id"]),
+            values_int=self._values(conn, "sw_values_coded", row["sw_values_coded_id"]),
+        )
+
+    def _axis_conts(self, conn: sqa.Connection, rid: typing.Optional[int]) -> list[elements.AxisContainer]:
+        if rid is None:
+            return []
+        cont = self.table("sw_axis_cont")
+        unit = self.table("unit_display_name")
+        category = self.table("category")
+        instance_ref = self.table("sw_instance_ref")
+        rows = conn.execute(
+            sqa.select(
+                cont,
+                unit.c.rid.label("unit_rid"),
+                unit.c.content.label("unit"),
+                category.c.rid.label("category_rid"),
+                category.c.content.label("category"),
+                instance_ref.c.rid.label("instance_ref_rid"),
+                instance_ref.c.content.label("instance_ref"),
+            )
+            .select_from(
+                cont.outerjoin(unit, cont.c.unit_display_name_id == unit.c.rid)
+                .outerjoin(category, cont.c.category_id == category.c.rid)
+                .outerjoin(instance_ref, cont.c.sw_instance_ref_id == instance_ref.c.rid)
+            )
+            .where(cont.c.sw_axis_conts_id == rid)
+            .order_by(cont.c.rid)
+        ).mappings()
+        return [
+            elements.AxisContainer(
+                category=_content(row, "category", ""),
+                unit_display_name=_content(row, "unit", ""),
+                array_size=self._array_size(conn, row["sw_arraysize_id"]),
+                values_phys=self._values(conn, "sw_values_phys", row["sw_values_phys_id"]),
+                values_int=self._values(conn, "sw_values_coded", row["sw_values_coded_id"]),
+                instance_ref=elements.InstanceRef(_content(row, "instance_ref")),
+            )
+            for row in rows.all()
+        ]
+
+    def _array_size(self, conn: sqa.Connection, rid: typing.Optional[int]) -> elements.ArraySize:
+        if rid is None:
+            return elements.ArraySize(())
+        values = self._leaf_values(conn, "sw_arraysize", rid, ("vf", "v"))
+        return elements.ArraySize(tuple(int(value.phys) for value in values))
+
+    def _values(self, conn: sqa.Connection, table_name: str, rid: typing.Optional[int]) -> list[typing.Any]:
+        if rid is None:
+            return []
+        return self._leaf_values(conn, table_name, rid, _VALUE_KINDS)
+
+    def _leaf_values(self, conn: sqa.Connection, table_name: str, rid: int, kinds: tuple[str, ...]) -> list[typing.Any]:
+        owner = self.table(table_name)
+        row = conn.execute(sqa.select(owner).where(owner.c.rid == rid)).mappings().one()
+        result: list[typing.Any] = []
+        for kind in kinds:
+            association_id = row.get(f"{kind}_association_id")
+            if association_id is None:
+                continue
+            if kind == "vg":
+                result.extend(self._vgs(conn, self.table("vg").c.association_id == association_id))
+            else:
+                result.extend(self._kind_values(conn, kind, association_id))
+        return result
+
+    def _kind_values(self, conn: sqa.Connection, kind: str, association_id: int) -> list[typing.Any]:
+        table = self.table(kind)
+        query = sqa.select(table.c.content).where(table.c.association_id == association_id).order_by(table.c.rid)
+        return [_value(kind, content) for content in conn.execute(query).scalars()]
+
+    def _vgs(self, conn: sqa.Connection, condition: sqa.ColumnElement[bool]) -> list[elements.VG]:
+        vg = self.table("vg")
+        label = self.table("label")
+        rows = conn.execute(
+            sqa.select(vg, label.c.rid.label("label_rid"), label.c.content.label("label"))
+            .select_from(vg.outerjoin(label, vg.c.label_id == label.c.rid))
+            .where(condition)
+            .order_by(vg.c.rid)
+        ).mappings()
+        result = []
+        for row in rows.all():
+            group = elements.VG()
+            if row["label_rid"] is not None:
+                group.label = row["label"]
+            for kind in _VG_KINDS:
+                association_id = row[f"{kind}_association_id"]
+                values = [] if association_id is None else self._kind_values(conn, kind, association_id)
+                if values:
+                    group.values.extend(values)
+                    break
+            group.values.extend(self._vgs(conn, vg.c._p_id == row["rid"]))
+            result.append(group)
+        return result
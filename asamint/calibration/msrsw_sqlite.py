@@ -0,0 +1,94 @@
+"""
+SQLite storage settings of MSRSW databases (``.msrswdb``).
+
+Shared by the ORM schema in :mod:`asamint.calibration.msrsw_db` and the
+Core-only :mod:`asamint.calibration.msrsw_reader`, so that opening a database
+for reading does not require importing -- and configuring -- the ORM schema.
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+import typing
+from dataclasses import dataclass
+
+DB_EXTENSION = ".msrswdb"
+
+CURRENT_SCHEMA_VERSION = 10
+
+CACHE_SIZE = 4  # MB
+PAGE_SIZE = mmap.PAGESIZE
+
+
+def calculateCacheSize(value):
+    return -(value // PAGE_SIZE)
+
+
+REGEXER_CACHE = {}
+
+
+def regexer(value, expr):
+    if not REGEXER_CACHE.get(expr):
+        REGEXER_CACHE[expr] = re.compile(expr, re.UNICODE)
+    re_expr = REGEXER_CACHE[expr]
+    return re_expr.match(value) is not None
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """Connection pragmas applied to every connection of an :class:`MSRSWDatabase`.
+
+    Args:
+        journal_mode: ``PRAGMA journal_mode`` (``WAL`` lets readers run next to a writer).
+        synchronous: ``PRAGMA synchronous``.
+        locking_mode: ``PRAGMA locking_mode``; ``EXCLUSIVE`` keeps other connections out.
+        cache_size: Page cache size in MB.
+        mmap_size: Bytes of the database file to memory-map for reads (0: off).
+        busy_timeout: Milliseconds to wait for a lock held by another connection.
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    locking_mode: str = "NORMAL"
+    cache_size: int = CACHE_SIZE
+    mmap_size: int = 0
+    busy_timeout: int = 5000
+
+
+PROFILES: dict[str, SQLiteProfile] = {
+    # Single writer, nothing else may touch the file; fastest for imports.
+    "bulk-import": SQLiteProfile(synchronous="OFF", locking_mode="EXCLUSIVE", cache_size=64),
+    # Readers (exporters, walkers) next to a running writer.
+    "concurrent-read": SQLiteProfile(cache_size=16, mmap_size=256 * 1024 * 1024),
+    # Every commit survives a power loss.
+    "durable": SQLiteProfile(synchronous="FULL"),
+}
+
+DEFAULT_PROFILE = "bulk-import"
+
+
+def set_sqlite3_pragmas(profile: SQLiteProfile, dbapi_connection, connection_record):
+    """``connect`` listener of MSRSW engines; see :class:`SQLiteProfile`."""
+    dbapi_connection.create_function("REGEXP", 2, regexer)
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA busy_timeout={profile.busy_timeout}")
+    cursor.execute(f"PRAGMA LOCKING_MODE={profile.locking_mode}")
+    cursor.execute(f"PRAGMA journal_mode={profile.journal_mode}")
+    cursor.execute("PRAGMA FOREIGN_KEYS=ON")
+    cursor.execute(f"PRAGMA PAGE_SIZE={PAGE_SIZE}")
+    cursor.execute(f"PRAGMA CACHE_SIZE={calculateCacheSize(profile.cache_size * 1024 * 1024)}")
+    cursor.execute(f"PRAGMA SYNCHRONOUS={profile.synchronous}")
+    cursor.execute(f"PRAGMA mmap_size={profile.mmap_size}")
+    cursor.execute("PRAGMA TEMP_STORE=MEMORY")  # FILE
+    cursor.close()
+
+
+def get_profile(profile: typing.Union[str, SQLiteProfile]) -> SQLiteProfile:
+    """Look up a named profile (see ``PROFILES``); :class:`SQLiteProfile` instances are passed through."""
+    if isinstance(profile, SQLiteProfile):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown SQLite profile {profile!r}, expected one of {sorted(PROFILES)}") from None
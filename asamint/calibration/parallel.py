@@ -0,0 +1,189 @@
+"""Decode the calibration parameters of an image in worker processes.
+
+``CalibrationData.load_hex(workers=N)`` hands the characteristics of every
+category to a pool of *N* spawned processes.  Each worker opens its own A2L
+database session, loads a :class:`DefinitionSnapshot` and decodes chunks of
+names against a private copy of the (read-only) image.  Decoded objects are
+returned without their ``api`` back-reference, which the caller re-attaches.
+
+Categories are scheduled in stages, because axes of CURVEs, MAPs and cubes
+refer to already decoded parameters:
+
+1. ``AXIS_PTS``, ``VALUE``, ``ASCII`` and ``VAL_BLK``.
+2. As soon as the AXIS_PTS are done: every CURVE without a ``CURVE_AXIS``
+   reference to another CURVE.
+3. The remaining CURVEs, in one task and in :meth:`CalibrationData._order_curves` order.
+4. ``MAP``, ``CUBOID``, ``CUBE_4`` and ``CUBE_5``.
+
+Only the AXIS_PTS and CURVEs a chunk actually refers to are shipped with it.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import math
+import pickle  # nosec
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Optional
+
+from asamint.adapters.a2l import ModCommon, ModPar, open_a2l_database
+from asamint.adapters.objutils import Image
+from asamint.calibration.api import Calibration
+from asamint.calibration.definitions import DefinitionSnapshot
+from asamint.utils import mp_context
+
+if TYPE_CHECKING:
+    from asamint.calibration import CalibrationData
+
+logger = logging.getLogger(__name__)
+
+NUM_AXES = {"AXIS_PTS": 0, "VALUE": 0, "ASCII": 0, "VAL_BLK": 0, "CURVE": 1, "MAP": 2, "CUBOID": 3, "CUBE_4": 4, "CUBE_5": 5}
+
+# Number of chunks per worker and category; more chunks balance better, fewer pickle less.
+CHUNKS_PER_WORKER = 4
+
+_calibration: Optional[Calibration] = None
+
+
+def _init_worker(a2l_file: str, encoding: str, image_file: str, empty_axis_policy: Optional[str]) -> None:
+    global _calibration
+
+    with open(image_file, "rb") as inf:
+        image: Image = pickle.load(inf)  # nosec -- written by ParallelLoader.run()
+    session = open_a2l_database(a2l_file, encoding=encoding, local=True)
+    context = SimpleNamespace(
+        session=session,
+        mod_common=ModCommon.get(session),
+        mod_par=ModPar.get(session) if ModPar.exists(session) else None,
+        empty_axis_policy=empty_axis_policy,
+    )
+    definitions = DefinitionSnapshot.load(session, logger)
+    _calibration = Calibration(context, image, {category: {} for category in NUM_AXES}, logger, definitions=definitions)
+
+
+def _decode(category: str, names: list[str], references: dict[str, dict[str, Any]]) -> list[tuple[str, Any]]:
+    calibration = _calibration
+    for ref_category, objects in references.items():
+        calibration.parameter_cache[ref_category].update(objects)
+    result = []
+    for name in names:
+        match category:
+            case "AXIS_PTS":
+                obj = calibration.load_axis_pts(name)
+            case "VALUE":
+                obj = calibration.load_value(name)
+            case "ASCII":
+                obj = calibration.load_ascii(name)
+            case "VAL_BLK":
+                obj = calibration.load_value_block(name)
+            case _:
+                obj = calibration.load_curve_or_map(name, category, NUM_AXES[category])
+        calibration.parameter_cache[category][name] = obj
+        result.append((name, _detach(obj)))
+    return result
+
+
+def _detach(obj: Any) -> Any:
+    if getattr(obj, "api", None) is None:
+        return obj
+    obj = copy.copy(obj)
+    obj.api = None
+    return obj
+
+
+def _references(characteristic: Any) -> list[tuple[str, str]]:
+    """``(category, name)`` of the parameters the axes of *characteristic* refer to."""
+    refs = []
+    for axis_descr in getattr(characteristic, "axisDescriptions", None) or ():
+        match axis_descr.attribute:
+            case "CURVE_AXIS":
+                refs.append(("CURVE", axis_descr.curveAxisRef.name))
+            case "COM_AXIS" | "RES_AXIS":
+                refs.append(("AXIS_PTS", axis_descr.axisPtsRef.name))
+    return refs
+
+
+class ParallelLoader:
+    """Decode all parameters of a :class:`CalibrationData` with a process pool.
+
+    Args:
+        calibration_data: Source of the image, definitions and A2L file; its
+            ``parameters`` are filled in.
+        workers: Number of worker processes.
+    """
+
+    def __init__(self, calibration_data: CalibrationData, workers: int) -> None:
+        self.calibration_data = calibration_data
+        self.workers = workers
+        self.parameters = calibration_data.parameters
+
+    def run(self) -> None:
+        cal = self.calibration_data
+        asam_mc = cal.asam_mc
+        definitions = {"AXIS_PTS": [ap for ap in cal.axis_points() if ap is not None]}
+        for category in NUM_AXES:
+            if category != "AXIS_PTS":
+                definitions[category] = [c for c in cal.characteristics(category) if c is not None]
+        curves = cal._order_curves(definitions["CURVE"])
+        curve_names = {c.name for c in curves}
+        dependent = {c.name for c in curves if any(kind == "CURVE" and ref in curve_names for kind, ref in _references(c))}
+
+        # The image is handed over as a file: large start-up arguments block process creation.
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_file = Path(tmp_dir) / "image.pickle"
+            with image_file.open("wb") as outf:
+                pickle.dump(cal.image, outf, protocol=pickle.HIGHEST_PROTOCOL)
+            initargs = (str(asam_mc.a2l_file), asam_mc.a2l_encoding, str(image_file), cal.api.empty_axis_policy)
+            self._run(initargs, definitions, curves, dependent)
+
+        # Same order as sequential loading.
+        decoded = dict(self.parameters["CURVE"])
+        self.parameters["CURVE"].clear()
+        self.parameters["CURVE"].update((c.name, decoded[c.name]) for c in curves if c.name in decoded)
+
+    def _run(self, initargs: tuple, definitions: dict[str, list[Any]], curves: list[Any], dependent: set[str]) -> None:
+        context = mp_context()
+        with ProcessPoolExecutor(self.workers, mp_context=context, initializer=_init_worker, initargs=initargs) as pool:
+            results = {
+                category: self._submit(pool, category, definitions[category])
+                for category in ("AXIS_PTS", "VALUE", "ASCII", "VAL_BLK")
+            }
+            self._collect("AXIS_PTS", results.pop("AXIS_PTS"))
+            self._collect("CURVE", self._submit(pool, "CURVE", [c for c in curves if c.name not in dependent]))
+            self._collect("CURVE", self._submit(pool, "CURVE", [c for c in curves if c.name in dependent], chunks=1))
+            for category in ("MAP", "CUBOID", "CUBE_4", "CUBE_5"):
+                results[category] = self._submit(pool, category, definitions[category])
+            for category, futures in results.items():
+                self._collect(category, futures)
+
+    def _submit(
+        self, pool: ProcessPoolExecutor, category: str, definitions: list[Any], chunks: Optional[int] = None
+    ) -> list[Future]:
+        if not definitions:
+            return []
+        if chunks is None:
+            chunks = self.workers * CHUNKS_PER_WORKER
+        size = math.ceil(len(definitions) / chunks)
+        futures = []
+        for start in range(0, len(definitions), size):
+            chunk = definitions[start : start + size]
+            references: dict[str, dict[str, Any]] = {}
+            for characteristic in chunk:
+                for ref_category, ref_name in _references(characteristic):
+                    obj = self.parameters[ref_category].get(ref_name)
+                    if obj is not None:
+                        references.setdefault(ref_category, {})[ref_name] = _detach(obj)
+            futures.append(pool.submit(_decode, category, [c.name for c in chunk], references))
+        return futures
+
+    def _collect(self, category: str, futures: list[Future]) -> None:
+        api = self.calibration_data.api
+        target = self.parameters[category]
+        for future in futures:
+            for name, obj in future.result():
+                obj.api = api
+                target[name] = obj
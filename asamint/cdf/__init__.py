@@ -42,7 +42,7 @@ from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from types import TracebackType
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import h5py
 import numpy as np
@@ -54,10 +54,10 @@ from asamint.adapters.a2l import model
 from asamint.asam import AsamMC
 from asamint.calibration import CalibrationData
 from asamint.calibration.db import CalibrationDB
-from asamint.calibration.msrsw_db import MSRSWDatabase
-from asamint.cdf.exporter.cdf_exporter import CDFExporter
+from asamint.calibration.msrsw_reader import MSRSWReader
+from asamint.calibration.msrsw_sqlite import SQLiteProfile
 from asamint.cdf.importer.cdf_importer import CDFImporter
-from asamint.core.deprecation import DeprecatedAlias, deprecated_dir, deprecated_getattr
+from asamint.core.deprecation import DeprecatedAlias, deprecated_dir, deprecated_getattr, warn_deprecated
 from asamint.core.exceptions import AdapterError
 from asamint.core.logging import configure_logging
 from asamint.utils import add_suffix_to_path
@@ -65,6 +65,9 @@ from asamint.utils.xml import create_elem, xml_comment
 
 from .importer import DBImporter
 
+if TYPE_CHECKING:
+    from asamint.calibration.msrsw_db import MSRSWDatabase
+
 __all__ = ["DB", "CDFCreator", "DBImporter", "CdfIOResult", "export_cdf", "import_cdf"]
 
 _DEPRECATED_ALIASES: dict[str, DeprecatedAlias] = {}
@@ -121,11 +124,15 @@ def export_cdf(
     Raises:
         AdapterError: If the export fails.
     """
+    # Imported here: loading the MSRSW ORM schema takes seconds.
+    from asamint.calibration.msrsw_db import MSRSWDatabase
+    from asamint.cdf.exporter.cdf_exporter import CDFExporter
+
     log: logging.Logger = logger or configure_logging(__name__)
     db_file = Path(db_path)
     output = Path(output_path)
     h5_db: CalibrationDB | None = CalibrationDB(str(h5_db_path), mode="r", logger=log) if h5_db_path else None
-    db = MSRSWDatabase(db_file)
+    db = MSRSWDatabase(db_file, profile="concurrent-read")
     try:
         exporter = CDFExporter(
             db=db,
@@ -148,6 +155,8 @@ def import_cdf(
     xml_path: str | Path,
     db_path: str | Path,
     logger: logging.Logger | None = None,
+    streaming: bool = False,
+    profile: str | SQLiteProfile | None = None,
 ) -> CdfIOResult:
     """Import calibration parameters from a CDF20 XML file into an MSRSW database.
 
@@ -155,6 +164,13 @@ def import_cdf(
         xml_path: Path to the CDF XML file.
         db_path: Destination path for the MSRSW database (``.msrswdb``).
         logger: Optional logger; one is created if not provided.
+        streaming: Parse incrementally with bulk inserts and flat memory use
+            (:class:`~asamint.calibration.msrsw_db.StreamingParser`); recommended
+            for large files.  Skips DTD validation.
+        profile: SQLite profile of the writing connection; defaults to
+            ``bulk-import``, which locks readers out until the import is done.
+            ``concurrent-read`` or ``durable`` let readers open the database
+            while it is written.
 
     Returns:
         :class:`CdfIOResult` with the XML and database paths.
@@ -163,7 +179,7 @@ def import_cdf(
         AdapterError: If the import fails.
     """
     log: logging.Logger = logger or configure_logging(__name__)
-    importer = CDFImporter(logger=log)
+    importer = CDFImporter(logger=log, streaming=streaming, profile=profile)
     xml = Path(xml_path)
     db_file = Path(db_path)
     success = importer.import_file(xml, db_file)
@@ -181,7 +197,10 @@ class DB:
     """Lightweight reader for CDF HDF5 payload produced by the importer.
 
     Opens the companion ``.h5`` store next to the ``.msrswdb`` and allows
-    loading parameters into :class:`xarray.DataArray` structures.
+    loading parameters into :class:`xarray.DataArray` structures.  The MSRSW
+    database itself is opened with the Core-only
+    :class:`~asamint.calibration.msrsw_reader.MSRSWReader`, which does not
+    configure the ORM schema.
 
     Supports the context-manager protocol::
 
@@ -189,11 +208,13 @@ class DB:
             arr = db.load("MyParameter")
     """
 
+    _SESSION_ALIAS = DeprecatedAlias(target="session", remove_in_version="0.10.0", replacement="DB.db (MSRSWReader)")
+
     def __init__(self, file_name: str | Path) -> None:
         self.opened: bool = False
+        self._orm_db: MSRSWDatabase | None = None
         db_name = Path(file_name).with_suffix(".msrswdb")
-        self.db = MSRSWDatabase(db_name, debug=False)
-        self.session = self.db.session
+        self.db = MSRSWReader(db_name)
         self.storage: h5py.File = h5py.File(
             db_name.with_suffix(".h5"),
             mode="r",
@@ -224,8 +245,25 @@ class DB:
         if getattr(self, "opened", False):
             self.storage.close()
             self.db.close()
+            if self._orm_db is not None:
+                self._orm_db.close()
+                self._orm_db = None
             self.opened = False
 
+    @property
+    def session(self) -> Any:
+        """ORM session on the MSRSW database.
+
+        Deprecated: use :attr:`db`.  The session is opened on first access,
+        which configures the full ORM schema.
+        """
+        warn_deprecated("DB.session", self._SESSION_ALIAS)
+        if self._orm_db is None:
+            from asamint.calibration.msrsw_db import MSRSWDatabase
+
+            self._orm_db = MSRSWDatabase(self.db.dbname, debug=False, profile="concurrent-read")
+        return self._orm_db.session
+
     # -- Internal helpers --------------------------------------------------
 
     @staticmethod
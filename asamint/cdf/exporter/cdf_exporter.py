@@ -261,7 +261,7 @@ def export_to_cdf(
     h5_path: str | Path = None,
     variant_coding: bool = False,
 ) -> bool:
-    db = MSRSWDatabase(db_path)
+    db = MSRSWDatabase(db_path, profile="concurrent-read")
 
     h5_db = None
     if h5_path:
@@ -1,49 +1,49 @@
+from __future__ import annotations
+
 import logging
+from concurrent.futures import Executor
 from collections.abc import Mapping
 from contextlib import suppress
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from asamint.calibration.db import CalibrationDB
-from asamint.calibration.msrsw_db import (
-    Category,
-    DataFile,
-    DisplayName,
-    LongName,
-    Msrsw,
-    MSRSWDatabase,
-    ShortName,
-    SwCsCollection,
-    SwCsCollections,
-    SwInstance,
-    SwInstanceSpec,
-    SwInstanceTree,
-    SwInstanceTreeOrigin,
-    SwSystem,
-    SwSystems,
-    SwValueCont,
-    SymbolicFile,
-    UnitDisplayName,
-)
+from asamint.calibration.msrsw_sqlite import SQLiteProfile
 from asamint.core.exceptions import CalibrationError
 from asamint.model.calibration import klasses
 
 from .cdf_importer import CDFImporter, import_cdf_to_db
 
+if TYPE_CHECKING:
+    from asamint.calibration.msrsw_db import PendingRow
+
 logger = logging.getLogger(__name__)
 
+# Parameter categories, in the order their SW-INSTANCEs are written.
+CATEGORIES = ("VALUE", "ASCII", "VAL_BLK", "AXIS_PTS", "CURVE", "MAP", "CUBOID", "CUBE_4", "CUBE_5")
+
 
 class DBImporter:
     opened: bool = False
 
-    def __init__(self, file_name: str, parameters: Mapping[str, Any], logger: Any) -> None:
+    def __init__(
+        self,
+        file_name: str,
+        parameters: Mapping[str, Any],
+        logger: Any,
+        *,
+        profile: str | SQLiteProfile | None = None,
+    ) -> None:
         db_name = Path(file_name).with_suffix(".msrswdb")
         self.parameters = parameters
         self.logger = logger
+        # Imported here (as in the other methods): loading the MSRSW ORM schema takes seconds.
+        from asamint.calibration.msrsw_db import MSRSWDatabase
+
         with suppress(FileNotFoundError):
             db_name.unlink()
         self.logger.info(f"Creating database {str(db_name)!r}.")
-        self.cdf_db = MSRSWDatabase(db_name, debug=False)
+        self.cdf_db = MSRSWDatabase(db_name, debug=False, profile=profile)
         # self.hdf_db = h5py.File(db_name.with_suffix(".h5"), mode="w", libver="latest", locking="best-effort",
         #                         track_order=True)
         self.hdf_db = CalibrationDB(db_name, mode="w")
@@ -60,127 +60,109 @@ class DBImporter:
     def __del__(self) -> None:
         self.close()
 
-    def run(self) -> None:
-        self.top_level_boilerplate()
+    def run(self, executor: Executor | None = None) -> None:
+        """Write the MSRSW and the HDF5 database.
+
+        Args:
+            executor: If given, both databases are written concurrently as two
+                tasks of this executor (which needs two free workers).
+        """
+        if executor is None:
+            self.top_level_boilerplate()
+            self.import_hdf5()
+        else:
+            futures = [executor.submit(self.top_level_boilerplate), executor.submit(self.import_hdf5)]
+            for future in futures:
+                future.result()
         self.logger.info("Done.")
 
     def top_level_boilerplate(self) -> None:
-        msrsw = Msrsw()
-        self.session.add(msrsw)
-
+        """Write the MSRSW skeleton and one ``SW-INSTANCE`` per parameter.
+
+        Rows are not built as an ORM object graph, but written table by table
+        with a :class:`BulkWriter` (precomputed primary keys, one
+        ``executemany`` per table and batch).
+        """
+        from asamint.calibration.msrsw_db import (
+            BulkWriter,
+            DataFile,
+            Msrsw,
+            SwCsCollection,
+            SwCsCollections,
+            SwInstanceSpec,
+            SwInstanceTree,
+            SwInstanceTreeOrigin,
+            SwSystem,
+            SwSystems,
+            SymbolicFile,
+        )
+
+        self.writer = BulkWriter(self.cdf_db)
+        msrsw = self.create_element(Msrsw)
         self.set_short_name(msrsw, "calib_test")
         self.set_category(msrsw, "CDF20")
 
-        systems = SwSystems()
-        self.session.add(systems)
-        msrsw.sw_systems = systems
-        system = SwSystem()
-
+        systems = self.create_element(SwSystems)
+        self.writer.link(msrsw, systems)
+        system = self.create_element(SwSystem)
         self.set_short_name(system, "n/a")
+        self.writer.link(systems, system)
 
-        self.session.add(system)
-        systems.sw_system.append(system)
-
-        instance_spec = SwInstanceSpec()
-        self.session.add(instance_spec)
+        instance_spec = self.create_element(SwInstanceSpec)
+        self.writer.link(system, instance_spec)
 
-        instance_tree = SwInstanceTree()
+        instance_tree = self.create_element(SwInstanceTree)
         self.set_short_name(instance_tree, r"ETAS\CalDemo_V2a\CalDemo_V2\CalDemo_V2_1")
         self.set_category(instance_tree, "VCD")
-        self.session.add(instance_tree)
-
-        origin = SwInstanceTreeOrigin()
-        self.session.add(origin)
-
-        instance_tree.sw_instance_tree_origin = origin
-
-        symbolic_file = SymbolicFile()
-        symbolic_file.content = "symfile.a2l"
-
-        self.session.add(symbolic_file)
-
-        data_file = DataFile()
-        data_file.content = "datafile.hex"
-        self.session.add(data_file)
-
-        origin.symbolic_file = symbolic_file
-        origin.data_file = data_file
-
-        instance_spec.sw_instance_tree.append(instance_tree)
-        system.sw_instance_spec = instance_spec
-
-        collections = SwCsCollections()
-        self.session.add(collections)
-        collection = SwCsCollection()
-        self.session.add(collection)
-
-        collections.sw_cs_collection.append(collection)
-        instance_tree.sw_instances = []
-        self.logger.info("VALUEs")
-        for value in self.parameters.get("VALUE", {}).values():
-            instance_tree.sw_instances.append(self.scalar_value(value))
-        self.logger.info("ASCIIs")
-        for value in self.parameters.get("ASCII", {}).values():
-            instance_tree.sw_instances.append(self.scalar_value(value))
-        self.logger.info("VAL_BLKs")
-        for value in self.parameters.get("VAL_BLK", {}).values():
-            instance_tree.sw_instances.append(self.value_block(value))
-        self.logger.info("AXIS_PTSs")
-        for value in self.parameters.get("AXIS_PTS", {}).values():
-            instance_tree.sw_instances.append(self.axis_pts(value))
-        self.logger.info("CURVEs")
-        for value in self.parameters.get("CURVE", {}).values():
-            instance_tree.sw_instances.append(self.map_curve(value, "CURVE"))
-        self.logger.info("MAPs")
-        for value in self.parameters.get("MAP", {}).values():
-            instance_tree.sw_instances.append(self.map_curve(value, "MAP"))
-        self.logger.info("CUBOIDs")
-        for value in self.parameters.get("CUBOID", {}).values():
-            instance_tree.sw_instances.append(self.map_curve(value, "CUBOID"))
-        self.logger.info("CUBE_4s")
-        for value in self.parameters.get("CUBE_4", {}).values():
-            instance_tree.sw_instances.append(self.map_curve(value, "CUBE_4"))
-        self.logger.info("CUBE_5s")
-        for value in self.parameters.get("CUBE_5", {}).values():
-            instance_tree.sw_instances.append(self.map_curve(value, "CUBE_5"))
-        self.session.commit()
+        self.writer.link(instance_spec, instance_tree)
+
+        origin = self.create_element(SwInstanceTreeOrigin)
+        self.writer.link(instance_tree, origin)
+        self.add_child(origin, SymbolicFile, "symfile.a2l")
+        self.add_child(origin, DataFile, "datafile.hex")
+
+        collections = self.create_element(SwCsCollections)
+        self.add_child(collections, SwCsCollection)
+
+        for category in CATEGORIES:
+            self.logger.info(f"{category}s")
+            for value in self.parameters.get(category, {}).values():
+                self.add_instance(instance_tree, self.sw_instance(value))
+        # Parents are queued last, after all their foreign-key columns are set.
+        self.writer.add(instance_tree, origin, instance_spec, system, systems, msrsw, collections)
+        self.writer.commit()
         self.cdf_db.create_indices()
 
-    def scalar_value(self, value: klasses.Value) -> SwInstance:
+    def import_hdf5(self) -> None:
+        """Write all parameters to the HDF5 database."""
+        for category in CATEGORIES:
+            for value in self.parameters.get(category, {}).values():
+                match category:
+                    case "VALUE" | "ASCII":
+                        self.hdf_db.import_scalar_value(value)
+                    case "VAL_BLK":
+                        self.hdf_db.import_value_block(value)
+                    case "AXIS_PTS":
+                        self.hdf_db.import_axis_pts(value)
+                    case _:
+                        try:
+                            self.hdf_db.import_map_curve(value)
+                        except (AttributeError, ValueError, KeyError, CalibrationError) as e:
+                            self.logger.error(f"map_curve({value.name}): {e} value: {value}")
+
+    def sw_instance(self, value: Any) -> PendingRow:
         inst = self.create_instance(value)
         self.add_value_container(inst, value.unit)
-        self.hdf_db.import_scalar_value(value)
         return inst
 
-    def map_curve(
-        self,
-        value: (klasses.Curve | klasses.Map | klasses.Cuboid | klasses.Cube4 | klasses.Cube5),
-        category: str,
-    ) -> SwInstance:
-        inst = self.create_instance(value)
-        self.add_value_container(inst, value.unit)
-
-        try:
-            self.hdf_db.import_map_curve(value)
-        except (AttributeError, ValueError, KeyError, CalibrationError) as e:
-            self.logger.error(f"map_curve({value.name}): {e} value: {value}")
-        return inst
+    def add_instance(self, instance_tree: PendingRow, inst: PendingRow) -> None:
+        self.writer.link(instance_tree, inst)
+        self.writer.add(inst)
 
-    def value_block(self, value: klasses.ValueBlock) -> SwInstance:
-        inst = self.create_instance(value)
-        self.add_value_container(inst, value.unit)
-        self.hdf_db.import_value_block(value)
-        return inst
+    def create_instance(self, value: Any) -> PendingRow:
+        from asamint.calibration.msrsw_db import SwInstance
 
-    def axis_pts(self, value: klasses.AxisPts) -> SwInstance:
-        inst = self.create_instance(value)
-        self.add_value_container(inst, value.unit)
-        self.hdf_db.import_axis_pts(value)
-        return inst
-
-    def create_instance(self, value: Any) -> SwInstance:
-        inst = SwInstance()
-        self.session.add(inst)
+        inst = self.create_element(SwInstance)
         self.set_short_name(inst, value.name)
         self.set_category(inst, "VALUE" if value.category == "TEXT" else value.category)
         if value.comment:
@@ -189,35 +171,40 @@ class DBImporter:
             self.set_display_name(inst, value.displayIdentifier)
         return inst
 
-    def add_value_container(self, obj: SwInstance, unit: str | None) -> None:
-        container = SwValueCont()
-        self.session.add(container)
+    def add_value_container(self, obj: PendingRow, unit: str | None) -> None:
+        from asamint.calibration.msrsw_db import SwValueCont, UnitDisplayName
+
+        container = self.create_element(SwValueCont)
         if unit:
-            unit_display_name = UnitDisplayName()
-            unit_display_name.content = unit
-            container.unit_display_name = unit_display_name
-        obj.sw_value_cont = container
-
-    def set_short_name(self, obj: Any, name: str) -> None:
-        short_name = ShortName()
-        short_name.content = name
-        self.session.add(short_name)
-        obj.short_name = short_name
-
-    def set_long_name(self, obj: Any, name: str) -> None:
-        long_name = LongName()
-        long_name.content = name
-        self.session.add(long_name)
-        obj.long_name = long_name
-
-    def set_category(self, obj: Any, name: str) -> None:
-        category = Category()
-        category.content = name
-        self.session.add(category)
-        obj.category = category
-
-    def set_display_name(self, obj: Any, name: str) -> None:
-        display_name = DisplayName()
-        display_name.content = name
-        self.session.add(display_name)
-        obj.display_name = display_name
+            self.add_child(container, UnitDisplayName, unit)
+        self.writer.link(obj, container)
+        self.writer.add(container)
+
+    def create_element(self, klass: type, content: str | None = None) -> PendingRow:
+        return self.writer.row(klass, content)
+
+    def add_child(self, obj: PendingRow, klass: type, content: str | None = None) -> PendingRow:
+        child = self.create_element(klass, content)
+        self.writer.link(obj, child)
+        self.writer.add(child)
+        return child
+
+    def set_short_name(self, obj: PendingRow, name: str) -> None:
+        from asamint.calibration.msrsw_db import ShortName
+
+        self.add_child(obj, ShortName, name)
+
+    def set_long_name(self, obj: PendingRow, name: str) -> None:
+        from asamint.calibration.msrsw_db import LongName
+
+        self.add_child(obj, LongName, name)
+
+    def set_category(self, obj: PendingRow, name: str) -> None:
+        from asamint.calibration.msrsw_db import Category
+
+        self.add_child(obj, Category, name)
+
+    def set_display_name(self, obj: PendingRow, name: str) -> None:
+        from asamint.calibration.msrsw_db import DisplayName
+
+        self.add_child(obj, DisplayName, name)
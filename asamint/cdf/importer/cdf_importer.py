@@ -1,18 +1,44 @@
 import logging
 from pathlib import Path
 
-from asamint.calibration.msrsw_db import MSRSWDatabase, Parser
+from asamint.calibration.msrsw_sqlite import SQLiteProfile
 
 
-def import_cdf_to_db(xml_path: str | Path, db_path: str | Path, logger: logging.Logger = None) -> bool:
+def import_cdf_to_db(
+    xml_path: str | Path,
+    db_path: str | Path,
+    logger: logging.Logger = None,
+    *,
+    streaming: bool = False,
+    profile: str | SQLiteProfile | None = None,
+) -> bool:
+    """Parse a CDF20 XML file into an MSRSW database.
+
+    Args:
+        xml_path: CDF20 file to import.
+        db_path: Destination ``.msrswdb`` file.
+        logger: Optional logger; the module logger is used if not provided.
+        streaming: Use the incremental :class:`StreamingParser`.
+        profile: SQLite profile of the writing connection (see
+            ``msrsw_sqlite.PROFILES``); defaults to ``bulk-import``, whose
+            exclusive locking keeps readers out until the import is done.
+            Use ``concurrent-read`` or ``durable`` to let readers in.
+
+    Returns:
+        ``True`` if the import succeeded.
+    """
+    # Imported here: loading the MSRSW ORM schema takes seconds.
+    from asamint.calibration.msrsw_db import MSRSWDatabase, Parser, StreamingParser
+
     logger = logger or logging.getLogger(__name__)
     logger.info(f"Importing {xml_path} to {db_path}")
+    parser_class = StreamingParser if streaming else Parser
 
-    db = MSRSWDatabase(db_path)
+    db = MSRSWDatabase(db_path, profile=profile)
     try:
         db.begin_transaction()
         # Parser.__init__ handles the parsing and committing to DB
-        Parser(str(xml_path), db)
+        parser_class(str(xml_path), db)
         logger.info("Import completed successfully.")
         return True
     except Exception as e:
@@ -27,8 +53,12 @@ def import_cdf_to_db(xml_path: str | Path, db_path: str | Path, logger: logging.
 
 
 class CDFImporter:
-    def __init__(self, logger: logging.Logger = None) -> None:
+    def __init__(
+        self, logger: logging.Logger = None, *, streaming: bool = False, profile: str | SQLiteProfile | None = None
+    ) -> None:
         self.logger = logger or logging.getLogger(__name__)
+        self.streaming = streaming
+        self.profile = profile
 
     def import_file(self, xml_path: str | Path, db_path: str | Path) -> bool:
-        return import_cdf_to_db(xml_path, db_path, self.logger)
+        return import_cdf_to_db(xml_path, db_path, self.logger, streaming=self.streaming, profile=self.profile)
@@ -8,7 +8,6 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
-from asamint.calibration.msrsw_db import MSRSWDatabase, SwInstance, SwInstanceSpec
 from asamint.msrsw import elements
 from asamint.msrsw.elements import VG, VT
 from asamint.utils import slicer
@@ -92,7 +91,10 @@ def get_content(
 
 class CdfWalker:
     def __init__(self, db_name: str) -> None:
-        self.db = MSRSWDatabase(db_name)
+        # Imported here: loading the MSRSW ORM schema takes seconds.
+        from asamint.calibration.msrsw_db import MSRSWDatabase
+
+        self.db = MSRSWDatabase(db_name, profile="concurrent-read")
         self.session = self.db.session
 
     def on_instance(self, instance: elements.Instance) -> None:
@@ -390,6 +392,8 @@ class CdfWalker:
         return cp
 
     def run(self) -> None:
+        from asamint.calibration.msrsw_db import SwInstance, SwInstanceSpec
+
         spec = self.session.query(SwInstanceSpec).first()
         tree = spec.sw_instance_tree[0]
         collections = tree.sw_cs_collections
@@ -72,8 +72,12 @@ def finalize_daq_csv(
     hdf5_out: Optional[str | Path] = None,
     units: Optional[dict[str, Optional[str]]] = None,
     project_meta: Optional[dict[str, Any]] = None,
+    workers: int = 1,
 ) -> Any:
-    """CLI-friendly wrapper to finalize DAQ CSV outputs into CSV/HDF5 with metadata."""
+    """CLI-friendly wrapper to finalize DAQ CSV outputs into CSV/HDF5 with metadata.
+
+    *workers* > 1 parses the CSV files concurrently in as many processes.
+    """
 
     if project_meta is None:
         app = get_application()
@@ -97,4 +101,5 @@ def finalize_daq_csv(
         project_meta=project_meta,
         csv_out=csv_out_path,
         hdf5_out=hdf5_out_path,
+        workers=workers,
     )
@@ -26,11 +26,16 @@ __copyright__ = """
 __author__ = "Christoph Schueler"
 
 
+from collections import OrderedDict
 from collections.abc import Iterator, Mapping
 import logging
-from typing import Any, Optional
+import threading
+from typing import Any, Callable, Optional
+import weakref
 
-from asamint.adapters.a2l import model
+import numpy as np
+
+from asamint.adapters.a2l import CompuMethod, model
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +132,228 @@ def getCM(session: Any, name: str) -> Optional[Any]:
         return None
 
 
+class CompiledConversion:
+    """Pre-compiled, array-oriented INT ==> PHYS conversion of a `COMPU_METHOD`.
+
+    IDENTICAL, LINEAR, RAT_FUNC (linear cases) and the table based conversions
+    (TAB_INTP, TAB_NOINTP, TAB_VERB with and without ranges) are evaluated with
+    plain numpy (``np.interp`` / ``np.searchsorted``); everything else
+    (FORM, non-invertible RAT_FUNC) is delegated to the pya2l evaluator.
+
+    Parameters
+    ----------
+    compu_method: `CompuMethod` (or `NoCompuMethod`) instance.
+
+    Note
+    ----
+    TAB_INTP inputs outside the table range are mapped to the default value
+    (NaN if there is none) element-wise, whereas pya2l replaces the whole
+    result by the default value.
+    """
+
+    def __init__(self, compu_method: Any) -> None:
+        self.compu_method = compu_method
+        self.name = compu_method.name
+        self.conversion_type = compu_method.conversionType
+        self.unit = compu_method.unit
+        self._func: Callable[[Any], Any] = self._compile(compu_method)
+
+    def int_to_physical(self, values: Any) -> Any:
+        """Convert internal (ECU) value(s), scalar or array-like, to physical value(s)."""
+        return self._func(values)
+
+    def _compile(self, cm: Any) -> Callable[[Any], Any]:  # noqa: C901
+        conversion_type = self.conversion_type
+        if conversion_type in ("IDENTICAL", "NO_COMPU_METHOD"):
+            return _identity
+        if conversion_type == "LINEAR":
+            return _linear(cm.coeffs_linear.a, cm.coeffs_linear.b)
+        if conversion_type == "RAT_FUNC":
+            c = cm.coeffs
+            if c.a == 0 and c.d == 0 and c.e == 0 and c.b != 0 and c.f != 0:
+                # INT = (b * PHYS + c) / f  ==>  PHYS = (f / b) * INT - c / b
+                return _linear(c.f / c.b, -c.c / c.b)
+            if c.a == 0 and c.b == 0 and c.d == 0 and c.e != 0:
+                return _reciprocal(c.c, c.e, c.f)
+        elif conversion_type in ("TAB_INTP", "TAB_NOINTP") and cm.tab is not None and cm.tab.in_values:
+            if cm.tab.interpolation:
+                return _interpolated_table(cm.tab.in_values, cm.tab.out_values, cm.tab.default_value)
+            return _lookup_table(cm.tab.in_values, cm.tab.out_values, cm.evaluator.default)
+        elif conversion_type == "TAB_VERB":
+            if cm.tab_verb is not None and cm.tab_verb.in_values:
+                return _lookup_table(cm.tab_verb.in_values, cm.tab_verb.text_values, cm.evaluator.default)
+            if cm.tab_verb_ranges is not None and cm.tab_verb_ranges.lower_values:
+                ranges = cm.tab_verb_ranges
+                return _range_table(ranges.lower_values, ranges.upper_values, ranges.text_values, cm.evaluator.default)
+        return cm.int_to_physical
+
+    def __repr__(self) -> str:
+        return f"CompiledConversion(name={self.name!r}, conversion_type={self.conversion_type!r})"
+
+
+def _identity(values: Any) -> Any:
+    # Copy: raw and physical values must not alias each other.
+    return np.array(values, copy=True)[()]
+
+
+def _as_result(result: np.ndarray, values: Any) -> Any:
+    """Return a scalar for scalar input, an array otherwise."""
+    return result[()] if np.ndim(values) == 0 else result
+
+
+def _linear(a: float, b: float) -> Callable[[Any], Any]:
+    def evaluate(values: Any) -> Any:
+        return (a * np.asarray(values, dtype=np.float64) + b)[()]
+
+    return evaluate
+
+
+def _reciprocal(c: float, e: float, f: float) -> Callable[[Any], Any]:
+    def evaluate(values: Any) -> Any:
+        return (c / (e * np.asarray(values, dtype=np.float64) + f))[()]
+
+    return evaluate
+
+
+def _interpolated_table(xs: list[float], ys: list[float], default: Optional[float]) -> Callable[[Any], Any]:
+    x = np.asarray(xs, dtype=np.float64)
+    y = np.asarray(ys, dtype=np.float64)
+    fill = np.nan if default is None else default
+
+    def evaluate(values: Any) -> Any:
+        v = np.asarray(values, dtype=np.float64)
+        result = np.interp(v, x, y)
+        return _as_result(np.where((v < x[0]) | (v > x[-1]), fill, result), values)
+
+    return evaluate
+
+
+def _lookup_table(keys: list[float], outputs: list[Any], default: Any) -> Callable[[Any], Any]:
+    # Keys are truncated to int, like pya2l's ``LookupTable``.
+    mapping = dict(zip((int(k) for k in keys), outputs, strict=True))
+    k = np.fromiter(sorted(mapping), dtype=np.float64, count=len(mapping))
+    out = np.asarray([mapping[int(key)] for key in k])
+    last = len(k) - 1
+    fill = np.nan if default is None and out.dtype.kind in "iuf" else default
+
+    def evaluate(values: Any) -> Any:
+        v = np.asarray(values)
+        if v.ndim == 0:
+            return mapping.get(values, default)
+        idx = np.minimum(np.searchsorted(k, v), last)
+        return np.where(k[idx] == v, out[idx], fill)
+
+    return evaluate
+
+
+def _range_table(lowers: list[float], uppers: list[float], texts: list[str], default: Any) -> Callable[[Any], Any]:
+    order = np.argsort(lowers, kind="stable")
+    lo = np.asarray(lowers, dtype=np.float64)[order]
+    hi = np.asarray(uppers, dtype=np.float64)[order]
+    out = np.asarray(texts)[order]
+
+    def evaluate(values: Any) -> Any:
+        v = np.asarray(values, dtype=np.float64)
+        pos = np.searchsorted(lo, v, side="right") - 1
+        idx = np.maximum(pos, 0)
+        result = np.where((pos >= 0) & (v <= hi[idx]), out[idx], default)
+        return result.item() if result.ndim == 0 else result
+
+    return evaluate
+
+
+class ConversionCache:
+    """Process-wide, bounded (LRU) cache of `CompiledConversion` objects.
+
+    Entries are keyed by session and `COMPU_METHOD` name.
+
+    Parameters
+    ----------
+    maxsize: int
+        Maximum number of compiled conversions kept.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[int, str], tuple[Any, CompiledConversion]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session: Any, compu_method: Any) -> Any:
+        """Get the compiled conversion for `compu_method`.
+
+        Parameters
+        ----------
+        session: `SQLAlchemy` session instance.
+
+        compu_method: str or `CompuMethod`
+            Name of the `COMPU_METHOD` or an already resolved pya2l `CompuMethod`.
+            Objects that are not pya2l compu methods (e.g. test doubles) are returned unchanged.
+
+        Returns
+        -------
+        `CompiledConversion` (or `compu_method` itself, s.a.)
+        """
+        if isinstance(compu_method, str):
+            name = compu_method
+            source = None
+        elif isinstance(compu_method, CompuMethod) or type(compu_method).__name__ == "NoCompuMethod":
+            name = compu_method.name or "NO_COMPU_METHOD"
+            source = compu_method
+        else:
+            return compu_method
+        key = (id(session), name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                session_ref, compiled = entry
+                if session_ref() is session and (source is None or compiled.compu_method is source):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return compiled
+            self.misses += 1
+        if source is None:
+            source = CompuMethod.get(session, name)
+        compiled = CompiledConversion(source)
+        with self._lock:
+            self._entries[key] = (_session_ref(session), compiled)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _session_ref(session: Any) -> Callable[[], Any]:
+    try:
+        return weakref.ref(session)
+    except TypeError:
+        return lambda: session
+
+
+#: The process-wide conversion cache used by measurement and calibration code.
+conversion_cache = ConversionCache()
+
+
+def compiled_conversion(session: Any, compu_method: Any) -> Any:
+    """Shortcut for ``conversion_cache.get(session, compu_method)``."""
+    return conversion_cache.get(session, compu_method)
+
+
 if __name__ == "__main__":
     import pya2l  # noqa: E402 — only used in standalone script mode
 
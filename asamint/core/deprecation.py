@@ -40,6 +40,19 @@ def _resolve_target(target: str, module_globals: dict[str, object]) -> object:
     return module_globals[target]
 
 
+def warn_deprecated(name: str, alias: DeprecatedAlias, stacklevel: int = 2) -> None:
+    """Emit the :class:`DeprecationWarning` for accessing *name*.
+
+    Also usable for deprecated instance attributes (from a ``property``).
+    """
+    replacement = alias.replacement or alias.target
+    warn(
+        (f"{name!r} is deprecated. Use {replacement!r} instead. It will be removed in {alias.remove_in_version}."),
+        category=DeprecationWarning,
+        stacklevel=stacklevel + 1,
+    )
+
+
 def deprecated_getattr(
     name: str,
     aliases: dict[str, DeprecatedAlias],
@@ -55,12 +68,7 @@ def deprecated_getattr(
     if alias is None:
         raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
 
-    replacement = alias.replacement or alias.target
-    warn(
-        (f"{name!r} is deprecated. Use {replacement!r} instead. It will be removed in {alias.remove_in_version}."),
-        category=DeprecationWarning,
-        stacklevel=2,
-    )
+    warn_deprecated(name, alias, stacklevel=2)
     return _resolve_target(alias.target, module_globals)
 
 
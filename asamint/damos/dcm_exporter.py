@@ -186,7 +186,7 @@ class DcmExporter:
 
 
 def export_to_dcm(db_path: str | Path, output_dcm_path: str | Path, h5_path: str | Path = None) -> bool:
-    db = MSRSWDatabase(db_path)
+    db = MSRSWDatabase(db_path, profile="concurrent-read")
 
     h5_db = None
     if h5_path:
@@ -25,8 +25,10 @@ __copyright__ = """
    s. FLOSS-EXCEPTION.txt
 """
 
+import asyncio
 import time
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, TypedDict, Union
@@ -40,27 +42,30 @@ from asamint.adapters.measurement import (
     get_measurement_format,
     register_measurement_format,
 )
-from asamint.adapters.xcp import ArgumentParser, DaqList, Hdf5OnlinePolicy
+from asamint.adapters.xcp import DaqList, Hdf5OnlinePolicy
 from asamint.config import get_application
 from asamint.core.deprecation import DeprecatedAlias, deprecated_dir, deprecated_getattr
 from asamint.core.logging import configure_logging
+from asamint.measurement.capture import DaqCaptureEngine, Overflow, tapped_policy
 from asamint.measurement.csv import (
+    DaqCsvReader,
     _csv_fieldnames,
     _iter_csv_rows,
     _merge_daq_csv_results,
     _parse_daq_csv,
-    _read_daq_csv_rows,
     _timestamp_index,
     _write_csv,
     _write_metadata_headers,
 )
 from asamint.measurement.hdf5 import (
     HDF5Creator,
+    HDF5Storage,
+    HDF5StreamWriter,
     _annotate_daq_hdf5_metadata,
     _annotate_hdf5_root,
     _write_hdf5,
 )
-from asamint.measurement.mdf import MDFCreator
+from asamint.measurement.mdf import MDFCreator, MDFStreamWriter
 
 logger = configure_logging(__name__)
 
@@ -104,7 +109,6 @@ __all__ = [
     "_iter_csv_rows",
     "_write_csv",
     "_parse_daq_csv",
-    "_read_daq_csv_rows",
     "_timestamp_index",
     "_compute_timebase_metadata",
     "_median_timebase",
@@ -121,8 +125,12 @@ __all__ = [
     "available_measurement_formats",
     "register_measurement_format",
     "get_measurement_format",
+    "DaqCsvReader",
     "HDF5Creator",
+    "HDF5Storage",
+    "HDF5StreamWriter",
     "MDFCreator",
+    "MDFStreamWriter",
 ]
 
 _DEPRECATED_ALIASES: dict[str, DeprecatedAlias] = {}
@@ -365,6 +373,8 @@ class RunResult:
     # Optional summary of detected timebases (one entry per distinct timestamp source)
     # Each item: {"group_id": int, "timestamp_source": str, "timebase_s": float|None, "members": [signal names]}
     timebases: Optional[list[dict[str, Any]]] = None
+    # Polling loop timing/jitter statistics (see AsamMC.acquire_via_pyxcp), None for other acquisition modes
+    timing: Optional[dict[str, Any]] = None
 
 
 def _resolve_output_format(preferred: Optional[str], hdf5_out: Optional[str]) -> str:
@@ -608,7 +618,7 @@ def _prepare_daq_metadata(
 
 
 def finalize_measurement_outputs(
-    data: dict[str, Any],
+    data: Mapping[str, Any],
     units: Optional[dict[str, Optional[str]]] = None,
     project_meta: Optional[dict[str, Any]] = None,
     csv_out: Optional[str | Path] = None,
@@ -616,6 +626,7 @@ def finalize_measurement_outputs(
     signal_metadata: Optional[dict[str, dict[str, Any]]] = None,
     *,
     hdf5_only: bool = False,
+    csv_float_format: Optional[str] = None,
 ) -> RunResult:
     """Persist measurement data to CSV/HDF5 with metadata and return paths/meta.
 
@@ -627,6 +638,8 @@ def finalize_measurement_outputs(
         hdf5_out: Target HDF5 path (absolute or relative to CWD).
         signal_metadata: Optional per-signal metadata to merge (e.g., compu methods).
         hdf5_only: If True, skip CSV writing even if ``csv_out`` is provided.
+        csv_float_format: Optional ``%``-format for floating-point CSV cells (e.g. ``"%.6g"``);
+            by default floats are written with their shortest round-trip representation.
 
     Returns:
         RunResult with written CSV/HDF5 paths and per-signal metadata.
@@ -659,7 +672,7 @@ def finalize_measurement_outputs(
         csv_path = Path(csv_out)
         if not csv_path.is_absolute():
             csv_path = Path.cwd() / csv_path
-        _write_csv(csv_path, data, units, project_meta, meta_with_units)
+        _write_csv(csv_path, data, units, project_meta, meta_with_units, float_format=csv_float_format)
 
     if hdf5_out is not None:
         h5_path = Path(hdf5_out)
@@ -686,13 +699,17 @@ def finalize_from_daq_csv(
     hdf5_out: Optional[str | Path] = None,
     *,
     hdf5_only: bool = False,
+    workers: int = 1,
 ) -> RunResult:
-    """Merge DAQ CSV results, compute metadata, and persist to CSV/HDF5."""
+    """Merge DAQ CSV results, compute metadata, and persist to CSV/HDF5.
+
+    *workers* > 1 parses the CSV files concurrently in as many processes.
+    """
 
     files = [Path(p) for p in csv_files]
     if not files:
         raise ValueError("No CSV files provided for finalization.")
-    data = _merge_daq_csv_results(files)
+    data = _merge_daq_csv_results(files, workers=workers)
     if not data:
         raise ValueError("No data parsed from DAQ CSV files.")
     return finalize_measurement_outputs(
@@ -852,25 +869,30 @@ def _execute_daq_capture(
     metadata: Optional[dict[str, Any]] = None,
 ) -> str:
     target_hdf5 = hdf5_out or _auto_filename(shortname or "daq", "h5")
-    daq_parser = Hdf5OnlinePolicy(target_hdf5, daq_lists, **(metadata or {}))
-    ap = ArgumentParser(description="asamint DAQ run")
-    with ap.run(policy=daq_parser) as connection:
-        connection.connect()
-        if connection.slaveProperties.optionalCommMode:
-            connection.getCommModeInfo()
-        connection.cond_unlock("DAQ")
-        daq_parser.setup()
-        daq_parser.start()
-        try:
-            if samples is not None and period_s:
-                time.sleep(max(0.0, samples * float(period_s)))
-            elif duration is not None:
-                time.sleep(max(0.0, float(duration)))
-            else:
-                time.sleep(1.0)
-        finally:
-            daq_parser.stop()
-            connection.disconnect()
+    daq_parser = tapped_policy(Hdf5OnlinePolicy)(target_hdf5, daq_lists, **(metadata or {}))
+    if samples is not None and period_s:
+        run_time = max(0.0, samples * float(period_s))
+    elif duration is not None:
+        run_time = max(0.0, float(duration))
+    else:
+        run_time = 1.0
+    # HDF5 writing happens inside the policy; the engine only observes, so it must never stall the receiver.
+    engine = DaqCaptureEngine(daq_parser, overflow=Overflow.DROP_OLDEST)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        stats = asyncio.run(engine.run(duration=run_time))
+    else:
+        # Called from within an event loop (e.g. Jupyter), where asyncio.run() refuses to start: use a private loop.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            stats = pool.submit(lambda: asyncio.run(engine.run(duration=run_time))).result()
+    logger.info(
+        "DAQ capture finished: %d frames (%.1f frames/s, %.1f kB/s) in %.2f s.",
+        stats.frames,
+        stats.frames_per_s,
+        stats.bytes_per_s / 1024.0,
+        stats.elapsed_s,
+    )
     return target_hdf5
 
 
@@ -1009,9 +1031,10 @@ def _run_polling_flow(
         samples=samples,
         period_s=period_s or 0.01,
     )
+    timing = getattr(creator, "acquisition_timing", None)
     if isinstance(creator, MDFCreator):
         mdf_path = mdf_out or creator.generate_filename(".mf4")
-        return creator.save_measurements(
+        result = creator.save_measurements(
             mdf_filename=mdf_path,
             data=data,
             csv_out=csv_out,
@@ -1021,16 +1044,21 @@ def _run_polling_flow(
             strict_no_synth=strict_no_synth,
             project_meta=project_meta,
         )
+        if result is not None:
+            result.timing = timing
+        return result
     if isinstance(creator, HDF5Creator):
         csv_target = csv_out or mdf_out
         h5_target = hdf5_out or creator.generate_filename(".h5")
-        return finalize_measurement_outputs(
+        result = finalize_measurement_outputs(
             data=data,
             units=None,
             project_meta=project_meta,
             csv_out=csv_target,
             hdf5_out=h5_target,
         )
+        result.timing = timing
+        return result
     return RunResult(
         mdf_path=None,
         csv_path=None,
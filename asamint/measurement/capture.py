@@ -0,0 +1,320 @@
+"""
+asyncio front end for XCP DAQ measurements.
+
+pyXCP delivers decoded DAQ lists on its transport thread via
+``DaqOnlinePolicy.on_daq_list``.  :func:`tapped_policy` derives a policy class
+which, besides its normal processing (e.g. writing HDF5), forwards every frame
+to a sink.  :class:`DaqCaptureEngine` installs itself as that sink and exposes
+the frames as an async iterator backed by a bounded buffer, together with live
+throughput counters.
+
+Example::
+
+    policy = tapped_policy(Hdf5OnlinePolicy)("run.h5", daq_lists)
+    async with DaqCaptureEngine(policy, maxsize=10_000, overflow="drop_oldest") as engine:
+        async for frame in engine:
+            if frame.payload[0] > LIMIT:
+                break
+    print(engine.stats)
+
+Several engines may run concurrently (``asyncio.gather``); each XCP session is
+opened and closed in a worker thread so the event loop is never blocked.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from asamint.adapters.xcp import ArgumentParser
+
+
+class Overflow(str, Enum):
+    """What to do with a new frame if the capture buffer is full."""
+
+    BLOCK = "block"
+    """Stall the XCP receive thread until the consumer catches up (back-pressure)."""
+    DROP_NEWEST = "drop_newest"
+    """Discard the incoming frame."""
+    DROP_OLDEST = "drop_oldest"
+    """Discard the oldest buffered frame."""
+
+
+@dataclass(frozen=True, slots=True)
+class DaqFrame:
+    """One decoded DAQ list sample as delivered by pyXCP."""
+
+    daq_list: int
+    timestamp0: int
+    timestamp1: int
+    payload: list[Any]
+
+
+@dataclass(frozen=True, slots=True)
+class CaptureStats:
+    """Snapshot of the counters of a :class:`DaqCaptureEngine`."""
+
+    frames: int
+    bytes: int
+    dropped: int
+    queued: int
+    elapsed_s: float
+
+    @property
+    def frames_per_s(self) -> float:
+        return self.frames / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def bytes_per_s(self) -> float:
+        return self.bytes / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+class FrameTap:
+    """Policy mixin forwarding every DAQ list sample to :attr:`frame_sink` after regular processing."""
+
+    frame_sink: Optional[Callable[[int, int, int, list[Any]], None]] = None
+
+    def on_daq_list(self, daq_list: int, timestamp0: int, timestamp1: int, payload: list[Any]) -> None:
+        super().on_daq_list(daq_list, timestamp0, timestamp1, payload)
+        sink = self.frame_sink
+        if sink is not None:
+            sink(daq_list, timestamp0, timestamp1, payload)
+
+
+@lru_cache(maxsize=None)
+def tapped_policy(policy_class: type) -> type:
+    """Subclass of the DAQ policy class *policy_class* with :class:`FrameTap` mixed in."""
+    return type(f"Tapped{policy_class.__name__}", (FrameTap, policy_class), {})
+
+
+@contextmanager
+def xcp_daq_session(policy: Any) -> Iterator[Any]:
+    """Connect to the XCP slave configured on the command line and run *policy* until exit."""
+    ap = ArgumentParser(description="asamint DAQ run")
+    with ap.run(policy=policy) as connection:
+        connection.connect()
+        if connection.slaveProperties.optionalCommMode:
+            connection.getCommModeInfo()
+        connection.cond_unlock("DAQ")
+        policy.setup()
+        policy.start()
+        try:
+            yield connection
+        finally:
+            policy.stop()
+            connection.disconnect()
+
+
+_TYPE_BITS = re.compile(r"(\d+)$")
+
+
+def _record_size(daq_list: Any) -> int:
+    """Payload size in bytes of one sample of *daq_list* (from its ``headers``)."""
+    size = 0
+    for _, data_type in getattr(daq_list, "headers", None) or ():
+        match = _TYPE_BITS.search(str(data_type))
+        size += int(match.group(1)) // 8 if match else 0
+    return size
+
+
+class DaqCaptureEngine:
+    """
+    Run a tapped DAQ policy and stream its frames into asyncio.
+
+    Frames are buffered in a deque of at most *maxsize* entries; the
+    *overflow* policy decides between back-pressure and dropping once the
+    consumer falls behind.  The wrapped policy itself always sees every frame.
+
+    Args:
+        policy: DAQ policy created from :func:`tapped_policy`.
+        maxsize: Capacity of the frame buffer.
+        overflow: :class:`Overflow` member or its value.
+        session_factory: Callable returning a context manager which runs the
+            XCP session for *policy*; defaults to :func:`xcp_daq_session`.
+    """
+
+    def __init__(
+        self,
+        policy: Any,
+        *,
+        maxsize: int = 4096,
+        overflow: Overflow | str = Overflow.BLOCK,
+        session_factory: Callable[[Any], AbstractContextManager[Any]] = xcp_daq_session,
+    ) -> None:
+        if not isinstance(policy, FrameTap):
+            raise TypeError(f"{type(policy).__name__} is not a tapped policy; create it via tapped_policy().")
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}.")
+        self.policy = policy
+        self.maxsize = maxsize
+        self.overflow = Overflow(overflow)
+        self.session_factory = session_factory
+        self._buffer: deque[DaqFrame] = deque()
+        self._cond = threading.Condition()
+        self._record_sizes: dict[int, int] = {}
+        self._frames = 0
+        self._bytes = 0
+        self._dropped = 0
+        self._started: Optional[float] = None
+        self._stopped: Optional[float] = None
+        self._closing = False
+        self._finished = False
+        self._consumer_waiting = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._readable: Optional[asyncio.Event] = None
+        self._session: Optional[AbstractContextManager[Any]] = None
+
+    # -- Life cycle ------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Open the XCP session and start the DAQ lists."""
+        if self._session is not None:
+            raise RuntimeError("DaqCaptureEngine already started.")
+        self._loop = asyncio.get_running_loop()
+        self._readable = asyncio.Event()
+        self.policy.frame_sink = self._offer
+        self._session = self.session_factory(self.policy)
+        self._started = time.perf_counter()
+        try:
+            await self._loop.run_in_executor(None, self._session.__enter__)
+        except BaseException:
+            self.policy.frame_sink = None
+            self._finish()
+            raise
+
+    async def stop(self) -> None:
+        """Stop the DAQ lists and close the session; buffered frames remain readable."""
+        if self._session is None or self._finished:
+            return
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        try:
+            await asyncio.shield(self._loop.run_in_executor(None, self._session.__exit__, None, None, None))
+        finally:
+            self.policy.frame_sink = None
+            self._finish()
+
+    def _finish(self) -> None:
+        self._stopped = time.perf_counter()
+        with self._cond:
+            self._closing = True
+            self._finished = True
+            self._cond.notify_all()
+        self._readable.set()
+
+    async def __aenter__(self) -> DaqCaptureEngine:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.stop()
+
+    async def run(
+        self,
+        *,
+        duration: Optional[float] = None,
+        max_frames: Optional[int] = None,
+        until: Optional[Callable[[DaqFrame], bool]] = None,
+    ) -> CaptureStats:
+        """Capture until *duration* seconds passed, *max_frames* were consumed or *until* returns true.
+
+        Returns:
+            Final counters.
+        """
+        consumed = 0
+
+        async def _consume() -> None:
+            nonlocal consumed
+            async for frame in self:
+                consumed += 1
+                if (max_frames is not None and consumed >= max_frames) or (until is not None and until(frame)):
+                    return
+
+        async with self:
+            try:
+                await asyncio.wait_for(_consume(), timeout=duration)
+            except asyncio.TimeoutError:
+                pass
+        return self.stats
+
+    # -- Producer side (XCP receive thread) ------------------------------------
+
+    def _offer(self, daq_list: int, timestamp0: int, timestamp1: int, payload: list[Any]) -> None:
+        size = self._record_sizes.get(daq_list)
+        if size is None:
+            daq_lists = getattr(self.policy, "daq_lists", None) or ()
+            size = self._record_sizes[daq_list] = _record_size(daq_lists[daq_list]) if daq_list < len(daq_lists) else 0
+        self._frames += 1
+        self._bytes += size
+        frame = DaqFrame(daq_list, timestamp0, timestamp1, payload)
+        with self._cond:
+            if len(self._buffer) >= self.maxsize and not self._closing:
+                if self.overflow is Overflow.BLOCK:
+                    self._cond.wait_for(lambda: len(self._buffer) < self.maxsize or self._closing)
+                elif self.overflow is Overflow.DROP_NEWEST:
+                    self._dropped += 1
+                    return
+                else:
+                    self._buffer.popleft()
+                    self._dropped += 1
+            self._buffer.append(frame)
+            wake = self._consumer_waiting
+            self._consumer_waiting = False
+        if wake:
+            self._loop.call_soon_threadsafe(self._readable.set)
+
+    # -- Consumer side ----------------------------------------------------------
+
+    def __aiter__(self) -> AsyncIterator[DaqFrame]:
+        return self
+
+    async def __anext__(self) -> DaqFrame:
+        if self._readable is None:
+            raise RuntimeError("DaqCaptureEngine not started.")
+        while True:
+            with self._cond:
+                if self._buffer:
+                    frame = self._buffer.popleft()
+                    self._cond.notify()
+                    return frame
+                if self._finished:
+                    raise StopAsyncIteration
+                self._readable.clear()
+                self._consumer_waiting = True
+            await self._readable.wait()
+
+    @property
+    def stats(self) -> CaptureStats:
+        """Current counters; rates refer to the time since :meth:`start`."""
+        if self._started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._stopped or time.perf_counter()) - self._started
+        return CaptureStats(
+            frames=self._frames,
+            bytes=self._bytes,
+            dropped=self._dropped,
+            queued=len(self._buffer),
+            elapsed_s=elapsed,
+        )
+
+
+__all__ = [
+    "CaptureStats",
+    "DaqCaptureEngine",
+    "DaqFrame",
+    "FrameTap",
+    "Overflow",
+    "tapped_policy",
+    "xcp_daq_session",
+]
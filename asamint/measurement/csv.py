@@ -3,14 +3,16 @@ from __future__ import annotations
 
 import csv
 import warnings
-from io import StringIO
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
 from typing import Any, Optional
 
 import numpy as np
 
 from asamint.core.logging import configure_logging
+from asamint.utils import mp_context
 
 logger = configure_logging(__name__)
 
@@ -71,60 +73,103 @@ def _iter_csv_rows(timestamps: list[Any], series_keys: list[str], data: dict[str
         yield row
 
 
+# Cells formatted per block of rows; bounds the memory of the formatted strings independent of the column count.
+CSV_BLOCK_CELLS = 256 * 1024
+_CSV_LINE_TERMINATOR = "\r\n"  # as written by csv.writer
+
+
+def _csv_quote(value: str) -> str:
+    """Quote *value* like ``csv.QUOTE_MINIMAL``."""
+    if any(ch in value for ch in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _csv_column(series: Any, start: int, stop: int, float_format: Optional[str] = None) -> list[str]:
+    """Cells of rows ``start:stop`` of one series; rows past its end (or of a missing series) are empty."""
+    if isinstance(series, np.ndarray) and series.ndim == 1 and series.dtype.kind in "biufc":
+        values = series[start:stop]
+        if values.dtype.kind == "f" and float_format is not None:
+            cells = [float_format % value for value in values.tolist()]
+        elif values.dtype.kind in "biu" or values.dtype == np.float64:
+            # Python ints / floats print like their NumPy counterparts (shortest round-trip repr).
+            cells = list(map(str, values.tolist()))
+        else:
+            cells = values.astype(str).tolist()
+    else:
+        try:
+            # csv.writer writes None as an empty field.
+            cells = ["" if value is None else _csv_quote(str(value)) for value in series[start:stop]]
+        except (TypeError, IndexError):  # None or a 0-d array
+            cells = []
+    if len(cells) < stop - start:
+        cells.extend([""] * (stop - start - len(cells)))
+    return cells
+
+
+def _csv_numeric_block(columns: list[Any], start: int, stop: int, float_format: str) -> Optional[str]:
+    """Rows ``start:stop`` through one pre-built format string, or ``None`` unless all columns are full numeric arrays."""
+    formats: list[str] = []
+    values: list[list[Any]] = []
+    for series in columns:
+        if not (isinstance(series, np.ndarray) and series.ndim == 1 and series.dtype.kind in "iuf" and series.shape[0] >= stop):
+            return None
+        formats.append(float_format if series.dtype.kind == "f" else "%d")
+        values.append(series[start:stop].tolist())
+    row_format = ",".join(formats) + _CSV_LINE_TERMINATOR
+    return (row_format * (stop - start)) % tuple(chain.from_iterable(zip(*values, strict=True)))
+
+
 def _write_csv(
     csv_path: Path,
     data: dict[str, Any],
     units: dict[str, Optional[str]],
     project_meta: Optional[dict[str, Any]] = None,
     meta: Optional[dict[str, dict[str, Any]]] = None,
+    *,
+    float_format: Optional[str] = None,
 ) -> None:
-    flush_threshold_bytes = 512 * 1024
+    """Write *data* column-wise as CSV below the metadata header.
+
+    Rows are formatted in blocks of about :data:`CSV_BLOCK_CELLS` cells: every
+    column of a block is converted to strings at once, shorter series are padded
+    with empty cells, and the block is written in one piece.  By default the
+    output is the same as writing :func:`_iter_csv_rows` through ``csv.writer``
+    (shortest round-trip representation of floats).
+
+    Args:
+        float_format: Optional ``%``-format for floating-point samples, e.g. ``"%.6g"`` or
+            ``"%.17g"``.  Blocks of numeric samples are then formatted through one
+            pre-built format string, which is considerably faster than the default.
+    """
     fieldnames = _csv_fieldnames(data)
+    series_keys = fieldnames[1:]
+    ts = data.get("TIMESTAMPS")
+    if ts is None:
+        max_len = 0
+        for k, v in data.items():
+            if k == "TIMESTAMPS":
+                continue
+            try:
+                max_len = max(max_len, len(v))
+            except TypeError as exc:
+                logger.debug("Cannot determine length for series %s: %s", k, exc)
+        ts = np.arange(max_len)
+    elif not isinstance(ts, np.ndarray):
+        ts = list(ts)
+    columns = [ts] + [data.get(key) for key in series_keys]
+    row_count = len(ts)
+    block_rows = max(1, CSV_BLOCK_CELLS // len(columns))
     with csv_path.open("w", newline="", encoding="utf-8") as fh:
         _write_metadata_headers(fh, units, project_meta, meta)
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-        writer.writerow(fieldnames)
-        ts = data.get("TIMESTAMPS")
-        if ts is None:
-            max_len = 0
-            for k, v in data.items():
-                if k == "TIMESTAMPS":
-                    continue
-                try:
-                    max_len = max(max_len, len(v))
-                except TypeError as exc:
-                    logger.debug("Cannot determine length for series %s: %s", k, exc)
-            ts = list(range(max_len))
-        series_keys = [k for k in fieldnames if k != "timestamp"]
-
-        def flush_buffer() -> None:
-            if buffer.tell() == 0:
-                return
-            fh.write(buffer.getvalue())
-            buffer.seek(0)
-            buffer.truncate(0)
-
-        for row in _iter_csv_rows(list(ts), series_keys, data):
-            writer.writerow(row)
-            if buffer.tell() >= flush_threshold_bytes:
-                flush_buffer()
-        flush_buffer()
-
-
-def _read_daq_csv_rows(csv_file: Path) -> tuple[list[str], list[list[str]]]:
-    columns: list[str] = []
-    rows: list[list[str]] = []
-    with csv_file.open("r", encoding="utf-8", newline="") as fh:
-        reader = csv.reader(fh)
-        for raw in reader:
-            if not raw or raw[0].startswith("#"):
-                continue
-            if not columns:
-                columns = [c.strip() for c in raw]
-                continue
-            rows.append(raw)
-    return columns, rows
+        fh.write(",".join(_csv_quote(name) for name in fieldnames) + _CSV_LINE_TERMINATOR)
+        for start in range(0, row_count, block_rows):
+            stop = min(start + block_rows, row_count)
+            block = None if float_format is None else _csv_numeric_block(columns, start, stop, float_format)
+            if block is None:
+                cells = [_csv_column(series, start, stop, float_format) for series in columns]
+                block = _CSV_LINE_TERMINATOR.join(map(",".join, zip(*cells, strict=True))) + _CSV_LINE_TERMINATOR
+            fh.write(block)
 
 
 def _timestamp_index(headers: list[str]) -> Optional[int]:
@@ -132,109 +177,197 @@ def _timestamp_index(headers: list[str]) -> Optional[int]:
     return next((i for i, col in enumerate(headers) if col in ts_names), None)
 
 
-def _parse_daq_csv(csv_file: Path) -> dict[str, Any]:
-    """
-    Parse a single CSV produced by pyXCP DaqToCsv.
+# Cells parsed per block (unless DaqCsvReader gets explicit block_rows); bounds the memory beyond the result arrays.
+DAQ_CSV_BLOCK_CELLS = 1 << 20
+# Data rows inspected to choose between int64 and float64 columns.
+_DTYPE_PROBE_ROWS = 1024
 
-    Returns a dict: {"TIMESTAMPS": np.ndarray | None, <signal>: np.ndarray, ...}
-    """
-    fast = _fast_parse_daq_csv(csv_file)
-    if fast is not None:
-        return fast
-    return _parse_daq_csv_python(csv_file)
 
+def _is_comment_or_blank(line: str) -> bool:
+    stripped = line.lstrip()
+    return not stripped or stripped.startswith("#")
 
-def _fast_parse_daq_csv(csv_file: Path) -> Optional[dict[str, Any]]:
-    """Fast path using numpy.genfromtxt; returns None to fall back on errors."""
 
+def _is_int(cell: str) -> bool:
     try:
-        first_non_ws: Optional[str] = None
-        with csv_file.open("r", encoding="utf-8") as fh:
-            for line in fh:
-                stripped = line.lstrip()
-                if not stripped:
-                    continue
-                first_non_ws = stripped[0]
-                break
-        if first_non_ws == "#":
-            return None
-    except (OSError, UnicodeDecodeError) as exc:  # pragma: no cover - guarded fallback
-        logger.debug("Fast CSV precheck skipped for %s: %s", csv_file, exc)
-        return None
+        int(cell)
+    except ValueError:
+        return False
+    return True
+
+
+class DaqCsvReader:
+    """Streaming, column-wise reader for DAQ CSV files.
+
+    Reads CSV files written by pyXCP ``DaqToCsv`` or :func:`_write_csv`: blank
+    lines and ``#`` metadata / comment lines are skipped, the first remaining
+    line names the columns.  Data rows are parsed in blocks of *block_rows*
+    lines (default: about :data:`DAQ_CSV_BLOCK_CELLS` cells) with ``numpy.loadtxt`` into typed arrays -- ``int64`` for columns whose
+    first rows are all integers (e.g. nanosecond timestamps), ``float64``
+    otherwise.  Blocks that do not parse cleanly (empty or non-numeric cells,
+    short rows) are parsed cell by cell instead: such cells become NaN, and
+    ``int64`` columns meeting a non-integer value continue as ``float64``.
+
+    Args:
+        csv_file: CSV file to read.
+        block_rows: Lines parsed per block; by default derived from the number of columns.
+
+    Attributes:
+        columns: Stripped column names of the header line (empty for a file without header).
+    """
 
-    try:
-        arr = np.genfromtxt(
-            csv_file,
-            delimiter=",",
-            names=True,
-            autostrip=True,
-            comments="#",
-            dtype=float,
-            invalid_raise=False,
-        )
-    except (OSError, ValueError, TypeError) as exc:  # pragma: no cover - guarded fallback
-        logger.debug("Fast CSV parse skipped for %s: %s", csv_file, exc)
-        return None
-
-    if arr.size == 0:
-        return {}
-    if arr.dtype.names is None:
-        return None
-
-    arr = np.atleast_1d(arr)
-    names = list(arr.dtype.names)
-    ts_idx = _timestamp_index(names)
-
-    result: dict[str, Any] = {}
-    for idx, name in enumerate(names):
-        series = np.asarray(arr[name])
-        if ts_idx is not None and idx == ts_idx:
-            result["TIMESTAMPS"] = series
-        else:
-            result[name] = series
+    def __init__(self, csv_file: str | Path, *, block_rows: Optional[int] = None) -> None:
+        if block_rows is not None and block_rows < 1:
+            raise ValueError(f"block_rows must be positive, got {block_rows}.")
+        self.csv_file = Path(csv_file)
+        self.block_rows = block_rows
+        self.columns: list[str] = []
+        self._dtypes: list[np.dtype] = []
+        self._filled: list[int] = []
+        self._rows = 0
+
+    def __iter__(self) -> Iterator[dict[str, np.ndarray]]:
+        return self.iter_blocks()
+
+    def iter_blocks(self) -> Iterator[dict[str, np.ndarray]]:
+        """Yield the data rows block by block as ``{column: array}``; cells missing in a row are NaN."""
+        for block in self._blocks():
+            yield dict(zip(self.columns, block, strict=True))
+
+    def read(self) -> dict[str, Any]:
+        """Read the whole file like :func:`_parse_daq_csv`.
+
+        The result arrays are allocated up front from a count of the lines in the
+        file and filled block by block, so parsing needs one block of memory on
+        top of the result.
+
+        Returns:
+            ``{"TIMESTAMPS": array, <signal>: array, ...}``; ``TIMESTAMPS`` only if a timestamp
+            column exists.  Trailing empty cells (the padding of shorter signals) are dropped.
+        """
+        capacity = self._count_lines()
+        arrays: list[np.ndarray] = []
+        row = 0
+        for block in self._blocks():
+            if not arrays:
+                arrays = [np.empty(capacity, dtype=values.dtype) for values in block]
+            count = len(block[0])
+            for idx, values in enumerate(block):
+                if arrays[idx].dtype != values.dtype:  # int64 column continued as float64
+                    arrays[idx] = arrays[idx].astype(values.dtype)
+                arrays[idx][row : row + count] = values
+            row += count
+        if not arrays:
+            return {}
+        ts_idx = _timestamp_index(self.columns)
+        return {"TIMESTAMPS" if idx == ts_idx else name: arrays[idx][: self._filled[idx]] for idx, name in enumerate(self.columns)}
+
+    def _count_lines(self) -> int:
+        count = 1
+        with self.csv_file.open("rb") as fh:
+            while chunk := fh.read(1 << 20):
+                count += chunk.count(b"\n")
+        return count
+
+    def _blocks(self) -> Iterator[list[np.ndarray]]:
+        with self.csv_file.open("r", encoding="utf-8", newline="") as fh:
+            header = next((line for line in fh if not _is_comment_or_blank(line)), None)
+            if header is None:
+                return
+            self.columns = [c.strip() for c in next(csv.reader([header]))]
+            self._dtypes = []
+            # Per column: number of rows up to and including its last non-empty cell.
+            self._filled = [0] * len(self.columns)
+            self._rows = 0
+            block_rows = self.block_rows or max(1, DAQ_CSV_BLOCK_CELLS // len(self.columns))
+            while lines := list(islice(fh, block_rows)):
+                if not self._dtypes:
+                    self._dtypes = self._probe_dtypes(lines)
+                    if not self._dtypes:
+                        continue  # only comments / blank lines so far
+                block = self._parse_block(lines)
+                if len(block[0]):
+                    yield block
+
+    def _probe_dtypes(self, lines: list[str]) -> list[np.dtype]:
+        probe = list(csv.reader(line for line in lines[:_DTYPE_PROBE_ROWS] if not _is_comment_or_blank(line)))
+        if not probe:
+            return []
+        dtypes = []
+        for idx in range(len(self.columns)):
+            cells = [row[idx] for row in probe if idx < len(row)]
+            dtypes.append(np.dtype(np.int64 if cells and all(map(_is_int, cells)) else np.float64))
+        return dtypes
+
+    def _parse_block(self, lines: list[str]) -> list[np.ndarray]:
+        record = np.dtype([(f"f{idx}", dtype) for idx, dtype in enumerate(self._dtypes)])
+        try:
+            parsed = np.loadtxt(lines, delimiter=",", dtype=record, comments="#", ndmin=1, quotechar='"')
+        except (ValueError, OverflowError):
+            return self._parse_block_cells(lines)
+        self._rows += len(parsed)
+        if len(parsed):
+            self._filled = [self._rows] * len(self.columns)
+        return [np.ascontiguousarray(parsed[name]) for name in record.names]
+
+    def _parse_block_cells(self, lines: list[str]) -> list[np.ndarray]:
+        rows = list(csv.reader(line for line in lines if not _is_comment_or_blank(line)))
+        columns = []
+        for idx in range(len(self.columns)):
+            values: list[Any] = []
+            for offset, row in enumerate(rows):
+                cell = row[idx].strip() if idx < len(row) else ""
+                if cell:
+                    self._filled[idx] = self._rows + offset + 1
+                if self._dtypes[idx].kind == "i" and _is_int(cell) and -(2**63) <= int(cell) < 2**63:
+                    values.append(int(cell))
+                    continue
+                self._dtypes[idx] = np.dtype(np.float64)
+                try:
+                    values.append(float(cell))
+                except ValueError:
+                    values.append(np.nan)
+            columns.append(np.array(values, dtype=self._dtypes[idx]))
+        self._rows += len(rows)
+        return columns
 
-    return result
 
+def _parse_daq_csv(csv_file: Path) -> dict[str, Any]:
+    """
+    Parse a single CSV produced by pyXCP DaqToCsv (or :func:`_write_csv`) with :class:`DaqCsvReader`.
 
-def _parse_daq_csv_python(csv_file: Path) -> dict[str, Any]:
-    """Original Python parser fallback for DAQ CSV files."""
-    columns, rows = _read_daq_csv_rows(csv_file)
-    if not columns:
-        return {}
+    Returns a dict: {"TIMESTAMPS": np.ndarray | None, <signal>: np.ndarray, ...}
+    """
+    return DaqCsvReader(csv_file).read()
 
-    norm = [c.strip() for c in columns]
-    ts_idx = _timestamp_index(norm)
 
-    col_data: list[list[float]] = [[] for _ in norm]
-    for row in rows:
-        for idx, value in enumerate(row):
-            try:
-                col_data[idx].append(float(value))
-            except (ValueError, TypeError, IndexError) as exc:
-                logger.debug("Skipping non-numeric value %r at column %s: %s", value, idx, exc)
-
-    result: dict[str, Any] = {}
-    if ts_idx is not None:
-        result["TIMESTAMPS"] = np.asarray(col_data[ts_idx])
-    for i, name in enumerate(norm):
-        if ts_idx is not None and i == ts_idx:
-            continue
-        result[name] = np.asarray(col_data[i])
-    return result
+def _parse_daq_csv_file(csv_file: Path) -> tuple[dict[str, Any], Optional[str]]:
+    """:func:`_parse_daq_csv` for a worker process: parse errors are returned, not raised."""
+    try:
+        return _parse_daq_csv(csv_file), None
+    except (OSError, ValueError, TypeError, UnicodeDecodeError) as e:
+        return {}, str(e)
 
 
-def _merge_daq_csv_results(files: Iterable[Path]) -> dict[str, Any]:
+def _merge_daq_csv_results(files: Iterable[Path], *, workers: int = 1) -> dict[str, Any]:
     """
     Merge multiple DaqToCsv CSV files into one data dict.
     Prefer the first file's timestamps if available; warn on length mismatches.
+
+    With *workers* > 1 the files are parsed concurrently in a process pool;
+    the merge order (and thus the result) is the same as for sequential parsing.
     """
+    files = list(files)
+    if workers > 1 and len(files) > 1:
+        with ProcessPoolExecutor(min(workers, len(files)), mp_context=mp_context()) as pool:
+            parts = list(pool.map(_parse_daq_csv_file, files))
+    else:
+        parts = map(_parse_daq_csv_file, files)
     merged: dict[str, Any] = {}
     base_ts = None
-    for f in files:
-        try:
-            part = _parse_daq_csv(f)
-        except (OSError, ValueError, TypeError) as e:
-            warnings.warn(f"Failed to parse DAQ CSV {f}: {e}", stacklevel=2)
+    for f, (part, error) in zip(files, parts, strict=True):
+        if error is not None:
+            warnings.warn(f"Failed to parse DAQ CSV {f}: {error}", stacklevel=2)
             continue
         if not part:
             continue
@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 
 import warnings
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
+import numpy as np
+
 from asamint.adapters.a2l import inspect
 from asamint.asam import AsamMC
 from asamint.core.logging import configure_logging
@@ -14,6 +17,79 @@ logger = configure_logging(__name__)
 if TYPE_CHECKING:
     from asamint.measurement import RunResult
 
+DEFAULT_HDF5_CHUNK_ROWS = 65536
+HDF5_COMPRESSIONS = ("gzip", "lzf", None)
+# Filters are only applied to fixed-size numeric samples.
+_FILTERABLE_KINDS = "biuf"
+
+
+@dataclass(frozen=True)
+class HDF5Storage:
+    """Chunking and compression settings of HDF5 measurement datasets.
+
+    Args:
+        chunk_rows: Records per chunk; every dataset is resizable along its first axis.
+        compression: ``"gzip"``, ``"lzf"`` or ``None``.
+        compression_opts: gzip level (0-9); ignored for the other filters.
+        shuffle: Apply the byte-shuffle filter, which usually improves compression of numeric samples.
+    """
+
+    chunk_rows: int = DEFAULT_HDF5_CHUNK_ROWS
+    compression: Optional[str] = "gzip"
+    compression_opts: Optional[int] = 1
+    shuffle: bool = True
+
+    def __post_init__(self) -> None:
+        if self.chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be positive, got {self.chunk_rows}.")
+        if self.compression not in HDF5_COMPRESSIONS:
+            raise ValueError(f"Unsupported HDF5 compression {self.compression!r}; expected one of {HDF5_COMPRESSIONS}.")
+        if self.compression_opts is not None and self.compression != "gzip":
+            object.__setattr__(self, "compression_opts", None)
+
+    def create_dataset(self, parent: Any, name: str, samples: np.ndarray) -> Any:
+        """Create an empty, chunked dataset under *parent* for records shaped like *samples*."""
+        filters: dict[str, Any] = {}
+        if samples.dtype.kind in _FILTERABLE_KINDS:
+            filters = {"compression": self.compression, "compression_opts": self.compression_opts, "shuffle": self.shuffle}
+        dset = parent.create_dataset(
+            name,
+            shape=(0,) + samples.shape[1:],
+            maxshape=(None,) + samples.shape[1:],
+            dtype=samples.dtype,
+            chunks=(self.chunk_rows,) + samples.shape[1:],
+            **filters,
+        )
+        dset.attrs["chunk_rows"] = self.chunk_rows
+        dset.attrs["compression"] = filters.get("compression") or "none"
+        if filters.get("compression_opts") is not None:
+            dset.attrs["compression_opts"] = self.compression_opts
+        dset.attrs["shuffle"] = bool(filters.get("shuffle", False))
+        return dset
+
+
+def _append_rows(dset: Any, samples: np.ndarray) -> None:
+    start = dset.shape[0]
+    dset.resize(start + samples.shape[0], axis=0)
+    dset[start:] = samples
+
+
+def _write_project_attrs(hf: Any, project_meta: dict[str, Any]) -> None:
+    for k, v in project_meta.items():
+        try:
+            hf.attrs[k] = v if v is not None else ""
+        except (TypeError, ValueError) as exc:
+            logger.debug("Skipping HDF5 root attr %s: %s", k, exc)
+
+
+def _write_signal_attrs(dset: Any, meta: dict[str, Any]) -> None:
+    if meta.get("units"):
+        dset.attrs["units"] = meta["units"]
+    if meta.get("compu_method"):
+        dset.attrs["compu_method"] = meta["compu_method"]
+    if meta.get("sample_count") is not None:
+        dset.attrs["sample_count"] = int(meta["sample_count"])
+
 
 class HDF5Creator(AsamMC):
     """
@@ -44,9 +120,51 @@ class HDF5Creator(AsamMC):
         if names:
             self.add_measurements(names)
 
+    def _project_meta(self) -> dict[str, Any]:
+        return {
+            "author": self.config.general.author,
+            "company": self.config.general.company,
+            "department": self.config.general.department,
+            "project": self.config.general.project,
+            "shortname": self.experiment_config.get("SHORTNAME"),
+            "subject": self.experiment_config.get("SUBJECT"),
+            "time_source": self.experiment_config.get("TIME_SOURCE"),
+        }
+
+    def _signal_meta(self) -> dict[str, dict[str, Any]]:
+        signal_meta: dict[str, dict[str, Any]] = {}
+        for meas in getattr(self, "measurement_variables", []):
+            try:
+                signal_meta[meas.name] = {
+                    "units": getattr(meas.compuMethod, "unit", None),
+                    "compu_method": getattr(meas.compuMethod, "name", None),
+                }
+            except AttributeError:
+                signal_meta[meas.name] = {"units": None, "compu_method": None}
+        return signal_meta
+
+    def open_stream(
+        self,
+        hdf5_filename: str | Path | None = None,
+        *,
+        storage: Optional[HDF5Storage] = None,
+        mode: str = "w",
+    ) -> "HDF5StreamWriter":
+        """Start a streaming recording into chunked, compressed HDF5 datasets.
+
+        See :class:`HDF5StreamWriter`; *hdf5_filename* defaults to an auto-generated filename.
+        """
+        return HDF5StreamWriter(
+            hdf5_filename or self.generate_filename(".h5"),
+            storage=storage,
+            mode=mode,
+            project_meta=self._project_meta(),
+            signal_meta=self._signal_meta(),
+        )
+
     def save_measurements(
         self,
-        data: dict[str, Any],
+        data: Mapping[str, Any],
         *,
         csv_out: str | Path | None = None,
         hdf5_out: str | Path | None = None,
@@ -77,25 +195,13 @@ class HDF5Creator(AsamMC):
 
         from asamint import measurement
 
-        project_meta = project_meta or {
-            "author": self.config.general.author,
-            "company": self.config.general.company,
-            "department": self.config.general.department,
-            "project": self.config.general.project,
-            "shortname": self.experiment_config.get("SHORTNAME"),
-            "subject": self.experiment_config.get("SUBJECT"),
-            "time_source": self.experiment_config.get("TIME_SOURCE"),
-        }
+        project_meta = project_meta or self._project_meta()
 
         units: dict[str, Any] = {}
         signal_meta: dict[str, dict[str, Any]] = {}
-        for meas in getattr(self, "measurement_variables", []):
-            try:
-                units[meas.name] = getattr(meas.compuMethod, "unit", None)
-                signal_meta[meas.name] = {"compu_method": getattr(meas.compuMethod, "name", None)}
-            except AttributeError:
-                units[meas.name] = None
-                signal_meta[meas.name] = {"compu_method": None}
+        for name, meta in self._signal_meta().items():
+            units[name] = meta["units"]
+            signal_meta[name] = {"compu_method": meta["compu_method"]}
 
         target_h5 = hdf5_out or self.generate_filename(".h5")
         return measurement.finalize_measurement_outputs(
@@ -114,14 +220,18 @@ def _write_hdf5(
     data: dict[str, Any],
     meta: dict[str, dict[str, Any]],
     project_meta: dict[str, Any],
+    *,
+    storage: Optional[HDF5Storage] = None,
 ) -> None:
     """
     Write converted values to HDF5 with per-signal datasets and metadata attributes.
     This uses h5py if available; otherwise a warning is emitted and the file is not written.
+
+    Without *storage* every dataset is written contiguously; with it, datasets are chunked,
+    filtered and resizable as described by :class:`HDF5Storage`.
     """
     try:
         import h5py
-        import numpy as np  # ensure numpy available
     except ImportError as e:  # pragma: no cover
         warnings.warn(
             f"HDF5 export requested but h5py is not available: {e}. Skipping HDF5 write.",
@@ -130,27 +240,191 @@ def _write_hdf5(
         )
         return
 
+    def create(name: str, values: Any) -> Any:
+        if storage is None:
+            return hf.create_dataset(name, data=values)
+        values = np.asarray(values)
+        dset = storage.create_dataset(hf, name, values)
+        _append_rows(dset, values)
+        return dset
+
     with h5py.File(str(h5_path), "w") as hf:
-        for k, v in project_meta.items():
-            try:
-                hf.attrs[k] = v if v is not None else ""
-            except (TypeError, ValueError) as exc:
-                logger.debug("Skipping HDF5 root attr %s: %s", k, exc)
+        _write_project_attrs(hf, project_meta)
         ts = data.get("TIMESTAMPS")
         if ts is not None:
-            dset_ts = hf.create_dataset("timestamps", data=ts)
+            dset_ts = create("timestamps", ts)
             dset_ts.attrs["description"] = "Relative timestamps in seconds"
         for name, values in data.items():
             if name == "TIMESTAMPS":
                 continue
-            dset = hf.create_dataset(name, data=values)
-            m = meta.get(name, {})
-            if m.get("units"):
-                dset.attrs["units"] = m["units"]
-            if m.get("compu_method"):
-                dset.attrs["compu_method"] = m["compu_method"]
-            if m.get("sample_count") is not None:
-                dset.attrs["sample_count"] = int(m["sample_count"])
+            _write_signal_attrs(create(name, values), meta.get(name, {}))
+
+
+class _HDF5StreamGroup:
+    """Buffered samples and datasets of one streamed timestamp group."""
+
+    def __init__(self, group_id: int, source: str, node: Any, names: list[str]) -> None:
+        self.group_id = group_id
+        self.source = source
+        self.node = node
+        self.names = names
+        self.timebase_s: Optional[float] = None
+        self.buffered = 0
+        self.timestamps: list[np.ndarray] = []
+        self.samples: dict[str, list[np.ndarray]] = {name: [] for name in names}
+
+
+class HDF5StreamWriter:
+    """
+    Append measurement batches to chunked, optionally compressed HDF5 datasets.
+
+    Every timestamp *source* becomes one group of resizable datasets: a
+    ``timestamps`` dataset plus one dataset per signal.  The default source
+    ``"timestamps"`` writes to the file root, the layout of
+    :func:`_write_hdf5`; other sources (e.g. ``"timestamp0"`` for DAQ list 0)
+    get an HDF5 group of that name.  Samples are buffered per group until
+    ``storage.chunk_rows`` records are available and then written as whole
+    chunks, so memory usage is independent of the recording length.
+
+    With ``mode="a"`` an existing file written by this class is continued:
+    batches are appended to the datasets already present.
+
+    Example::
+
+        with HDF5StreamWriter("endurance.h5") as stream:
+            for timestamps, values in daq_blocks:
+                stream.append(timestamps, values, source="timestamp0")
+        result = stream.result
+    """
+
+    def __init__(
+        self,
+        h5_path: str | Path,
+        *,
+        storage: Optional[HDF5Storage] = None,
+        mode: str = "w",
+        project_meta: Optional[dict[str, Any]] = None,
+        signal_meta: Optional[dict[str, dict[str, Any]]] = None,
+    ) -> None:
+        import h5py
+
+        if mode not in ("w", "a"):
+            raise ValueError(f"mode must be 'w' or 'a', got {mode!r}.")
+        self.h5_path = Path(h5_path)
+        self.storage = storage or HDF5Storage()
+        self.signal_meta = signal_meta or {}
+        self.result: "Optional[RunResult]" = None
+        self._groups: dict[str, _HDF5StreamGroup] = {}
+        self._closed = False
+        self._file = h5py.File(str(self.h5_path), mode)
+        _write_project_attrs(self._file, project_meta or {})
+
+    def __enter__(self) -> "HDF5StreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if not self._closed:
+            self.close()
+
+    def append(self, timestamps: Any, data: dict[str, Any], *, source: str = "timestamps") -> None:
+        """Append a block of samples.
+
+        Args:
+            timestamps: 1-D array of timestamps, one per record.
+            data: Sample arrays keyed by signal name, each as long as *timestamps*.
+            source: Timestamp source identifying the dataset group.
+
+        Raises:
+            ValueError: Mismatching array lengths, a change of the group's signal set,
+                a non-resizable existing dataset, or a write after :meth:`close`.
+        """
+        if self._closed:
+            raise ValueError("HDF5StreamWriter is closed.")
+        timestamps = np.asarray(timestamps)
+        group = self._groups.get(source) or self._open_group(source, timestamps, data)
+        if set(group.names) != set(data):
+            raise ValueError(f"Signals of HDF5 stream group '{source}' must not change between blocks.")
+        count = int(timestamps.shape[0])
+        for name, buffer in group.samples.items():
+            samples = np.asarray(data[name])
+            if samples.shape[0] != count:
+                raise ValueError(f"Length mismatch for '{name}' samples({samples.shape[0]}) vs ts({count}).")
+            # Copy: callers usually reuse their receive buffers.
+            buffer.append(np.array(samples, copy=True))
+        group.timestamps.append(np.array(timestamps, copy=True))
+        group.buffered += count
+        if group.buffered >= self.storage.chunk_rows:
+            self._flush_group(group)
+
+    def flush(self) -> None:
+        """Write all buffered samples and flush the HDF5 file."""
+        for group in self._groups.values():
+            self._flush_group(group)
+        self._file.flush()
+
+    def close(self) -> "RunResult":
+        """Flush outstanding samples, record sample counts, close the file and return the run summary."""
+        from asamint import measurement as measurement_module
+
+        if self._closed:
+            return self.result
+        self.flush()
+        meta: dict[str, dict[str, Any]] = {}
+        for group in self._groups.values():
+            for name in group.names:
+                dset = group.node[name]
+                dset.attrs["sample_count"] = int(dset.shape[0])
+                meta[name] = {
+                    "timestamp_source": group.source,
+                    "timebase_s": group.timebase_s,
+                    "group_id": group.group_id,
+                    "sample_count": int(dset.shape[0]),
+                    "units": self.signal_meta.get(name, {}).get("units"),
+                    "compu_method": self.signal_meta.get(name, {}).get("compu_method"),
+                }
+        self._file.close()
+        self._closed = True
+        self.result = measurement_module.RunResult(
+            mdf_path=None,
+            csv_path=None,
+            hdf5_path=str(self.h5_path),
+            signals=meta,
+            timebases=measurement_module._collect_timebase_summary(meta),
+        )
+        return self.result
+
+    def _open_group(self, source: str, timestamps: np.ndarray, data: dict[str, Any]) -> _HDF5StreamGroup:
+        node = self._file if source == "timestamps" else self._file.require_group(source)
+        if "timestamps" in node:
+            names = [name for name, item in node.items() if name != "timestamps" and not hasattr(item, "keys")]
+            for name in ["timestamps", *names]:
+                if node[name].maxshape[0] is not None:
+                    raise ValueError(f"HDF5 dataset '{node[name].name}' is not resizable and cannot be appended to.")
+        else:
+            names = list(data)
+            dset_ts = self.storage.create_dataset(node, "timestamps", timestamps)
+            dset_ts.attrs["description"] = "Relative timestamps in seconds"
+            for name in names:
+                dset = self.storage.create_dataset(node, name, np.asarray(data[name]))
+                _write_signal_attrs(dset, self.signal_meta.get(name, {}))
+        group = _HDF5StreamGroup(len(self._groups), source, node, names)
+        self._groups[source] = group
+        return group
+
+    def _flush_group(self, group: _HDF5StreamGroup) -> None:
+        from asamint import measurement as measurement_module
+
+        if not group.buffered:
+            return
+        timestamps = np.concatenate(group.timestamps)
+        group.timestamps.clear()
+        if group.timebase_s is None:
+            group.timebase_s = measurement_module._median_timebase(group.source, timestamps)
+        _append_rows(group.node["timestamps"], timestamps)
+        for name, buffer in group.samples.items():
+            _append_rows(group.node[name], np.concatenate(buffer))
+            buffer.clear()
+        group.buffered = 0
 
 
 def _annotate_hdf5_root(h5_path: Path, project_meta: dict[str, Any]) -> None:
@@ -162,11 +436,7 @@ def _annotate_hdf5_root(h5_path: Path, project_meta: dict[str, Any]) -> None:
         return
     try:
         with h5py.File(str(h5_path), "a") as hf:
-            for k, v in project_meta.items():
-                try:
-                    hf.attrs[k] = v if v is not None else ""
-                except (TypeError, ValueError) as exc:
-                    logger.debug("Skipping HDF5 root attr %s: %s", k, exc)
+            _write_project_attrs(hf, project_meta)
     except OSError as exc:  # pragma: no cover - best-effort
         logger.debug("Failed to annotate HDF5 file %s: %s", h5_path, exc)
 
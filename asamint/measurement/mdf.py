@@ -26,7 +26,7 @@ __copyright__ = """
 __author__ = "Christoph Schueler"
 
 import time
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
@@ -41,6 +41,8 @@ from asamint.utils.xml import create_elem
 if TYPE_CHECKING:
     from asamint.measurement import RunResult
 
+DEFAULT_STREAM_CHUNK_SIZE = 65536
+
 
 class Datasource:
     """Measurement values could be located... well we don't know, so some
@@ -152,7 +154,7 @@ class MDFCreator(AsamMC):
     def save_measurements(  # noqa: C901
         self,
         mdf_filename: str | None = None,
-        data: dict[str, Any] | None = None,
+        data: Mapping[str, Any] | None = None,
         *,
         csv_out: str | Path | None = None,
         hdf5_out: str | Path | None = None,
@@ -327,26 +329,9 @@ class MDFCreator(AsamMC):
                 unit = compuMethod.unit if compuMethod != "NO_COMPU_METHOD" else None
                 units[measurement.name] = unit
 
-                samples = np.array(data.get(measurement.name), copy=False)
-
-                # Step #1: bit fiddling.
-                bitMask = measurement.bitMask
-                if bitMask is not None:
-                    samples &= bitMask
-                bitOperation = measurement.bitOperation
-                if bitOperation and bitOperation.get("amount", 0) != 0:
-                    amount = bitOperation["amount"]
-                    if bitOperation.get("direction") == "L":
-                        samples <<= amount
-                    else:
-                        samples >>= amount
-
-                # Step #2: apply COMPU_METHODs.
-                samples = self.calculate_physical_values(samples, compuMethod)
-
+                samples = self.raw_to_physical(measurement, np.array(data.get(measurement.name), copy=False))
                 if getattr(compuMethod, "conversionType", None) == "TAB_VERB":
                     kws["encoding"] = "utf-8"
-                    samples = samples.astype(bytes)
 
                 # Align lengths defensively (should already match)
                 if samples.shape[0] != chosen_ts.shape[0]:
@@ -430,6 +415,37 @@ class MDFCreator(AsamMC):
             timebases=timebases,
         )
 
+    def raw_to_physical(self, measurement: Any, samples: np.ndarray) -> np.ndarray:
+        """Apply BIT_MASK, BIT_OPERATION and COMPU_METHOD of *measurement* to raw *samples*.
+
+        Bit operations are applied in-place. Verbal conversions (TAB_VERB) yield byte strings.
+        """
+        # Step #1: bit fiddling.
+        bitMask = measurement.bitMask
+        if bitMask is not None:
+            samples &= bitMask
+        bitOperation = measurement.bitOperation
+        if bitOperation and bitOperation.get("amount", 0) != 0:
+            amount = bitOperation["amount"]
+            if bitOperation.get("direction") == "L":
+                samples <<= amount
+            else:
+                samples >>= amount
+
+        # Step #2: apply COMPU_METHODs.
+        compuMethod = measurement.compuMethod
+        samples = self.calculate_physical_values(samples, compuMethod)
+        if getattr(compuMethod, "conversionType", None) == "TAB_VERB":
+            samples = samples.astype(bytes)
+        return samples
+
+    def open_stream(self, mdf_filename: str | Path, *, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> "MDFStreamWriter":
+        """Start a streaming recording of the selected measurements into *mdf_filename*.
+
+        See :class:`MDFStreamWriter`.
+        """
+        return MDFStreamWriter(self, mdf_filename, chunk_size=chunk_size)
+
     def ccblock(self, compuMethod) -> str | None:  # noqa: C901
         """Construct CCBLOCK
 
@@ -540,3 +556,191 @@ class MDFCreator(AsamMC):
             )
             conversion = None
         return conversion
+
+
+def _is_event_timestamp_source(source: str) -> bool:
+    """Event-specific timestamp keys (``timestamp0``, ``timestamp1``, ...) carry nanoseconds."""
+    base = source.lower().split("[")[0]
+    return base.startswith("timestamp") and base not in ("timestamp", "timestamps")
+
+
+class _StreamGroup:
+    """Buffered samples and MDF bookkeeping of one streamed channel group."""
+
+    def __init__(self, group_id: int, source: str, measurements: list[Any]) -> None:
+        self.group_id = group_id
+        self.source = source
+        self.measurements = measurements
+        self.mdf_index: Optional[int] = None
+        self.timebase_s: Optional[float] = None
+        self.sample_count = 0
+        self.buffered = 0
+        self.timestamps: list[np.ndarray] = []
+        self.samples: dict[str, list[np.ndarray]] = {m.name: [] for m in measurements}
+
+
+class MDFStreamWriter:
+    """
+    Write measurements chunk-wise into an MDF4 file with bounded memory.
+
+    Samples are buffered per channel group until *chunk_size* records are
+    available, then converted (BIT_MASK, BIT_OPERATION, COMPU_METHOD) and
+    handed to asammdf: the first chunk of a group creates the channel group
+    via ``MDF.append``, following chunks are added with ``MDF.extend``.
+    asammdf keeps the record data in its temporary file, so memory usage is
+    independent of the recording length.
+
+    Each *source* (e.g. ``"timestamp0"`` for DAQ list 0) becomes one channel
+    group; the set of measurements of a group is fixed by its first
+    :meth:`append` call.
+
+    Example::
+
+        with creator.open_stream("endurance.mf4") as stream:
+            for timestamps, values in daq_blocks:
+                stream.append(timestamps, values, source="timestamp0")
+        result = stream.result
+    """
+
+    def __init__(self, creator: MDFCreator, mdf_filename: str | Path, *, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+        self.creator = creator
+        self.mdf_filename = mdf_filename
+        self.chunk_size = chunk_size
+        self.result: "Optional[RunResult]" = None
+        self._groups: dict[str, _StreamGroup] = {}
+        self._measurements = {m.name: m for m in creator.measurement_variables}
+        self._closed = False
+
+    def __enter__(self) -> "MDFStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if not self._closed:
+            self.close()
+
+    def append(self, timestamps: Any, data: dict[str, Any], *, source: str = "timestamps") -> None:
+        """Append a block of raw samples.
+
+        Args:
+            timestamps: 1-D array of timestamps, one per record.
+            data: Raw sample arrays keyed by measurement name, each as long as *timestamps*.
+                Names not selected on the creator are ignored.
+            source: Timestamp source identifying the channel group.
+
+        Raises:
+            ValueError: Mismatching array lengths, a change of the group's measurement set,
+                or a write after :meth:`close`.
+        """
+        if self._closed:
+            raise ValueError("MDFStreamWriter is closed.")
+        timestamps = np.asarray(timestamps)
+        group = self._groups.get(source)
+        if group is None:
+            measurements = [self._measurements[name] for name in data if name in self._measurements]
+            if not measurements:
+                self.creator.logger.warning(f"No selected measurements in stream block for '{source}'; ignored.")
+                return
+            group = _StreamGroup(len(self._groups), source, measurements)
+            self._groups[source] = group
+        elif set(group.samples) != {name for name in data if name in self._measurements}:
+            raise ValueError(f"Measurements of stream group '{source}' must not change between blocks.")
+        count = int(timestamps.shape[0])
+        for name, buffer in group.samples.items():
+            samples = np.asarray(data[name])
+            if samples.shape[0] != count:
+                raise ValueError(f"Length mismatch for '{name}' samples({samples.shape[0]}) vs ts({count}).")
+            # Copy: bit operations are applied in-place, and callers usually reuse their receive buffers.
+            buffer.append(np.array(samples, copy=True))
+        group.timestamps.append(np.array(timestamps, copy=True))
+        group.buffered += count
+        if group.buffered >= self.chunk_size:
+            self._flush_group(group)
+
+    def flush(self) -> None:
+        """Write all buffered samples to the MDF object."""
+        for group in self._groups.values():
+            self._flush_group(group)
+
+    def close(self) -> "RunResult":
+        """Flush outstanding samples, save the MDF file and return the run summary."""
+        from asamint import measurement as measurement_module
+
+        if self._closed:
+            return self.result
+        self.flush()
+        self._closed = True
+        if self._groups:
+            self.creator._mdf_obj.save(dst=self.mdf_filename, overwrite=True)
+        meta = {
+            m.name: {
+                "timestamp_source": group.source,
+                "timebase_s": group.timebase_s,
+                "group_id": group.group_id,
+                "sample_count": group.sample_count,
+                "compu_method": (getattr(m.compuMethod, "name", None) if m.compuMethod else None),
+                "units": self._unit_of(m),
+            }
+            for group in self._groups.values()
+            for m in group.measurements
+        }
+        self.result = measurement_module.RunResult(
+            mdf_path=str(self.mdf_filename) if self._groups else None,
+            csv_path=None,
+            hdf5_path=None,
+            signals=meta,
+            timebases=measurement_module._collect_timebase_summary(meta),
+        )
+        return self.result
+
+    @staticmethod
+    def _unit_of(measurement: Any) -> Optional[str]:
+        compuMethod = measurement.compuMethod
+        return compuMethod.unit if compuMethod != "NO_COMPU_METHOD" else None
+
+    def _flush_group(self, group: _StreamGroup) -> None:
+        if not group.buffered:
+            return
+        timestamps = np.concatenate(group.timestamps)
+        group.timestamps.clear()
+        columns = []
+        for measurement in group.measurements:
+            buffer = group.samples[measurement.name]
+            raw = np.concatenate(buffer)
+            buffer.clear()
+            columns.append(self.creator.raw_to_physical(measurement, raw))
+        if group.mdf_index is None:
+            self._create_group(group, timestamps, columns)
+        else:
+            self.creator._mdf_obj.extend(group.mdf_index, [(timestamps, None)] + [(col, None) for col in columns])
+        group.sample_count += group.buffered
+        group.buffered = 0
+
+    def _create_group(self, group: _StreamGroup, timestamps: np.ndarray, columns: list[np.ndarray]) -> None:
+        if timestamps.shape[0] > 1:
+            median_dt = float(np.median(np.diff(timestamps.astype(float))))
+            group.timebase_s = median_dt / 1e9 if _is_event_timestamp_source(group.source) else median_dt
+        tb_str = f" tb≈{group.timebase_s:.6g}s" if group.timebase_s is not None else ""
+        src = f"{group.source}(ns)" if _is_event_timestamp_source(group.source) else group.source
+        signals: list[Signal] = []
+        for measurement, samples in zip(group.measurements, columns, strict=True):
+            self.creator.logger.info(f"Adding SIGNAL: '{measurement.name}' (streamed) with timestamps='{group.source}'.")
+            kws: dict[str, Any] = {}
+            compuMethod = measurement.compuMethod
+            if getattr(compuMethod, "conversionType", None) == "TAB_VERB":
+                kws["encoding"] = "utf-8"
+            comment = (measurement.longIdentifier or "") + f" [{tb_str} src={src} grp={group.group_id}]".replace("  ", " ")
+            signals.append(
+                Signal(
+                    samples=samples,
+                    timestamps=timestamps,
+                    name=measurement.name,
+                    unit=self._unit_of(measurement) or "",
+                    conversion=self.creator.ccblock(compuMethod),
+                    comment=comment.strip(),
+                    **kws,
+                )
+            )
+        group.mdf_index = len(self.creator._mdf_obj.groups)
+        self.creator._mdf_obj.append(signals)
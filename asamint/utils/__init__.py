@@ -29,6 +29,7 @@ __author__ = "Christoph Schueler"
 import hashlib
 import itertools
 import math
+import multiprocessing
 import pathlib
 import re
 import time
@@ -170,3 +171,15 @@ def adjust_to_word_boundary(value: int, alignment: int = 2) -> int:
         return value
     else:
         return ((value >> alignment) + 1) << alignment
+
+
+def mp_context() -> multiprocessing.context.BaseContext:
+    """Fork server or, where unavailable, spawn.
+
+    The fork server's preload list is process-wide state shared with the
+    application, so it is left alone; workers import the modules they need
+    when they unpickle their task.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    return multiprocessing.get_context("forkserver")
@@ -0,0 +1,116 @@
+"""
+Growable columnar sample storage.
+
+:class:`ColumnarBuffer` keeps one preallocated, typed numpy array per signal
+and appends rows in amortised O(1) by growing all columns geometrically.
+It is a mapping of signal name to the filled part of each column (a view,
+not a copy), so it can be handed directly to the measurement persisters,
+which expect ``{"TIMESTAMPS": ..., <name>: ...}`` dicts.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+
+class ColumnarBuffer(MutableMapping[str, np.ndarray]):
+    """Per-signal typed sample columns with preallocated capacity.
+
+    Args:
+        dtypes: Column name to numpy dtype.
+        capacity: Initial number of rows to allocate.
+        growth: Factor by which the capacity grows when full (> 1).
+    """
+
+    def __init__(self, dtypes: Mapping[str, DTypeLike], capacity: int = 1024, growth: float = 2.0) -> None:
+        if growth <= 1.0:
+            raise ValueError(f"growth must be greater than 1, got {growth}.")
+        self.growth = growth
+        self._capacity = max(int(capacity), 1)
+        self._size = 0
+        self._columns: dict[str, np.ndarray] = {name: np.empty(self._capacity, dtype=dtype) for name, dtype in dtypes.items()}
+
+    @property
+    def size(self) -> int:
+        """Number of filled rows."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Number of allocated rows."""
+        return self._capacity
+
+    @property
+    def storage(self) -> dict[str, np.ndarray]:
+        """Full-capacity column arrays; only valid until the next reallocation."""
+        return self._columns
+
+    def reserve(self, capacity: int) -> None:
+        """Make room for at least *capacity* rows."""
+        if capacity <= self._capacity:
+            return
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._columns[name] = grown
+        self._capacity = capacity
+
+    def _ensure(self, rows: int) -> None:
+        needed = self._size + rows
+        if needed > self._capacity:
+            self.reserve(max(needed, math.ceil(self._capacity * self.growth)))
+
+    def new_row(self) -> int:
+        """Append an (uninitialised) row and return its index; write it via :attr:`storage`."""
+        self._ensure(1)
+        self._size += 1
+        return self._size - 1
+
+    def append(self, row: Mapping[str, Any]) -> int:
+        """Append one row; *row* must provide a value for every column."""
+        index = self.new_row()
+        for name, column in self._columns.items():
+            column[index] = row[name]
+        return index
+
+    def extend(self, rows: Mapping[str, ArrayLike]) -> None:
+        """Append a block of rows given as equally long per-column arrays."""
+        arrays = {name: np.asarray(rows[name]) for name in self._columns}
+        lengths = {arr.shape[0] for arr in arrays.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns of a block must have equal length, got {sorted(lengths)}.")
+        count = lengths.pop() if lengths else 0
+        self._ensure(count)
+        for name, arr in arrays.items():
+            self._columns[name][self._size : self._size + count] = arr
+        self._size += count
+
+    # -- Mapping interface ---------------------------------------------------
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._columns[name][: self._size]
+
+    def __setitem__(self, name: str, values: ArrayLike) -> None:
+        values = np.asarray(values)
+        if values.shape[0] != self._size:
+            raise ValueError(f"Column '{name}' must have {self._size} rows, got {values.shape[0]}.")
+        column = np.empty(self._capacity, dtype=values.dtype)
+        column[: self._size] = values
+        self._columns[name] = column
+
+    def __delitem__(self, name: str) -> None:
+        del self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(columns={list(self._columns)}, size={self._size}, capacity={self._capacity})"
@@ -370,3 +370,69 @@ def test_axis_pts006(offline):
 def test_axis_pts0XX(offline):
     # load_save_verify_axis_pts(offline, "CDF20.axis.X_AXIS_xU16", [], [])
     pass
+
+
+def test_load_many_matches_load(offline, calibration_context):
+    from asamint.adapters.a2l import model
+
+    query = calibration_context.session.query(model.Characteristic.name)
+    names = [row.name for row in query.filter(model.Characteristic.type.in_(("VALUE", "VAL_BLK", "ASCII")))]
+    names.append("CDF20.axis.X_AXIS_xU16")
+    batch = offline.load_many(names)
+    assert list(batch) == names
+    for name in names:
+        single = offline.load(name)
+        loaded = batch[name]
+        assert type(loaded) is type(single)
+        assert loaded.category == single.category
+        np.testing.assert_array_equal(np.asarray(loaded.raw), np.asarray(single.raw))
+        np.testing.assert_array_equal(np.asarray(loaded.phys), np.asarray(single.phys))
+
+
+def test_load_many_unknown_parameter(offline):
+    with pytest.raises(ValueError):
+        offline.load_many(["CDF20.scalar.FW_wU8", "NO_SUCH_PARAMETER"])
+
+
+def test_repeated_curve_load_is_stable(offline):
+    first = offline.load("CDF20.curve.KL_xU8_wU8")
+    second = offline.load("CDF20.curve.KL_xU8_wU8")
+    np.testing.assert_array_equal(second.raw, first.raw)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["CDF20.map.KF_xCURu16u8_yCURu16u8_wU8", "CDF20.curve.KL_xU8_wU8", "CDF20.curve.GKL_xCOM_wU16"],
+)
+def test_interpolate_many_matches_interpolate(offline, name):
+    num_axes = len(offline.load(name).axes)
+    inputs = np.random.default_rng(0).uniform(-60.0, 300.0, (50, num_axes))
+    expected = [offline.interpolate(name, *point) for point in inputs]
+    np.testing.assert_allclose(offline.interpolate_many(name, inputs), expected, rtol=1e-12, atol=1e-12)
+
+
+def test_interpolate_many_grid_follows_normalisation_curve(offline):
+    name = "CDF20.map.KF_xCURu16u8_yCURu16u8_wU8"
+    inputs = np.array([[210.0, 260.0], [250.0, 280.0], [310.0, 300.0]])
+    before = offline.interpolate_many(name, inputs)
+    grid = offline._grids[name]
+    offline.interpolate_many(name, inputs)
+    assert offline._grids[name] is grid
+
+    curve = offline.load("CDF20.axis.X_CU_AXIS_xU16_wU8")
+    curve.phys = np.asarray(curve.phys)[::-1].copy()
+    offline.save_curve_or_map(curve.name, curve)
+    assert name not in offline._grids
+
+    after = offline.interpolate_many(name, inputs)
+    assert offline._grids[name] is not grid
+    np.testing.assert_allclose(after, [offline.interpolate(name, *point) for point in inputs])
+    assert not np.allclose(after, before)
+
+
+def test_interpolate_uses_axis_order_of_parameter(offline):
+    name = "abs_sinp2_cosp2_table"
+    table = offline.load(name)
+    x, y = table.axes[0].phys[2], table.axes[1].phys[15]
+    assert offline.interpolate(name, x, y) == pytest.approx(table.phys[2, 15])
+    assert table.phys[2, 15] != pytest.approx(table.phys[15, 2])
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+
+from asamint.calibration import _PARAMETER_CATEGORIES, CalibrationData
+from asamint.calibration.api import Calibration
+from asamint.calibration.parallel import ParallelLoader
+
+FIXTURE_DIR = Path(__file__).parent
+
+
+def _make_calibration_data(context: SimpleNamespace, image: Any) -> CalibrationData:
+    instance = CalibrationData.__new__(CalibrationData)
+    instance.asam_mc = SimpleNamespace(
+        session=context.session,
+        mod_common=context.mod_common,
+        mod_par=context.mod_par,
+        a2l_file=FIXTURE_DIR / "CDF20demo.a2l",
+        a2l_encoding="latin1",
+    )
+    instance.logger = context.logger
+    instance._parameters = {category: {} for category in _PARAMETER_CATEGORIES}
+    instance._definitions = None
+    instance._layouts = None
+    instance.image = image
+    instance.api = Calibration(instance.asam_mc, image, instance._parameters, instance.logger, definitions=instance.definitions)
+    return instance
+
+
+def test_parallel_loader_matches_sequential_loading(calibration_context: SimpleNamespace, hex_image: Any) -> None:
+    sequential = _make_calibration_data(calibration_context, hex_image)
+    sequential._load_axis_pts()
+    sequential._load_values()
+    sequential._load_asciis()
+    sequential._load_value_blocks()
+    sequential._load_curves()
+    sequential._load_maps()
+    sequential._load_cubes()
+
+    parallel = _make_calibration_data(calibration_context, hex_image)
+    ParallelLoader(parallel, 2).run()
+
+    assert any(sequential.parameters["CURVE"])
+    for category, expected in sequential.parameters.items():
+        actual = parallel.parameters[category]
+        assert list(actual) == list(expected), category
+        for name, obj in actual.items():
+            assert obj.api is parallel.api
+            assert np.array_equal(np.asarray(obj.phys), np.asarray(expected[name].phys)), name
+            for axis, expected_axis in zip(obj.axes or [], expected[name].axes or [], strict=True):
+                assert np.array_equal(np.asarray(axis.phys), np.asarray(expected_axis.phys)), name
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from asamint.calibration.db import CalibrationDB
+from asamint.calibration.msrsw_db import Msrsw, MSRSWDatabase, ShortName, SwInstance, SwInstanceTree
+from asamint.cdf import DB
+from asamint.cdf.importer import DBImporter
+from asamint.model.calibration import klasses
+
+
+def _make_parameters() -> dict[str, dict[str, klasses.CalibratedObject]]:
+    value = klasses.Value(
+        name="SPEED_LIMIT",
+        comment="Maximum speed",
+        category="VALUE",
+        _raw=np.array(120, dtype=np.uint16),
+        _phys=np.array(120.0),
+        displayIdentifier="DI_SPEED_LIMIT",
+        unit="km/h",
+        is_numeric=True,
+    )
+    text = klasses.Value(
+        name="VARIANT",
+        comment="",
+        category="TEXT",
+        _raw=np.array(0),
+        _phys="ABC",
+        is_numeric=False,
+    )
+    axis_pts = klasses.AxisPts(
+        name="AXIS_REF",
+        comment="",
+        category="AXIS_PTS",
+        _raw=np.array([10, 20, 30], dtype=np.uint16),
+        _phys=np.array([1.0, 2.0, 3.0], dtype=np.float64),
+        unit="rpm",
+        is_numeric=True,
+    )
+    return {"VALUE": {value.name: value, text.name: text}, "AXIS_PTS": {axis_pts.name: axis_pts}}
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_db_importer_writes_instance_tree(tmp_path: Path, concurrent: bool) -> None:
+    importer = DBImporter(str(tmp_path / "import"), _make_parameters(), logging.getLogger(__name__))
+    if concurrent:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            importer.run(pool)
+    else:
+        importer.run()
+    importer.close()
+    db_file = tmp_path / "import.msrswdb"
+
+    db = MSRSWDatabase(db_file)
+    try:
+        msrsw = db.session.query(Msrsw).one()
+        assert msrsw.short_name.content == "calib_test"
+        assert msrsw.category.content == "CDF20"
+        system = msrsw.sw_systems.sw_system[0]
+        assert system.short_name.content == "n/a"
+        tree = db.session.query(SwInstanceTree).one()
+        assert tree.category.content == "VCD"
+        assert tree.sw_instance_tree_origin.symbolic_file.content == "symfile.a2l"
+        assert tree.sw_instance_tree_origin.data_file.content == "datafile.hex"
+
+        instances = {inst.short_name.content: inst for inst in tree.sw_instances}
+        assert set(instances) == {"SPEED_LIMIT", "VARIANT", "AXIS_REF"}
+        assert db.session.query(SwInstance).count() == 3
+        speed_limit = instances["SPEED_LIMIT"]
+        assert speed_limit.category.content == "VALUE"
+        assert speed_limit.long_name.content == "Maximum speed"
+        assert speed_limit.display_name.content == "DI_SPEED_LIMIT"
+        assert speed_limit.sw_value_cont.unit_display_name.content == "km/h"
+        assert instances["VARIANT"].category.content == "VALUE"
+        assert instances["VARIANT"].long_name is None
+        assert instances["VARIANT"].sw_value_cont.unit_display_name is None
+        assert instances["AXIS_REF"].category.content == "AXIS_PTS"
+        assert db.session.query(ShortName).count() == 6
+    finally:
+        db.close()
+
+    with CalibrationDB(str(tmp_path / "import"), mode="r") as hdf_db:
+        assert np.array_equal(hdf_db.load("AXIS_REF").values, np.array([1.0, 2.0, 3.0]))
+
+    conn = sqlite3.connect(db_file)
+    try:
+        assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+        assert ("shortname_content_idx",) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+    finally:
+        conn.close()
+
+
+def test_db_reader_session_is_deprecated(tmp_path: Path) -> None:
+    importer = DBImporter(str(tmp_path / "import"), _make_parameters(), logging.getLogger(__name__))
+    importer.run()
+    importer.close()
+
+    with DB(tmp_path / "import") as reader:
+        assert reader.db.instance_names() == ["SPEED_LIMIT", "VARIANT", "AXIS_REF"]
+        with pytest.warns(DeprecationWarning, match="DB.session"):
+            session = reader.session
+        assert session.query(SwInstance).count() == 3
+        with pytest.warns(DeprecationWarning):
+            assert reader.session is session
@@ -8,10 +8,16 @@ from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
 import pytest
+from sqlalchemy.exc import OperationalError
 
+from asamint.calibration.msrsw_db import MSRSWDatabase, ShortName
+from asamint.calibration.msrsw_reader import MSRSWReader
+from asamint.calibration.msrsw_sqlite import CURRENT_SCHEMA_VERSION, SQLiteProfile
 from asamint.cdf.importer.cdf_importer import CDFImporter, import_cdf_to_db
 
 _MODULE = "asamint.cdf.importer.cdf_importer"
+# import_cdf_to_db imports the ORM classes on use, so they are patched at their source.
+_ORM = "asamint.calibration.msrsw_db"
 
 
 # ---------------------------------------------------------------------------
@@ -32,49 +38,49 @@ def _make_db(closed: bool = False) -> MagicMock:
 
 def test_import_returns_true_on_success() -> None:
     db = _make_db()
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser"):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser"):
         result = import_cdf_to_db("file.xml", "file.msrswdb")
     assert result is True
 
 
 def test_import_creates_db_with_given_path() -> None:
     db = _make_db()
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db) as MockDB, patch(f"{_MODULE}.Parser"):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db) as MockDB, patch(f"{_ORM}.Parser"):
         import_cdf_to_db("data.xml", "out.msrswdb")
-    MockDB.assert_called_once_with("out.msrswdb")
+    MockDB.assert_called_once_with("out.msrswdb", profile=None)
 
 
 def test_import_calls_begin_transaction() -> None:
     db = _make_db()
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser"):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser"):
         import_cdf_to_db("x.xml", "x.db")
     db.begin_transaction.assert_called_once()
 
 
 def test_import_creates_parser_with_xml_path() -> None:
     db = _make_db()
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser") as MockParser:
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser") as MockParser:
         import_cdf_to_db("path/to/file.xml", "out.db")
     MockParser.assert_called_once_with("path/to/file.xml", db)
 
 
 def test_import_closes_db_after_success() -> None:
     db = _make_db(closed=False)
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser"):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser"):
         import_cdf_to_db("x.xml", "x.db")
     db.close.assert_called_once()
 
 
 def test_import_does_not_close_already_closed_db() -> None:
     db = _make_db(closed=True)
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser"):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser"):
         import_cdf_to_db("x.xml", "x.db")
     db.close.assert_not_called()
 
 
 def test_import_accepts_path_objects() -> None:
     db = _make_db()
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser"):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser"):
         result = import_cdf_to_db(Path("file.xml"), Path("file.db"))
     assert result is True
 
@@ -82,8 +88,8 @@ def test_import_accepts_path_objects() -> None:
 def test_import_uses_default_logger_when_none() -> None:
     db = _make_db()
     with (
-        patch(f"{_MODULE}.MSRSWDatabase", return_value=db),
-        patch(f"{_MODULE}.Parser"),
+        patch(f"{_ORM}.MSRSWDatabase", return_value=db),
+        patch(f"{_ORM}.Parser"),
         patch(f"{_MODULE}.logging") as mock_logging,
     ):
         mock_logging.getLogger.return_value = MagicMock()
@@ -94,7 +100,7 @@ def test_import_uses_default_logger_when_none() -> None:
 def test_import_uses_provided_logger() -> None:
     db = _make_db()
     custom_logger = MagicMock(spec=logging.Logger)
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser"):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser"):
         import_cdf_to_db("x.xml", "x.db", logger=custom_logger)
     custom_logger.info.assert_called()
 
@@ -106,14 +112,14 @@ def test_import_uses_provided_logger() -> None:
 
 def test_import_returns_false_on_parser_error() -> None:
     db = _make_db()
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser", side_effect=RuntimeError("parse error")):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser", side_effect=RuntimeError("parse error")):
         result = import_cdf_to_db("bad.xml", "out.db")
     assert result is False
 
 
 def test_import_rolls_back_on_exception() -> None:
     db = _make_db()
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser", side_effect=ValueError("corrupt")):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser", side_effect=ValueError("corrupt")):
         import_cdf_to_db("bad.xml", "out.db")
     db.rollback_transaction.assert_called_once()
 
@@ -121,7 +127,7 @@ def test_import_rolls_back_on_exception() -> None:
 def test_import_logs_error_on_exception() -> None:
     db = _make_db()
     custom_logger = MagicMock(spec=logging.Logger)
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser", side_effect=RuntimeError("oops")):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser", side_effect=RuntimeError("oops")):
         import_cdf_to_db("bad.xml", "out.db", logger=custom_logger)
     custom_logger.error.assert_called_once()
     assert "oops" in custom_logger.error.call_args[0][0]
@@ -129,21 +135,21 @@ def test_import_logs_error_on_exception() -> None:
 
 def test_import_closes_db_after_failure() -> None:
     db = _make_db(closed=False)
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser", side_effect=RuntimeError("fail")):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser", side_effect=RuntimeError("fail")):
         import_cdf_to_db("bad.xml", "out.db")
     db.close.assert_called_once()
 
 
 def test_import_no_rollback_on_success() -> None:
     db = _make_db()
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser"):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser"):
         import_cdf_to_db("x.xml", "x.db")
     db.rollback_transaction.assert_not_called()
 
 
 def test_import_db_error_also_handled() -> None:
     db = _make_db()
-    with patch(f"{_MODULE}.MSRSWDatabase", return_value=db), patch(f"{_MODULE}.Parser", side_effect=Exception("db error")):
+    with patch(f"{_ORM}.MSRSWDatabase", return_value=db), patch(f"{_ORM}.Parser", side_effect=Exception("db error")):
         result = import_cdf_to_db("x.xml", "x.db")
     assert result is False
 
@@ -172,7 +178,7 @@ def test_cdf_importer_import_file_delegates() -> None:
     imp = CDFImporter()
     with patch(f"{_MODULE}.import_cdf_to_db", return_value=True) as mock_fn:
         result = imp.import_file("file.xml", "file.db")
-    mock_fn.assert_called_once_with("file.xml", "file.db", imp.logger)
+    mock_fn.assert_called_once_with("file.xml", "file.db", imp.logger, streaming=False, profile=None)
     assert result is True
 
 
@@ -187,4 +193,43 @@ def test_cdf_importer_import_file_path_objects() -> None:
     imp = CDFImporter()
     with patch(f"{_MODULE}.import_cdf_to_db", return_value=True) as mock_fn:
         imp.import_file(Path("a.xml"), Path("a.db"))
-    mock_fn.assert_called_once_with(Path("a.xml"), Path("a.db"), imp.logger)
+    mock_fn.assert_called_once_with(Path("a.xml"), Path("a.db"), imp.logger, streaming=False, profile=None)
+
+
+def test_cdf_importer_forwards_profile() -> None:
+    imp = CDFImporter(streaming=True, profile="durable")
+    with patch(f"{_MODULE}.import_cdf_to_db", return_value=True) as mock_fn:
+        imp.import_file("a.xml", "a.db")
+    mock_fn.assert_called_once_with("a.xml", "a.db", imp.logger, streaming=True, profile="durable")
+
+
+# ---------------------------------------------------------------------------
+# One writer, one reader
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("profile, readable", [("concurrent-read", True), (None, False)])
+def test_reader_during_import(tmp_path: Path, profile: str | None, readable: bool) -> None:
+    db_path = tmp_path / "import.msrswdb"
+    seen: list[object] = []
+
+    class ReadingParser:
+        """Writes a row and, with the write transaction still open, reads the file through a second connection."""
+
+        def __init__(self, xml_path: str, db: MSRSWDatabase) -> None:
+            db.session.add(ShortName(content="pending"))
+            db.session.flush()
+            try:
+                # busy_timeout=0: fail at once instead of waiting for the writer.
+                with MSRSWReader(db_path, profile=SQLiteProfile(busy_timeout=0)) as reader:
+                    seen.append(reader.schema_version)
+            except OperationalError as exc:
+                seen.append(exc)
+            db.commit_transaction()
+
+    with patch(f"{_ORM}.Parser", ReadingParser):
+        assert import_cdf_to_db("x.xml", db_path, profile=profile) is True
+    if readable:
+        assert seen == [CURRENT_SCHEMA_VERSION]
+    else:
+        assert isinstance(seen[0], OperationalError) and "locked" in str(seen[0])
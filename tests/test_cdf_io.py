@@ -6,6 +6,8 @@ import pytest
 from lxml import etree
 
 from asamint import cdf
+from asamint.calibration import msrsw_db
+from asamint.cdf.exporter import cdf_exporter
 from asamint.cdf.exporter.cdf_exporter import CDFExporter
 from asamint.utils.xml import create_validator
 
@@ -16,8 +18,9 @@ def test_export_cdf_invokes_export(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
     monkeypatch.setattr(cdf, "configure_logging", lambda _: dummy_logger)
 
     class DummyDB:
-        def __init__(self, file_name: str | Path) -> None:
+        def __init__(self, file_name: str | Path, *, profile: str = "bulk-import") -> None:
             calls["db_path"] = Path(file_name)
+            calls["db_profile"] = profile
 
         def close(self) -> None:
             calls["db_closed"] = True
@@ -48,9 +51,10 @@ def test_export_cdf_invokes_export(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
             calls["validate_dtd"] = validate_dtd
             return True
 
-    monkeypatch.setattr(cdf, "MSRSWDatabase", DummyDB)
+    # export_cdf imports the MSRSW database and the exporter on first use.
+    monkeypatch.setattr(msrsw_db, "MSRSWDatabase", DummyDB)
     monkeypatch.setattr(cdf, "CalibrationDB", DummyH5)
-    monkeypatch.setattr(cdf, "CDFExporter", DummyExporter)
+    monkeypatch.setattr(cdf_exporter, "CDFExporter", DummyExporter)
 
     output = tmp_path / "out.cdfx"
     db_path = tmp_path / "source.msrswdb"
@@ -70,6 +74,7 @@ def test_export_cdf_invokes_export(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
     assert calls["variant_coding"] is True
     assert calls["validate_dtd"] is True
     assert calls["db_closed"] is True
+    assert calls["db_profile"] == "concurrent-read"
     assert calls["h5_closed"] is True
     assert calls["exporter_logger"] is dummy_logger
     assert calls["h5_logger"] is dummy_logger
@@ -81,8 +86,9 @@ def test_import_cdf_invokes_importer(monkeypatch: pytest.MonkeyPatch, tmp_path:
     monkeypatch.setattr(cdf, "configure_logging", lambda _: dummy_logger)
 
     class DummyImporter:
-        def __init__(self, logger: object | None = None) -> None:
+        def __init__(self, logger: object | None = None, *, streaming: bool = False, profile: str | None = None) -> None:
             calls["logger"] = logger
+            calls["options"] = (streaming, profile)
 
         def import_file(self, xml_path: str | Path, db_path: str | Path) -> bool:
             calls["paths"] = (Path(xml_path), Path(db_path))
@@ -99,6 +105,10 @@ def test_import_cdf_invokes_importer(monkeypatch: pytest.MonkeyPatch, tmp_path:
     assert result.db_path == db
     assert calls["paths"] == (xml, db)
     assert calls["logger"] is dummy_logger
+    assert calls["options"] == (False, None)
+
+    cdf.import_cdf(xml_path=xml, db_path=db, streaming=True, profile="bulk-import")
+    assert calls["options"] == (True, "bulk-import")
 
 
 class _FakeAttrs(dict):
@@ -478,6 +478,62 @@ class TestExampleRoundTrip:
         )
 
 
+# ---------------------------------------------------------------------------
+# Streaming import
+# ---------------------------------------------------------------------------
+
+
+def _table_counts(db_path: Path) -> dict[str, int]:
+    import sqlite3
+
+    conn = sqlite3.connect(db_path)
+    try:
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()]
+        counts = {table: conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchall()[0][0] for table in tables}
+    finally:
+        conn.close()
+    return {table: count for table, count in counts.items() if count}
+
+
+class TestStreamingImport:
+    """The iterparse/bulk-insert importer must produce the same database as the ORM parser."""
+
+    def test_same_database_as_orm_parser(self, tmp_path: Path) -> None:
+        xml_file = _write_xml(tmp_path, "multi.cdfx", _MULTI_CDF)
+        orm_db = tmp_path / "orm.msrswdb"
+        stream_db = tmp_path / "stream.msrswdb"
+        assert import_cdf_to_db(xml_file, orm_db)
+        assert import_cdf_to_db(xml_file, stream_db, streaming=True)
+
+        assert _table_counts(stream_db) == _table_counts(orm_db)
+        assert sorted(_query_instances(stream_db), key=str) == sorted(_query_instances(orm_db), key=str)
+        orm_xml, stream_xml = tmp_path / "orm.cdfx", tmp_path / "stream.cdfx"
+        assert _export_xml(orm_db, orm_xml) and _export_xml(stream_db, stream_xml)
+        assert stream_xml.read_bytes() == orm_xml.read_bytes()
+
+    def test_small_batches_and_metadata(self, tmp_path: Path) -> None:
+        from asamint.calibration.msrsw_db import MetaData, StreamingParser
+
+        xml_file = _write_xml(tmp_path, "multi.cdfx", _MULTI_CDF)
+        db = MSRSWDatabase(tmp_path / "multi.msrswdb")
+        db.begin_transaction()
+        parser = StreamingParser(str(xml_file), db, batch_size=3)
+        assert parser.rows == sum(_table_counts(tmp_path / "multi.msrswdb").values()) - 1
+
+        db = MSRSWDatabase(tmp_path / "multi.msrswdb")
+        try:
+            assert db.session.query(MetaData).first().variant == "CDF20"
+            values = [str(v.content) for v in db.session.query(V).order_by(V.rid)]
+            assert values == ["3.14", "3", "10.0", "20.0", "30.0"]
+        finally:
+            db.close()
+
+    def test_import_cdf_streaming(self, tmp_path: Path) -> None:
+        xml_file = _write_xml(tmp_path, "scalar.cdfx", _SCALAR_CDF)
+        result = import_cdf(xml_path=xml_file, db_path=tmp_path / "scalar.msrswdb", streaming=True)
+        assert _query_instances(result.db_path) == [{"name": "ScalarParam", "category": "VALUE", "long_name": "A scalar parameter"}]
+
+
 # ---------------------------------------------------------------------------
 # API surface
 # ---------------------------------------------------------------------------
@@ -3,12 +3,14 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
-from asamint.adapters.a2l import model
-from asamint.compu import CompuMethods, Measurement, getCM
+from asamint.adapters.a2l import CompuMethod, model
+from asamint.compu import CompiledConversion, CompuMethods, ConversionCache, Measurement, getCM
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -209,3 +211,95 @@ def test_get_cm_calls_query_with_compu_method(monkeypatch) -> None:
     session.query.return_value.filter.return_value.first.return_value = None
     getCM(session, "SomeName")
     session.query.assert_called_once_with(model.CompuMethod)
+
+
+# ---------------------------------------------------------------------------
+# CompiledConversion / ConversionCache
+# ---------------------------------------------------------------------------
+
+
+def _sample_inputs(cm) -> np.ndarray:
+    if cm.conversionType == "TAB_INTP" and cm.tab.interpolation:
+        return np.linspace(min(cm.tab.in_values), max(cm.tab.in_values), 11)
+    return np.arange(-3, 20)
+
+
+def test_compiled_conversion_matches_pya2l(asap2_demo_session) -> None:
+    for row in asap2_demo_session.query(model.CompuMethod).all():
+        cm = CompuMethod.get(asap2_demo_session, row.name)
+        compiled = CompiledConversion(cm)
+        values = _sample_inputs(cm)
+        expected = cm.int_to_physical(values)
+        result = compiled.int_to_physical(values)
+        if np.asarray(expected).dtype.kind in "iuf":
+            np.testing.assert_allclose(np.asarray(result, dtype=float), np.asarray(expected, dtype=float), err_msg=row.name)
+        else:
+            assert list(result) == list(expected), row.name
+        assert compiled.int_to_physical(values[3]) == cm.int_to_physical(values[3]), row.name
+
+
+def test_compiled_tab_intp_out_of_range_is_element_wise(asap2_demo_session) -> None:
+    cm = CompuMethod.get(asap2_demo_session, "CM.TAB_INTP.DEFAULT_VALUE")
+    lo, hi = min(cm.tab.in_values), max(cm.tab.in_values)
+    result = CompiledConversion(cm).int_to_physical(np.array([lo - 1, lo, hi, hi + 1]))
+    assert result[0] == result[3] == cm.tab.default_value
+    np.testing.assert_allclose(result[1:3], cm.int_to_physical(np.array([lo, hi])))
+
+
+def test_compiled_identity_returns_a_copy(asap2_demo_session) -> None:
+    compiled = CompiledConversion(CompuMethod.get(asap2_demo_session, "CM.IDENTICAL"))
+    raw = np.arange(4)
+    phys = compiled.int_to_physical(raw)
+    phys[0] = 99
+    assert raw[0] == 0
+    assert compiled.int_to_physical(7) == 7
+
+
+def _rat_func(**coeffs: float) -> SimpleNamespace:
+    values = dict.fromkeys("abcdef", 0.0) | coeffs
+    return SimpleNamespace(
+        name="CM_RAT_FUNC",
+        conversionType="RAT_FUNC",
+        unit="",
+        coeffs=SimpleNamespace(**values),
+        int_to_physical=MagicMock(return_value="pya2l"),
+    )
+
+
+def test_compiled_rat_func_linear_offset() -> None:
+    # INT = (4 * PHYS + 6) / 2  ==>  PHYS = 0.5 * INT - 1.5
+    compiled = CompiledConversion(_rat_func(b=4.0, c=6.0, f=2.0))
+    np.testing.assert_allclose(compiled.int_to_physical(np.array([0, 3, 10])), [-1.5, 0.0, 3.5])
+    compiled.compu_method.int_to_physical.assert_not_called()
+
+
+def test_compiled_rat_func_without_f_uses_pya2l() -> None:
+    cm = _rat_func(b=4.0, c=6.0)
+    assert CompiledConversion(cm).int_to_physical(3) == "pya2l"
+    cm.int_to_physical.assert_called_once_with(3)
+
+
+def test_conversion_cache_hits_and_misses(asap2_demo_session) -> None:
+    cache = ConversionCache()
+    first = cache.get(asap2_demo_session, "CM.LINEAR.MUL_2")
+    assert cache.get(asap2_demo_session, "CM.LINEAR.MUL_2") is first
+    assert cache.get(asap2_demo_session, CompuMethod.get(asap2_demo_session, "CM.LINEAR.MUL_2")) is first
+    assert cache.stats() == {"hits": 2, "misses": 1, "size": 1, "maxsize": cache.maxsize}
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_conversion_cache_is_bounded(asap2_demo_session) -> None:
+    cache = ConversionCache(maxsize=2)
+    for name in ("CM.IDENTICAL", "CM.LINEAR.IDENT", "CM.LINEAR.MUL_2"):
+        cache.get(asap2_demo_session, name)
+    assert len(cache) == 2
+    cache.get(asap2_demo_session, "CM.IDENTICAL")
+    assert cache.misses == 4
+
+
+def test_conversion_cache_passes_through_foreign_objects() -> None:
+    cache = ConversionCache()
+    double = SimpleNamespace(name="CM_FAKE", int_to_physical=lambda value: value)
+    assert cache.get(MagicMock(), double) is double
+    assert len(cache) == 0
@@ -1,19 +1,22 @@
 #!/usr/bin/env python
 """Tests for asamint.measurement.csv helper functions."""
 
+import csv
+from io import StringIO
 from pathlib import Path
 
 import numpy as np
 import numpy.testing as npt
 import pytest
 
+from asamint.measurement import csv as csv_module
 from asamint.measurement.csv import (
+    DaqCsvReader,
     _csv_fieldnames,
-    _fast_parse_daq_csv,
     _iter_csv_rows,
-    _parse_daq_csv_python,
-    _read_daq_csv_rows,
+    _merge_daq_csv_results,
     _timestamp_index,
+    _write_csv,
     _write_metadata_headers,
 )
 
@@ -119,39 +122,78 @@ class TestIterCsvRows:
 
 
 # ---------------------------------------------------------------------------
-# _read_daq_csv_rows
+# _write_csv
 # ---------------------------------------------------------------------------
 
 
-class TestReadDaqCsvRows:
-    def test_reads_columns_and_data(self, tmp_path: Path):
-        f = tmp_path / "data.csv"
-        f.write_text("timestamp,sig1\n0,1.5\n1,2.5\n", encoding="utf-8")
-        cols, rows = _read_daq_csv_rows(f)
-        assert cols == ["timestamp", "sig1"]
-        assert len(rows) == 2
-        assert rows[0] == ["0", "1.5"]
-
-    def test_skips_comment_lines(self, tmp_path: Path):
-        f = tmp_path / "data.csv"
-        f.write_text("# comment\n# another\ntimestamp,s\n0,1\n", encoding="utf-8")
-        cols, rows = _read_daq_csv_rows(f)
-        assert cols == ["timestamp", "s"]
-        assert len(rows) == 1
-
-    def test_skips_empty_lines(self, tmp_path: Path):
-        f = tmp_path / "data.csv"
-        f.write_text("\n\ntimestamp,s\n\n0,1\n\n", encoding="utf-8")
-        cols, rows = _read_daq_csv_rows(f)
-        assert cols == ["timestamp", "s"]
-        assert len(rows) == 1
-
-    def test_empty_file(self, tmp_path: Path):
-        f = tmp_path / "empty.csv"
-        f.write_text("", encoding="utf-8")
-        cols, rows = _read_daq_csv_rows(f)
-        assert cols == []
-        assert rows == []
+def _rows_via_csv_writer(data: dict) -> str:
+    fieldnames = _csv_fieldnames(data)
+    ts = data.get("TIMESTAMPS")
+    if ts is None:
+        ts = range(max((len(v) for k, v in data.items() if hasattr(v, "__len__")), default=0))
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fieldnames)
+    writer.writerows(_iter_csv_rows(list(ts), fieldnames[1:], data))
+    return buffer.getvalue()
+
+
+class TestWriteCsv:
+    @pytest.mark.parametrize("block_cells", [3, 7, 1 << 18])
+    def test_matches_row_wise_csv_writer(self, tmp_path: Path, monkeypatch, block_cells: int):
+        monkeypatch.setattr(csv_module, "CSV_BLOCK_CELLS", block_cells)
+        rng = np.random.default_rng(0)
+        data = {
+            "TIMESTAMPS": np.arange(11) * 0.1,
+            "f64": rng.normal(size=11) * 1e6,
+            "f32": rng.normal(size=11).astype(np.float32),
+            "i16": np.arange(-5, 6, dtype=np.int16),
+            "flag": np.arange(11) % 2 == 0,
+            "short": np.array([1.5, np.nan, np.inf]),
+            "text": ["plain", 'say "hi"', "a,b"],
+            "nullable": np.array(["x", None, "y"], dtype=object),
+            "list": [1, 2.5],
+            "scalar": np.float64(3.0),
+            "missing": None,
+        }
+        target = tmp_path / "out.csv"
+        _write_csv(target, data, {})
+        text = target.read_bytes().decode("utf-8")
+        assert text.endswith(_rows_via_csv_writer(data))
+        assert text.count("\r\n") == 12
+
+    def test_synthesized_timestamps_pad_ragged_signals(self, tmp_path: Path):
+        target = tmp_path / "ragged.csv"
+        _write_csv(target, {"a": np.array([1, 2, 3]), "b": np.array([0.5])}, {"a": "V"})
+        lines = target.read_text(encoding="utf-8").splitlines()
+        assert "# a [V]" in lines
+        assert lines[-4:] == ["timestamp,a,b", "0,1,0.5", "1,2,", "2,3,"]
+
+    def test_float_format(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(csv_module, "CSV_BLOCK_CELLS", 6)
+        data = {
+            "TIMESTAMPS": np.array([0.0, 0.125, 0.25]),
+            "big": np.array([2**60, 1, 2], dtype=np.int64),
+            "x": np.array([1 / 3, 2.0, -1e-7], dtype=np.float32),
+        }
+        full = tmp_path / "full.csv"
+        _write_csv(full, data, {}, float_format="%.3g")
+        assert full.read_text(encoding="utf-8").splitlines()[-3:] == ["0,1152921504606846976,0.333", "0.125,1,2", "0.25,2,-1e-07"]
+
+        data["short"] = np.array([0.5])  # ragged: cell-wise formatting, same float format
+        ragged = tmp_path / "ragged.csv"
+        _write_csv(ragged, data, {}, float_format="%.3g")
+        assert ragged.read_text(encoding="utf-8").splitlines()[-2:] == ["0.125,1,,2", "0.25,2,,-1e-07"]
+
+    def test_none_is_an_empty_cell(self, tmp_path: Path):
+        target = tmp_path / "none.csv"
+        _write_csv(target, {"TIMESTAMPS": np.arange(3), "s": ["x", None, "y"]}, {})
+        assert target.read_text(encoding="utf-8").splitlines()[-3:] == ["0,x", "1,", "2,y"]
+
+    def test_header_only_without_samples(self, tmp_path: Path):
+        target = tmp_path / "empty.csv"
+        _write_csv(target, {"TIMESTAMPS": np.array([])}, {})
+        assert target.read_text(encoding="utf-8").splitlines()[-1] == "timestamp"
 
 
 # ---------------------------------------------------------------------------
@@ -177,64 +219,88 @@ class TestTimestampIndex:
 
 
 # ---------------------------------------------------------------------------
-# _fast_parse_daq_csv
+# DaqCsvReader
 # ---------------------------------------------------------------------------
 
 
-class TestFastParseDaqCsv:
-    def test_parses_simple_csv(self, tmp_path: Path):
-        f = tmp_path / "fast.csv"
-        f.write_text("timestamp,sig\n0,1.0\n1,2.0\n2,3.0\n", encoding="utf-8")
-        result = _fast_parse_daq_csv(f)
-        assert result is not None
-        assert "TIMESTAMPS" in result
-        assert "sig" in result
-        npt.assert_array_equal(result["sig"], [1.0, 2.0, 3.0])
-
-    def test_returns_none_for_comment_prefixed(self, tmp_path: Path):
-        f = tmp_path / "commented.csv"
-        f.write_text("# asamint\ntimestamp,sig\n0,1\n", encoding="utf-8")
-        assert _fast_parse_daq_csv(f) is None
-
-    def test_returns_empty_for_empty_data(self, tmp_path: Path):
-        f = tmp_path / "hdr_only.csv"
-        f.write_text("timestamp,sig\n", encoding="utf-8")
-        result = _fast_parse_daq_csv(f)
-        # numpy.genfromtxt with no data rows → empty array
-        assert result is not None
-        assert result == {}
-
-
-# ---------------------------------------------------------------------------
-# _parse_daq_csv_python (fallback parser)
-# ---------------------------------------------------------------------------
-
-
-class TestParseDaqCsvPython:
-    def test_parses_with_comments(self, tmp_path: Path):
-        f = tmp_path / "commented.csv"
-        f.write_text("# comment\ntimestamp,sig\n0,10\n1,20\n", encoding="utf-8")
-        result = _parse_daq_csv_python(f)
-        assert "TIMESTAMPS" in result
-        npt.assert_array_equal(result["TIMESTAMPS"], [0.0, 1.0])
-        npt.assert_array_equal(result["sig"], [10.0, 20.0])
-
-    def test_returns_empty_for_empty_file(self, tmp_path: Path):
-        f = tmp_path / "empty.csv"
-        f.write_text("", encoding="utf-8")
-        assert _parse_daq_csv_python(f) == {}
-
-    def test_skips_non_numeric_values(self, tmp_path: Path):
+class TestDaqCsvReader:
+    def test_typed_columns_and_metadata_header(self, tmp_path: Path):
+        f = tmp_path / "daq.csv"
+        f.write_text(
+            "# asamint\n#\n\ntimestamp,sig.a,sig_b\n1700000000000000001,1.5,3\n1700000000000000002,2.5,4\n", encoding="utf-8"
+        )
+        result = DaqCsvReader(f).read()
+        assert list(result) == ["TIMESTAMPS", "sig.a", "sig_b"]
+        assert result["TIMESTAMPS"].dtype == np.int64
+        npt.assert_array_equal(result["TIMESTAMPS"], [1700000000000000001, 1700000000000000002])
+        assert result["sig.a"].dtype == np.float64 and result["sig_b"].dtype == np.int64
+        npt.assert_array_equal(result["sig_b"], [3, 4])
+
+    def test_blocks_and_fallbacks(self, tmp_path: Path):
         f = tmp_path / "mixed.csv"
-        f.write_text("sig\n1.0\nnot_a_number\n3.0\n", encoding="utf-8")
-        result = _parse_daq_csv_python(f)
-        # non-numeric skipped, so only 2 values
-        npt.assert_array_equal(result["sig"], [1.0, 3.0])
+        lines = ["timestamp,ints,other"] + [f"{i},{i},{i * 0.5}" for i in range(10)]
+        lines[6] = "5,5.5,bad"  # int column turns float, invalid cell becomes NaN
+        lines[8] = "# comment inside the data"
+        lines[9] = "8,8"  # short row
+        f.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        reader = DaqCsvReader(f, block_rows=3)
+        blocks = list(reader)
+        assert [len(block["timestamp"]) for block in blocks] == [3, 3, 2, 1]
+        assert blocks[0]["ints"].dtype == np.int64 and blocks[-1]["ints"].dtype == np.float64
+        result = reader.read()
+        npt.assert_array_equal(result["TIMESTAMPS"], [0, 1, 2, 3, 4, 5, 6, 8, 9])
+        npt.assert_array_equal(result["ints"], [0, 1, 2, 3, 4, 5.5, 6, 8, 9])
+        npt.assert_array_equal(result["other"], [0.0, 0.5, 1.0, 1.5, 2.0, np.nan, 3.0, np.nan, 4.5])
+
+    @pytest.mark.parametrize("block_rows", [2, 1000])
+    def test_round_trip_of_write_csv(self, tmp_path: Path, block_rows: int):
+        f = tmp_path / "out.csv"
+        data = {
+            "TIMESTAMPS": np.arange(5) * 0.1,
+            "long": np.arange(5.0),
+            "short": np.array([1.5, 2.5]),
+            "f32": np.float32([0.1] * 5),
+        }
+        _write_csv(f, data, {"long": "V"}, {"author": "me"}, {"long": {"timebase_s": 0.1}})
+        result = DaqCsvReader(f, block_rows=block_rows).read()
+        npt.assert_array_equal(result["TIMESTAMPS"], data["TIMESTAMPS"])
+        npt.assert_array_equal(result["long"], data["long"])
+        npt.assert_array_equal(result["short"], data["short"])
+        npt.assert_array_equal(result["f32"].astype(np.float32), data["f32"])
+
+    def test_header_only_and_empty(self, tmp_path: Path):
+        f = tmp_path / "hdr_only.csv"
+        f.write_text("# meta\ntimestamp,sig\n", encoding="utf-8")
+        reader = DaqCsvReader(f)
+        assert reader.read() == {}
+        assert reader.columns == ["timestamp", "sig"]
+        empty = tmp_path / "empty.csv"
+        empty.write_text("", encoding="utf-8")
+        assert DaqCsvReader(empty).read() == {}
+        with pytest.raises(ValueError):
+            DaqCsvReader(f, block_rows=0)
 
     def test_no_timestamp_column(self, tmp_path: Path):
         f = tmp_path / "no_ts.csv"
         f.write_text("sig_a,sig_b\n1,2\n3,4\n", encoding="utf-8")
-        result = _parse_daq_csv_python(f)
+        result = DaqCsvReader(f).read()
         assert "TIMESTAMPS" not in result
-        npt.assert_array_equal(result["sig_a"], [1.0, 3.0])
-        npt.assert_array_equal(result["sig_b"], [2.0, 4.0])
+        npt.assert_array_equal(result["sig_a"], [1, 3])
+        npt.assert_array_equal(result["sig_b"], [2, 4])
+
+    def test_parallel_merge_matches_sequential(self, tmp_path: Path):
+        files = []
+        for idx in range(3):
+            f = tmp_path / f"daq{idx}.csv"
+            f.write_text(f"timestamp,sig{idx}\n" + "".join(f"{i},{i * idx}\n" for i in range(50)), encoding="utf-8")
+            files.append(f)
+        broken = tmp_path / "broken.csv"
+        broken.write_bytes(b"timestamp,x\n\xff\xfe\n")
+        files.insert(1, broken)
+        with pytest.warns(UserWarning, match="broken.csv"):
+            sequential = _merge_daq_csv_results(files)
+        with pytest.warns(UserWarning, match="broken.csv"):
+            parallel = _merge_daq_csv_results(files, workers=2)
+        assert list(parallel) == list(sequential) == ["TIMESTAMPS", "sig0", "sig1", "sig2"]
+        for name in sequential:
+            npt.assert_array_equal(parallel[name], sequential[name])
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import numpy as np
 import pytest
 
 from asamint.calibration.curve_axis import (
+    NormalizedGrid,
     interpolate_normalized,
+    interpolate_normalized_many,
+    lookup_normalized_map,
     normalize_axis_input,
 )
 
@@ -257,3 +262,58 @@ class TestLookupChain:
         z = interpolate_normalized(Z_MAP, [x_idx, y_idx])
         # x_idx=4.9, y_idx=4.2 → clamped to valid map range
         assert isinstance(z, float)
+
+
+# ---------------------------------------------------------------------------
+# Tests: many operating points at once
+# ---------------------------------------------------------------------------
+
+
+def _appendix_b_calibration() -> SimpleNamespace:
+    """Just enough of a Calibration to look up Z_MAP through X_NORM / Y_NORM."""
+
+    def curve(x, y):
+        return SimpleNamespace(axes=[SimpleNamespace(phys=x)], phys=y)
+
+    def axis(ref):
+        return SimpleNamespace(category="CURVE_AXIS", axis_pts_ref=ref, phys=[])
+
+    # Loaded parameters are indexed [x, y], Z_MAP is printed [y, x].
+    z_map = SimpleNamespace(axes=[axis("X_NORM"), axis("Y_NORM")], phys=Z_MAP.T)
+    return SimpleNamespace(
+        characteristic_category=lambda name: "MAP",
+        load_curve_or_map=lambda name, category, num_axes: z_map,
+        parameter_cache={"CURVE": {"X_NORM": curve(X_NORM_X, X_NORM_Y), "Y_NORM": curve(Y_NORM_X, Y_NORM_Y)}},
+    )
+
+
+class TestInterpolateNormalizedMany:
+    """Vectorised B.1.4 interpolation must agree with the scalar version."""
+
+    @pytest.mark.parametrize("shape", [(7,), (1,), (6, 7), (6, 1), (2, 3, 4), (2, 2, 3, 2), (3, 2, 2, 2, 2)])
+    def test_matches_scalar(self, shape):
+        rng = np.random.default_rng(len(shape))
+        values = rng.normal(size=shape)
+        indices = rng.uniform(-1.0, max(shape) + 1.0, (200, len(shape)))
+        indices[:5] = np.floor(indices[:5])  # exact grid points
+        expected = [interpolate_normalized(values, list(row)) for row in indices]
+        np.testing.assert_allclose(interpolate_normalized_many(values, indices), expected, rtol=1e-12, atol=1e-12)
+
+    def test_wrong_shape(self):
+        with pytest.raises(ValueError, match="Expected indices of shape"):
+            interpolate_normalized_many(Z_MAP, np.zeros((3, 1)))
+
+    def test_normalized_grid_appendix_b(self):
+        cal = _appendix_b_calibration()
+        grid = NormalizedGrid.load(cal, "Z_MAP")
+        assert grid.sources == {"Z_MAP", "X_NORM", "Y_NORM"}
+        inputs = np.array([[850.0, 60.0], [-999.0, -999.0], [99999.0, 99999.0], [300.0, 75.0]])
+        result = grid(inputs)
+        assert result[0] == pytest.approx(2.194, abs=1e-9)
+        np.testing.assert_allclose(result, [lookup_normalized_map(cal, "Z_MAP", *row) for row in inputs])
+
+    def test_normalized_grid_input_shape(self):
+        grid = NormalizedGrid.load(_appendix_b_calibration(), "Z_MAP")
+        with pytest.raises(ValueError, match="2 axis/axes"):
+            grid(np.zeros(4))
+        assert grid(np.empty((0, 2))).shape == (0,)
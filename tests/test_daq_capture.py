@@ -0,0 +1,169 @@
+"""Tests for asamint.measurement.capture (asyncio DAQ capture engine)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from asamint.measurement.capture import DaqCaptureEngine, DaqFrame, Overflow, tapped_policy
+
+
+class RecordingPolicy:
+    """Stand-in for a pyXCP DAQ policy: records what the transport delivers."""
+
+    def __init__(self, daq_lists: list[Any]) -> None:
+        self.daq_lists = daq_lists
+        self.received: list[tuple[int, int, int, list[Any]]] = []
+
+    def on_daq_list(self, daq_list: int, timestamp0: int, timestamp1: int, payload: list[Any]) -> None:
+        self.received.append((daq_list, timestamp0, timestamp1, payload))
+
+
+class FakeXcpSlave:
+    """Emits DAQ lists from a receiver thread while a session is open, like the pyXCP transport does."""
+
+    def __init__(self, frames: int | None = None, period_s: float = 0.0) -> None:
+        self.frames = frames
+        self.period_s = period_s
+        self.sessions = 0
+        self.closed = 0
+
+    @contextmanager
+    def session(self, policy: Any) -> Iterator[None]:
+        stop = threading.Event()
+
+        def _receiver() -> None:
+            counter = 0
+            while not stop.is_set() and (self.frames is None or counter < self.frames):
+                daq_list = counter % len(policy.daq_lists)
+                policy.on_daq_list(daq_list, counter * 1000, counter, [counter, float(counter) / 2])
+                counter += 1
+                if self.period_s:
+                    time.sleep(self.period_s)
+
+        receiver = threading.Thread(target=_receiver, daemon=True)
+        self.sessions += 1
+        receiver.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            receiver.join()
+            self.closed += 1
+
+
+def _policy(lists: int = 1) -> Any:
+    daq_lists = [SimpleNamespace(name=f"daq{n}", headers=[("a", "U32"), ("b", "F64")]) for n in range(lists)]
+    return tapped_policy(RecordingPolicy)(daq_lists)
+
+
+def test_frames_in_order_with_counters() -> None:
+    slave = FakeXcpSlave(frames=500)
+    policy = _policy(lists=2)
+    engine = DaqCaptureEngine(policy, maxsize=16, session_factory=slave.session)
+
+    async def _run() -> list[DaqFrame]:
+        frames = []
+        async with engine:
+            async for frame in engine:
+                frames.append(frame)
+                if len(frames) == 500:
+                    break
+        return frames
+
+    frames = asyncio.run(_run())
+    assert [f.timestamp1 for f in frames] == list(range(500))
+    assert frames[3] == DaqFrame(1, 3000, 3, [3, 1.5])
+    stats = engine.stats
+    assert (stats.frames, stats.bytes, stats.dropped) == (500, 500 * 12, 0)
+    assert stats.frames_per_s > 0
+    assert len(policy.received) == 500
+    assert slave.closed == 1
+    assert policy.frame_sink is None
+
+
+@pytest.mark.parametrize("overflow", [Overflow.DROP_NEWEST, Overflow.DROP_OLDEST])
+def test_drop_policies(overflow: Overflow) -> None:
+    slave = FakeXcpSlave(frames=200)
+    policy = _policy()
+    engine = DaqCaptureEngine(policy, maxsize=4, overflow=overflow, session_factory=slave.session)
+
+    async def _run() -> list[DaqFrame]:
+        async with engine:
+            while engine.stats.frames < 200:
+                await asyncio.sleep(0.001)
+        return [frame async for frame in engine]
+
+    frames = asyncio.run(_run())
+    ids = [f.timestamp1 for f in frames]
+    assert len(ids) == 4
+    assert engine.stats.dropped == 196
+    assert ids == ([0, 1, 2, 3] if overflow is Overflow.DROP_NEWEST else [196, 197, 198, 199])
+    # The wrapped policy is never affected by the capture buffer.
+    assert len(policy.received) == 200
+
+
+def test_block_applies_back_pressure() -> None:
+    slave = FakeXcpSlave(frames=100)
+    engine = DaqCaptureEngine(_policy(), maxsize=2, overflow="block", session_factory=slave.session)
+    frames = []
+
+    async def _run() -> None:
+        async with engine:
+            async for frame in engine:
+                assert engine.stats.queued <= 2
+                frames.append(frame)
+                if len(frames) == 100:
+                    break
+                await asyncio.sleep(0)
+
+    asyncio.run(_run())
+    assert [f.timestamp1 for f in frames] == list(range(100))
+    assert engine.stats.dropped == 0
+
+
+def test_run_stops_on_condition_and_duration() -> None:
+    slave = FakeXcpSlave(period_s=0.0005)
+    engine = DaqCaptureEngine(_policy(), overflow="drop_oldest", session_factory=slave.session)
+    stats = asyncio.run(engine.run(until=lambda frame: frame.payload[0] >= 50))
+    assert stats.frames >= 51
+    assert slave.closed == 1
+
+    slave = FakeXcpSlave(period_s=0.0005)
+    engine = DaqCaptureEngine(_policy(), session_factory=slave.session)
+    stats = asyncio.run(engine.run(duration=0.05))
+    assert 0.05 <= stats.elapsed_s < 1.0
+    assert stats.frames > 0
+    assert slave.closed == 1
+
+
+def test_concurrent_sessions_and_cancellation() -> None:
+    slaves = [FakeXcpSlave(period_s=0.0002) for _ in range(2)]
+    engines = [DaqCaptureEngine(_policy(), overflow="drop_oldest", session_factory=s.session) for s in slaves]
+
+    async def _run() -> None:
+        await asyncio.gather(*(engine.run(max_frames=100) for engine in engines))
+        task = asyncio.ensure_future(DaqCaptureEngine(_policy(), session_factory=slaves[0].session).run())
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(_run())
+    assert all(engine.stats.frames >= 100 for engine in engines)
+    assert [s.sessions for s in slaves] == [2, 1]
+    assert [s.closed for s in slaves] == [2, 1]
+
+
+def test_rejects_untapped_policy() -> None:
+    with pytest.raises(TypeError):
+        DaqCaptureEngine(RecordingPolicy([]))
+    with pytest.raises(ValueError):
+        DaqCaptureEngine(_policy(), maxsize=0)
@@ -0,0 +1,62 @@
+"""Tests for asamint.calibration.definitions (bulk A2L definition snapshot)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from asamint import calibration
+from asamint.adapters.a2l import model
+from asamint.calibration.definitions import DefinitionSnapshot
+
+
+@pytest.fixture()
+def snapshot(calibration_context: Any) -> DefinitionSnapshot:
+    return DefinitionSnapshot.load(calibration_context.session)
+
+
+def test_snapshot_covers_all_rows(calibration_context: Any, snapshot: DefinitionSnapshot) -> None:
+    session = calibration_context.session
+    assert set(snapshot.characteristics) == {row.name for row in session.query(model.Characteristic.name)}
+    assert set(snapshot.axis_pts) == {row.name for row in session.query(model.AxisPts.name)}
+    assert set(snapshot.compu_methods) == {row.name for row in session.query(model.CompuMethod.name)}
+    assert set(snapshot.record_layouts) == {row.name for row in session.query(model.RecordLayout.name)}
+
+
+def test_snapshot_categories(calibration_context: Any, snapshot: DefinitionSnapshot) -> None:
+    session = calibration_context.session
+    for category in ("VALUE", "CURVE", "MAP", "VAL_BLK", "ASCII"):
+        expected = {row.name for row in session.query(model.Characteristic.name).filter(model.Characteristic.type == category)}
+        assert set(snapshot.names(category)) == expected
+        assert all(chx.type == category for chx in snapshot.characteristics_of(category))
+    assert snapshot.names("NO_SUCH_CATEGORY") == []
+
+
+def test_snapshot_axis_pts_ordered_by_address(snapshot: DefinitionSnapshot) -> None:
+    addresses = [ap.address for ap in snapshot.axis_pts.values()]
+    assert addresses == sorted(addresses)
+
+
+def test_seed_populates_definition_cache(snapshot: DefinitionSnapshot) -> None:
+    cache: dict[tuple[str, str], Any] = {}
+    snapshot.seed(cache)
+    name = next(iter(snapshot.characteristics))
+    assert cache[("CHAR", name)] is snapshot.characteristics[name]
+    assert cache[("TYPE", name)] == snapshot.types[name]
+    for ap_name in snapshot.axis_pts:
+        assert cache[("AXIS_EXISTS", ap_name)] is True
+
+
+def test_offline_calibration_with_snapshot(calibration_context: Any, hex_image: Any, snapshot: DefinitionSnapshot) -> None:
+    plain = calibration.OfflineCalibration(calibration_context, hex_image, loglevel="INFO")
+    seeded = calibration.OfflineCalibration(calibration_context, hex_image, loglevel="INFO", definitions=snapshot)
+    name = snapshot.names("VALUE")[0]
+    assert seeded.get_characteristic(name, "VALUE", False) is snapshot.characteristics[name]
+    for name in snapshot.names("VALUE")[:10]:
+        assert seeded.load_value(name).phys == plain.load_value(name).phys
+    for name in snapshot.names("CURVE")[:5]:
+        np.testing.assert_array_equal(
+            seeded.load_curve_or_map(name, "CURVE", 1).phys, plain.load_curve_or_map(name, "CURVE", 1).phys
+        )
@@ -0,0 +1,106 @@
+"""Tests for the checksum-driven delta image refresh."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from asamint.adapters.objutils import Image, Section
+from asamint.adapters.xcp import compute_checksum
+from asamint.calibration.delta_refresh import RefreshStats, refresh_image
+
+
+class EcuStandIn:
+    """XCP slave stand-in answering ``BUILD_CHECKSUM`` and ``UPLOAD`` from its own sections."""
+
+    def __init__(self, sections: dict[int, bytes], checksum_type: str = "XCP_CRC_32") -> None:
+        self.sections = {start: bytearray(data) for start, data in sections.items()}
+        self.checksum_type = checksum_type
+        self.pulls: list[tuple[int, int]] = []
+        self._mta = 0
+
+    def _read(self, length: int) -> bytes:
+        for start, data in self.sections.items():
+            if start <= self._mta and self._mta + length <= start + len(data):
+                return bytes(data[self._mta - start : self._mta - start + length])
+        raise AssertionError(f"range 0x{self._mta:X}+{length} outside ECU memory")
+
+    def setMta(self, address: int) -> None:
+        self._mta = address
+
+    def buildChecksum(self, length: int) -> SimpleNamespace:
+        return SimpleNamespace(checksumType=self.checksum_type, checksum=compute_checksum(self._read(length), self.checksum_type))
+
+    def pull(self, length: int) -> bytes:
+        self.pulls.append((self._mta, length))
+        return self._read(length)
+
+    def poke(self, address: int, data: bytes) -> None:
+        for start, memory in self.sections.items():
+            if start <= address < start + len(memory):
+                memory[address - start : address - start + len(data)] = data
+
+
+def _image(sections: dict[int, bytes]) -> Image:
+    return Image(sections=[Section(start_address=start, data=bytes(data)) for start, data in sections.items()], join=False)
+
+
+@pytest.fixture
+def memory() -> dict[int, bytes]:
+    rng = np.random.default_rng(0)
+    return {
+        0x1000: rng.integers(0, 256, 0x10000, dtype=np.uint8).tobytes(),
+        0x80000: rng.integers(0, 256, 1001, dtype=np.uint8).tobytes(),
+    }
+
+
+def _contents(image: Image) -> dict[int, bytes]:
+    return {section.start_address: bytes(section.data) for section in image.sections}
+
+
+def test_identical_image_pulls_nothing(memory):
+    ecu = EcuStandIn(memory)
+    stats = refresh_image(_image(memory), ecu, block_size=0x4000)
+    assert stats == RefreshStats(bytes_total=0x10000 + 1001, bytes_pulled=0, checksums=5, ranges=0)
+    assert ecu.pulls == []
+
+
+@pytest.mark.parametrize("checksum_type", ["XCP_CRC_32", "XCP_ADD_44"])
+def test_changed_bytes_are_pulled_and_patched(memory, checksum_type):
+    ecu = EcuStandIn(memory, checksum_type)
+    for address, data in ((0x1003, b"\x01\x02"), (0x8ABC, b"\xff"), (0x80000 + 999, b"\x00\x00")):
+        ecu.poke(address, bytes(b ^ 0x5A for b in data))
+    image = _image(memory)
+
+    stats = refresh_image(image, ecu, block_size=0x4000, min_range=64)
+
+    assert _contents(image) == {start: bytes(data) for start, data in ecu.sections.items()}
+    assert stats.ranges == 3
+    assert stats.bytes_pulled <= 3 * 64
+    assert stats.bytes_saved == stats.bytes_total - stats.bytes_pulled
+    assert all(length <= 64 for _, length in ecu.pulls)
+
+
+def test_adjacent_mismatches_are_pulled_in_one_range(memory):
+    ecu = EcuStandIn(memory)
+    ecu.poke(0x1000 + 60, bytes(8))
+    stats = refresh_image(_image(memory), ecu, block_size=0x4000, min_range=64)
+    assert stats.ranges == 1
+    assert ecu.pulls == [(0x1000, 128)]
+
+
+def test_fewer_checksums_than_blocks_of_min_range(memory):
+    ecu = EcuStandIn(memory)
+    ecu.poke(0x1000 + 0x7777, bytes([memory[0x1000][0x7777] ^ 1]))
+    stats = refresh_image(_image(memory), ecu, block_size=0x4000, min_range=64)
+    # 5 blocks + at most two checksums per bisection level (0x4000 -> 64 is 8 levels)
+    assert stats.checksums <= 5 + 2 * 8
+    assert stats.bytes_pulled == 64
+
+
+@pytest.mark.parametrize("kwargs", [{"block_size": 0}, {"block_size": 100 * 1024 + 2}, {"min_range": 6}])
+def test_sizes_must_be_dword_multiples(memory, kwargs):
+    with pytest.raises(ValueError):
+        refresh_image(_image(memory), EcuStandIn(memory), **kwargs)
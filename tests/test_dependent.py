@@ -9,17 +9,17 @@ from types import SimpleNamespace
 import numpy as np
 import pytest
 
-from asamint.adapters.a2l import ModCommon, ModPar, open_a2l_database
+from asamint.adapters.a2l import Formula, ModCommon, ModPar, open_a2l_database
 from asamint.calibration import api as calibration
+from asamint.calibration import dependent
 from asamint.calibration.dependent import (
+    CompiledFormula,
     DependencyEntry,
     DependencyGraph,
     DependencyKind,
     EvaluationResult,
     ValidationResult,
     _detect_special_function,
-    _eval_interp_1d,
-    _eval_interp_nd,
     _eval_max,
     _eval_min,
 )
@@ -152,6 +152,34 @@ class TestDependencyGraph:
         with pytest.raises(CalibrationError, match="[Cc]ircular"):
             graph._detect_cycles()
 
+    def test_levels_and_merged_order(self):
+        """Shared dependents appear once, after all of their inputs."""
+
+        def entry(name, *inputs):
+            return DependencyEntry(
+                name=name, formula="X1", input_names=list(inputs), kind=DependencyKind.DEPENDENT, dependent_type="VALUE"
+            )
+
+        graph = DependencyGraph()
+        for e in (entry("D", "B", "C"), entry("B", "IN_1"), entry("C", "IN_2", "B"), entry("E", "IN_2")):
+            graph.entries[e.name] = e
+            for inp in e.input_names:
+                graph.reverse_map[inp].append(e.name)
+
+        assert graph.levels == {"B": 0, "C": 1, "D": 2, "E": 0}
+        assert [e.name for e in graph.calculation_order("IN_1")] == ["B", "C", "D"]
+        assert [e.name for e in graph.calculation_order_many(["IN_1", "IN_2", "IN_1"])] == ["B", "E", "C", "D"]
+        assert graph.calculation_order_many([]) == []
+
+    def test_levels_reject_cycles(self):
+        graph = DependencyGraph()
+        graph.entries = {
+            "A": DependencyEntry(name="A", formula="X1", input_names=["B"], kind=DependencyKind.DEPENDENT, dependent_type="VALUE"),
+            "B": DependencyEntry(name="B", formula="X1", input_names=["A"], kind=DependencyKind.DEPENDENT, dependent_type="VALUE"),
+        }
+        with pytest.raises(CalibrationError, match="[Cc]ircular"):
+            _ = graph.levels
+
 
 # ---------------------------------------------------------------------------
 # Unit tests: special function detection
@@ -194,6 +222,73 @@ class TestSpecialFunctionDetection:
         assert _detect_special_function("INTERP(Z, 1.0)") is not None
 
 
+# ---------------------------------------------------------------------------
+# Unit tests: compiled formulas
+# ---------------------------------------------------------------------------
+
+
+class TestCompiledFormula:
+    """CompiledFormula must agree with pya2l's numexpr-based Formula."""
+
+    SYSTEM_CONSTANTS = {"Gain": "2.5", "Offset": "4"}
+
+    @pytest.mark.parametrize(
+        "formula, args",
+        [
+            ("X1 * 5", (17,)),
+            ("X + 5", (3.5,)),
+            ("X1 + X2", (np.arange(4), np.arange(4, 8))),
+            ("sqrt(X1) * sysc(Gain) + sysc(Offset)", (np.array([1.0, 4.0, 9.0]),)),
+            ("pow(X1, 2) - abs(X2)", (3.0, -2.0)),
+            ("(X1 > 3) && (X2 < 2)", (np.array([1, 4, 5]), np.array([1, 1, 3]))),
+            ("X1 & 0x0F", (0x3C,)),
+            ("X1 / 0", (np.array([1.0, 2.0]),)),
+            ("X1 ** 2", (np.array([3, 4], dtype=np.int8),)),
+            ("X1 * X2", (np.array([200, 255], dtype=np.uint8), np.array([200, 255], dtype=np.uint8))),
+            ("abs(X1)", (np.array([-128, 5], dtype=np.int8),)),
+            ("abs(X1)", (-3,)),
+            ("floor(X1) + ceil(X2)", (7, np.array([1, 2]))),
+            ("X1 ** 0.5", (-4.0,)),
+        ],
+    )
+    def test_matches_interpreter(self, formula, args):
+        compiled = CompiledFormula(formula, len(args), self.SYSTEM_CONSTANTS)
+        assert compiled.compiled
+        expected = Formula(formula=formula, system_constants=self.SYSTEM_CONSTANTS).int_to_physical(*args)
+        result = compiled(*args)
+        assert np.array_equal(result, expected, equal_nan=np.asarray(expected).dtype.kind == "f")
+        assert type(result) is type(expected)
+        assert np.asarray(result).dtype == np.asarray(expected).dtype
+
+    @pytest.mark.parametrize(
+        "formula, args",
+        [
+            ("X1 ** -1", (2,)),
+            ("2 ** X1", (-1,)),
+            ("X1 ** X2", (np.array([2, 3]), np.array([-1, 2]))),
+        ],
+    )
+    def test_integer_negative_power_matches_interpreter(self, formula, args):
+        expected = Formula(formula=formula).int_to_physical(*args)
+        result = CompiledFormula(formula, len(args))(*args)
+        assert np.array_equal(result, expected)
+        assert type(result) is type(expected)
+
+    def test_chained_comparison_is_not_compiled(self):
+        compiled = CompiledFormula("1 < X1 < 3", 1)
+        assert not compiled.compiled
+        assert np.array_equal(compiled(2), Formula(formula="1 < X1 < 3").int_to_physical(2))
+
+    def test_unsupported_expression_falls_back(self):
+        compiled = CompiledFormula("X1 + Unknown", 1)
+        assert not compiled.compiled
+        assert np.array_equal(compiled(1.0), np.array([]))
+
+    def test_failing_evaluation_falls_back(self):
+        compiled = CompiledFormula("X1 / X2", 2)
+        assert compiled(1.0, 0.0) == Formula(formula="X1 / X2").int_to_physical(1.0, 0.0)
+
+
 # ---------------------------------------------------------------------------
 # Unit tests: special functions (min, max, interp)
 # ---------------------------------------------------------------------------
@@ -210,39 +305,51 @@ class TestSpecialFunctions:
         arr = np.array([8, 5, 3, 4, 6, 7, 21, 7, 11, 9, 13, 14])
         assert _eval_max(arr) == 21.0
 
-    def test_eval_interp_1d_exact(self):
+    @staticmethod
+    def _interp(fnc: np.ndarray, axes: list[np.ndarray], *positions: float) -> float:
+        """Evaluate ``interp(Table, *positions)`` through the dependency engine."""
+        table = SimpleNamespace(phys=fnc, axes=[SimpleNamespace(phys=axis) for axis in axes])
+        cal = SimpleNamespace(
+            characteristic_category=lambda name: "CURVE" if len(axes) == 1 else "MAP",
+            parameter_cache={},
+            load_curve_or_map=lambda name, category, num_axes: table,
+        )
+        entry = DependencyEntry("Result", "", ["Table"], DependencyKind.VIRTUAL, "VALUE")
+        engine = dependent.DependencyEngine(cal, graph=None)
+        return engine._evaluate_special(entry, "interp", "Table", list(positions)).physical_value
+
+    def test_interp_1d_exact(self):
         """Interpolation at exact axis points returns exact values."""
         axes = np.array([1.0, 2.0, 3.0, 4.0])
         vals = np.array([5.0, 10.0, 15.0, 20.0])
-        assert _eval_interp_1d(axes, vals, 2.0) == 10.0
+        assert self._interp(vals, [axes], 2.0) == 10.0
 
-    def test_eval_interp_1d_between(self):
+    def test_interp_1d_between(self):
         """G.2.3 example: interp(Curve_C, 3.5) = 17.5."""
         axes = np.array([1.0, 2.0, 3.0, 4.0])
         vals = np.array([5.0, 10.0, 15.0, 20.0])
-        assert _eval_interp_1d(axes, vals, 3.5) == pytest.approx(17.5)
+        assert self._interp(vals, [axes], 3.5) == pytest.approx(17.5)
 
-    def test_eval_interp_1d_below_range(self):
+    def test_interp_1d_below_range(self):
         """G.2.3: axis value below lowest returns lowest value."""
         axes = np.array([1.0, 2.0, 3.0, 4.0])
         vals = np.array([5.0, 10.0, 15.0, 20.0])
-        assert _eval_interp_1d(axes, vals, 0.0) == pytest.approx(5.0)
+        assert self._interp(vals, [axes], 0.0) == pytest.approx(5.0)
 
-    def test_eval_interp_1d_above_range(self):
+    def test_interp_1d_above_range(self):
         """G.2.3: axis value above highest returns highest value."""
         axes = np.array([1.0, 2.0, 3.0, 4.0])
         vals = np.array([5.0, 10.0, 15.0, 20.0])
-        assert _eval_interp_1d(axes, vals, 5.0) == pytest.approx(20.0)
+        assert self._interp(vals, [axes], 5.0) == pytest.approx(20.0)
 
-    def test_eval_interp_nd_2d(self):
+    def test_interp_2d(self):
         """2-D interpolation on a simple MAP."""
         x_axis = np.array([1.0, 2.0])
         y_axis = np.array([1.0, 2.0])
         # 2x2 grid: [[10, 20], [30, 40]]
         fnc = np.array([[10.0, 20.0], [30.0, 40.0]])
         # Interpolate at center (1.5, 1.5) → (10+20+30+40)/4 = 25
-        result = _eval_interp_nd([x_axis, y_axis], fnc, [1.5, 1.5])
-        assert result == pytest.approx(25.0)
+        assert self._interp(fnc, [x_axis, y_axis], 1.5, 1.5) == pytest.approx(25.0)
 
 
 # ---------------------------------------------------------------------------
@@ -302,6 +409,44 @@ class TestCDF20DependentIntegration:
         results = cdf20_offline.recalculate_dependents("CDF20")
         assert results == []
 
+    def test_formula_compiled_once(self, cdf20_offline, monkeypatch):
+        """The engine parses each formula only on its first evaluation."""
+        created = []
+        monkeypatch.setattr(dependent, "Formula", lambda **kws: created.append(kws) or Formula(**kws))
+        engine = cdf20_offline.dependency_engine
+        engine.clear_compiled()
+        entry = cdf20_offline.dependency_graph.entries["CDF20.Dependent.Ref_1.FW_wU16"]
+        for _ in range(3):
+            assert engine.evaluate(entry).physical_value == pytest.approx(85.0)
+        assert len(created) == 1
+
+    def test_batch_defers_recalculation(self, cdf20_offline, monkeypatch):
+        """Inside ``batch()`` saves are collected; the dependent is evaluated once on exit."""
+        engine = cdf20_offline.dependency_engine
+        evaluated = []
+        evaluate = engine.evaluate
+
+        def counting_evaluate(entry):
+            evaluated.append(entry.name)
+            return evaluate(entry)
+
+        monkeypatch.setattr(engine, "evaluate", counting_evaluate)
+        with cdf20_offline.batch():
+            for value in (3.0, 7.0, 11.0):
+                cdf20_offline.save_value("CDF20.Dependent.Base.FW_wU16", value)
+            with cdf20_offline.batch():
+                cdf20_offline.save_value("CDF20.Dependent.Base.FW_wU16", 12.0)
+            assert evaluated == []
+            assert cdf20_offline.load_value("CDF20.Dependent.Ref_1.FW_wU16").raw == 85
+
+        assert evaluated == ["CDF20.Dependent.Ref_1.FW_wU16"]
+        assert cdf20_offline.load_value("CDF20.Dependent.Ref_1.FW_wU16").raw == 60
+
+        # Outside a batch every save recalculates immediately again.
+        cdf20_offline.save_value("CDF20.Dependent.Base.FW_wU16", 2.0)
+        assert len(evaluated) == 2
+        assert cdf20_offline.load_value("CDF20.Dependent.Ref_1.FW_wU16").raw == 10
+
 
 # ---------------------------------------------------------------------------
 # Integration tests: ASAP2 Demo dependency chain
@@ -12,6 +12,9 @@ import numpy.testing as npt
 import pytest
 
 from asamint.measurement.hdf5 import (
+    HDF5Creator,
+    HDF5Storage,
+    HDF5StreamWriter,
     _annotate_daq_hdf5_metadata,
     _annotate_hdf5_root,
     _serialize_daq_lists,
@@ -79,6 +82,104 @@ class TestWriteHdf5:
             assert "units" not in hf["sig"].attrs
             assert "compu_method" not in hf["sig"].attrs
 
+    def test_chunked_storage(self, tmp_path: Path):
+        h5 = tmp_path / "chunked.h5"
+        data = {"TIMESTAMPS": np.arange(100) * 0.01, "sig": np.arange(100, dtype=np.uint16)}
+        storage = HDF5Storage(chunk_rows=32, compression="lzf", shuffle=False)
+        _write_hdf5(h5, data, {"sig": {"units": "rpm"}}, {}, storage=storage)
+        with h5py.File(str(h5), "r") as hf:
+            dset = hf["sig"]
+            npt.assert_array_equal(dset[:], data["sig"])
+            assert dset.chunks == (32,) and dset.maxshape == (None,) and dset.compression == "lzf"
+            assert dset.attrs["compression"] == "lzf" and dset.attrs["chunk_rows"] == 32
+            assert "compression_opts" not in dset.attrs and not dset.attrs["shuffle"]
+            assert dset.attrs["units"] == "rpm"
+            assert hf["timestamps"].chunks == (32,)
+
+
+# ---------------------------------------------------------------------------
+# HDF5StreamWriter
+# ---------------------------------------------------------------------------
+
+
+class TestHDF5StreamWriter:
+    def test_batches_are_appended_in_chunks(self, tmp_path: Path):
+        h5 = tmp_path / "stream.h5"
+        storage = HDF5Storage(chunk_rows=8)
+        with HDF5StreamWriter(h5, storage=storage, project_meta={"author": "Test"}, signal_meta={"fast": {"units": "V"}}) as stream:
+            for block in range(5):
+                ts = np.arange(block * 4, block * 4 + 4, dtype=np.int64) * 1_000_000
+                stream.append(ts, {"fast": ts // 1_000_000, "vec": np.ones((4, 3), dtype=np.float32)}, source="timestamp0")
+            stream.append(np.array([0.0, 0.1]), {"slow": np.array([1.5, 2.5])})
+        result = stream.result
+
+        assert result.hdf5_path == str(h5)
+        assert result.signals["fast"]["sample_count"] == 20
+        assert result.signals["fast"]["timebase_s"] == pytest.approx(1e-3)
+        assert result.signals["fast"]["units"] == "V"
+        assert result.signals["slow"]["group_id"] == 1
+        with h5py.File(str(h5), "r") as hf:
+            assert hf.attrs["author"] == "Test"
+            group = hf["timestamp0"]
+            npt.assert_array_equal(group["fast"][:], np.arange(20))
+            assert group["vec"].shape == (20, 3) and group["vec"].chunks == (8, 3)
+            assert group["fast"].compression == "gzip" and group["fast"].shuffle
+            assert group["fast"].attrs["compression_opts"] == 1
+            assert group["fast"].attrs["sample_count"] == 20
+            assert group["fast"].attrs["units"] == "V"
+            npt.assert_array_equal(hf["timestamps"][:], [0.0, 0.1])
+            npt.assert_array_equal(hf["slow"][:], [1.5, 2.5])
+
+    def test_append_mode_continues_datasets(self, tmp_path: Path):
+        h5 = tmp_path / "resume.h5"
+        with HDF5StreamWriter(h5) as stream:
+            stream.append(np.arange(3), {"sig": np.arange(3)})
+        with HDF5StreamWriter(h5, mode="a") as stream:
+            stream.append(np.arange(3, 5), {"sig": np.arange(3, 5)})
+            with pytest.raises(ValueError):
+                stream.append(np.arange(2), {"other": np.arange(2)})
+        assert stream.result.signals["sig"]["sample_count"] == 5
+        with h5py.File(str(h5), "r") as hf:
+            npt.assert_array_equal(hf["sig"][:], np.arange(5))
+            npt.assert_array_equal(hf["timestamps"][:], np.arange(5))
+
+    def test_refuses_to_append_to_contiguous_file(self, tmp_path: Path):
+        h5 = tmp_path / "legacy.h5"
+        _write_hdf5(h5, {"TIMESTAMPS": np.arange(2.0), "sig": np.arange(2)}, {}, {})
+        with HDF5StreamWriter(h5, mode="a") as stream, pytest.raises(ValueError, match="not resizable"):
+            stream.append(np.arange(2.0), {"sig": np.arange(2)})
+
+    def test_rejects_inconsistent_blocks(self, tmp_path: Path):
+        stream = HDF5StreamWriter(tmp_path / "stream.h5")
+        stream.append(np.arange(2), {"sig": np.arange(2)})
+        with pytest.raises(ValueError):
+            stream.append(np.arange(2), {"sig": np.arange(3)})
+        stream.close()
+        with pytest.raises(ValueError):
+            stream.append(np.arange(2), {"sig": np.arange(2)})
+
+    def test_creator_open_stream_uses_measurement_meta(self, tmp_path: Path):
+        creator = HDF5Creator.__new__(HDF5Creator)
+        general = SimpleNamespace(author="A", company="C", department="D", project="P")
+        creator.config = SimpleNamespace(general=general)
+        creator.experiment_config = {"SHORTNAME": "run"}
+        creator.measurement_variables = [SimpleNamespace(name="sig", compuMethod=SimpleNamespace(unit="km/h", name="CM"))]
+        creator.generate_filename = MagicMock(return_value=str(tmp_path / "auto.h5"))
+        with creator.open_stream(storage=HDF5Storage(compression=None)) as stream:
+            stream.append(np.arange(3), {"sig": np.arange(3)})
+        with h5py.File(stream.result.hdf5_path, "r") as hf:
+            assert hf.attrs["shortname"] == "run"
+            assert hf["sig"].attrs["units"] == "km/h" and hf["sig"].attrs["compu_method"] == "CM"
+            assert hf["sig"].compression is None and hf["sig"].attrs["compression"] == "none"
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"chunk_rows": 0}, {"compression": "zstd"}],
+    )
+    def test_invalid_storage(self, kwargs: dict[str, Any]):
+        with pytest.raises(ValueError):
+            HDF5Storage(**kwargs)
+
 
 # ---------------------------------------------------------------------------
 # _annotate_hdf5_root
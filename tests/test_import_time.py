@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""Import-time regression tests for the lazy ``asamint`` package."""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time (``python -X importtime``) of the modules that must
+# stay light, as a multiple of ``import numpy`` measured in the same run, so
+# the budgets do not depend on the speed of the machine.  The sys.modules
+# checks below are the hard guard against eager heavy imports; absolute times
+# of every public module are reported by tools/benchmarks/bench_import.py.
+IMPORT_BUDGETS: dict[str, float] = {
+    "asamint": 0.5,
+    "asamint.model": 0.5,
+    "asamint.adapters": 3.0,
+    "asamint.core": 3.0,
+    "asamint.cvx": 3.0,
+    "asamint.utils": 3.0,
+}
+TIMING_RUNS = 3
+
+HEAVY_DEPENDENCIES = ("asammdf", "numpy", "objutils", "pya2l", "pyxcp", "rich", "sqlalchemy")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+\d+\s+\|\s+(?P<cumulative>\d+)\s+\|\s*(?P<module>\S+)\s*$")
+
+
+def _run(code: str, *args: str, env: dict[str, str] | None = None) -> subprocess.CompletedProcess[str]:
+    environment = {key: value for key, value in os.environ.items() if key != "ASAMINT_RICH"}
+    environment.update(env or {})
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], capture_output=True, text=True, check=True, env=environment, timeout=120
+    )
+
+
+def _loaded(code: str) -> set[str]:
+    """Names in ``sys.modules`` after running *code* in a fresh interpreter."""
+    return set(_run(f"{code}\nimport sys\nprint(' '.join(sys.modules))").stdout.split())
+
+
+def _cumulative_import_time(module: str) -> float:
+    stderr = _run(f"import {module}", "-X", "importtime").stderr
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match and match.group("module") == module:
+            return int(match.group("cumulative")) / 1e6
+    raise AssertionError(f"No importtime record for {module!r}:\n{stderr}")
+
+
+def test_import_asamint_loads_no_heavy_dependencies() -> None:
+    modules = _loaded("import asamint")
+    assert not {name for name in modules if name.split(".")[0] in HEAVY_DEPENDENCIES}
+
+
+def test_lazy_attributes_and_submodules_resolve() -> None:
+    import asamint
+    from asamint.calibration.api import Calibration
+
+    assert asamint.Calibration is Calibration
+    assert asamint.measurement is sys.modules["asamint.measurement"]
+    assert "Calibration" in dir(asamint)
+    assert "measurement" in dir(asamint)
+    with pytest.raises(AttributeError):
+        _ = asamint._missing_symbol_  # type: ignore[attr-defined]
+
+
+def test_lazy_attribute_imports_its_module_only_on_access() -> None:
+    modules = _loaded("import asamint\nasamint.__version__")
+    assert "asamint.calibration.api" not in modules
+    modules = _loaded("import asamint\nasamint.Status")
+    assert "asamint.calibration.api" in modules
+
+
+def test_rich_is_opt_in() -> None:
+    assert "rich" not in _loaded("import asamint")
+    hook = _run("import asamint, sys\nprint(sys.excepthook.__module__)", env={"ASAMINT_RICH": "1"}).stdout.strip()
+    assert hook.startswith("rich")
+    hook = _run("import asamint, sys\nasamint.install_rich(pretty=False)\nprint(sys.excepthook.__module__)").stdout.strip()
+    assert hook.startswith("rich")
+
+
+def test_adapter_modules_are_independent() -> None:
+    modules = _loaded("import asamint.adapters.objutils")
+    assert not {"pya2l", "asammdf", "pyxcp"} & modules
+
+
+def _best_import_time(module: str) -> float:
+    return min(_cumulative_import_time(module) for _ in range(TIMING_RUNS))
+
+
+@pytest.fixture(scope="module")
+def numpy_import_time() -> float:
+    return _best_import_time("numpy")
+
+
+@pytest.mark.parametrize("module", list(IMPORT_BUDGETS))
+def test_import_time_budget(module: str, numpy_import_time: float) -> None:
+    ratio = _best_import_time(module) / numpy_import_time
+    assert ratio <= IMPORT_BUDGETS[module], f"import {module} took {ratio:.2f} x import numpy (budget {IMPORT_BUDGETS[module]})"
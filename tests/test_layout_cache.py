@@ -0,0 +1,152 @@
+"""Tests for asamint.calibration.layout_cache (persistent parameter layout cache)."""
+
+from __future__ import annotations
+
+import logging
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from asamint.adapters.a2l import AxisPts, Characteristic
+from asamint.adapters.objutils import load
+from asamint.calibration import CalibrationData, layout_cache
+from asamint.calibration.api import OfflineCalibration
+from asamint.calibration.definitions import DefinitionSnapshot
+from asamint.calibration.layout_cache import LayoutCache, a2l_digest, cache_path_for
+
+
+@pytest.fixture()
+def snapshot(asap2_demo_session: Any) -> DefinitionSnapshot:
+    return DefinitionSnapshot.load(asap2_demo_session)
+
+
+@pytest.fixture()
+def fake_session(tmp_path: Path, fixture_dir: Path) -> SimpleNamespace:
+    a2l_path = tmp_path / "demo.a2l"
+    shutil.copy(fixture_dir / "ASAP2_Demo_V161.a2l", a2l_path)
+    return SimpleNamespace(a2l_path=a2l_path, db_path=tmp_path / "demo.a2ldb")
+
+
+def test_build_matches_definitions(asap2_demo_session: Any, snapshot: DefinitionSnapshot) -> None:
+    cache = LayoutCache.build(snapshot)
+    assert len(cache) == len(snapshot.characteristics) + len(snapshot.axis_pts)
+    for name in snapshot.characteristics:
+        chx = Characteristic.get(asap2_demo_session, name)
+        lay = cache.get(name)
+        assert lay.category == chx.type
+        assert lay.address == chx.address
+        assert lay.size == chx.total_allocated_memory
+        assert lay.shape == tuple(chx.fnc_np_shape)
+        assert np.dtype(lay.dtype) == np.dtype(chx.fnc_np_dtype)
+        assert lay.byte_order == (chx.byteOrder or "")
+        assert lay.bit_mask == (chx.bitMask or 0)
+        assert lay.virtual == bool(chx.virtual_characteristic)
+    for name in snapshot.axis_pts:
+        ap = AxisPts.get(asap2_demo_session, name)
+        lay = cache.get(name)
+        assert lay.category == "AXIS_PTS"
+        assert (lay.address, lay.size, lay.shape) == (ap.address, ap.total_allocated_memory, (ap.maxAxisPoints,))
+    assert cache.get("NO_SUCH_PARAMETER") is None
+
+
+def test_save_and_open_roundtrip(tmp_path: Path, snapshot: DefinitionSnapshot) -> None:
+    cache = LayoutCache.build(snapshot, "abc")
+    path = tmp_path / "demo.a2llayout"
+    cache.save(path)
+    reopened = LayoutCache.open(path, "abc")
+    assert isinstance(reopened.records, np.memmap)
+    assert list(reopened) == list(cache)
+    assert [(m.name, m.address, m.length) for m in reopened.memory_objects()] == [
+        (m.name, m.address, m.length) for m in cache.memory_objects()
+    ]
+
+
+def test_open_rejects_stale_or_corrupt(tmp_path: Path, snapshot: DefinitionSnapshot, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "demo.a2llayout"
+    assert LayoutCache.open(path, "abc") is None
+    LayoutCache.build(snapshot, "abc").save(path)
+    assert LayoutCache.open(path, "other-hash") is None
+    monkeypatch.setattr(layout_cache, "A2L_SCHEMA_VERSION", -1)
+    assert LayoutCache.open(path, "abc") is None
+    monkeypatch.undo()
+    path.write_bytes(b"garbage")
+    assert LayoutCache.open(path, "abc") is None
+
+
+def test_for_session_writes_and_reuses_cache(fake_session: SimpleNamespace, snapshot: DefinitionSnapshot) -> None:
+    path = cache_path_for(fake_session.db_path)
+    assert LayoutCache.find(fake_session) is None
+    first = LayoutCache.for_session(fake_session, snapshot)
+    assert path.exists()
+    assert list(LayoutCache.find(fake_session)) == list(first)
+    header = first.header
+    assert header["a2l_sha256"] == a2l_digest(fake_session.a2l_path)
+
+    # A second process maps the file without touching the A2L definitions.
+    second = LayoutCache.for_session(fake_session, definitions=None)
+    assert isinstance(second.records, np.memmap)
+    assert list(second) == list(first)
+
+    # Editing the A2L invalidates the cache.
+    with open(fake_session.a2l_path, "a", encoding="latin1") as fp:
+        fp.write("\n/* changed */\n")
+    third = LayoutCache.for_session(fake_session, snapshot)
+    assert third.header["a2l_sha256"] != header["a2l_sha256"]
+    assert LayoutCache.open(path, third.header["a2l_sha256"]) is not None
+
+
+def test_calibration_data_loads_definitions_once(
+    fake_session: SimpleNamespace, snapshot: DefinitionSnapshot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loads = []
+    monkeypatch.setattr(DefinitionSnapshot, "load", lambda session, log=None: loads.append(session) or snapshot)
+
+    def calibration_data() -> CalibrationData:
+        data = CalibrationData.__new__(CalibrationData)
+        data.asam_mc = SimpleNamespace(session=fake_session)
+        data.logger = logging.getLogger("asamint.calibration.tests")
+        data._definitions = None
+        data._layouts = None
+        return data
+
+    # Cache miss: the definitions are loaded once and shared with the layout table.
+    data = calibration_data()
+    assert len(data.layouts) == len(snapshot)
+    assert data.definitions is snapshot
+    assert len(loads) == 1
+
+    # Cache hit: the definitions are not needed at all.
+    assert len(calibration_data().layouts) == len(snapshot)
+    assert len(loads) == 1
+
+
+def test_load_many_plans_values_from_layouts(
+    calibration_context: SimpleNamespace, fixture_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    definitions = DefinitionSnapshot.load(calibration_context.session)
+    image = load("ihex", str(fixture_dir / "CDF20demo.hex"))
+    cal = OfflineCalibration(calibration_context, image, definitions=definitions, layouts=LayoutCache.build(definitions))
+    names = definitions.names("VALUE")
+
+    def unresolved(*args: Any, **kws: Any) -> Any:
+        raise AssertionError("characteristic resolved while planning")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(cal, "get_characteristic", unresolved)
+        cached_plans = [cal._batch_value_plan(name) for name in names]
+    assert any(plan is not None for plan in cached_plans)
+
+    layouts, cal.layouts = cal.layouts, None
+    assert [cal._batch_value_plan(name) for name in names] == cached_plans
+    cal.layouts = layouts
+
+    batch = cal.load_many(names)
+    for name in names:
+        single = cal.load(name)
+        assert batch[name].category == single.category
+        np.testing.assert_array_equal(np.asarray(batch[name].raw), np.asarray(single.raw))
+        np.testing.assert_array_equal(np.asarray(batch[name].phys), np.asarray(single.phys))
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from asamint.calibration.dependent import DependencyEngine
+from asamint.calibration.lookup import LookupTable
+
+
+def _reference(axes, values, position):
+    """Successive 1-D interpolation along every axis, clamped to the axis range."""
+    result = np.asarray(values, dtype=np.float64)
+    for dim in reversed(range(len(axes))):
+        axis = np.asarray(axes[dim], dtype=np.float64)
+        pos = np.clip(position[dim], axis[0], axis[-1])
+        idx = int(np.clip(np.searchsorted(axis, pos, side="right") - 1, 0, len(axis) - 2))
+        frac = (pos - axis[idx]) / (axis[idx + 1] - axis[idx])
+        result = np.take(result, idx, axis=dim) * (1.0 - frac) + np.take(result, idx + 1, axis=dim) * frac
+    return float(result)
+
+
+@pytest.mark.parametrize("shape", [(5,), (4, 6), (3, 4, 5), (2, 3, 2, 4), (2, 2, 3, 2, 2)])
+def test_matches_successive_interpolation(shape):
+    rng = np.random.default_rng(len(shape))
+    values = rng.normal(size=shape)
+    axes = [np.cumsum(rng.uniform(0.5, 2.0, size)) for size in shape]
+    positions = np.column_stack([rng.uniform(axis[0] - 1.0, axis[-1] + 1.0, 100) for axis in axes])
+    positions[0] = [axis[0] for axis in axes]
+    positions[1] = [axis[-1] for axis in axes]
+    table = LookupTable(values, axes)
+    expected = [_reference(axes, values, position) for position in positions]
+    np.testing.assert_allclose(table.evaluate_many(positions), expected, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose([table.evaluate(position) for position in positions], expected, rtol=1e-12, atol=1e-12)
+
+
+def test_read_only_views_without_copy():
+    values = np.arange(12.0).reshape(3, 4)
+    table = LookupTable(values)
+    assert np.shares_memory(table.values, values)
+    assert not table.values.flags.writeable
+    assert values.flags.writeable
+    assert table.strides.tolist() == [4, 1]
+    with pytest.raises(ValueError):
+        table.values[0, 0] = 1.0
+
+
+def test_float32_mode():
+    values = np.random.default_rng(0).normal(size=(20, 30))
+    table32 = LookupTable(values, dtype=np.float32)
+    indices = np.random.default_rng(1).uniform(0, 19, (50, 2))
+    result = table32.interpolate_indices(indices)
+    assert table32.values.dtype == np.float32 and result.dtype == np.float32
+    np.testing.assert_allclose(result, LookupTable(values).interpolate_indices(indices), rtol=1e-5, atol=1e-5)
+    with pytest.raises(ValueError, match="float32 and float64"):
+        LookupTable(values, dtype=np.int32)
+
+
+def test_from_parameter_and_shape_checks():
+    parameter = SimpleNamespace(
+        phys=[[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], axes=[SimpleNamespace(phys=[0, 1, 2]), SimpleNamespace(phys=[0, 10])]
+    )
+    table = LookupTable.from_parameter(parameter)
+    assert table.shape == (3, 2)
+    assert table.evaluate([1.5, 5.0]) == pytest.approx(4.5)
+    with pytest.raises(ValueError, match="Axis lengths"):
+        LookupTable(parameter.phys, [[0, 1], [0, 1]])
+    with pytest.raises(ValueError, match="2 position"):
+        table.evaluate([1.0])
+    with pytest.raises(ValueError, match="Expected positions of shape"):
+        table.evaluate_many(np.zeros((4, 3)))
+
+
+def test_dependency_engine_reuses_table_while_parameter_is_unchanged():
+    curve = SimpleNamespace(phys=[5.0, 10.0, 15.0, 20.0], axes=[SimpleNamespace(phys=[1.0, 2.0, 3.0, 4.0])])
+    cal = SimpleNamespace(
+        characteristic_category=lambda name: "CURVE",
+        parameter_cache={},
+        load_curve_or_map=lambda name, category, num_axes: curve,
+    )
+    engine = DependencyEngine(cal, graph=None)
+    table = engine._lookup_table("Curve_C")
+    assert table.evaluate([3.5]) == pytest.approx(17.5)
+    assert engine._lookup_table("Curve_C") is table
+    curve = SimpleNamespace(phys=[0.0, 0.0, 0.0, 0.0], axes=curve.axes)
+    assert engine._lookup_table("Curve_C") is not table
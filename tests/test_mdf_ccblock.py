@@ -288,6 +288,103 @@ class TestSaveMeasurements:
         assert result.csv_path is not None or result.hdf5_path is not None
 
 
+# ---------------------------------------------------------------------------
+# open_stream — chunked MDF writing
+# ---------------------------------------------------------------------------
+
+
+class TestMDFStreamWriter:
+    @pytest.fixture()
+    def stream_creator(self, creator):
+        from asamint.adapters.mdf import MDF
+
+        def meas(name, bitMask=None):
+            return SimpleNamespace(
+                name=name,
+                longIdentifier=f"Description of {name}",
+                compuMethod="NO_COMPU_METHOD",
+                bitMask=bitMask,
+                bitOperation=None,
+            )
+
+        creator._mdf_obj = MDF(version="4.20")
+        creator.measurement_variables = [meas("fast"), meas("masked", bitMask=0x0F), meas("slow")]
+        return creator
+
+    def test_chunks_are_appended_then_extended(self, stream_creator, tmp_path, monkeypatch):
+        from asamint.adapters.mdf import MDF
+
+        out = tmp_path / "stream.mf4"
+        mdf_obj = stream_creator._mdf_obj
+        extend_calls = []
+        original_extend = mdf_obj.extend
+        monkeypatch.setattr(mdf_obj, "extend", lambda idx, sigs: (extend_calls.append(idx), original_extend(idx, sigs)))
+
+        with stream_creator.open_stream(out, chunk_size=8) as stream:
+            for block in range(5):
+                ts = np.arange(block * 4, block * 4 + 4, dtype=np.int64) * 1_000_000
+                stream.append(ts, {"fast": ts // 1_000_000, "masked": np.full(4, 0xF3, dtype=np.uint8)}, source="timestamp0")
+            stream.append(np.array([0.0, 0.1]), {"slow": np.array([1.5, 2.5])}, source="timestamp1")
+        result = stream.result
+
+        assert extend_calls == [0, 0]  # 20 records in chunks of 8: append, extend, extend (close)
+        assert result.mdf_path == str(out)
+        assert result.signals["fast"]["sample_count"] == 20
+        assert result.signals["fast"]["timebase_s"] == pytest.approx(1e-3)
+        assert result.signals["slow"]["group_id"] == 1
+        with MDF(str(out)) as mdf:
+            np.testing.assert_array_equal(mdf.get("fast").samples, np.arange(20))
+            np.testing.assert_array_equal(mdf.get("masked").samples, np.full(20, 0x03))
+            np.testing.assert_array_equal(mdf.get("slow").samples, [1.5, 2.5])
+
+    def test_matches_save_measurements(self, stream_creator, tmp_path):
+        from asamint.adapters.mdf import MDF
+
+        ts = np.arange(10, dtype=np.int64) * 10_000_000
+        fast = np.arange(10, dtype=np.int32)
+        stream = stream_creator.open_stream(tmp_path / "stream.mf4", chunk_size=3)
+        for start in range(0, 10, 4):
+            stream.append(ts[start : start + 4], {"fast": fast[start : start + 4]}, source="timestamp0")
+        streamed = stream.close()
+
+        stream_creator._mdf_obj = MDF(version="4.20")
+        batch = stream_creator.save_measurements(str(tmp_path / "batch.mf4"), {"timestamp0": ts, "fast": fast.copy()})
+        assert streamed.signals["fast"]["timebase_s"] == batch.signals["fast"]["timebase_s"]
+        with MDF(streamed.mdf_path) as a, MDF(batch.mdf_path) as b:
+            np.testing.assert_array_equal(a.get("fast").samples, b.get("fast").samples)
+            np.testing.assert_array_equal(a.get("fast").timestamps, b.get("fast").timestamps)
+
+    def test_reused_receive_buffers_are_copied(self, stream_creator, tmp_path):
+        from asamint.adapters.mdf import MDF
+
+        ts = np.empty(2, dtype=np.int64)
+        fast = np.empty(2, dtype=np.int32)
+        stream = stream_creator.open_stream(tmp_path / "stream.mf4", chunk_size=100)
+        for block in range(3):
+            ts[:] = (np.arange(2) + 2 * block) * 10_000_000
+            fast[:] = np.arange(2) + 2 * block
+            stream.append(ts, {"fast": fast}, source="timestamp0")
+        result = stream.close()
+        with MDF(result.mdf_path) as mdf:
+            np.testing.assert_array_equal(mdf.get("fast").samples, np.arange(6))
+            np.testing.assert_array_equal(np.diff(mdf.get("fast").timestamps) > 0, True)
+
+    def test_rejects_inconsistent_blocks(self, stream_creator, tmp_path):
+        stream = stream_creator.open_stream(tmp_path / "stream.mf4")
+        stream.append(np.arange(2), {"fast": np.arange(2)})
+        with pytest.raises(ValueError):
+            stream.append(np.arange(2), {"fast": np.arange(2), "slow": np.arange(2)})
+        with pytest.raises(ValueError):
+            stream.append(np.arange(2), {"fast": np.arange(3)})
+        stream.close()
+        with pytest.raises(ValueError):
+            stream.append(np.arange(2), {"fast": np.arange(2)})
+
+    def test_invalid_chunk_size(self, stream_creator, tmp_path):
+        with pytest.raises(ValueError):
+            stream_creator.open_stream(tmp_path / "stream.mf4", chunk_size=0)
+
+
 # ---------------------------------------------------------------------------
 # persist_measurements (format dispatch)
 # ---------------------------------------------------------------------------
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
+import asyncio
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
@@ -80,3 +82,34 @@ def test_run_uses_creator_and_daq_capture(tmp_path: Path, monkeypatch: pytest.Mo
     assert result.timebases is not None
     assert result.timebases[0]["timebase_s"] == pytest.approx(0.01)
     assert result.timebases[0]["group_id"] == 1
+
+
+@pytest.mark.parametrize("inside_loop", [False, True])
+def test_execute_daq_capture_inside_running_loop(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, inside_loop: bool) -> None:
+    runs = []
+
+    class StubEngine:
+        def __init__(self, policy: Any, **kwargs: Any) -> None:
+            self.policy = policy
+
+        async def run(self, duration: float) -> SimpleNamespace:
+            runs.append(duration)
+            return SimpleNamespace(frames=0, frames_per_s=0.0, bytes_per_s=0.0, elapsed_s=duration)
+
+    monkeypatch.setattr(measurement, "tapped_policy", lambda cls: lambda *args, **kwargs: object())
+    monkeypatch.setattr(measurement, "DaqCaptureEngine", StubEngine)
+    kwargs = {
+        "daq_lists": [],
+        "duration": 0.25,
+        "samples": None,
+        "period_s": None,
+        "hdf5_out": str(tmp_path / "daq.h5"),
+        "shortname": "T",
+    }
+
+    async def _capture() -> str:
+        return measurement._execute_daq_capture(**kwargs)
+
+    path = asyncio.run(_capture()) if inside_loop else measurement._execute_daq_capture(**kwargs)
+    assert path == str(tmp_path / "daq.h5")
+    assert runs == [0.25]
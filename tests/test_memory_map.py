@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+
+from asamint.adapters.a2l import inspect, model
+from asamint.adapters.xcp import McObject
+from asamint.asam import AsamMC, MemoryRange
+from asamint.asam.memory_map import MemoryRangeIndex
+from asamint.calibration.api import Calibration
+
+FLASH = (inspect.PrgTypeSegment.DATA, inspect.MemoryType.FLASH)
+CALRAM = (inspect.PrgTypeSegment.CALIBRATION_VARIABLES, inspect.MemoryType.RAM)
+
+
+def _index() -> MemoryRangeIndex:
+    return MemoryRangeIndex(
+        [
+            MemoryRange("RAM", 0x2000, 0x100, *CALRAM),
+            MemoryRange("ROM", 0x1000, 0x800, *FLASH),
+            MemoryRange("ROM2", 0x1800, 0x100, *FLASH),
+        ]
+    )
+
+
+def test_find_and_locate_agree_with_linear_scan() -> None:
+    index = _index()
+    assert [mr.name for mr in index] == ["ROM", "ROM2", "RAM"]
+    addresses = [0, 0xFFF, 0x1000, 0x17FF, 0x1800, 0x18FF, 0x1900, 0x2000, 0x20FF, 0x2100]
+    expected = [next((i for i, mr in enumerate(index.ranges) if a in mr), -1) for a in addresses]
+    assert index.locate(addresses).tolist() == expected
+    assert [index.find(a) for a in addresses] == [index[i] if i >= 0 else None for i in expected]
+    assert index.in_hex_file(addresses).tolist() == [True] * 7 + [False, False, True]
+    assert index.gaps().tolist() == [0, 0x700]
+
+
+def test_empty_index() -> None:
+    index = MemoryRangeIndex([])
+    assert index.find(0x1000) is None
+    assert index.locate(np.arange(3)).tolist() == [-1, -1, -1]
+    assert index.in_hex_file([0x1000]).tolist() == [True]
+    assert index.continuous_blocks([]) == []
+
+
+def test_continuous_blocks_do_not_cross_segments() -> None:
+    objects = [McObject("a", 0x17F8, 0, 8, ""), McObject("b", 0x1800, 0, 4, ""), McObject("c", 0x1804, 0, 4, "")]
+    blocks = _index().continuous_blocks(objects)
+    assert [(b.address, b.length) for b in blocks] == [(0x17F8, 8), (0x1800, 8)]
+
+
+def test_calibration_memory_map_matches_linear_assignment(calibration_context: SimpleNamespace) -> None:
+    session = calibration_context.session
+    asam_mc = SimpleNamespace(session=session, mod_par=calibration_context.mod_par)
+    memory_map = AsamMC.create_calibration_memory_map(asam_mc)
+
+    assert memory_map == asam_mc.calibration_memory_index.ranges
+    assert any(mr.characteristics for mr in memory_map)
+    for mr in memory_map:
+        assert mr.characteristics == sorted(c.name for c in session.query(model.Characteristic) if c.address in mr)
+        assert mr.axis_pts == sorted(a.name for a in session.query(model.AxisPts) if a.address in mr)
+
+
+def test_is_in_hex_file_uses_memory_map(calibration_context: SimpleNamespace, hex_image: Any) -> None:
+    ranges = [MemoryRange("ROM", 0x1000, 0x800, *FLASH), MemoryRange("RAM", 0x2000, 0x100, *CALRAM)]
+    calibration_context.calibration_memory_map = ranges
+    cal = Calibration(calibration_context, hex_image, {}, calibration_context.logger)
+    results = [cal._is_in_hex_file(SimpleNamespace(address=address)) for address in (0x1000, 0x2010, 0x3000)]
+    assert results == [True, False, True]
+    assert cal._memory_index() is cal._memory_index()
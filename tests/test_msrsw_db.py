@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sqa
+
+from asamint.calibration.msrsw_db import DEFAULT_PROFILE, PROFILES, BulkWriter, MetaData, MSRSWDatabase, ShortName, SQLiteProfile
+
+
+def _pragma(db: MSRSWDatabase, name: str):
+    return db.session.connection().exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+@pytest.mark.parametrize("name", sorted(PROFILES))
+def test_profile_pragmas_are_applied(tmp_path: Path, name: str) -> None:
+    profile = PROFILES[name]
+    db = MSRSWDatabase(tmp_path / name, profile=name)
+    try:
+        assert db.profile is profile
+        assert _pragma(db, "journal_mode") == profile.journal_mode.lower()
+        assert _pragma(db, "locking_mode") == profile.locking_mode.lower()
+        assert _pragma(db, "mmap_size") == profile.mmap_size
+        assert _pragma(db, "foreign_keys") == 1
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"profile": None}])
+def test_default_profile(tmp_path: Path, kwargs: dict) -> None:
+    db = MSRSWDatabase(tmp_path / "default", **kwargs)
+    try:
+        assert db.profile is PROFILES[DEFAULT_PROFILE]
+    finally:
+        db.close()
+
+
+def test_custom_profile_and_unknown_name(tmp_path: Path) -> None:
+    db = MSRSWDatabase(tmp_path / "custom", profile=SQLiteProfile(synchronous="EXTRA", cache_size=1))
+    try:
+        assert _pragma(db, "synchronous") == 3
+        assert _pragma(db, "cache_size") == -(1024 * 1024 // db.session.connection().exec_driver_sql("PRAGMA page_size").scalar())
+    finally:
+        db.close()
+    with pytest.raises(ValueError, match="Unknown SQLite profile"):
+        MSRSWDatabase(tmp_path / "unknown", profile="turbo")
+
+
+def test_pragmas_do_not_leak_into_other_engines(tmp_path: Path) -> None:
+    db = MSRSWDatabase(tmp_path / "bulk", profile="bulk-import")
+    db.close()
+    engine = sqa.create_engine(f"sqlite:///{tmp_path / 'other.db'}")
+    try:
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA locking_mode").scalar() == "normal"
+    finally:
+        engine.dispose()
+
+
+def test_reader_opens_database_during_write(tmp_path: Path) -> None:
+    db_file = tmp_path / "shared.msrswdb"
+    writer_db = MSRSWDatabase(db_file, profile="durable")
+    writer = BulkWriter(writer_db)
+    name = writer.row(ShortName, "committed")
+    writer.add(name)
+    writer.commit()
+
+    writer = BulkWriter(writer_db)
+    writer.add(writer.row(ShortName, "pending"))
+    writer.flush()  # write transaction stays open
+    reader_db = MSRSWDatabase(db_file, profile="concurrent-read")
+    try:
+        assert [row.content for row in reader_db.session.query(ShortName)] == ["committed"]
+        assert reader_db.session.query(MetaData).count() == 1
+    finally:
+        reader_db.close()
+        writer.commit()
+        writer_db.close()
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from asamint.calibration.msrsw_db import MSRSWDatabase, StreamingParser, SwInstance
+from asamint.calibration.msrsw_reader import MSRSWReader
+from asamint.cdf.walker import CdfWalker
+from asamint.msrsw import elements
+
+EXAMPLE_CDF = Path(__file__).resolve().parent.parent / "asamint" / "examples" / "cdf" / "CDF20demo.cdfx"
+
+_CDF = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<MSRSW>
+  <SHORT-NAME>ReaderTest</SHORT-NAME>
+  <CATEGORY>CDF20</CATEGORY>
+  <SW-SYSTEMS>
+    <SW-SYSTEM>
+      <SHORT-NAME>Sys</SHORT-NAME>
+      <SW-INSTANCE-SPEC>
+        <SW-INSTANCE-TREE>
+          <SHORT-NAME>Tree</SHORT-NAME>
+          <CATEGORY>NO_VCD</CATEGORY>
+          <SW-INSTANCE>
+            <SHORT-NAME>Gain</SHORT-NAME>
+            <LONG-NAME>Controller gain</LONG-NAME>
+            <CATEGORY>VALUE</CATEGORY>
+            <SW-VALUE-CONT>
+              <UNIT-DISPLAY-NAME>-</UNIT-DISPLAY-NAME>
+              <SW-VALUES-PHYS><V>3.14</V></SW-VALUES-PHYS>
+            </SW-VALUE-CONT>
+          </SW-INSTANCE>
+          <SW-INSTANCE>
+            <SHORT-NAME>Label</SHORT-NAME>
+            <CATEGORY>ASCII</CATEGORY>
+            <SW-VALUE-CONT>
+              <SW-VALUES-PHYS><VT>Hello World</VT></SW-VALUES-PHYS>
+            </SW-VALUE-CONT>
+          </SW-INSTANCE>
+          <SW-INSTANCE>
+            <SHORT-NAME>Table</SHORT-NAME>
+            <CATEGORY>MAP</CATEGORY>
+            <SW-INSTANCE-PROPS-VARIANTS>
+              <SW-INSTANCE-PROPS-VARIANT>
+                <SW-VALUE-CONT>
+                  <UNIT-DISPLAY-NAME>Nm</UNIT-DISPLAY-NAME>
+                  <SW-VALUES-PHYS>
+                    <VG><LABEL>1000</LABEL><V>1</V><V>2</V></VG>
+                    <VG><LABEL>2000</LABEL><V>3</V><V>4</V></VG>
+                  </SW-VALUES-PHYS>
+                </SW-VALUE-CONT>
+                <SW-AXIS-CONTS>
+                  <SW-AXIS-CONT>
+                    <CATEGORY>STD_AXIS</CATEGORY>
+                    <UNIT-DISPLAY-NAME>rpm</UNIT-DISPLAY-NAME>
+                    <SW-VALUES-PHYS><V>1000</V><V>2000</V></SW-VALUES-PHYS>
+                  </SW-AXIS-CONT>
+                  <SW-AXIS-CONT>
+                    <CATEGORY>COM_AXIS</CATEGORY>
+                    <SW-ARRAYSIZE><V>2</V></SW-ARRAYSIZE>
+                    <SW-INSTANCE-REF>LoadAxis</SW-INSTANCE-REF>
+                  </SW-AXIS-CONT>
+                </SW-AXIS-CONTS>
+              </SW-INSTANCE-PROPS-VARIANT>
+            </SW-INSTANCE-PROPS-VARIANTS>
+          </SW-INSTANCE>
+        </SW-INSTANCE-TREE>
+      </SW-INSTANCE-SPEC>
+    </SW-SYSTEM>
+  </SW-SYSTEMS>
+</MSRSW>
+"""
+
+
+def _import(xml_file: Path) -> Path:
+    db_file = xml_file.with_suffix(".msrswdb")
+    StreamingParser(str(xml_file), MSRSWDatabase(db_file))
+    return db_file
+
+
+@pytest.fixture
+def db_file(tmp_path: Path) -> Path:
+    xml_file = tmp_path / "reader.cdfx"
+    xml_file.write_text(_CDF, encoding="utf-8")
+    return _import(xml_file)
+
+
+class _Walker(CdfWalker):
+    def on_header(self, *args) -> None:
+        pass
+
+    def on_instance(self, instance) -> None:
+        pass
+
+
+def test_instance_names_touch_few_tables(db_file: Path) -> None:
+    with MSRSWReader(db_file) as reader:
+        assert reader.instance_names() == ["Gain", "Label", "Table"]
+        assert reader.instance_names(category="MAP") == ["Table"]
+        assert reader.loaded_tables == {"metadata", "sw_instance", "short_name", "category"}
+        assert reader.schema_version == 10
+
+
+def test_instance_from_value_container(db_file: Path) -> None:
+    with MSRSWReader(db_file) as reader:
+        gain = reader.instance("Gain")
+        assert (gain.short_name, gain.long_name, gain.category) == ("Gain", "Controller gain", "VALUE")
+        assert gain.values.unit_display_name == elements.UnitDisplayName("-")
+        assert gain.values.values_phys == [elements.V(Decimal("3.14"))]
+        assert gain.axes == []
+        assert reader.instance("Label").values.values_phys == [elements.VT("Hello World")]
+        assert reader.instance("Missing") is None
+
+
+def test_instance_from_props_variant(db_file: Path) -> None:
+    with MSRSWReader(db_file) as reader:
+        table = reader.instance("Table")
+    assert table.values.unit_display_name.value == "Nm"
+    assert [(group.label, [v.phys for v in group.values]) for group in table.values.values_phys] == [
+        ("1000", [Decimal(1), Decimal(2)]),
+        ("2000", [Decimal(3), Decimal(4)]),
+    ]
+    std_axis, com_axis = table.axes
+    assert (std_axis.category, std_axis.unit_display_name) == ("STD_AXIS", "rpm")
+    assert [v.phys for v in std_axis.values_phys] == [Decimal(1000), Decimal(2000)]
+    assert (com_axis.category, com_axis.array_size, com_axis.instance_ref) == (
+        "COM_AXIS",
+        elements.ArraySize((2,)),
+        elements.InstanceRef("LoadAxis"),
+    )
+
+
+def test_instances_iterates_in_document_order(db_file: Path) -> None:
+    with MSRSWReader(db_file) as reader:
+        assert [p.short_name for p in reader.instances()] == ["Gain", "Label", "Table"]
+        assert [p.short_name for p in reader.instances(category="ASCII")] == ["Label"]
+
+
+def test_missing_database(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        MSRSWReader(tmp_path / "missing.msrswdb")
+    assert not (tmp_path / "missing.msrswdb").exists()
+
+
+@pytest.mark.skipif(not EXAMPLE_CDF.exists(), reason="CDF20demo.cdfx not available")
+def test_matches_orm_walker(tmp_path: Path) -> None:
+    logging.disable(logging.WARNING)
+    try:
+        xml_file = tmp_path / EXAMPLE_CDF.name
+        xml_file.write_bytes(EXAMPLE_CDF.read_bytes())
+        db_file = _import(xml_file)
+    finally:
+        logging.disable(logging.NOTSET)
+    walker = _Walker(str(db_file))
+    try:
+        with MSRSWReader(db_file) as reader:
+            for instance in walker.session.query(SwInstance).all():
+                parameter = reader.instance(instance.short_name.content)
+                assert parameter.category == walker.do_category(instance.category).value
+                assert parameter.display_name == walker.do_displayname(instance.display_name).value
+                assert parameter.feature_ref == walker.do_feature_ref(instance.sw_feature_ref).name
+                variant = instance.sw_instance_props_variants.sw_instance_props_variant[0]
+                assert parameter.values == walker.do_value_cont(variant.sw_value_cont)
+                assert parameter.axes == walker.do_axis_conts(variant.sw_axis_conts)
+    finally:
+        walker.db.close()
+
+
+@pytest.mark.parametrize(
+    "module", ["asamint.calibration.msrsw_reader", "asamint.cdf", "asamint.cdf.importer", "asamint.cdf.walker"]
+)
+def test_import_does_not_load_orm_schema(module: str) -> None:
+    code = f"import sys, {module}\nprint('asamint.calibration.msrsw_db' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -2,25 +2,33 @@
 
 from __future__ import annotations
 
+import contextlib
+import gc
 import logging
+import time
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 
 import numpy as np
 import pytest
 
 from asamint.adapters.a2l import ModCommon, ModPar, open_a2l_database
 from asamint.adapters.objutils import Image, Section, load
+from asamint.adapters.xcp import compute_checksum
+from asamint.asam.memory_map import MemoryRangeIndex
 from asamint.calibration import api as calibration
 from asamint.calibration.api import (
     ExecutionPolicy,
     OnlineCalibration,
     ParameterCache,
     Status,
+    WriteBehindPolicy,
+    _changed_extents,
     _merge_regions,
     _upload_parameters_xcp,
 )
+from asamint.core.exceptions import CalibrationError
 from asamint.core.logging import configure_logging
 
 FIXTURE_DIR = Path(__file__).parent
@@ -303,6 +311,22 @@ class TestDependencyFlush:
         # Verify dirty regions are empty (all flushed)
         assert cal._dirty_regions == []
 
+    def test_batch_flushes_once_on_exit(self, cdf20_online, mock_xcp_master):
+        """Saves inside ``batch()`` reach the ECU in one flush after recalculation."""
+        base_name = "CDF20.Dependent.Base.FW_wU16"
+        mock_xcp_master.reset_mock()
+
+        with patch.object(cdf20_online, "flush", wraps=cdf20_online.flush) as flush:
+            with cdf20_online.batch():
+                for value in (3.0, 4.0, 5.0):
+                    cdf20_online.save_value(base_name, value, limitsPolicy=ExecutionPolicy.IGNORE)
+                mock_xcp_master.push.assert_not_called()
+            assert flush.call_count == 1
+
+        assert cdf20_online._auto_flush is True
+        assert cdf20_online._dirty_regions == []
+        assert cdf20_online.load_value("CDF20.Dependent.Ref_1.FW_wU16").raw == 25
+
 
 # ---------------------------------------------------------------------------
 # Tests: bulk transfer
@@ -410,3 +434,370 @@ class TestInitWithXcpUpload:
         assert cal.image is not None
         mock_master.pull.assert_called()
         assert isinstance(cal, calibration.Calibration)
+
+    def test_upload_on_init_respects_memory_segments(self, cdf20_session):
+        """The initial upload passes the calibration memory index, like ``upload_image``."""
+        mock_master = MagicMock()
+        mock_master.pull = MagicMock(side_effect=lambda n: b"\x00" * n)
+        index = MemoryRangeIndex([])
+        asam_mc = SimpleNamespace(session=cdf20_session, calibration_memory_index=index)
+
+        with patch.object(calibration, "_upload_parameters_xcp", wraps=calibration._upload_parameters_xcp) as upload:
+            OnlineCalibration(asam_mc, mock_master, image=None, loglevel="DEBUG")
+
+        assert upload.call_args.args[3] is index
+
+
+# ---------------------------------------------------------------------------
+# Tests: write-behind flusher against a local XCP stand-in
+# ---------------------------------------------------------------------------
+
+ARRAY_ELEMENTS = [f"CDF20.array.Element[{idx}]" for idx in range(5)]  # adjacent UWORDs at 0x16080
+
+
+class XcpStandIn:
+    """Minimal XCP slave: ``setMta`` + ``push`` / ``pull`` / ``buildChecksum`` on a sparse memory, pushes optionally failing."""
+
+    def __init__(self) -> None:
+        self.memory: dict[int, int] = {}
+        self.round_trips: list[tuple[int, int]] = []
+        self.fail = False
+        self._mta = 0
+
+    def setMta(self, address: int) -> None:
+        self._mta = address
+
+    def push(self, data: bytes) -> None:
+        if self.fail:
+            raise ConnectionError("XCP timeout")
+        self.round_trips.append((self._mta, len(data)))
+        for offset, byte in enumerate(data):
+            self.memory[self._mta + offset] = byte
+        self._mta += len(data)
+
+    def pull(self, length: int) -> bytes:
+        data = self.read(self._mta, length)
+        self._mta += length
+        return data
+
+    def buildChecksum(self, length: int) -> SimpleNamespace:
+        return SimpleNamespace(checksumType="XCP_CRC_32", checksum=compute_checksum(self.read(self._mta, length), "XCP_CRC_32"))
+
+    def read(self, address: int, length: int) -> bytes:
+        return bytes(self.memory.get(address + offset, 0) for offset in range(length))
+
+    def write(self, address: int, data: bytes) -> None:
+        self.memory.update(zip(range(address, address + len(data)), data, strict=True))
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+@pytest.fixture
+def xcp_stand_in():
+    return XcpStandIn()
+
+
+@pytest.fixture
+def write_behind(cdf20_session, cdf20_image, xcp_stand_in):
+    """Factory for write-behind ``OnlineCalibration`` instances, closed after the test."""
+    instances = []
+
+    def make(**policy):
+        cal = OnlineCalibration(
+            cdf20_session,
+            xcp_stand_in,
+            image=cdf20_image,
+            write_behind=WriteBehindPolicy(**policy),
+            loglevel="DEBUG",
+        )
+        instances.append(cal)
+        return cal
+
+    yield make
+    for cal in instances:
+        cal.xcp_master.fail = False
+        with contextlib.suppress(CalibrationError):
+            cal.close()
+
+
+def _save_elements(cal, names=ARRAY_ELEMENTS, offset=1):
+    for idx, name in enumerate(names):
+        assert cal.save_value(name, idx + offset, limitsPolicy=ExecutionPolicy.IGNORE) == Status.OK
+
+
+class TestWriteBehind:
+    """Coalescing background flusher (``write_behind=WriteBehindPolicy(...)``)."""
+
+    def test_policy_validation(self):
+        with pytest.raises(ValueError):
+            WriteBehindPolicy(window=-1)
+        with pytest.raises(ValueError):
+            WriteBehindPolicy(max_bytes=0)
+
+    def test_saves_coalesce_into_one_round_trip(self, write_behind, xcp_stand_in):
+        cal = write_behind(window=60.0)
+        _save_elements(cal)
+        assert xcp_stand_in.round_trips == []
+        assert cal.stats.pending == 5
+
+        cal.barrier(timeout=5)
+        assert xcp_stand_in.round_trips == [(0x16080, 10)]
+        assert xcp_stand_in.read(0x16080, 10) == cal.image.read(0x16080, 10)
+        stats = cal.stats
+        assert (stats.regions_marked, stats.round_trips, stats.pending, stats.bytes_pushed) == (5, 1, 0, 10)
+        assert stats.round_trips_saved == 4
+
+    def test_window_expiry_pushes_in_background(self, write_behind, xcp_stand_in):
+        cal = write_behind(window=0.01)
+        _save_elements(cal, ARRAY_ELEMENTS[:1])
+        assert _wait_for(lambda: xcp_stand_in.round_trips)
+        assert xcp_stand_in.round_trips == [(0x16080, 2)]
+
+    def test_byte_threshold_pushes_before_window(self, write_behind, xcp_stand_in):
+        cal = write_behind(window=60.0, max_bytes=4)
+        _save_elements(cal, ARRAY_ELEMENTS[:2])
+        assert _wait_for(lambda: xcp_stand_in.round_trips)
+        assert xcp_stand_in.round_trips == [(0x16080, 4)]
+
+    def test_explicit_flush_is_synchronous(self, write_behind, xcp_stand_in):
+        cal = write_behind(window=60.0)
+        _save_elements(cal, ARRAY_ELEMENTS[:3])
+        assert cal.flush() == 6
+        assert xcp_stand_in.round_trips == [(0x16080, 6)]
+        assert cal.flush() == 0
+
+    def test_background_error_propagates_and_regions_are_retried(self, write_behind, xcp_stand_in):
+        cal = write_behind(window=0.0)
+        xcp_stand_in.fail = True
+        _save_elements(cal, ARRAY_ELEMENTS[:1])
+        with pytest.raises(CalibrationError, match="XCP timeout"):
+            cal.barrier(timeout=5)
+        assert cal.stats.pending == 1
+
+        xcp_stand_in.fail = False
+        cal.barrier(timeout=5)
+        assert xcp_stand_in.round_trips == [(0x16080, 2)]
+        assert cal.stats.pending == 0
+
+    def test_background_error_raised_by_next_save(self, write_behind, xcp_stand_in):
+        cal = write_behind(window=0.0)
+        xcp_stand_in.fail = True
+        _save_elements(cal, ARRAY_ELEMENTS[:1])
+        assert _wait_for(lambda: cal._flush_error is not None)
+        with pytest.raises(CalibrationError):
+            _save_elements(cal, ARRAY_ELEMENTS[1:2])
+
+    def test_batch_flushes_once_without_background_pushes(self, write_behind, xcp_stand_in):
+        cal = write_behind(window=0.0)
+        with cal.batch():
+            _save_elements(cal)
+            time.sleep(0.05)
+            assert xcp_stand_in.round_trips == []
+        assert xcp_stand_in.round_trips == [(0x16080, 10)]
+
+    def test_close_pushes_pending_and_stops_thread(self, cdf20_session, cdf20_image, xcp_stand_in):
+        with OnlineCalibration(cdf20_session, xcp_stand_in, image=cdf20_image, write_behind=WriteBehindPolicy(window=60.0)) as cal:
+            flusher = cal._flusher
+            _save_elements(cal)
+        assert not flusher.is_alive()
+        assert xcp_stand_in.round_trips == [(0x16080, 10)]
+
+    def test_unclosed_instance_is_collected_with_a_warning(self, cdf20_session, cdf20_image, xcp_stand_in, caplog):
+        cal = OnlineCalibration(cdf20_session, xcp_stand_in, image=cdf20_image, write_behind=WriteBehindPolicy(window=60.0))
+        flusher = cal._flusher
+        _save_elements(cal, ARRAY_ELEMENTS[:2])
+        with caplog.at_level(logging.WARNING):
+            del cal
+            gc.collect()
+            flusher.join(timeout=5)
+        assert not flusher.is_alive()
+        assert xcp_stand_in.round_trips == []
+        assert "was not closed: 2 dirty region(s) (4 bytes)" in caplog.text
+
+    def test_synchronous_mode_counts_every_round_trip(self, cdf20_online):
+        _save_elements(cdf20_online)
+        stats = cdf20_online.stats
+        assert (stats.regions_marked, stats.round_trips, stats.pending) == (5, 5, 0)
+        assert stats.round_trips_saved == 0
+
+
+# ---------------------------------------------------------------------------
+# Tests: byte-exact dirty tracking against a shadow image
+# ---------------------------------------------------------------------------
+
+MAP_NAME = "sinp2_cosp2_table"  # 19 x 19 SWORD map, 722 bytes
+
+
+class TestChangedExtents:
+    """Unit tests for the vectorised byte diff."""
+
+    def _extents(self, old, new, gap):
+        return _changed_extents(np.array(old, dtype=np.uint8), np.array(new, dtype=np.uint8), gap)
+
+    def test_equal(self):
+        assert self._extents([1, 2, 3], [1, 2, 3], 0) == []
+
+    def test_runs(self):
+        assert self._extents([0] * 8, [1, 1, 0, 0, 1, 0, 0, 1], 0) == [(0, 2), (4, 1), (7, 1)]
+
+    def test_gap_tolerance(self):
+        new = [1, 1, 0, 0, 1, 0, 0, 1]
+        assert self._extents([0] * 8, new, 1) == [(0, 2), (4, 1), (7, 1)]
+        assert self._extents([0] * 8, new, 2) == [(0, 8)]
+
+
+@pytest.fixture(scope="class")
+def map_session():
+    """Own session: resolving every characteristic (``_upload_parameters_xcp``) leaves stale layout addresses behind."""
+    session = open_a2l_database(str(FIXTURE_DIR / "CDF20demo"), encoding="latin1", local=True)
+    yield session
+    close_fn = getattr(session, "close", None)
+    if callable(close_fn):
+        close_fn()
+
+
+@pytest.fixture
+def diffing(map_session, cdf20_image, xcp_stand_in):
+    """Factory for diffing instances whose image has been downloaded to the ECU (seeding the shadow)."""
+
+    def make(diff_gap):
+        cal = OnlineCalibration(map_session, xcp_stand_in, image=cdf20_image, diff_gap=diff_gap, loglevel="DEBUG")
+        cal.download_image()
+        xcp_stand_in.round_trips.clear()
+        return cal
+
+    return make
+
+
+def _edit_map(cal, *cells):
+    values = cal.load(MAP_NAME)
+    for cell in cells:
+        values.phys[cell] += 1
+    cal.save(MAP_NAME, values)
+
+
+class TestShadowDiff:
+    """``diff_gap``: push only the bytes differing from the last synchronised image."""
+
+    def test_negative_gap_rejected(self, map_session, cdf20_image, xcp_stand_in):
+        with pytest.raises(ValueError):
+            OnlineCalibration(map_session, xcp_stand_in, image=cdf20_image, diff_gap=-1)
+
+    def test_without_diff_whole_map_is_pushed(self, map_session, cdf20_image, xcp_stand_in):
+        cal = OnlineCalibration(map_session, xcp_stand_in, image=cdf20_image, loglevel="DEBUG")
+        _edit_map(cal, (3, 4))
+        assert [length for _, length in xcp_stand_in.round_trips] == [722]
+
+    def test_supplied_image_is_not_taken_as_ecu_contents(self, map_session, cdf20_image, xcp_stand_in):
+        cal = OnlineCalibration(map_session, xcp_stand_in, image=cdf20_image, diff_gap=0, loglevel="DEBUG")
+        assert cal._shadow is None
+        _edit_map(cal, (3, 4))
+        assert [length for _, length in xcp_stand_in.round_trips] == [722]
+
+        cal.refresh_image()
+        assert cal._shadow is not None
+        xcp_stand_in.round_trips.clear()
+        _edit_map(cal, (3, 4))
+        [(_, length)] = xcp_stand_in.round_trips
+        assert length <= 2
+
+    def test_one_cell_pushes_only_changed_bytes(self, diffing, xcp_stand_in):
+        cal = diffing(0)
+        _edit_map(cal, (3, 4))
+        [(address, length)] = xcp_stand_in.round_trips
+        assert length <= 2
+        assert xcp_stand_in.read(address, length) == cal.image.read(address, length)
+        stats = cal.stats
+        assert (stats.bytes_pushed, stats.bytes_unchanged) == (length, 722 - length)
+
+    def test_unchanged_save_pushes_nothing(self, diffing, xcp_stand_in):
+        cal = diffing(0)
+        cal.save(MAP_NAME, cal.load(MAP_NAME))
+        assert xcp_stand_in.round_trips == []
+        assert cal.stats.pending == 0
+
+    def test_gap_tolerance_merges_extents(self, diffing, xcp_stand_in):
+        _edit_map(diffing(0), (0, 0), (5, 5))
+        (first, _), (last, size) = xcp_stand_in.round_trips
+        xcp_stand_in.round_trips.clear()
+        _edit_map(diffing(256), (0, 0), (5, 5))
+        assert xcp_stand_in.round_trips == [(first, last + size - first)]
+
+    def test_shadow_follows_pushes(self, diffing, xcp_stand_in):
+        cal = diffing(0)
+        original = cal.load(MAP_NAME).phys.copy()
+        _edit_map(cal, (3, 4))
+        values = cal.load(MAP_NAME)
+        values.phys[...] = original
+        cal.save(MAP_NAME, values)
+        assert len(xcp_stand_in.round_trips) == 2
+        assert xcp_stand_in.round_trips[0][0] == xcp_stand_in.round_trips[1][0]
+        assert cal.flush() == 0
+
+    def test_failed_extents_stay_dirty(self, diffing, xcp_stand_in):
+        cal = diffing(0)
+        cal._auto_flush = False
+        _edit_map(cal, (0, 0), (5, 5))
+        xcp_stand_in.fail = True
+        with pytest.raises(ConnectionError):
+            cal.flush()
+        assert cal._dirty_regions != []
+        xcp_stand_in.fail = False
+        assert cal.flush() > 0
+        assert len(xcp_stand_in.round_trips) == 2
+
+
+# ---------------------------------------------------------------------------
+# Tests: delta refresh via BUILD_CHECKSUM
+# ---------------------------------------------------------------------------
+
+
+class TestRefreshImage:
+    """``refresh_image`` pulls only the ranges in which ECU and image differ."""
+
+    NAME = "CDF20.scalar.FW_wU16"
+
+    @pytest.fixture
+    def ecu(self, cdf20_image, xcp_stand_in):
+        for section in cdf20_image.sections:
+            xcp_stand_in.write(section.start_address, bytes(section.data))
+        return xcp_stand_in
+
+    def test_pulls_only_changed_range(self, cdf20_online_no_flush, ecu):
+        cal = cdf20_online_no_flush
+        cal.xcp_master = ecu
+        raw = cal.load_value(self.NAME).raw
+        ecu.write(0x810000, bytes(byte ^ 0x01 for byte in cal.image.read(0x810000, 2)))
+
+        stats = cal.refresh_image(min_range=16)
+
+        assert (stats.ranges, stats.bytes_pulled) == (1, 16)
+        assert stats.bytes_saved == sum(len(section) for section in cal.image.sections) - 16
+        assert bytes(cal.image.read(0x810000, 2)) == ecu.read(0x810000, 2)
+        assert cal.load_value(self.NAME).raw != raw
+
+    def test_discards_pending_changes(self, cdf20_online_no_flush, ecu):
+        cal = cdf20_online_no_flush
+        cal.xcp_master = ecu
+        raw = cal.load_value(self.NAME).raw
+        cal.save_value(self.NAME, raw + 1, limitsPolicy=ExecutionPolicy.IGNORE)
+        assert cal._dirty_regions
+
+        stats = cal.refresh_image()
+
+        assert stats.ranges == 1
+        assert cal._dirty_regions == []
+        assert cal.load_value(self.NAME).raw == raw
+
+    def test_unchanged_ecu_pulls_nothing(self, cdf20_online, ecu):
+        cdf20_online.xcp_master = ecu
+        stats = cdf20_online.refresh_image()
+        assert (stats.ranges, stats.bytes_pulled) == (0, 0)
+        assert stats.checksums == len(cdf20_online.image.sections) + 3  # 64 KiB section = 4 blocks
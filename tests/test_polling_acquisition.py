@@ -0,0 +1,141 @@
+"""Tests for block-read polling in AsamMC.acquire_via_pyxcp."""
+
+from __future__ import annotations
+
+import logging
+import struct
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from asamint.asam import AsamMC
+
+
+class FakeMaster:
+    """XCP master stub serving uploads from a little-endian memory image."""
+
+    def __init__(self, base: int, memory: bytearray) -> None:
+        self.base = base
+        self.memory = memory
+        self.uploads: list[tuple[int, int]] = []
+        self.fail_at: set[int] = set()
+
+    def upload(self, address: int, length: int) -> bytes:
+        self.uploads.append((address, length))
+        if len(self.uploads) in self.fail_at:
+            raise OSError("timeout")
+        offset = address - self.base
+        # Let a counter change between samples.
+        self.memory[0] = (self.memory[0] + 1) & 0xFF
+        return bytes(self.memory[offset : offset + length])
+
+
+def _meas(name: str, address: int, data_type: str, bit_mask: int | None = None, bit_operation: Any = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        name=name,
+        address=address,
+        dataType=data_type,
+        bitMask=bit_mask,
+        bitOperation=bit_operation,
+        compuMethod="NO_COMPU_METHOD",
+        byteOrder=None,
+        ecuAddressExtension=0,
+    )
+
+
+@pytest.fixture()
+def mc() -> AsamMC:
+    obj = AsamMC.__new__(AsamMC)
+    obj.logger = logging.getLogger("test_polling_acquisition")
+    obj.measurement_variables = [
+        _meas("counter", 0x1000, "UBYTE"),
+        _meas("flags", 0x1001, "UBYTE", bit_mask=0x0C, bit_operation={"amount": 2, "direction": "R"}),
+        _meas("speed", 0x1002, "UWORD"),
+        _meas("temp", 0x1004, "FLOAT32_IEEE"),
+        _meas("remote", 0x2000, "SLONG"),
+    ]
+    return obj
+
+
+@pytest.fixture()
+def master() -> FakeMaster:
+    memory = bytearray(0x1010)
+    memory[0:8] = struct.pack("<BBHf", 0, 0xFF, 1234, 21.5)
+    memory[0x1000:0x1004] = struct.pack("<i", -42)
+    return FakeMaster(0x1000, memory)
+
+
+def test_one_upload_per_block(mc: AsamMC, master: FakeMaster) -> None:
+    data = mc.acquire_via_pyxcp(master, samples=4, period_s=0.0)
+    assert master.uploads == [(0x1000, 8), (0x2000, 4)] * 4
+    np.testing.assert_array_equal(data["counter"], [1, 3, 5, 7])
+    np.testing.assert_array_equal(data["flags"], [3, 3, 3, 3])
+    np.testing.assert_array_equal(data["speed"], [1234] * 4)
+    np.testing.assert_allclose(data["temp"], [21.5] * 4)
+    np.testing.assert_array_equal(data["remote"], [-42] * 4)
+    assert data["remote"].dtype == np.dtype("<i4")
+    assert data["TIMESTAMPS"].shape == (4,)
+    assert sorted(data) == ["TIMESTAMPS", "counter", "flags", "remote", "speed", "temp"]
+    assert all(column.flags.c_contiguous for column in data.values())
+
+    timing = mc.acquisition_timing
+    assert timing["samples"] == 4
+    assert timing["uploads_per_sample"] == 2
+    assert timing["overruns"] == 4
+    assert timing["min_period_s"] <= timing["mean_period_s"] <= timing["max_period_s"]
+
+
+def test_failed_upload_marks_block_samples_nan(mc: AsamMC, master: FakeMaster) -> None:
+    master.fail_at = {3}  # first block of the second sample
+    data = mc.acquire_via_pyxcp(master, samples=3, period_s=0.0)
+    assert np.isnan(data["speed"][1]) and np.isnan(data["counter"][1])
+    np.testing.assert_array_equal(data["speed"][[0, 2]], [1234, 1234])
+    np.testing.assert_array_equal(data["remote"], [-42] * 3)
+
+
+def test_duration_and_argument_checks(mc: AsamMC, master: FakeMaster) -> None:
+    data = mc.acquire_via_pyxcp(master, duration_s=0.02, period_s=0.005)
+    assert data["speed"].shape == (4,)
+    assert mc.acquisition_timing["period_s"] == 0.005
+    # Free-running polling: the columns grow beyond their initial capacity.
+    data = mc.acquire_via_pyxcp(master, duration_s=0.05, period_s=0.0)
+    assert data.size > 1024
+    assert np.shares_memory(data["speed"], data.storage["speed"])
+    with pytest.raises(ValueError):
+        mc.acquire_via_pyxcp(master, duration_s=1.0, samples=1)
+
+
+def test_overlapping_measurements_share_a_block(mc: AsamMC, master: FakeMaster) -> None:
+    mc.measurement_variables = [
+        _meas("byte0", 0x1000, "UBYTE"),
+        _meas("word0", 0x1000, "UWORD"),
+        _meas("straddle", 0x1003, "UWORD"),  # reaches past the 4-byte value below
+        _meas("dword0", 0x1000, "ULONG"),
+    ]
+    master.memory[0:6] = bytes([0x00, 0x11, 0x22, 0x33, 0x44, 0x55])
+    data = mc.acquire_via_pyxcp(master, samples=2, period_s=0.0)
+    assert master.uploads == [(0x1000, 5)] * 2
+    np.testing.assert_array_equal(data["byte0"], [1, 2])
+    np.testing.assert_array_equal(data["word0"], [0x1101, 0x1102])
+    np.testing.assert_array_equal(data["straddle"], [0x4433] * 2)
+    np.testing.assert_array_equal(data["dword0"], [0x33221101, 0x33221102])
+
+
+def test_bit_fields_sharing_an_address(mc: AsamMC, master: FakeMaster, caplog: pytest.LogCaptureFixture) -> None:
+    mc.measurement_variables = [
+        _meas("lo", 0x1000, "UBYTE", bit_mask=0x0F),
+        _meas("hi", 0x1000, "UBYTE", bit_mask=0xF0, bit_operation={"amount": 4, "direction": "R"}),
+        _meas("word", 0x1000, "UWORD"),
+        _meas("broken", 0x1008, "NO_SUCH_TYPE"),  # cannot be prepared
+    ]
+    master.memory[0:2] = bytes([0xA4, 0x5C])
+    with caplog.at_level(logging.WARNING):
+        data = mc.acquire_via_pyxcp(master, samples=3, period_s=0.0)
+    assert master.uploads == [(0x1000, 2)] * 3
+    np.testing.assert_array_equal(data["lo"], [0x5, 0x6, 0x7])
+    np.testing.assert_array_equal(data["hi"], [0xA, 0xA, 0xA])
+    np.testing.assert_array_equal(data["word"], [0x5CA5, 0x5CA6, 0x5CA7])
+    assert np.isnan(data["broken"]).all()
+    assert "'broken' was not acquired" in caplog.text
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import math
+import multiprocessing
 import re
 import time
 
@@ -22,11 +23,13 @@ from asamint.utils import (
     generate_filename,
     int_log2,
     make_2darray,
+    mp_context,
     partition,
     replace_non_c_char,
     sha1_digest,
     slicer,
 )
+from asamint.utils.buffers import ColumnarBuffer
 
 # ---------------------------------------------------------------------------
 # sha1_digest
@@ -398,3 +401,47 @@ def test_adjust_to_word_boundary_default_alignment() -> None:
     # default alignment=2 → 4-byte boundaries
     assert adjust_to_word_boundary(4) == 4
     assert adjust_to_word_boundary(5) == 8
+
+
+def test_mp_context_leaves_forkserver_preload_alone(monkeypatch) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(
+        multiprocessing.context.ForkServerContext, "set_forkserver_preload", lambda self, names: calls.append(names)
+    )
+    assert mp_context().get_start_method() in multiprocessing.get_all_start_methods()
+    assert calls == []
+
+
+# ---------------------------------------------------------------------------
+# ColumnarBuffer
+# ---------------------------------------------------------------------------
+
+
+def test_columnar_buffer_grows_geometrically() -> None:
+    buf = ColumnarBuffer({"t": np.float64, "x": np.uint16}, capacity=2)
+    for idx in range(5):
+        assert buf.append({"t": idx * 0.5, "x": idx}) == idx
+    assert (buf.size, buf.capacity) == (5, 8)
+    np.testing.assert_array_equal(buf["x"], [0, 1, 2, 3, 4])
+    assert buf["x"].dtype == np.uint16
+    buf.extend({"t": [2.5, 3.0], "x": [9, 9]})
+    np.testing.assert_array_equal(buf["t"], np.arange(7) * 0.5)
+    with pytest.raises(ValueError):
+        buf.extend({"t": [1.0], "x": [1, 2]})
+
+
+def test_columnar_buffer_is_a_zero_copy_mapping() -> None:
+    buf = ColumnarBuffer({"TIMESTAMPS": np.float64, "sig": np.int8}, capacity=4)
+    row = buf.new_row()
+    buf.storage["TIMESTAMPS"][row] = 1.0
+    buf.storage["sig"][row] = -3
+    assert dict(buf).keys() == {"TIMESTAMPS", "sig"}
+    assert np.shares_memory(buf["sig"], buf.storage["sig"])
+    buf["sig"] = buf["sig"].astype(np.float64)
+    assert buf["sig"].dtype == np.float64 and buf["sig"][0] == -3.0
+    with pytest.raises(ValueError):
+        buf["other"] = [1.0, 2.0]
+    del buf["sig"]
+    assert list(buf) == ["TIMESTAMPS"]
+    with pytest.raises(ValueError):
+        ColumnarBuffer({}, growth=1.0)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+bench_cdf_import: ORM versus streaming import of a large CDF20 file.
+
+Usage:
+  python -m tools.benchmarks.bench_cdf_import [--instances 1000,10000] [--values N] [--batch-size N]
+
+Generates a synthetic CDF20 document with *instances* ``VAL_BLK`` parameters
+of *values* values each and imports it into a fresh MSRSW database, once with
+``Parser`` (``etree.parse`` + ORM unit of work) and once with
+``StreamingParser`` (``iterparse`` + ``executemany``).  Every import runs in
+a fresh process; file size, wall time and peak resident set size are printed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+HEADER = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE MSRSW PUBLIC "-//ASAM//DTD CALIBRATION DATA FORMAT:V2.0.0:LAI:IAI:XML:CDF200.XSD//EN" "cdf_v2.0.0.sl.dtd">
+<MSRSW>
+  <SHORT-NAME>Bench</SHORT-NAME>
+  <CATEGORY>CDF20</CATEGORY>
+  <SW-SYSTEMS>
+    <SW-SYSTEM>
+      <SHORT-NAME>System</SHORT-NAME>
+      <SW-INSTANCE-SPEC>
+        <SW-INSTANCE-TREE>
+          <SHORT-NAME>Tree</SHORT-NAME>
+          <CATEGORY>NO_VCD</CATEGORY>
+"""
+
+FOOTER = """\
+        </SW-INSTANCE-TREE>
+      </SW-INSTANCE-SPEC>
+    </SW-SYSTEM>
+  </SW-SYSTEMS>
+</MSRSW>
+"""
+
+
+def write_cdf(path: Path, instances: int, values: int) -> None:
+    with path.open("w", encoding="utf-8") as fout:
+        fout.write(HEADER)
+        for idx in range(instances):
+            vs = "".join(f"<V>{idx + n * 0.5}</V>" for n in range(values))
+            fout.write(
+                f"<SW-INSTANCE><SHORT-NAME>Param_{idx}</SHORT-NAME><LONG-NAME>Parameter {idx}</LONG-NAME>"
+                f"<CATEGORY>VAL_BLK</CATEGORY><SW-VALUE-CONT><UNIT-DISPLAY-NAME>rpm</UNIT-DISPLAY-NAME>"
+                f"<SW-ARRAYSIZE><V>{values}</V></SW-ARRAYSIZE><SW-VALUES-PHYS>{vs}</SW-VALUES-PHYS>"
+                f"</SW-VALUE-CONT></SW-INSTANCE>\n"
+            )
+        fout.write(FOOTER)
+
+
+def _run(strategy: str, xml_file: str, db_file: str, batch_size: int) -> tuple[float, int]:
+    from asamint.calibration.msrsw_db import MSRSWDatabase, Parser, StreamingParser
+
+    logging.disable(logging.WARNING)
+    db = MSRSWDatabase(db_file)
+    db.begin_transaction()
+    start = time.perf_counter()
+    if strategy == "orm":
+        Parser(xml_file, db)
+    else:
+        StreamingParser(xml_file, db, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+    return elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--instances", default="1000,10000", help="Comma separated numbers of SW-INSTANCEs")
+    parser.add_argument("--values", type=int, default=16, help="Values per instance")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="Rows per executemany batch")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir, ctx.Pool(1, maxtasksperchild=1) as pool:
+        for instances in (int(n) for n in args.instances.split(",")):
+            xml_file = Path(tmp_dir) / f"bench_{instances}.cdfx"
+            write_cdf(xml_file, instances, args.values)
+            size = xml_file.stat().st_size
+            for strategy in ("orm", "streaming"):
+                db_file = Path(tmp_dir) / f"{strategy}_{instances}.msrswdb"
+                elapsed, max_rss = pool.apply(_run, (strategy, str(xml_file), str(db_file), args.batch_size))
+                print(
+                    f"{strategy:>10}: {instances:8d} instances  {size / 2**20:8.1f} MiB XML  "
+                    f"{max_rss / 1024:9.1f} MiB peak RSS  {elapsed:8.2f} s"
+                )
+
+
+if __name__ == "__main__":
+    main()
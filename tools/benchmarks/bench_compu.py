@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+bench_compu: Compare per-call COMPU_METHOD construction with the compiled conversion cache.
+
+Usage:
+  python -m tools.benchmarks.bench_compu [--a2l path/to/file.a2l] [--samples N] [--repeat N]
+
+For every COMPU_METHOD of the A2L file (default: ``tests/ASAP2_Demo_V161.a2l``)
+converts an array of *samples* raw values, once by constructing a fresh pya2l
+``CompuMethod`` per conversion (the former ``AsamMC.calculate_physical_values``
+behaviour) and once via ``asamint.compu.compiled_conversion``, and prints the
+median wall time per conversion.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+import numpy as np
+
+from asamint.adapters.a2l import CompuMethod, model, open_a2l_database
+from asamint.compu import compiled_conversion, conversion_cache
+
+DEFAULT_A2L = Path(__file__).resolve().parents[2] / "tests" / "ASAP2_Demo_V161.a2l"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--a2l", type=Path, default=DEFAULT_A2L, help="A2L file to benchmark")
+    parser.add_argument("--samples", type=int, default=10_000, help="Raw values per conversion")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs per strategy (median is reported)")
+    args = parser.parse_args()
+
+    session = open_a2l_database(str(args.a2l.with_suffix("")), encoding="latin1", local=True)
+    try:
+        names = [row.name for row in session.query(model.CompuMethod.name).all()]
+        values = np.arange(args.samples) % 32
+
+        def fresh() -> None:
+            for name in names:
+                CompuMethod(session, name).int_to_physical(values)
+
+        def cached() -> None:
+            for name in names:
+                compiled_conversion(session, name).int_to_physical(values)
+
+        for label, func in (("fresh", fresh), ("compiled", cached)):
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - start)
+            per_call = statistics.median(timings) / max(len(names), 1)
+            print(f"{label:>10}: {len(names):4d} COMPU_METHODs x {args.samples} samples  {per_call * 1e3:8.3f} ms/conversion")
+        print(f"cache: {conversion_cache.stats()}")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
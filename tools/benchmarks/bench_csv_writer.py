@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+bench_csv_writer: Row-wise ``csv.writer`` export vs. the block-wise ``_write_csv``.
+
+Usage:
+  python -m tools.benchmarks.bench_csv_writer [--signals N] [--records N]
+
+Writes *signals* synthetic signals (``float64`` / ``float32`` / ``int16``,
+every tenth one half as long to exercise the padding) with *records* samples
+each through the former row-wise path (``_iter_csv_rows`` indexing every
+cell, rows pushed through ``csv.writer``), through ``_write_csv`` (checked to
+produce an identical file) and through ``_write_csv`` with ``float_format``
+``"%.17g"`` (round-trip) and ``"%.6g"``.  Prints wall time and rows per second.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
+
+from asamint.measurement.csv import _csv_fieldnames, _iter_csv_rows, _write_csv, _write_metadata_headers
+
+
+def _signals(count: int, records: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    data: dict[str, np.ndarray] = {"TIMESTAMPS": np.arange(records) * 1e-3}
+    dtypes = (np.float64, np.float32, np.int16)
+    for idx in range(count):
+        length = records // 2 if idx % 10 == 9 else records
+        data[f"signal_{idx:03d}"] = (rng.normal(size=length) * 100).astype(dtypes[idx % len(dtypes)])
+    return data
+
+
+def _row_wise(csv_path: Path, data: dict[str, np.ndarray]) -> None:
+    fieldnames = _csv_fieldnames(data)
+    with csv_path.open("w", newline="", encoding="utf-8") as fh:
+        _write_metadata_headers(fh, {}, None, None)
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fieldnames)
+        for row in _iter_csv_rows(list(data["TIMESTAMPS"]), fieldnames[1:], data):
+            writer.writerow(row)
+            if buffer.tell() >= 512 * 1024:
+                fh.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate(0)
+        fh.write(buffer.getvalue())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signals", type=int, default=300, help="Number of signals")
+    parser.add_argument("--records", type=int, default=20_000, help="Samples per signal")
+    args = parser.parse_args()
+
+    data = _signals(args.signals, args.records)
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        writers = {
+            "row-wise": _row_wise,
+            "_write_csv": lambda path, data: _write_csv(path, data, {}),
+            "%.17g": lambda path, data: _write_csv(path, data, {}, float_format="%.17g"),
+            "%.6g": lambda path, data: _write_csv(path, data, {}, float_format="%.6g"),
+        }
+        for label, write in writers.items():
+            path = Path(tmp) / f"{label}.csv"
+            start = time.perf_counter()
+            write(path, data)
+            results[label] = (time.perf_counter() - start, path)
+        assert results["row-wise"][1].read_bytes() == results["_write_csv"][1].read_bytes()
+        print(f"{args.signals} signals x {args.records} records")
+        for label, (elapsed, path) in results.items():
+            print(f"{label:>12}: {elapsed:8.3f} s {args.records / elapsed:12.0f} rows/s {path.stat().st_size / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""
+bench_daq_csv: Former genfromtxt / row-wise DAQ CSV parsing vs. the streaming ``DaqCsvReader``.
+
+Usage:
+  python -m tools.benchmarks.bench_daq_csv [--files N] [--rows N] [--signals N] [--workers N]
+
+Writes *files* synthetic DAQ CSV files (nanosecond ``timestamp`` column,
+integer and float signals, optionally with the ``#`` metadata header of
+``_write_csv``) and parses them with
+
+* ``np.genfromtxt`` -- the former fast path (files without ``#`` header),
+* ``_parse_row_wise`` -- the former pure-Python fallback (files with ``#`` header),
+  kept here as the reference implementation,
+* ``DaqCsvReader`` (the current ``_parse_daq_csv``),
+
+printing wall time and -- in a separate pass over one file, as tracing slows
+parsing down -- the peak of traced allocations relative to the parsed arrays.
+Finally ``_merge_daq_csv_results`` is timed sequentially and with *workers*
+processes (which only pays off with as many idle CPU cores).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from asamint.measurement.csv import DaqCsvReader, _merge_daq_csv_results, _timestamp_index
+
+
+def _write_files(directory: Path, count: int, rows: int, signals: int, header: bool) -> list[Path]:
+    rng = np.random.default_rng(0)
+    files = []
+    for idx in range(count):
+        path = directory / f"daq_{idx}_{'hdr' if header else 'plain'}.csv"
+        columns = [1_700_000_000_000_000_000 + np.arange(rows, dtype=np.int64) * 1_000_000]
+        for sig in range(signals):
+            columns.append(rng.integers(0, 4096, rows) if sig % 2 else np.round(rng.normal(size=rows) * 100, 3))
+        names = ["timestamp"] + [f"file{idx}_sig{sig}" for sig in range(signals)]
+        with path.open("w", encoding="utf-8") as fh:
+            if header:
+                fh.write("# asamint measurement (converted physical values)\n#\n")
+            fh.write(",".join(names) + "\n")
+            fmt = ",".join(["%d"] + ["%d" if sig % 2 else "%.3f" for sig in range(signals)])
+            np.savetxt(fh, np.column_stack(columns).astype(object), fmt=fmt)
+        files.append(path)
+    return files
+
+
+def _genfromtxt(path: Path) -> Any:
+    return np.genfromtxt(path, delimiter=",", names=True, autostrip=True, comments="#", dtype=float, invalid_raise=False)
+
+
+def _read_rows(csv_file: Path) -> tuple[list[str], list[list[str]]]:
+    columns: list[str] = []
+    rows: list[list[str]] = []
+    with csv_file.open("r", encoding="utf-8", newline="") as fh:
+        for raw in csv.reader(fh):
+            if not raw or raw[0].startswith("#"):
+                continue
+            if not columns:
+                columns = [c.strip() for c in raw]
+                continue
+            rows.append(raw)
+    return columns, rows
+
+
+def _parse_row_wise(csv_file: Path) -> dict[str, Any]:
+    """Former Python fallback parser: one ``float()`` per cell, non-numeric cells skipped."""
+    columns, rows = _read_rows(csv_file)
+    if not columns:
+        return {}
+    ts_idx = _timestamp_index(columns)
+    col_data: list[list[float]] = [[] for _ in columns]
+    for row in rows:
+        for idx, value in enumerate(row):
+            try:
+                col_data[idx].append(float(value))
+            except (ValueError, TypeError, IndexError):
+                pass
+    result: dict[str, Any] = {}
+    if ts_idx is not None:
+        result["TIMESTAMPS"] = np.asarray(col_data[ts_idx])
+    for idx, name in enumerate(columns):
+        if idx != ts_idx:
+            result[name] = np.asarray(col_data[idx])
+    return result
+
+
+def _time(func: Callable[[Path], Any], files: list[Path]) -> float:
+    start = time.perf_counter()
+    for path in files:
+        func(path)
+    return time.perf_counter() - start
+
+
+def _peak_ratio(func: Callable[[Path], Any], path: Path) -> float:
+    tracemalloc.start()
+    try:
+        result = func(path)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    arrays = result.values() if isinstance(result, dict) else [result]
+    return peak / sum(np.asarray(array).nbytes for array in arrays)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=4, help="Number of DAQ CSV files")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per file")
+    parser.add_argument("--signals", type=int, default=10, help="Signals per file")
+    parser.add_argument("--workers", type=int, default=4, help="Processes for the parallel merge")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = _write_files(Path(tmp), args.files, args.rows, args.signals, header=False)
+        with_header = _write_files(Path(tmp), args.files, args.rows, args.signals, header=True)
+        size = sum(path.stat().st_size for path in plain)
+        print(f"{args.files} files x {args.rows} rows x {args.signals + 1} columns, {size / 2**20:.1f} MiB")
+        runs = {
+            "genfromtxt (plain)": (_genfromtxt, plain),
+            "row-wise (# header)": (_parse_row_wise, with_header),
+            "DaqCsvReader": (lambda path: DaqCsvReader(path).read(), with_header),
+        }
+        for label, (func, files) in runs.items():
+            elapsed = _time(func, files)
+            print(f"{label:>22}: {elapsed:8.3f} s  peak allocations {_peak_ratio(func, files[0]):5.2f}x result")
+        for workers in (1, args.workers):
+            start = time.perf_counter()
+            _merge_daq_csv_results(with_header, workers=workers)
+            print(f"{f'merge, workers={workers}':>22}: {time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
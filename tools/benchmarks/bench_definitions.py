@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+bench_definitions: Compare per-name and bulk loading of A2L calibration definitions.
+
+Usage:
+  python -m tools.benchmarks.bench_definitions [--a2l path/to/file.a2l] [--repeat N]
+
+Resolves every CHARACTERISTIC and AXIS_PTS of the A2L file (default:
+``tests/ASAP2_Demo_V161.a2l``) once via ``Characteristic.get`` /
+``AxisPts.get`` per name and once via :class:`DefinitionSnapshot`, clearing
+the pya2l object cache between runs, and prints wall time and the number of
+SQL statements issued for both strategies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from sqlalchemy import event
+
+from asamint.adapters.a2l import AxisPts, Characteristic, inspect, model, open_a2l_database
+from asamint.calibration.definitions import DefinitionSnapshot
+
+DEFAULT_A2L = Path(__file__).resolve().parents[2] / "tests" / "ASAP2_Demo_V161.a2l"
+
+
+def _per_name(session: Any) -> int:
+    count = 0
+    for row in session.query(model.AxisPts.name).order_by(model.AxisPts.address).all():
+        AxisPts.get(session, row.name)
+        count += 1
+    for row in session.query(model.Characteristic.name).all():
+        Characteristic.get(session, row.name)
+        count += 1
+    return count
+
+
+def _bulk(session: Any) -> int:
+    return len(DefinitionSnapshot.load(session))
+
+
+def _measure(session: Any, func: Callable[[Any], int], repeat: int) -> tuple[float, int, int]:
+    statements = 0
+
+    def _count(*_args: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    engine = session.get_bind()
+    timings = []
+    for _ in range(repeat):
+        inspect.CachedBase.clear_session(session)
+        session.expunge_all()
+        statements = 0
+        event.listen(engine, "before_cursor_execute", _count)
+        start = time.perf_counter()
+        objects = func(session)
+        timings.append(time.perf_counter() - start)
+        event.remove(engine, "before_cursor_execute", _count)
+    return statistics.median(timings), statements, objects
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--a2l", type=Path, default=DEFAULT_A2L, help="A2L file to benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs per strategy (median is reported)")
+    args = parser.parse_args()
+
+    session = open_a2l_database(str(args.a2l.with_suffix("")), encoding="latin1", local=True)
+    try:
+        for label, func in (("per-name", _per_name), ("snapshot", _bulk)):
+            elapsed, statements, objects = _measure(session, func, args.repeat)
+            print(f"{label:>10}: {objects:6d} objects  {elapsed * 1000.0:9.1f} ms  {statements:6d} SQL statements")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+bench_delta_refresh: Full re-upload vs. checksum-driven ``refresh_image`` of a calibration image.
+
+Usage:
+  python -m tools.benchmarks.bench_delta_refresh [--size KIB] [--changes N] [--block-size N] [--min-range N]
+
+Builds a random image of *size* KiB and an XCP slave stand-in holding the
+same memory with *changes* scattered bytes modified, then refreshes the
+image once by pulling everything (``SHORT_UPLOAD``-style, as
+``_upload_parameters_xcp`` does) and once with ``refresh_image``.  Besides
+wall time it prints the number of XCP requests and bytes transferred and an
+estimate of the time on a 500 kBit/s CAN bus (one request frame plus one
+response frame per 7 payload bytes, about 0.25 ms per frame).
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from asamint.adapters.objutils import Image, Section
+from asamint.adapters.xcp import compute_checksum
+from asamint.calibration.delta_refresh import refresh_image
+
+FRAME_S = 0.25e-3
+START = 0x80000
+
+
+class _EcuStandIn:
+    def __init__(self, memory: bytearray) -> None:
+        self.memory = memory
+        self.requests = 0
+        self.frames = 0
+        self.pulled = 0
+        self._mta = 0
+
+    def setMta(self, address: int) -> None:
+        self._mta = address - START
+        self.requests += 1
+        self.frames += 2
+
+    def buildChecksum(self, length: int) -> SimpleNamespace:
+        self.requests += 1
+        self.frames += 2
+        data = bytes(self.memory[self._mta : self._mta + length])
+        return SimpleNamespace(checksumType="XCP_CRC_32", checksum=compute_checksum(data, "XCP_CRC_32"))
+
+    def pull(self, length: int) -> bytes:
+        self.requests += 1
+        self.frames += 1 + math.ceil(length / 7)
+        self.pulled += length
+        data = bytes(self.memory[self._mta : self._mta + length])
+        self._mta += length
+        return data
+
+
+def _report(label: str, ecu: _EcuStandIn, elapsed: float) -> None:
+    print(
+        f"{label:>14}: {elapsed:8.3f} s  {ecu.requests:7d} requests  {ecu.pulled:9d} bytes pulled"
+        f"  ~{ecu.frames * FRAME_S:8.2f} s on CAN"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1024, help="Image size in KiB")
+    parser.add_argument("--changes", type=int, default=10, help="Number of bytes changed on the ECU")
+    parser.add_argument("--block-size", type=int, default=0x4000, help="Largest range per BUILD_CHECKSUM")
+    parser.add_argument("--min-range", type=int, default=64, help="Bisection stops at this range size")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    local = rng.integers(0, 256, args.size * 1024, dtype=np.uint8)
+    remote = local.copy()
+    positions = rng.choice(local.size, size=args.changes, replace=False)
+    remote[positions] ^= 0xFF
+    print(f"{args.size} KiB image, {args.changes} changed byte(s)")
+
+    ecu = _EcuStandIn(bytearray(remote.tobytes()))
+    start = time.perf_counter()
+    ecu.setMta(START)
+    for offset in range(0, local.size, 0xFF):
+        ecu.pull(min(0xFF, local.size - offset))
+    _report("full upload", ecu, time.perf_counter() - start)
+
+    ecu = _EcuStandIn(bytearray(remote.tobytes()))
+    image = Image(sections=[Section(start_address=START, data=local.tobytes())], join=False)
+    start = time.perf_counter()
+    stats = refresh_image(image, ecu, block_size=args.block_size, min_range=args.min_range)
+    _report("refresh_image", ecu, time.perf_counter() - start)
+    assert bytes(image.sections[0].data) == remote.tobytes()
+    print(f"{stats.checksums} checksums, {stats.ranges} range(s), {stats.bytes_saved} bytes saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+bench_hdf5_writer: Contiguous ``_write_hdf5`` vs. chunked / compressed HDF5 measurement writers.
+
+Usage:
+  python -m tools.benchmarks.bench_hdf5_writer [--signals N] [--records N] [--batch N] [--chunk-rows N]
+
+Generates *signals* synthetic measurement signals with *records* samples each
+(quantised random walks as ``int16`` / ``uint8`` / ``float32``, like typical
+ECU signals) and writes them
+
+* in one piece with the current, contiguous ``_write_hdf5``,
+* in one piece with ``_write_hdf5(storage=...)`` for several ``HDF5Storage`` settings,
+* in *batch*-record appends through ``HDF5StreamWriter``, as during acquisition.
+
+Prints the wall time, write throughput (raw sample bytes per second) and file size.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from asamint.measurement.hdf5 import HDF5Storage, HDF5StreamWriter, _write_hdf5
+
+
+def _signals(count: int, records: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    data: dict[str, np.ndarray] = {"TIMESTAMPS": np.arange(records) * 1e-3}
+    dtypes = (np.int16, np.uint8, np.float32)
+    for idx in range(count):
+        walk = np.cumsum(rng.integers(-2, 3, records)).astype(np.float64)
+        dtype = dtypes[idx % len(dtypes)]
+        if np.issubdtype(dtype, np.integer):
+            info = np.iinfo(dtype)
+            walk = np.clip(walk, info.min, info.max)
+        data[f"signal_{idx}"] = walk.astype(dtype)
+    return data
+
+
+def _stream(path: Path, data: dict[str, np.ndarray], storage: HDF5Storage, batch: int) -> None:
+    timestamps = data["TIMESTAMPS"]
+    signals = {name: values for name, values in data.items() if name != "TIMESTAMPS"}
+    with HDF5StreamWriter(path, storage=storage) as stream:
+        for start in range(0, len(timestamps), batch):
+            stream.append(
+                timestamps[start : start + batch], {name: values[start : start + batch] for name, values in signals.items()}
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signals", type=int, default=50, help="Number of signals")
+    parser.add_argument("--records", type=int, default=500_000, help="Samples per signal")
+    parser.add_argument("--batch", type=int, default=1_000, help="Records per HDF5StreamWriter.append() call")
+    parser.add_argument("--chunk-rows", type=int, default=65536, help="HDF5Storage.chunk_rows")
+    args = parser.parse_args()
+
+    data = _signals(args.signals, args.records)
+    raw_bytes = sum(values.nbytes for values in data.values())
+    settings = {
+        "none": HDF5Storage(args.chunk_rows, compression=None, shuffle=False),
+        "lzf": HDF5Storage(args.chunk_rows, compression="lzf", shuffle=False),
+        "lzf+shuffle": HDF5Storage(args.chunk_rows, compression="lzf"),
+        "gzip-1+shuffle": HDF5Storage(args.chunk_rows),
+        "gzip-4+shuffle": HDF5Storage(args.chunk_rows, compression_opts=4),
+    }
+    runs = {"_write_hdf5 (contiguous)": lambda path: _write_hdf5(path, data, {}, {})}
+    for label, storage in settings.items():
+        runs[f"_write_hdf5 {label}"] = lambda path, storage=storage: _write_hdf5(path, data, {}, {}, storage=storage)
+    for label in ("lzf+shuffle", "gzip-1+shuffle"):
+        runs[f"stream {label}"] = lambda path, storage=settings[label]: _stream(path, data, storage, args.batch)
+
+    print(f"{args.signals} signals x {args.records} records, {raw_bytes / 2**20:.1f} MiB raw, stream batches of {args.batch}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for idx, (label, run) in enumerate(runs.items()):
+            path = Path(tmp) / f"run_{idx}.h5"
+            start = time.perf_counter()
+            run(path)
+            elapsed = time.perf_counter() - start
+            size = path.stat().st_size
+            print(f"{label:>28}: {elapsed:7.3f} s {raw_bytes / elapsed / 2**20:8.1f} MiB/s {size / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
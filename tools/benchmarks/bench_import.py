@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+bench_import: Import time of ``asamint`` and its public submodules.
+
+Usage:
+  python -m tools.benchmarks.bench_import [--repeat N] [module ...]
+
+Imports each module in *repeat* fresh interpreters with ``python -X importtime``
+and prints the median cumulative import time of the module itself (excluding
+interpreter startup), the same relative to ``import numpy`` (the unit of the
+budgets in ``tests/test_import_time.py``), the median wall time of the whole
+process and the number of modules it loads.  Without arguments, ``asamint``
+and its public submodules are measured.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+\d+\s+\|\s+(?P<cumulative>\d+)\s+\|\s*(?P<module>\S+)\s*$")
+
+DEFAULT_MODULES = (
+    "asamint",
+    "asamint.adapters",
+    "asamint.api",
+    "asamint.asam",
+    "asamint.calibration",
+    "asamint.calibration.msrsw_db",
+    "asamint.calibration.msrsw_reader",
+    "asamint.cdf",
+    "asamint.cmdline",
+    "asamint.config",
+    "asamint.core",
+    "asamint.cvx",
+    "asamint.damos",
+    "asamint.hdf5",
+    "asamint.mdf",
+    "asamint.measurement",
+    "asamint.model",
+    "asamint.msrsw",
+    "asamint.utils",
+)
+
+
+def _measure(module: str) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    )
+    wall = time.perf_counter() - start
+    cumulative = 0.0
+    count = 0
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            count += 1
+            if match.group("module") == module:
+                cumulative = int(match.group("cumulative")) / 1e6
+    return cumulative, wall, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per module")
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES), help="Modules to import")
+    args = parser.parse_args()
+
+    print(f"{'module':>32} {'import':>10} {'x numpy':>8} {'process':>10} {'modules':>8}")
+    reference = None
+    for module in ["numpy", *args.modules]:
+        runs = [_measure(module) for _ in range(args.repeat)]
+        cumulative = statistics.median(run[0] for run in runs)
+        wall = statistics.median(run[1] for run in runs)
+        reference = reference or cumulative
+        print(f"{module:>32} {cumulative * 1e3:8.1f} ms {cumulative / reference:8.2f} {wall * 1e3:8.1f} ms {runs[-1][2]:8d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+bench_interpolate: Compare per-point ``Calibration.interpolate`` with ``Calibration.interpolate_many``.
+
+Usage:
+  python -m tools.benchmarks.bench_interpolate [--a2l path/to/file.a2l] [--hex path/to/file.hex] [--points N] [--scalar-points N]
+
+Evaluates a CURVE_AXIS-normalised MAP and a STD_AXIS CURVE of the A2L file
+(default: ``tests/CDF20demo.a2l`` with ``tests/CDF20demo.hex``) at random
+operating points, once per point through the scalar path and once for all
+*points* in one ``interpolate_many()`` call.  The scalar path is only run for
+the first *scalar-points* points; both results are checked for agreement.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from asamint.adapters.a2l import ModCommon, ModPar, open_a2l_database
+from asamint.adapters.objutils import load
+from asamint.calibration import OfflineCalibration
+
+TESTS_DIR = Path(__file__).resolve().parents[2] / "tests"
+
+CHARACTERISTICS = {
+    "CDF20.map.KF_xCURu16u8_yCURu16u8_wU8": [(200.0, 320.0), (250.0, 330.0)],
+    "CDF20.curve.KL_xU8_wU8": [(-50.0, -39.0)],
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--a2l", type=Path, default=TESTS_DIR / "CDF20demo.a2l", help="A2L file")
+    parser.add_argument("--hex", type=Path, default=TESTS_DIR / "CDF20demo.hex", help="Intel-HEX image")
+    parser.add_argument("--points", type=int, default=1_000_000, help="Operating points for interpolate_many()")
+    parser.add_argument("--scalar-points", type=int, default=2_000, help="Operating points for interpolate()")
+    args = parser.parse_args()
+
+    session = open_a2l_database(str(args.a2l.with_suffix("")), encoding="latin1", local=True)
+    try:
+        context = SimpleNamespace(
+            session=session,
+            mod_common=ModCommon.get(session),
+            mod_par=ModPar.get(session) if ModPar.exists(session) else None,
+            logger=logging.getLogger("bench_interpolate"),
+        )
+        calibration = OfflineCalibration(context, load("ihex", str(args.hex)), loglevel="ERROR")
+        rng = np.random.default_rng(0)
+        for name, ranges in CHARACTERISTICS.items():
+            inputs = np.column_stack([rng.uniform(lo, hi, args.points) for lo, hi in ranges])
+
+            start = time.perf_counter()
+            scalar = [calibration.interpolate(name, *point) for point in inputs[: args.scalar_points]]
+            per_point_scalar = (time.perf_counter() - start) / args.scalar_points
+
+            start = time.perf_counter()
+            vectorised = calibration.interpolate_many(name, inputs)
+            per_point_many = (time.perf_counter() - start) / args.points
+
+            np.testing.assert_allclose(vectorised[: args.scalar_points], scalar, rtol=1e-12, atol=1e-12)
+            print(name)
+            print(f"{'interpolate':>18}: {per_point_scalar * 1e6:10.3f} us/point")
+            print(f"{'interpolate_many':>18}: {per_point_many * 1e6:10.3f} us/point  ({args.points} points)")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+bench_load_hex: End-to-end ``CalibrationData.load_hex()`` timing.
+
+Usage:
+  python -m tools.benchmarks.bench_load_hex [--a2l path/to/file.a2l] [--hex path/to/file.hex] [--copies N] [--workers N] [--overlap] [--repeat N]
+
+Runs ``load_hex()`` for the A2L / Intel-HEX pair (default: ``tests/CDF20demo.a2l``
+with ``tests/CDF20demo.hex``) in a scratch project directory and prints the wall
+time of each phase -- reading the characteristics from the image, writing the
+JSON calibration log, writing the MSRSW + HDF5 databases (``DBImporter``) and
+writing the memory map -- together with the peak resident set size.  With
+``--copies N`` every characteristic is stored N times under distinct names to
+simulate a larger project.  ``--workers N`` decodes the characteristics in N
+processes and ``--overlap`` writes the log, the databases and the memory map
+concurrently (reported as one ``writers`` phase).  Every run happens in a
+fresh process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import logging
+import multiprocessing
+import os
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parents[2] / "tests"
+
+CONFIG = """\
+c = get_config()  # noqa
+c.Asamint.General.a2l_encoding = "latin-1"
+c.Asamint.General.a2l_file = {a2l!r}
+c.Asamint.General.master_hexfile = {hex!r}
+c.Asamint.General.master_hexfile_type = "ihex"
+c.Asamint.General.shortname = "bench"
+"""
+
+
+def _run(project_dir: str, copies: int, workers: int, overlap: bool) -> tuple[dict[str, float], int, dict[str, int]]:
+    from asamint.api import open_offline_calibration
+    from asamint.model.calibration import klasses
+
+    os.chdir(project_dir)
+    sys.argv = sys.argv[:1]
+    logging.disable(logging.CRITICAL)
+    cal = open_offline_calibration()
+    mc = cal.asam_mc
+    timings = {}
+
+    start = time.perf_counter()
+    cal._load_parameters(workers)
+    timings["characteristics"] = time.perf_counter() - start
+    if copies > 1:
+        for items in cal.parameters.values():
+            for name, value in list(items.items()):
+                for idx in range(1, copies):
+                    items[f"{name}_{idx}"] = dataclasses.replace(value, name=f"{name}_{idx}")
+
+    if overlap:
+        start = time.perf_counter()
+        cal._write_outputs(overlap_writers=True)
+        timings["writers"] = time.perf_counter() - start
+    else:
+        start = time.perf_counter()
+        (mc.sub_dir("logs") / mc.generate_filename(".json")).write_bytes(klasses.dump_characteristics(cal.parameters))
+        timings["json log"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        importer = cal._create_db_importer()
+        importer.run()
+        importer.close()
+        timings["msrsw + hdf5"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cal._write_map_file()
+        timings["memory map"] = time.perf_counter() - start
+
+    counts = {category: len(items) for category, items in cal.parameters.items() if items}
+    return timings, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--a2l", type=Path, default=TESTS_DIR / "CDF20demo.a2l", help="A2L file")
+    parser.add_argument("--hex", type=Path, default=TESTS_DIR / "CDF20demo.hex", help="Intel-HEX image")
+    parser.add_argument("--copies", type=int, default=1, help="Number of copies of every characteristic")
+    parser.add_argument("--workers", type=int, default=1, help="Processes decoding the characteristics")
+    parser.add_argument("--overlap", action="store_true", help="Write log, databases and memory map concurrently")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs (median is reported)")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_dir = Path(tmp_dir)
+        shutil.copy(args.a2l, project_dir / args.a2l.name)
+        shutil.copy(args.hex, project_dir / args.hex.name)
+        (project_dir / "asamint_conf.py").write_text(CONFIG.format(a2l=args.a2l.name, hex=args.hex.name))
+        # The first run also creates the A2L database and is not measured.
+        # Not a multiprocessing.Pool: its daemonic workers cannot start the --workers processes.
+        with ProcessPoolExecutor(1, mp_context=ctx, max_tasks_per_child=1) as pool:
+            for _ in range(args.repeat + 1):
+                results.append(pool.submit(_run, str(project_dir), args.copies, args.workers, args.overlap).result())
+
+    _, _, counts = results[0]
+    print("parameters: " + ", ".join(f"{count} {category}" for category, count in counts.items()))
+    for phase in results[-1][0]:
+        print(f"{phase:>16}: {statistics.median(timings[phase] for timings, _, _ in results[1:]):8.3f} s")
+    total = statistics.median(sum(timings.values()) for timings, _, _ in results[1:])
+    max_rss = statistics.median(rss for _, rss, _ in results[1:])
+    print(f"{'total':>16}: {total:8.3f} s  {max_rss / 1024:9.1f} MiB peak RSS")
+
+
+if __name__ == "__main__":
+    main()
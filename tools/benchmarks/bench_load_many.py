@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+bench_load_many: Compare per-name ``Calibration.load`` with ``Calibration.load_many``.
+
+Usage:
+  python -m tools.benchmarks.bench_load_many [--a2l path/to/file.a2l] [--hex path/to/file.hex] [--repeat N]
+
+Loads every VALUE characteristic of the A2L file (default: ``tests/CDF20demo.a2l``
+with ``tests/CDF20demo.hex``) once per name and once as a batch, and prints the
+median wall time per parameter for both strategies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from asamint.adapters.a2l import ModCommon, ModPar, model, open_a2l_database
+from asamint.adapters.objutils import load
+from asamint.calibration import OfflineCalibration
+
+TESTS_DIR = Path(__file__).resolve().parents[2] / "tests"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--a2l", type=Path, default=TESTS_DIR / "CDF20demo.a2l", help="A2L file")
+    parser.add_argument("--hex", type=Path, default=TESTS_DIR / "CDF20demo.hex", help="Intel-HEX image")
+    parser.add_argument("--repeat", type=int, default=20, help="Number of runs per strategy (median is reported)")
+    args = parser.parse_args()
+
+    session = open_a2l_database(str(args.a2l.with_suffix("")), encoding="latin1", local=True)
+    try:
+        context = SimpleNamespace(
+            session=session,
+            mod_common=ModCommon.get(session),
+            mod_par=ModPar.get(session) if ModPar.exists(session) else None,
+            logger=logging.getLogger("bench_load_many"),
+        )
+        calibration = OfflineCalibration(context, load("ihex", str(args.hex)), loglevel="ERROR")
+        names = [row.name for row in session.query(model.Characteristic.name).filter(model.Characteristic.type == "VALUE")]
+        calibration.load_many(names)  # warm up definition caches
+
+        strategies = {
+            "load": lambda: [calibration.load(name) for name in names],
+            "load_many": lambda: calibration.load_many(names),
+        }
+        for label, func in strategies.items():
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - start)
+            per_param = statistics.median(timings) / max(len(names), 1)
+            print(f"{label:>10}: {len(names):6d} VALUEs  {per_param * 1e6:9.1f} us/parameter")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+bench_lookup: Slice-based multilinear interpolation vs. ``LookupTable``.
+
+Usage:
+  python -m tools.benchmarks.bench_lookup [--size N] [--points N] [--scalar-points N]
+
+For synthetic MAP, CUBOID and CUBE_5 tables with *size* breakpoints per axis,
+compares the former per-call interpolation of ``interp()`` (slice tuples
+rebuilt per dimension, one point per call) with a prebuilt
+``LookupTable`` -- per point via ``evaluate()`` and batched via
+``evaluate_many()`` in float64 and float32 mode.  Prints microseconds per
+point and the size of the function values.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+
+import numpy as np
+
+from asamint.calibration.lookup import LookupTable
+
+
+def _slices(axes: list[np.ndarray], fnc_values: np.ndarray, positions: np.ndarray) -> float:
+    result = fnc_values.astype(float)
+    for dim in reversed(range(len(axes))):
+        axis = axes[dim]
+        pos = np.clip(positions[dim], axis[0], axis[-1])
+        idx = np.clip(np.searchsorted(axis, pos, side="right") - 1, 0, len(axis) - 2)
+        lo, hi = axis[idx], axis[idx + 1]
+        frac = (pos - lo) / (hi - lo) if hi != lo else 0.0
+        slices_lo = [slice(None)] * result.ndim
+        slices_hi = [slice(None)] * result.ndim
+        slices_lo[dim] = idx
+        slices_hi[dim] = idx + 1
+        result = result[tuple(slices_lo)] * (1.0 - frac) + result[tuple(slices_hi)] * frac
+    return float(result)
+
+
+def _per_point(func: Callable[[np.ndarray], float], positions: np.ndarray) -> list[float]:
+    return [func(position) for position in positions]
+
+
+def _report(runs: dict[str, tuple[Callable[[], object], int]]) -> None:
+    for label, (func, count) in runs.items():
+        start = time.perf_counter()
+        func()
+        print(f"{label:>24}: {(time.perf_counter() - start) / count * 1e6:9.3f} us/point")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=16, help="Breakpoints per axis")
+    parser.add_argument("--points", type=int, default=200_000, help="Operating points for evaluate_many()")
+    parser.add_argument("--scalar-points", type=int, default=2_000, help="Operating points for per-point evaluation")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for label, ndim in (("MAP", 2), ("CUBOID", 3), ("CUBE_5", 5)):
+        shape = (args.size,) * ndim
+        values = rng.normal(size=shape)
+        axes = [np.cumsum(rng.uniform(0.5, 2.0, args.size)) for _ in range(ndim)]
+        positions = np.column_stack([rng.uniform(axis[0], axis[-1], args.points) for axis in axes])
+        scalar = positions[: args.scalar_points]
+        table = LookupTable(values, axes)
+        table32 = LookupTable(values, axes, dtype=np.float32)
+
+        expected = [_slices(axes, values, position) for position in scalar]
+        np.testing.assert_allclose(table.evaluate_many(scalar), expected, rtol=1e-9, atol=1e-9)
+
+        print(f"{label} {shape}, {values.nbytes / 1024:.0f} KiB float64 / {table32.values.nbytes / 1024:.0f} KiB float32")
+        _report(
+            {
+                "slices": (partial(_per_point, partial(_slices, axes, values), scalar), len(scalar)),
+                "evaluate": (partial(_per_point, table.evaluate, scalar), len(scalar)),
+                "evaluate_many": (partial(table.evaluate_many, positions), args.points),
+                "evaluate_many (float32)": (partial(table32.evaluate_many, positions), args.points),
+            }
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+bench_mdf_stream: Peak RSS of in-memory versus streamed MDF4 recordings.
+
+Usage:
+  python -m tools.benchmarks.bench_mdf_stream [--durations 60,600,3600] [--rate HZ] [--signals N] [--chunk-size N]
+
+Simulates a recording of *signals* ``UWORD`` measurements sampled at *rate* Hz
+for each duration (in seconds), once collected in RAM and written with
+``MDFCreator.save_measurements`` and once written block-wise with
+``MDFCreator.open_stream``.  Every run happens in a fresh process; its peak
+resident set size and wall time are printed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing
+import resource
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from asamint.adapters.mdf import MDF
+from asamint.measurement.mdf import MDFCreator, MDFStreamWriter
+
+BLOCK_SECONDS = 1.0
+
+
+def _creator(signals: int) -> SimpleNamespace:
+    creator = SimpleNamespace(
+        logger=logging.getLogger("bench_mdf_stream"),
+        _mdf_obj=MDF(version="4.20"),
+        measurement_variables=[
+            SimpleNamespace(name=f"sig{idx}", longIdentifier="", compuMethod="NO_COMPU_METHOD", bitMask=None, bitOperation=None)
+            for idx in range(signals)
+        ],
+        calculate_physical_values=lambda values, cm: values,
+        ccblock=lambda cm: None,
+    )
+    creator.raw_to_physical = lambda meas, samples: MDFCreator.raw_to_physical(creator, meas, samples)
+    return creator
+
+
+def _blocks(duration: float, rate: int, signals: int):
+    per_block = int(rate * BLOCK_SECONDS)
+    for block in range(int(duration / BLOCK_SECONDS)):
+        ts = (np.arange(per_block, dtype=np.int64) + block * per_block) * (1_000_000_000 // rate)
+        yield ts, {f"sig{idx}": (ts // 1000 + idx).astype(np.uint16) for idx in range(signals)}
+
+
+def _run(strategy: str, duration: float, rate: int, signals: int, chunk_size: int, out: str) -> tuple[float, int]:
+    creator = _creator(signals)
+    start = time.perf_counter()
+    if strategy == "in-memory":
+        parts = list(_blocks(duration, rate, signals))
+        data = {"timestamp0": np.concatenate([ts for ts, _ in parts])}
+        for idx in range(signals):
+            data[f"sig{idx}"] = np.concatenate([values[f"sig{idx}"] for _, values in parts])
+        del parts
+        MDFCreator.save_measurements(creator, out, data, project_meta={"author": ""})
+    else:
+        with MDFStreamWriter(creator, out, chunk_size=chunk_size) as stream:
+            for ts, values in _blocks(duration, rate, signals):
+                stream.append(ts, values, source="timestamp0")
+    elapsed = time.perf_counter() - start
+    return elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--durations", default="60,600,3600", help="Comma separated recording durations in seconds")
+    parser.add_argument("--rate", type=int, default=1000, help="Sample rate in Hz")
+    parser.add_argument("--signals", type=int, default=20, help="Number of measurements")
+    parser.add_argument("--chunk-size", type=int, default=65536, help="Records per streamed chunk")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir, ctx.Pool(1, maxtasksperchild=1) as pool:
+        for duration in (float(d) for d in args.durations.split(",")):
+            for strategy in ("in-memory", "stream"):
+                out = str(Path(tmp_dir) / f"{strategy}.mf4")
+                elapsed, max_rss = pool.apply(_run, (strategy, duration, args.rate, args.signals, args.chunk_size, out))
+                size = Path(out).stat().st_size
+                print(
+                    f"{strategy:>10}: {duration:8.0f} s  {size / 2**20:9.1f} MiB file  "
+                    f"{max_rss / 1024:9.1f} MiB peak RSS  {elapsed:8.2f} s"
+                )
+
+
+if __name__ == "__main__":
+    main()
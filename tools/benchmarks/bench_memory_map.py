@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+bench_memory_map: Linear scan vs. ``MemoryRangeIndex`` address-to-segment look-ups.
+
+Usage:
+  python -m tools.benchmarks.bench_memory_map [--segments N] [--addresses N]
+
+Builds *segments* adjacent synthetic memory segments (alternating FLASH and
+calibration RAM) and resolves *addresses* random addresses -- the
+``Calibration._is_in_hex_file`` question -- three ways: the former linear scan
+over the memory map, one ``MemoryRangeIndex.find()`` per address and a single
+vectorised ``MemoryRangeIndex.in_hex_file()`` call.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from asamint.adapters.a2l import inspect
+from asamint.asam import MemoryRange
+from asamint.asam.memory_map import MemoryRangeIndex, is_in_hex_file
+
+SEGMENT_SIZE = 0x1000
+
+
+def _segments(count: int) -> list[MemoryRange]:
+    kinds = [
+        (inspect.PrgTypeSegment.DATA, inspect.MemoryType.FLASH),
+        (inspect.PrgTypeSegment.CALIBRATION_VARIABLES, inspect.MemoryType.RAM),
+    ]
+    return [MemoryRange(f"SEG_{idx}", idx * SEGMENT_SIZE, SEGMENT_SIZE, *kinds[idx % 2]) for idx in range(count)]
+
+
+def _linear(memory_map: list[MemoryRange], addresses: list[int]) -> list[bool]:
+    result = []
+    for address in addresses:
+        in_hex = True
+        for mr in memory_map:
+            if address in mr:
+                in_hex = is_in_hex_file(mr)
+                break
+        result.append(in_hex)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=500, help="Number of memory segments")
+    parser.add_argument("--addresses", type=int, default=50_000, help="Number of addresses to resolve")
+    args = parser.parse_args()
+
+    memory_map = _segments(args.segments)
+    rng = np.random.default_rng(0)
+    addresses = rng.integers(0, args.segments * SEGMENT_SIZE, args.addresses).tolist()
+
+    start = time.perf_counter()
+    expected = _linear(memory_map, addresses)
+    linear = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = MemoryRangeIndex(memory_map)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scalar = [(mr is None or is_in_hex_file(mr)) for mr in map(index.find, addresses)]
+    find = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorised = index.in_hex_file(addresses).tolist()
+    bulk = time.perf_counter() - start
+
+    assert scalar == expected and vectorised == expected
+    print(f"{args.segments} segments, {args.addresses} addresses")
+    print(f"{'linear scan':>14}: {linear:8.3f} s")
+    print(f"{'index build':>14}: {build:8.3f} s")
+    print(f"{'find()':>14}: {find:8.3f} s")
+    print(f"{'in_hex_file()':>14}: {bulk:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
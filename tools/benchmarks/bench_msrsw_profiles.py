@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+bench_msrsw_profiles: Import and query throughput of the MSRSW SQLite profiles.
+
+Usage:
+  python -m tools.benchmarks.bench_msrsw_profiles [--instances N] [--values N] [--queries N]
+
+Generates a synthetic CDF20 document (see ``bench_cdf_import``), imports it
+with ``StreamingParser`` into a fresh database once per profile of
+``msrsw_db.PROFILES`` and then runs *queries* random ``SW-INSTANCE`` look-ups
+by short name against the result, opened with the same profile.  Every step
+runs in a fresh process; import time, queries per second and peak resident
+set size are printed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing
+import random
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+from tools.benchmarks.bench_cdf_import import write_cdf
+
+
+def _import(profile: str, xml_file: str, db_file: str) -> tuple[float, int]:
+    from asamint.calibration.msrsw_db import MSRSWDatabase, StreamingParser
+
+    logging.disable(logging.WARNING)
+    start = time.perf_counter()
+    StreamingParser(xml_file, MSRSWDatabase(db_file, profile=profile))
+    elapsed = time.perf_counter() - start
+    return elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _query(profile: str, db_file: str, instances: int, queries: int) -> tuple[float, int]:
+    from asamint.calibration.msrsw_db import MSRSWDatabase, ShortName, SwInstance
+
+    logging.disable(logging.WARNING)
+    db = MSRSWDatabase(db_file, profile=profile)
+    rng = random.Random(0)
+    names = [f"Param_{rng.randrange(instances)}" for _ in range(queries)]
+    query = db.session.query(SwInstance).join(SwInstance.short_name)
+    start = time.perf_counter()
+    for name in names:
+        instance = query.filter(ShortName.content == name).one()
+        _ = [v.content for v in instance.sw_value_cont.sw_values_phys.vs]
+    elapsed = time.perf_counter() - start
+    db.close()
+    return queries / elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main() -> None:
+    from asamint.calibration.msrsw_db import PROFILES
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--instances", type=int, default=10_000, help="Number of SW-INSTANCEs")
+    parser.add_argument("--values", type=int, default=16, help="Values per instance")
+    parser.add_argument("--queries", type=int, default=2_000, help="Number of look-ups per profile")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xml_file = Path(tmp_dir) / "bench.cdfx"
+        write_cdf(xml_file, args.instances, args.values)
+        for profile in PROFILES:
+            db_file = str(Path(tmp_dir) / f"{profile}.msrswdb")
+            with ctx.Pool(1, maxtasksperchild=1) as pool:
+                elapsed, import_rss = pool.apply(_import, (profile, str(xml_file), db_file))
+            with ctx.Pool(1, maxtasksperchild=1) as pool:
+                rate, query_rss = pool.apply(_query, (profile, db_file, args.instances, args.queries))
+            print(
+                f"{profile:>16}: import {elapsed:7.2f} s ({import_rss / 1024:7.1f} MiB)  "
+                f"query {rate:9.1f} /s ({query_rss / 1024:7.1f} MiB)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+bench_msrsw_reader: ORM schema (``msrsw_db``) vs. Core-only ``MSRSWReader``.
+
+Usage:
+  python -m tools.benchmarks.bench_msrsw_reader [--instances N] [--values N] [--queries N]
+
+Imports a synthetic CDF20 document (see ``bench_cdf_import``) with
+*instances* ``VAL_BLK`` parameters and then, for both access paths, each in a
+fresh process, measures
+
+* the import time of the module,
+* the time to open the database and answer the first ``SW-INSTANCE`` look-up
+  by short name (for the ORM this includes configuring all mappers),
+* the rate of *queries* further look-ups, each reading unit, array size and values.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from tools.benchmarks.bench_cdf_import import write_cdf
+
+
+def _import(xml_file: str, db_file: str) -> None:
+    from asamint.calibration.msrsw_db import MSRSWDatabase, StreamingParser
+
+    logging.disable(logging.WARNING)
+    StreamingParser(xml_file, MSRSWDatabase(db_file))
+
+
+def _orm(db_file: str, names: list[str]) -> tuple[float, float, float]:
+    start = time.perf_counter()
+    from asamint.calibration.msrsw_db import MSRSWDatabase, ShortName, SwInstance
+
+    imported = time.perf_counter()
+    db = MSRSWDatabase(db_file, profile="concurrent-read")
+    query = db.session.query(SwInstance).join(SwInstance.short_name)
+
+    def lookup(name: str) -> tuple:
+        cont = query.filter(ShortName.content == name).one().sw_value_cont
+        return (
+            cont.unit_display_name.content,
+            [v.content for v in cont.sw_arraysize.vs],
+            [v.content for v in cont.sw_values_phys.vs],
+        )
+
+    lookup(names[0])
+    first = time.perf_counter()
+    for name in names[1:]:
+        lookup(name)
+    rate = (len(names) - 1) / (time.perf_counter() - first)
+    db.close()
+    return imported - start, first - imported, rate
+
+
+def _core(db_file: str, names: list[str]) -> tuple[float, float, float]:
+    start = time.perf_counter()
+    from asamint.calibration.msrsw_reader import MSRSWReader
+
+    imported = time.perf_counter()
+    reader = MSRSWReader(db_file)
+
+    def lookup(name: str) -> tuple:
+        cont = reader.instance(name).values
+        return cont.unit_display_name.value, cont.array_size.dimensions, [v.phys for v in cont.values_phys]
+
+    lookup(names[0])
+    first = time.perf_counter()
+    for name in names[1:]:
+        lookup(name)
+    rate = (len(names) - 1) / (time.perf_counter() - first)
+    reader.close()
+    return imported - start, first - imported, rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--instances", type=int, default=5_000, help="Number of SW-INSTANCEs")
+    parser.add_argument("--values", type=int, default=16, help="Values per instance")
+    parser.add_argument("--queries", type=int, default=500, help="Number of look-ups")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [f"Param_{rng.randrange(args.instances)}" for _ in range(args.queries)]
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xml_file = Path(tmp_dir) / "bench.cdfx"
+        db_file = str(Path(tmp_dir) / "bench.msrswdb")
+        write_cdf(xml_file, args.instances, args.values)
+        with ctx.Pool(1, maxtasksperchild=1) as pool:
+            pool.apply(_import, (str(xml_file), db_file))
+        print(f"{args.instances} instances x {args.values} values, {args.queries} look-ups")
+        for label, func in (("ORM (msrsw_db)", _orm), ("Core (MSRSWReader)", _core)):
+            with ctx.Pool(1, maxtasksperchild=1) as pool:
+                imported, first, rate = pool.apply(func, (db_file, names))
+            print(f"{label:>20}: import {imported:6.2f} s  open + first query {first:6.2f} s  {rate:8.1f} queries/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+bench_shadow_diff: XCP download traffic of full-footprint vs. shadow-diffed ``OnlineCalibration`` flushes.
+
+Usage:
+  python -m tools.benchmarks.bench_shadow_diff [--cells N] [--gaps G [G ...]] [--latency MS]
+
+Changes *cells* random cells of every MAP of ``tests/CDF20demo.a2l`` that
+survives a plain ``load`` / ``save`` round-trip through
+an ``OnlineCalibration`` connected to a local XCP stand-in that sleeps
+*latency* milliseconds per ``push``, once without *diff_gap* (the whole
+memory footprint of each map is pushed) and once per gap tolerance in
+*gaps*.  Prints wall time, round-trips and bytes pushed / skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from asamint.adapters.a2l import model, open_a2l_database
+from asamint.adapters.objutils import load
+from asamint.calibration.api import OnlineCalibration
+
+FIXTURES = Path(__file__).resolve().parents[2] / "tests"
+
+
+class _XcpStandIn:
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def setMta(self, address: int) -> None:
+        pass
+
+    def push(self, data: bytes) -> None:
+        time.sleep(self.latency)
+
+
+def _round_trippable(session, names: list[str]) -> list[str]:
+    cal = OnlineCalibration(session, _XcpStandIn(0.0), image=load("ihex", str(FIXTURES / "CDF20demo.hex")), loglevel="ERROR")
+    result = []
+    for name in names:
+        try:
+            cal.save(name, cal.load(name))
+        except ValueError:
+            continue
+        result.append(name)
+    return result
+
+
+def _run(session, names: list[str], cells: int, latency: float, diff_gap: Optional[int]) -> None:
+    rng = np.random.default_rng(0)
+    image = load("ihex", str(FIXTURES / "CDF20demo.hex"))
+    cal = OnlineCalibration(session, _XcpStandIn(latency), image=image, diff_gap=diff_gap, loglevel="ERROR")
+    start = time.perf_counter()
+    for name in names:
+        values = cal.load(name)
+        for _ in range(cells):
+            values.phys[tuple(rng.integers(0, size) for size in values.phys.shape)] += 1
+        cal.save(name, values)
+    elapsed = time.perf_counter() - start
+    stats = cal.stats
+    label = "full footprint" if diff_gap is None else f"diff_gap={diff_gap}"
+    print(
+        f"{label:>16}: {elapsed:8.3f} s  {stats.round_trips:5d} round-trips"
+        f"  {stats.bytes_pushed:7d} bytes pushed  {stats.bytes_unchanged:7d} skipped"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cells", type=int, default=1, help="Cells changed per map")
+    parser.add_argument("--gaps", type=int, nargs="+", default=[0, 8, 64], help="Gap tolerances to compare")
+    parser.add_argument("--latency", type=float, default=2.0, help="Simulated round-trip latency in milliseconds")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    session = open_a2l_database(str(FIXTURES / "CDF20demo"), encoding="latin1", local=True)
+    names = _round_trippable(session, [row.name for row in session.query(model.Characteristic.name).filter_by(type="MAP")])
+    print(f"{len(names)} maps, {args.cells} cell(s) changed per map, {args.latency:g} ms per round-trip")
+    for gap in [None, *args.gaps]:
+        _run(session, names, args.cells, args.latency / 1e3, gap)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+bench_write_behind: Synchronous vs. write-behind ECU write-back of ``OnlineCalibration``.
+
+Usage:
+  python -m tools.benchmarks.bench_write_behind [--saves N] [--latency MS] [--window S] [--max-bytes N]
+
+Saves *saves* values, cycling over the scalar characteristics of
+``tests/CDF20demo.a2l``, through an ``OnlineCalibration`` connected to a local
+XCP stand-in that sleeps *latency* milliseconds per ``push`` (one
+``setMta`` + ``push`` round-trip), once with the synchronous ``auto_flush``
+and once with ``WriteBehindPolicy(window, max_bytes)`` followed by
+``barrier()``.  Prints wall time and the ``FlushStats`` counters.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import Optional
+
+from asamint.adapters.a2l import model, open_a2l_database
+from asamint.adapters.objutils import load
+from asamint.calibration.api import ExecutionPolicy, OnlineCalibration, WriteBehindPolicy
+
+FIXTURES = Path(__file__).resolve().parents[2] / "tests"
+
+
+class _XcpStandIn:
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def setMta(self, address: int) -> None:
+        pass
+
+    def push(self, data: bytes) -> None:
+        time.sleep(self.latency)
+
+
+def _run(session, names: list[str], saves: int, latency: float, policy: Optional[WriteBehindPolicy]) -> None:
+    image = load("ihex", str(FIXTURES / "CDF20demo.hex"))
+    with OnlineCalibration(session, _XcpStandIn(latency), image=image, write_behind=policy, loglevel="ERROR") as cal:
+        start = time.perf_counter()
+        for idx in range(saves):
+            cal.save_value(names[idx % len(names)], idx % 100, limitsPolicy=ExecutionPolicy.IGNORE)
+        cal.barrier()
+        elapsed = time.perf_counter() - start
+        stats = cal.stats
+    label = "synchronous" if policy is None else f"write-behind {policy.window * 1e3:g} ms / {policy.max_bytes} B"
+    print(
+        f"{label:>30}: {elapsed:8.3f} s  {stats.round_trips:5d} round-trips"
+        f"  {stats.round_trips_saved:5d} saved  {stats.bytes_pushed:7d} bytes"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--saves", type=int, default=200, help="Number of save_value calls")
+    parser.add_argument("--latency", type=float, default=2.0, help="Simulated round-trip latency in milliseconds")
+    parser.add_argument("--window", type=float, default=0.05, help="Write-behind coalescing window in seconds")
+    parser.add_argument("--max-bytes", type=int, default=4096, help="Write-behind byte threshold")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    session = open_a2l_database(str(FIXTURES / "CDF20demo"), encoding="latin1", local=True)
+    names = [
+        row.name
+        for row in session.query(model.Characteristic.name)
+        .filter(model.Characteristic.type == "VALUE", model.Characteristic.name.like("CDF20.array.%"))
+        .all()
+    ]
+    latency = args.latency / 1e3
+    print(f"{args.saves} saves over {len(names)} characteristics, {args.latency:g} ms per round-trip")
+    _run(session, names, args.saves, latency, None)
+    _run(session, names, args.saves, latency, WriteBehindPolicy(window=args.window, max_bytes=args.max_bytes))
+
+
+if __name__ == "__main__":
+    main()